@@ -0,0 +1,54 @@
+-- Migration 006: Stage-level timing spans in performance_metrics
+-- Purpose: Record per-stage spans (navigate, wait, extract, parse, match,
+-- db_write, image_download, llm_call) for every batch item
+--
+-- SQLite cannot alter CHECK constraints, so the table is recreated:
+-- - operation accepts the span stages alongside the original operations
+-- - batch_type accepts 'census_transcription'
+-- - item_id ties a span to the batch item it timed
+-- - session_id no longer references batch_sessions: census and transcription
+--   sessions live in their own tables
+-- duration_ms keeps INTEGER affinity; fractional span durations are stored as REAL
+
+BEGIN;
+
+CREATE TABLE performance_metrics_new (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TIMESTAMP NOT NULL,
+    operation TEXT NOT NULL CHECK(operation IN (
+        'page_load', 'extraction', 'citation_creation', 'image_download',
+        'navigate', 'wait', 'extract', 'parse', 'match', 'db_write', 'llm_call'
+    )),
+    duration_ms INTEGER NOT NULL,
+    success BOOLEAN NOT NULL,
+    session_id TEXT,
+    batch_type TEXT CHECK(batch_type IN ('findagrave', 'census', 'census_transcription')),
+    item_id INTEGER
+);
+
+INSERT INTO performance_metrics_new (
+    id, timestamp, operation, duration_ms, success, session_id, batch_type
+)
+SELECT id, timestamp, operation, duration_ms, success, session_id, batch_type
+FROM performance_metrics;
+
+DROP TABLE performance_metrics;
+
+ALTER TABLE performance_metrics_new RENAME TO performance_metrics;
+
+CREATE INDEX IF NOT EXISTS idx_performance_metrics_session
+    ON performance_metrics(session_id, operation, timestamp);
+
+CREATE INDEX IF NOT EXISTS idx_performance_metrics_recent
+    ON performance_metrics(timestamp DESC);
+
+CREATE INDEX IF NOT EXISTS idx_performance_metrics_batch_type
+    ON performance_metrics(batch_type, timestamp DESC);
+
+CREATE INDEX IF NOT EXISTS idx_performance_metrics_item
+    ON performance_metrics(session_id, item_id);
+
+INSERT OR REPLACE INTO schema_version (version, applied_at)
+VALUES (6, datetime('now'));
+
+COMMIT;
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark baseline and regression check for RMCitecraft.
+
+Runs the pytest-benchmark suite in tests/benchmarks and either stores the
+results as a baseline or compares them against a stored baseline. Timings
+are compared by median, which is the most stable statistic for short runs.
+
+Usage:
+    python scripts/benchmark_compare.py save
+    python scripts/benchmark_compare.py check --threshold 0.15
+    python scripts/benchmark_compare.py check --current .benchmarks/current.json
+
+Exit Codes:
+    0: Baseline saved, or no benchmark regressed beyond the threshold
+    1: A benchmark regressed, or the benchmark run failed
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_BASELINE = PROJECT_ROOT / ".benchmarks" / "baseline.json"
+DEFAULT_CURRENT = PROJECT_ROOT / ".benchmarks" / "current.json"
+
+
+@dataclass
+class BenchmarkChange:
+    """Median timing of one benchmark in the baseline and the current run."""
+
+    name: str
+    baseline: float | None
+    current: float | None
+
+    @property
+    def change(self) -> float | None:
+        """Relative change of the median (0.1 = 10% slower)."""
+        if not self.baseline or self.current is None:
+            return None
+        return self.current / self.baseline - 1
+
+
+def run_benchmarks(output: Path, sizes: str | None = None) -> int:
+    """Run the benchmark suite, writing pytest-benchmark JSON to output."""
+    output.parent.mkdir(parents=True, exist_ok=True)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(PROJECT_ROOT / "src"), env.get("PYTHONPATH")])
+    )
+    if sizes:
+        env["RMCITECRAFT_BENCH_SIZES"] = sizes
+    command = [
+        sys.executable, "-m", "pytest", "tests/benchmarks", "-q", "-p", "no:cacheprovider",
+        "--benchmark-only", "--benchmark-disable-gc", "--benchmark-warmup=on",
+        f"--benchmark-json={output}",
+    ]
+    return subprocess.run(command, cwd=PROJECT_ROOT, env=env).returncode
+
+
+def load_medians(path: Path) -> dict[str, float]:
+    """Median seconds per benchmark from a pytest-benchmark JSON file."""
+    data = json.loads(path.read_text())
+    return {bench["fullname"]: bench["stats"]["median"] for bench in data["benchmarks"]}
+
+
+def compare(baseline: dict[str, float], current: dict[str, float]) -> list[BenchmarkChange]:
+    """Pair up benchmarks from two runs, sorted by name."""
+    names = sorted(set(baseline) | set(current))
+    return [BenchmarkChange(name, baseline.get(name), current.get(name)) for name in names]
+
+
+def print_report(changes: list[BenchmarkChange], threshold: float) -> list[BenchmarkChange]:
+    """Print a comparison table; returns the regressions."""
+    regressions = []
+    print(f"{'Baseline ms':>12} {'Current ms':>11} {'Change':>8}  Benchmark")
+    for item in changes:
+        baseline = f"{item.baseline * 1000:.2f}" if item.baseline is not None else "-"
+        current = f"{item.current * 1000:.2f}" if item.current is not None else "-"
+        if item.change is not None:
+            change = f"{item.change:+.1%}"
+        else:
+            change = "new" if item.baseline is None else "missing"
+        marker = ""
+        if item.change is not None and item.change > threshold:
+            regressions.append(item)
+            marker = "  ✗ regressed"
+        print(f"{baseline:>12} {current:>11} {change:>8}  {item.name}{marker}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Store a benchmark baseline or check the current run against it."
+    )
+    parser.add_argument("action", choices=["save", "check"], help="save or check")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON")
+    parser.add_argument(
+        "--current", type=Path,
+        help="Compare an existing pytest-benchmark JSON instead of running the suite",
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.15,
+        help="Largest accepted slowdown of a median (default: 0.15 = 15%%)",
+    )
+    parser.add_argument("--sizes", help="Tree sizes, e.g. 1000,10000 (default: suite default)")
+    args = parser.parse_args()
+
+    if args.action == "save":
+        if run_benchmarks(args.baseline, args.sizes) != 0:
+            print("✗ Benchmark run failed")
+            return 1
+        print(f"✓ Baseline saved: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"✗ Baseline not found: {args.baseline} (run 'save' first)")
+        return 1
+    current_path = args.current
+    if current_path is None:
+        current_path = DEFAULT_CURRENT
+        if run_benchmarks(current_path, args.sizes) != 0:
+            print("✗ Benchmark run failed")
+            return 1
+
+    changes = compare(load_medians(args.baseline), load_medians(current_path))
+    regressions = print_report(changes, args.threshold)
+    if regressions:
+        print(f"✗ {len(regressions)} benchmark(s) slower than the baseline by more than "
+              f"{args.threshold:.0%}")
+        return 1
+    print(f"✓ No benchmark slower than the baseline by more than {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,18 +5,22 @@ in RootsMagic databases.
 
 Public API:
     run_quality_check: Main function to run quality checks
+    run_all_quality_checks: Parallel, cached multi-year checks with merged results
     format_text_output: Human-readable output
     format_compact_output: Token-efficient output for LLMs
+    format_consolidated_output: Summary of merged multi-year results
     build_census_configs: Get all year configurations
 """
 
 from .configs import build_census_configs
-from .formatters import format_compact_output, format_text_output
-from .runner import run_quality_check
+from .formatters import format_compact_output, format_consolidated_output, format_text_output
+from .runner import run_all_quality_checks, run_quality_check
 
 __all__ = [
     "run_quality_check",
+    "run_all_quality_checks",
     "format_text_output",
     "format_compact_output",
+    "format_consolidated_output",
     "build_census_configs",
 ]
@@ -0,0 +1,149 @@
+"""Persistent per-source result cache for census quality checking.
+
+Source-level validator results depend only on the source's Name and Fields
+and on the validation rules. Results are stored in a small SQLite file keyed
+by (year_key, SourceID) and reused while the source's UTCModDate, a digest
+of its Name/Fields and the validator version are all unchanged, so re-runs
+only re-validate sources edited since the last run.
+
+Media counts and citation quality are not cached: they live in other tables
+and do not change SourceTable.UTCModDate.
+"""
+
+import hashlib
+import json
+import sqlite3
+import zlib
+from pathlib import Path
+
+from .models import Issue
+
+# Bump to invalidate all cached results when validation semantics change in a
+# way not captured by the module hash below (e.g. a dependency upgrade).
+VALIDATOR_SCHEMA = 1
+
+# Modules whose source code determines source-level validation results
+_VALIDATION_MODULES = ("validators.py", "configs.py", "extractors.py", "constants.py", "models.py")
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS source_result (
+    year_key TEXT NOT NULL,
+    source_id INTEGER NOT NULL,
+    utc_mod_date REAL,
+    content_crc INTEGER NOT NULL,
+    validator_version TEXT NOT NULL,
+    issues_json TEXT NOT NULL,
+    PRIMARY KEY (year_key, source_id)
+);
+"""
+
+
+def get_validator_version() -> str:
+    """Version string identifying the current validation rules.
+
+    Combines VALIDATOR_SCHEMA with a hash of the validation modules, so any
+    edit to a validator or year config invalidates cached results.
+    """
+    digest = hashlib.sha256(str(VALIDATOR_SCHEMA).encode())
+    package_dir = Path(__file__).parent
+    for name in _VALIDATION_MODULES:
+        digest.update((package_dir / name).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def source_content_crc(name: str, fields_blob: bytes | str | None) -> int:
+    """Cheap digest of the columns the validators read.
+
+    Guards against writers that update Name/Fields without touching UTCModDate.
+    """
+    if isinstance(fields_blob, str):
+        fields_blob = fields_blob.encode("utf-8")
+    return zlib.crc32(fields_blob or b"", zlib.crc32((name or "").encode("utf-8")))
+
+
+def default_cache_path(db_path: Path) -> Path:
+    """Default cache location: next to the RootsMagic database."""
+    return db_path.with_name(f"{db_path.name}.quality-cache.sqlite")
+
+
+class QualityResultCache:
+    """SQLite-backed cache of per-source validator issues."""
+
+    def __init__(self, cache_path: Path, validator_version: str | None = None):
+        self.cache_path = cache_path
+        self.validator_version = validator_version or get_validator_version()
+        self.hits = 0
+        self.misses = 0
+
+        self.conn = sqlite3.connect(cache_path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(CACHE_SCHEMA)
+        self._pending: list[tuple] = []
+
+    def load_year(self, year_key: int | str) -> dict[int, tuple[float | None, int, list[Issue]]]:
+        """Load valid cached results for a year.
+
+        Returns:
+            Dict mapping source_id to (utc_mod_date, content_crc, issues)
+        """
+        rows = self.conn.execute(
+            """
+            SELECT source_id, utc_mod_date, content_crc, issues_json
+            FROM source_result
+            WHERE year_key = ? AND validator_version = ?
+            """,
+            (str(year_key), self.validator_version),
+        ).fetchall()
+        return {
+            source_id: (utc_mod_date, crc, [Issue(**i) for i in json.loads(issues_json)])
+            for source_id, utc_mod_date, crc, issues_json in rows
+        }
+
+    def put(
+        self,
+        year_key: int | str,
+        source_id: int,
+        utc_mod_date: float | None,
+        content_crc: int,
+        issues: list[Issue],
+    ) -> None:
+        """Queue a source's results for writing on flush()."""
+        self._pending.append((
+            str(year_key),
+            source_id,
+            utc_mod_date,
+            content_crc,
+            self.validator_version,
+            json.dumps([i.to_dict() for i in issues]),
+        ))
+
+    def flush(self) -> None:
+        """Write queued results in one transaction."""
+        if not self._pending:
+            return
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT OR REPLACE INTO source_result (
+                    year_key, source_id, utc_mod_date, content_crc,
+                    validator_version, issues_json
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                self._pending,
+            )
+        self._pending = []
+
+    def prune_year(self, year_key: int | str, source_ids: set[int]) -> None:
+        """Drop cached results for sources that no longer exist in a year."""
+        with self.conn:
+            cached = self.conn.execute(
+                "SELECT source_id FROM source_result WHERE year_key = ?", (str(year_key),)
+            ).fetchall()
+            stale = [(str(year_key), sid) for (sid,) in cached if sid not in source_ids]
+            self.conn.executemany(
+                "DELETE FROM source_result WHERE year_key = ? AND source_id = ?", stale
+            )
+
+    def close(self) -> None:
+        self.flush()
+        self.conn.close()
@@ -6,6 +6,8 @@ Contains functions for extracting data from RootsMagic database.
 import re
 import sqlite3
 
+from .cache import source_content_crc
+
 
 def extract_field_from_blob(fields_blob: bytes | str | None, field_name: str) -> str:
     """Extract a field value from the Fields BLOB."""
@@ -49,6 +51,7 @@ def get_sources_for_year(conn: sqlite3.Connection, year_key: int | str) -> list[
             s.SourceID,
             s.Name,
             s.Fields,
+            s.UTCModDate,
             (SELECT COUNT(*) FROM MediaLinkTable ml
              WHERE ml.OwnerID = s.SourceID AND ml.OwnerType = 3) as media_count
         FROM SourceTable s
@@ -60,7 +63,7 @@ def get_sources_for_year(conn: sqlite3.Connection, year_key: int | str) -> list[
 
     sources = []
     for row in cursor.fetchall():
-        source_id, name, fields_blob, media_count = row
+        source_id, name, fields_blob, utc_mod_date, media_count = row
 
         footnote = extract_field_from_blob(fields_blob, "Footnote")
         short_footnote = extract_field_from_blob(fields_blob, "ShortFootnote")
@@ -74,6 +77,8 @@ def get_sources_for_year(conn: sqlite3.Connection, year_key: int | str) -> list[
                 "short_footnote": short_footnote,
                 "bibliography": bibliography,
                 "media_count": media_count,
+                "utc_mod_date": utc_mod_date,
+                "content_crc": source_content_crc(name, fields_blob),
             }
         )
 
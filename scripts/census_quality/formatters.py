@@ -273,3 +273,35 @@ def format_text_output(result: dict, detailed: bool = False) -> str:
     lines.append("═" * width)
 
     return "\n".join(lines)
+
+
+def format_consolidated_output(consolidated: dict) -> str:
+    """Format merged multi-year results as a compact summary table."""
+    lines = ["ALL YEARS SUMMARY"]
+
+    for r in consolidated["years"]:
+        errors = r.get("by_severity", {}).get("error", 0)
+        warnings = r.get("by_severity", {}).get("warning", 0)
+        status = "PASS" if r["total_issues"] == 0 else "FAIL" if errors else "WARN"
+        lines.append(
+            f"  {str(r['year']):<16} {status:<4} {r['total_sources']:>6} sources "
+            f"{r['total_issues']:>6} issues ({errors}E/{warnings}W)"
+        )
+
+    errors = consolidated["by_severity"].get("error", 0)
+    warnings = consolidated["by_severity"].get("warning", 0)
+    lines.append(
+        f"  {'TOTAL':<21} {consolidated['total_sources']:>6} sources "
+        f"{consolidated['total_issues']:>6} issues ({errors}E/{warnings}W)"
+    )
+
+    cache = consolidated.get("cache")
+    if cache:
+        lines.append(
+            f"  cache: {cache.get('hits', 0)} reused / {cache.get('checked', 0)} re-checked"
+        )
+
+    for r in consolidated["errors"]:
+        lines.append(f"  error: {r['error']}")
+
+    return "\n".join(lines)
@@ -2,15 +2,25 @@
 
 Contains functions for validating media file attachments and
 checking for orphaned or missing files.
+
+File existence is answered from a MediaInventory, which lists each census
+directory once with os.scandir instead of stat-ing every linked file.
 """
 
 import sqlite3
+import sys
 from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 
 from .constants import CENSUS_DIRECTORIES, MEDIA_ROOT
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+from rmcitecraft.utils.media_inventory import (  # noqa: E402
+    MediaInventory,
+    get_media_inventory,
+)
+
 
 @dataclass
 class MediaCheckResult:
@@ -133,13 +143,18 @@ def get_all_media_in_directory(
     return files
 
 
-def run_media_check(conn: sqlite3.Connection, year_key: int | str) -> MediaCheckResult:
+def run_media_check(
+    conn: sqlite3.Connection,
+    year_key: int | str,
+    inventory: MediaInventory | None = None,
+) -> MediaCheckResult:
     """Run comprehensive media file validation for a census year.
 
     Args:
         conn: Database connection
         year_key: Either an integer year (1850, 1860, etc.) or a string key
                   like "1860-slave" for slave schedules.
+        inventory: Filesystem inventory (defaults to the shared inventory)
 
     Checks:
     1. Every source has media linked
@@ -160,6 +175,7 @@ def run_media_check(conn: sqlite3.Connection, year_key: int | str) -> MediaCheck
 
     dir_name = CENSUS_DIRECTORIES.get(year, f"{year} Federal")
     census_dir = MEDIA_ROOT / "Records - Census" / dir_name
+    inventory = inventory or get_media_inventory()
 
     # Get all source names
     cursor = conn.cursor()
@@ -194,7 +210,7 @@ def run_media_check(conn: sqlite3.Connection, year_key: int | str) -> MediaCheck
 
             # Only check files that should be in this year's directory
             if dir_name in str(full_path):
-                if not full_path.exists():
+                if not inventory.exists(full_path):
                     source_name = source_names.get(source_id, f"Source {source_id}")
                     missing_files.append((source_id, source_name, str(full_path)))
 
@@ -203,28 +219,24 @@ def run_media_check(conn: sqlite3.Connection, year_key: int | str) -> MediaCheck
     case_mismatches = []
     total_files_on_disk = 0
 
-    if census_dir.exists():
-        for file_path in census_dir.iterdir():
-            # Skip .DS_Store and other hidden files
-            if file_path.name.startswith("."):
-                continue
-
-            if file_path.is_file():
-                total_files_on_disk += 1
-                disk_path = str(file_path)
-                disk_path_lower = disk_path.lower()
-
-                # Check if this file is linked in RootsMagic
-                if disk_path_lower not in linked_media_paths:
-                    orphaned_files.append(file_path.name)
-                else:
-                    # Check for case mismatch
-                    db_path = linked_media_paths[disk_path_lower]
-                    if db_path != disk_path:
-                        # Extract just filenames for clearer output
-                        db_filename = Path(db_path).name
-                        disk_filename = file_path.name
-                        case_mismatches.append((db_filename, disk_filename))
+    # Hidden files such as .DS_Store are skipped by list_files
+    for entry in inventory.list_files(census_dir):
+        file_path = entry.path
+        total_files_on_disk += 1
+        disk_path = str(file_path)
+        disk_path_lower = disk_path.lower()
+
+        # Check if this file is linked in RootsMagic
+        if disk_path_lower not in linked_media_paths:
+            orphaned_files.append(file_path.name)
+        else:
+            # Check for case mismatch
+            db_path = linked_media_paths[disk_path_lower]
+            if db_path != disk_path:
+                # Extract just filenames for clearer output
+                db_filename = Path(db_path).name
+                disk_filename = file_path.name
+                case_mismatches.append((db_filename, disk_filename))
 
     return MediaCheckResult(
         sources_without_media=sources_without_media,
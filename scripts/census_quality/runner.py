@@ -1,12 +1,17 @@
 """Main quality check orchestration for census sources.
 
-Contains the run_quality_check function that coordinates all validation.
+Contains the run_quality_check function that coordinates all validation,
+and run_all_quality_checks which fans years out across a process pool and
+merges the per-year results.
 """
 
+import os
 import sqlite3
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from .cache import QualityResultCache
 from .configs import build_census_configs
 from .database import get_citation_quality_counts, get_sources_for_year
 from .media import run_media_check
@@ -25,6 +30,7 @@ def run_quality_check(
     year_key: int | str,
     include_all: bool = False,
     check_media: bool = False,
+    cache_path: Path | None = None,
 ) -> dict:
     """Run quality check for a specific census year.
 
@@ -33,6 +39,8 @@ def run_quality_check(
         year_key: Census year to check (e.g., 1860) or special key (e.g., "1860-slave")
         include_all: Include informational issues
         check_media: Run comprehensive media file validation (slower)
+        cache_path: Per-source result cache; only sources changed since the
+            cached run are re-validated (None disables caching)
     """
     configs = build_census_configs()
 
@@ -41,6 +49,7 @@ def run_quality_check(
         int_keys = sorted(k for k in configs.keys() if isinstance(k, int))
         str_keys = sorted(k for k in configs.keys() if isinstance(k, str))
         return {
+            "year": year_key,
             "error": f"No configuration for census year {year_key}",
             "supported_years": int_keys + str_keys,
         }
@@ -58,30 +67,33 @@ def run_quality_check(
 
     conn.close()
 
+    cache = QualityResultCache(cache_path) if cache_path else None
+    cached = cache.load_year(year_key) if cache else {}
+
     all_issues = []
     media_counts = {"no_media": 0, "single": 0, "multiple": 0}
     source_names = {}
 
     for source in sources:
         source_id = source["source_id"]
-        name = source["name"]
-        footnote = source["footnote"]
-        short_footnote = source["short_footnote"]
-        bibliography = source["bibliography"]
         media_count = source["media_count"]
 
-        source_names[source_id] = name
+        source_names[source_id] = source["name"]
 
-        # Run all checks
-        all_issues.extend(check_source_name(source_id, name, config))
-        all_issues.extend(check_footnote(source_id, footnote, config))
-        all_issues.extend(check_short_footnote(source_id, short_footnote, config))
-        all_issues.extend(check_bibliography(source_id, bibliography, config))
-        all_issues.extend(
-            check_cross_field_consistency(
-                source_id, name, footnote, short_footnote, bibliography, config
-            )
-        )
+        # Run all checks, reusing cached results for unchanged sources
+        entry = cached.get(source_id)
+        if entry and entry[:2] == (source["utc_mod_date"], source["content_crc"]):
+            all_issues.extend(entry[2])
+            cache.hits += 1
+        else:
+            source_issues = check_source(source, config)
+            all_issues.extend(source_issues)
+            if cache:
+                cache.misses += 1
+                cache.put(
+                    year_key, source_id, source["utc_mod_date"], source["content_crc"],
+                    source_issues,
+                )
 
         # Track media counts
         if media_count == 0:
@@ -208,4 +220,106 @@ def run_quality_check(
     if media_file_check:
         result["media_file_check"] = media_file_check
 
+    if cache:
+        cache.prune_year(year_key, set(source_names))
+        cache.close()
+        result["cache"] = {"hits": cache.hits, "checked": cache.misses}
+
     return result
+
+
+def check_source(source: dict, config) -> list[Issue]:
+    """Run all source-level validators for one source.
+
+    The result depends only on the source's name and citation fields and on
+    config, which is what makes it cacheable.
+    """
+    source_id = source["source_id"]
+    name = source["name"]
+    footnote = source["footnote"]
+    short_footnote = source["short_footnote"]
+    bibliography = source["bibliography"]
+
+    issues = []
+    issues.extend(check_source_name(source_id, name, config))
+    issues.extend(check_footnote(source_id, footnote, config))
+    issues.extend(check_short_footnote(source_id, short_footnote, config))
+    issues.extend(check_bibliography(source_id, bibliography, config))
+    issues.extend(
+        check_cross_field_consistency(
+            source_id, name, footnote, short_footnote, bibliography, config
+        )
+    )
+    return issues
+
+
+def run_all_quality_checks(
+    db_path: Path,
+    year_keys: list[int | str],
+    include_all: bool = False,
+    check_media: bool = False,
+    cache_path: Path | None = None,
+    workers: int | None = None,
+) -> dict:
+    """Run quality checks for several census years in parallel.
+
+    Each year runs in its own worker process with its own database
+    connection; results are returned in year_keys order and merged into a
+    consolidated summary.
+
+    Args:
+        db_path: Path to RootsMagic database
+        year_keys: Census years / special keys to check
+        include_all: Include informational issues
+        check_media: Run comprehensive media file validation (slower)
+        cache_path: Per-source result cache shared by all workers
+        workers: Worker processes (default: one per year, up to CPU count)
+
+    Returns:
+        Consolidated result (see merge_results)
+    """
+    workers = workers or min(len(year_keys), os.cpu_count() or 1)
+    args = [(db_path, key, include_all, check_media, cache_path) for key in year_keys]
+
+    if workers <= 1 or len(year_keys) <= 1:
+        results = [run_quality_check(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(run_quality_check, *zip(*args, strict=True)))
+
+    return merge_results(results)
+
+
+def merge_results(results: list[dict]) -> dict:
+    """Merge per-year results into a consolidated report.
+
+    Year results with an "error" key are reported separately and excluded
+    from the totals.
+    """
+    years = [r for r in results if "error" not in r]
+    by_severity: Counter = Counter()
+    by_type: Counter = Counter()
+    quality_counts: Counter = Counter()
+    media_counts: Counter = Counter()
+    cache_stats: Counter = Counter()
+
+    for r in years:
+        by_severity.update(r["by_severity"])
+        by_type.update(r["by_type"])
+        quality_counts.update(r["quality_counts"])
+        media_counts.update(r["media_counts"])
+        cache_stats.update(r.get("cache", {}))
+
+    consolidated = {
+        "years": years,
+        "errors": [r for r in results if "error" in r],
+        "total_sources": sum(r["total_sources"] for r in years),
+        "total_issues": sum(r["total_issues"] for r in years),
+        "by_severity": dict(by_severity),
+        "by_type": dict(by_type),
+        "quality_counts": dict(quality_counts),
+        "media_counts": dict(media_counts),
+    }
+    if cache_stats:
+        consolidated["cache"] = dict(cache_stats)
+    return consolidated
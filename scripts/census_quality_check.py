@@ -40,9 +40,11 @@ from pathlib import Path
 
 from census_quality import (
     format_compact_output,
+    format_consolidated_output,
     format_text_output,
-    run_quality_check,
+    run_all_quality_checks,
 )
+from census_quality.cache import default_cache_path
 
 # Standard population schedule years
 ALL_CENSUS_YEARS: list[int | str] = [
@@ -81,6 +83,11 @@ Examples:
 
   All years with media check:
     %(prog)s all --check-media --format compact
+
+  Years are checked in parallel, and per-source results are cached next to
+  the database so re-runs only re-validate sources changed since last run:
+    %(prog)s all --jobs 4
+    %(prog)s all --no-cache
 """,
     )
 
@@ -122,6 +129,26 @@ Examples:
         help="Validate media files: check linked files exist, find orphaned files (slower)",
     )
 
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for multi-year checks (default: one per year, up to CPU count)",
+    )
+
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=None,
+        help="Per-source result cache file (default: <db>.quality-cache.sqlite)",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-validate every source instead of reusing cached results",
+    )
+
     args = parser.parse_args()
 
     # Parse years - handle "all" keyword and special schedule types
@@ -178,25 +205,36 @@ Examples:
     # Show detailed tables when --detailed or --include-all-issues is used
     show_detailed = args.detailed or args.include_all_issues
 
-    # Run check for each year
-    all_results = []
-    for year in years_to_check:
-        result = run_quality_check(args.db, year, args.include_all_issues, args.check_media)
+    cache_path = None if args.no_cache else (args.cache or default_cache_path(args.db))
 
-        if "error" in result:
-            print(f"Error for {year}: {result['error']}", file=sys.stderr)
-            continue
+    # Run checks (years in parallel) and merge results
+    consolidated = run_all_quality_checks(
+        args.db,
+        years_to_check,
+        args.include_all_issues,
+        args.check_media,
+        cache_path=cache_path,
+        workers=args.jobs,
+    )
 
-        all_results.append(result)
+    for result in consolidated["errors"]:
+        print(f"Error for {result.get('year')}: {result['error']}", file=sys.stderr)
 
-        if args.format == "json":
-            print(json.dumps(result, indent=2))
-        elif args.format == "compact":
-            print(format_compact_output(result, show_detailed))
+    if args.format == "json":
+        if len(years_to_check) == 1 and consolidated["years"]:
+            print(json.dumps(consolidated["years"][0], indent=2))
         else:
-            print(format_text_output(result, show_detailed))
+            print(json.dumps(consolidated, indent=2))
+    else:
+        for result in consolidated["years"]:
+            if args.format == "compact":
+                print(format_compact_output(result, show_detailed))
+            else:
+                print(format_text_output(result, show_detailed))
+        if len(consolidated["years"]) > 1:
+            print(format_consolidated_output(consolidated))
 
-    return 0 if all_results else 1
+    return 0 if consolidated["years"] else 1
 
 
 if __name__ == "__main__":
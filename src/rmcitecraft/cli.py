@@ -4,7 +4,10 @@ This module provides the CLI commands for starting, stopping, and managing
 the RMCitecraft application.
 """
 
+import argparse
+import sqlite3
 import sys
+from pathlib import Path
 
 from loguru import logger
 
@@ -174,6 +177,519 @@ def cmd_serve() -> int:
         return 1
 
 
+def cmd_export(flags: list[str]) -> int:
+    """Export extracted census data from census.db to a file.
+
+    Args:
+        flags: Command arguments (output path, format and filters)
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    parser = argparse.ArgumentParser(
+        prog="rmcitecraft export",
+        description="Stream census.db to CSV, JSONL or Parquet (one row per person).",
+    )
+    parser.add_argument("output", type=Path, help="Output file (.csv, .jsonl or .parquet)")
+    parser.add_argument(
+        "--format", dest="fmt", choices=["csv", "jsonl", "parquet"],
+        help="Output format (default: from the output file extension)",
+    )
+    parser.add_argument("--year", type=int, help="Census year")
+    parser.add_argument("--state", help="State name (exact match)")
+    parser.add_argument("--county", help="County name (exact match)")
+    parser.add_argument("--batch", type=int, help="Extraction batch ID")
+    parser.add_argument("--db", type=Path, help="Path to census.db")
+    parser.add_argument("--chunk-size", type=int, default=500, help="Rows per fetch")
+
+    try:
+        options = parser.parse_args(flags)
+    except SystemExit as e:
+        return int(e.code or 0)
+
+    from rmcitecraft.services.census_export import CensusExporter, CensusExportFilter
+
+    db_path = options.db
+    if db_path is None:
+        from rmcitecraft.database.census_extraction_db import CENSUS_DB_PATH
+
+        db_path = CENSUS_DB_PATH
+    if not db_path.exists():
+        print(f"✗ Census database not found: {db_path}")
+        return 1
+
+    filters = CensusExportFilter(
+        census_year=options.year,
+        state=options.state,
+        county=options.county,
+        batch_id=options.batch,
+    )
+    exporter = CensusExporter(db_path, chunk_size=options.chunk_size)
+
+    try:
+        count = exporter.export(options.output, fmt=options.fmt, filters=filters)
+    except (ValueError, RuntimeError) as e:
+        print(f"✗ Export failed: {e}")
+        return 1
+
+    print(f"✓ Exported {count} persons to {options.output}")
+    return 0
+
+
+def cmd_format_citations(flags: list[str]) -> int:
+    """Format all census citations for a year, as a dry run or applied.
+
+    Args:
+        flags: Command arguments (census year and options)
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    parser = argparse.ArgumentParser(
+        prog="rmcitecraft format-citations",
+        description=(
+            "Reformat every census citation for a year. Prints a diff report; "
+            "pass --apply to write all changes in one transaction."
+        ),
+    )
+    parser.add_argument("year", type=int, help="Census year")
+    parser.add_argument("--apply", action="store_true", help="Write changes to the database")
+    parser.add_argument(
+        "--all", dest="include_processed", action="store_true",
+        help="Also reformat citations that are already processed",
+    )
+    parser.add_argument("--db", help="Path to RootsMagic database (default: from config)")
+
+    try:
+        options = parser.parse_args(flags)
+    except SystemExit as e:
+        return int(e.code or 0)
+
+    from rmcitecraft.repositories.database import DatabaseConnection
+    from rmcitecraft.services.bulk_citation_formatter import BulkCitationFormatter
+
+    try:
+        db = DatabaseConnection(options.db)
+        conn = db.connect(read_only=not options.apply)
+    except (FileNotFoundError, sqlite3.Error) as e:
+        print(f"✗ Cannot open database: {e}")
+        return 1
+
+    try:
+        bulk = BulkCitationFormatter(conn)
+        report = bulk.plan(options.year, include_processed=options.include_processed)
+        print(report.to_text())
+        if options.apply:
+            count = bulk.apply(report)
+            print(f"✓ Updated {count} citations")
+    except sqlite3.Error as e:
+        print(f"✗ Update failed: {e}")
+        return 1
+    finally:
+        db.close()
+
+    return 0
+
+
+def cmd_llm_stats(flags: list[str]) -> int:
+    """Print LLM latency and token usage per model and census year.
+
+    Args:
+        flags: Command arguments (time window and database path)
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    parser = argparse.ArgumentParser(
+        prog="rmcitecraft llm-stats",
+        description="Summarize recorded LLM calls: p50/p95 latency and token totals.",
+    )
+    parser.add_argument("--days", type=float, help="Only include the last N days")
+    parser.add_argument("--db", type=Path, help="Path to llm_telemetry.db")
+    parser.add_argument(
+        "--routing", action="store_true",
+        help="Show model cascade acceptance rates instead of latency",
+    )
+
+    try:
+        options = parser.parse_args(flags)
+    except SystemExit as e:
+        return int(e.code or 0)
+
+    from datetime import datetime, timedelta
+
+    from rmcitecraft.llm.telemetry import LLMTelemetryStore, get_telemetry_store
+
+    try:
+        store = LLMTelemetryStore(options.db) if options.db else get_telemetry_store()
+        if options.routing:
+            return _print_routing_summary(store.routing_summary())
+        since = datetime.now() - timedelta(days=options.days) if options.days else None
+        summaries = store.summarize(since=since)
+    except sqlite3.Error as e:
+        print(f"✗ Cannot read telemetry: {e}")
+        return 1
+
+    if not summaries:
+        print("No LLM calls recorded")
+        return 0
+
+    def fmt_seconds(value: float | None) -> str:
+        return f"{value:.1f}s" if value is not None else "-"
+
+    print(
+        f"{'Model':<32} {'Year':>5} {'Calls':>6} {'Errors':>6} {'p50':>7} {'p95':>7} "
+        f"{'In tok':>10} {'Out tok':>9} {'Cached':>6}"
+    )
+    for s in summaries:
+        print(
+            f"{s.model[:32]:<32} {s.census_year or '-':>5} {s.calls:>6} {s.errors:>6} "
+            f"{fmt_seconds(s.p50_seconds):>7} {fmt_seconds(s.p95_seconds):>7} "
+            f"{s.input_tokens:>10,} {s.output_tokens:>9,} {s.cache_hit_rate:>6.0%}"
+        )
+    return 0
+
+
+def _print_routing_summary(summaries: list) -> int:
+    """Print model cascade outcomes per model and census year."""
+    if not summaries:
+        print("No model cascade decisions recorded")
+        return 0
+
+    print(
+        f"{'Model':<32} {'Year':>5} {'Tries':>6} {'Kept':>6} {'Escal.':>6} "
+        f"{'Failed':>6} {'Kept %':>7} {'Warn/try':>8}"
+    )
+    for s in summaries:
+        print(
+            f"{s.model[:32]:<32} {s.census_year or '-':>5} {s.attempts:>6} {s.accepted:>6} "
+            f"{s.escalated:>6} {s.failed:>6} {s.acceptance_rate:>7.0%} {s.mean_warnings:>8.1f}"
+        )
+    return 0
+
+
+def cmd_transcribe(flags: list[str]) -> int:
+    """Run a census transcription batch without the UI.
+
+    Progress is written to stdout as JSON lines (one object per event);
+    logs go to stderr.
+
+    Args:
+        flags: Command arguments (queue filters, concurrency, resume session)
+
+    Returns:
+        Exit code (0 for success, 1 for error or lost browser connection)
+    """
+    parser = argparse.ArgumentParser(
+        prog="rmcitecraft transcribe",
+        description="Transcribe census sources from FamilySearch into census.db, headless.",
+    )
+    parser.add_argument("--year", type=int, help="Census year to queue (default: all)")
+    parser.add_argument("--state", help="Only queue sources for this state")
+    parser.add_argument(
+        "--sort", choices=["location", "name"], default="location",
+        help="Queue order (default: location)",
+    )
+    parser.add_argument("--limit", type=int, help="Queue at most N sources")
+    parser.add_argument(
+        "--concurrency", type=int, default=1,
+        help="Items in flight at once, each in its own browser tab (default: 1)",
+    )
+    parser.add_argument("--resume", metavar="SESSION_ID", help="Resume an existing session")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Build the queue and report its size only"
+    )
+
+    try:
+        options = parser.parse_args(flags)
+    except SystemExit as e:
+        return int(e.code or 0)
+
+    import asyncio
+
+    return asyncio.run(_run_transcription(options))
+
+
+def _emit(event: str, **fields) -> None:
+    """Write one JSON-lines progress event to stdout."""
+    import json
+
+    print(json.dumps({"event": event, **fields}, default=str), flush=True)
+
+
+async def _run_transcription(options: argparse.Namespace) -> int:
+    """Build or resume a transcription session and process it."""
+    from rmcitecraft.services.census_transcription_batch import (
+        CensusTranscriptionBatchService,
+    )
+
+    service = CensusTranscriptionBatchService()
+
+    if options.resume:
+        session_id = options.resume
+    else:
+        queue, stats = await service.build_transcription_queue(
+            census_year=options.year, state_filter=options.state, sort_by=options.sort
+        )
+        if options.limit is not None:
+            queue = queue[: options.limit]
+        _emit(
+            "queue",
+            items=len(queue),
+            total_sources=stats.total_sources,
+            already_processed=stats.already_processed,
+        )
+        if options.dry_run or not queue:
+            return 0
+        session_id = service.create_session_from_queue(queue, options.year, options.state)
+
+    _emit("session", session_id=session_id, resumed=bool(options.resume))
+
+    def on_item_done(item, item_result: dict) -> None:
+        if item_result.get("success"):
+            status = "completed"
+        elif item_result.get("skipped"):
+            status = "skipped"
+        else:
+            status = "error"
+        _emit(
+            "item",
+            item_id=item.item_id,
+            name=item.person_name,
+            census_year=item.census_year,
+            status=status,
+            error=item_result.get("error"),
+            edge_warning=item_result.get("edge_message") or None,
+        )
+
+    try:
+        if options.resume:
+            # Refuses sessions that are missing, completed or failed
+            result = await service.resume_session(
+                session_id, concurrency=options.concurrency, on_item_done=on_item_done
+            )
+        else:
+            result = await service.process_batch(
+                session_id, concurrency=options.concurrency, on_item_done=on_item_done
+            )
+    except ValueError as e:
+        _emit("error", message=str(e))
+        return 1
+    finally:
+        await service.extractor.disconnect()
+
+    _emit(
+        "done",
+        session_id=session_id,
+        total=result.total_items,
+        completed=result.completed,
+        errors=result.errors,
+        skipped=result.skipped,
+        edge_warnings=result.edge_warnings,
+        connection_error=result.connection_error_message,
+    )
+    return 1 if result.connection_error else 0
+
+
+def _parse_import_times(output: str) -> list[tuple[str, int, int]]:
+    """Parse `python -X importtime` output.
+
+    Args:
+        output: stderr of the interpreter run with -X importtime
+
+    Returns:
+        (module, self_us, cumulative_us) tuples in import order
+    """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # Column header
+        timings.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return timings
+
+
+def cmd_import_time(flags: list[str]) -> int:
+    """Report the slowest imports when loading a module in a fresh interpreter.
+
+    Args:
+        flags: Command arguments (module and number of rows)
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    parser = argparse.ArgumentParser(
+        prog="rmcitecraft import-time",
+        description="Show which imports dominate startup time.",
+    )
+    parser.add_argument(
+        "module", nargs="?", default="rmcitecraft.main",
+        help="Module to import (default: rmcitecraft.main)",
+    )
+    parser.add_argument("--top", type=int, default=20, help="Rows to show (default: 20)")
+
+    try:
+        options = parser.parse_args(flags)
+    except SystemExit as e:
+        return int(e.code or 0)
+
+    import subprocess
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {options.module}"],
+        capture_output=True,
+        text=True,
+    )
+    timings = _parse_import_times(result.stderr)
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        print(f"✗ Cannot import {options.module}: {error[0]}")
+        return 1
+
+    total = next((cumulative for name, _, cumulative in timings if name == options.module), 0)
+    print(f"Importing {options.module}: {total / 1000:.0f} ms ({len(timings)} modules)")
+    print()
+    print(f"{'Self ms':>8} {'Total ms':>9}  Module")
+    for name, self_us, cumulative_us in sorted(timings, key=lambda t: t[1], reverse=True)[
+        : options.top
+    ]:
+        print(f"{self_us / 1000:>8.1f} {cumulative_us / 1000:>9.1f}  {name}")
+    return 0
+
+
+def cmd_generate_tree(flags: list[str]) -> int:
+    """Generate a synthetic RootsMagic database for scale testing.
+
+    Args:
+        flags: Command arguments (output path, size and seed)
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    parser = argparse.ArgumentParser(
+        prog="rmcitecraft generate-tree",
+        description="Write a seeded synthetic .rmtree (and matching census.db) for scale tests.",
+    )
+    parser.add_argument("output", type=Path, help="Output .rmtree file")
+    parser.add_argument("--persons", type=int, default=10_000, help="Persons (default: 10000)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--census-db", type=Path, help="Also write a matching census.db here")
+    parser.add_argument(
+        "--extracted", type=float, default=0.5,
+        help="Share of census households already in census.db (default: 0.5)",
+    )
+
+    try:
+        options = parser.parse_args(flags)
+    except SystemExit as e:
+        return int(e.code or 0)
+
+    from rmcitecraft.database.synthetic_tree import SyntheticTreeConfig, generate_synthetic_tree
+
+    config = SyntheticTreeConfig(
+        persons=options.persons, seed=options.seed, extracted_rate=options.extracted
+    )
+    try:
+        stats = generate_synthetic_tree(options.output, config, census_db_path=options.census_db)
+    except (FileExistsError, sqlite3.Error) as e:
+        print(f"✗ Cannot generate tree: {e}")
+        return 1
+
+    print(
+        f"✓ Wrote {options.output}: {stats.persons} persons, {stats.households} households, "
+        f"{stats.sources} sources, {stats.urls} Find a Grave links, {stats.media} media"
+    )
+    if options.census_db:
+        print(f"✓ Wrote {options.census_db}: {stats.census_persons} extracted persons")
+    return 0
+
+
+def cmd_stage_timings(flags: list[str]) -> int:
+    """Print per-stage p50/p95 batch timings, or export a session trace.
+
+    Args:
+        flags: Command arguments (session, grouping, trace output, database path)
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    parser = argparse.ArgumentParser(
+        prog="rmcitecraft stage-timings",
+        description="Summarize recorded batch stage timings: p50/p95 per stage and slowest items.",
+    )
+    parser.add_argument("--session", help="Only include this batch session")
+    parser.add_argument(
+        "--by", choices=["hour", "session"], default="hour",
+        help="Bucket stage timings by hour or by session (default: hour)",
+    )
+    parser.add_argument("--slowest", type=int, default=10, help="Slowest items to list")
+    parser.add_argument(
+        "--trace", type=Path,
+        help="Write the session's spans as Chrome trace JSON (opens in speedscope)",
+    )
+    parser.add_argument("--db", type=Path, help="Path to batch_state.db")
+
+    try:
+        options = parser.parse_args(flags)
+    except SystemExit as e:
+        return int(e.code or 0)
+
+    import json
+
+    from rmcitecraft.database.batch_state_repository import FindAGraveBatchStateRepository
+    from rmcitecraft.monitoring.stage_report import (
+        item_timings,
+        stage_percentiles,
+        to_chrome_trace,
+    )
+
+    if options.trace and not options.session:
+        print("✗ --trace needs --session")
+        return 1
+
+    try:
+        repo = FindAGraveBatchStateRepository(
+            str(options.db) if options.db else "~/.rmcitecraft/batch_state.db"
+        )
+        spans = repo.get_stage_spans(session_id=options.session)
+    except sqlite3.Error as e:
+        print(f"✗ Cannot read stage timings: {e}")
+        return 1
+
+    if not spans:
+        print("No stage timings recorded")
+        return 0
+
+    if options.trace:
+        options.trace.write_text(json.dumps(to_chrome_trace(spans, name=options.session)))
+        print(f"✓ Wrote {len(spans)} spans to {options.trace}")
+        return 0
+
+    def fmt_ms(value: float | None) -> str:
+        return f"{value:,.0f}" if value is not None else "-"
+
+    print(f"{options.by.title():<22} {'Stage':<15} {'Items':>6} {'Fail':>5} {'p50 ms':>9} {'p95 ms':>9}")
+    for s in stage_percentiles(spans, by=options.by):
+        print(
+            f"{s.bucket[:22]:<22} {s.stage:<15} {s.items:>6} {s.failures:>5} "
+            f"{fmt_ms(s.p50_ms):>9} {fmt_ms(s.p95_ms):>9}"
+        )
+
+    if options.slowest > 0:
+        print()
+        print(f"{'Slowest items':<32} {'Session':<28} {'Total s':>8}  Slowest stage")
+        for item in item_timings(spans)[:options.slowest]:
+            name = item.item_name or f"item {item.item_id}"
+            stage = item.slowest_stage
+            print(
+                f"{name[:32]:<32} {(item.session_id or '-')[:28]:<28} "
+                f"{item.total_ms / 1000:>8.1f}  {stage} ({item.stages[stage] / 1000:.1f}s)"
+            )
+    return 0
+
+
 def print_help() -> None:
     """Print CLI help message."""
     print_version()
@@ -187,6 +703,13 @@ def print_help() -> None:
     print("  restart     Restart RMCitecraft (stop + start in background)")
     print("  status      Show current status and version information")
     print("  version     Show version information")
+    print("  export      Export census.db to CSV/JSONL/Parquet (export --help for options)")
+    print("  format-citations YEAR  Reformat a census year's citations (dry run unless --apply)")
+    print("  llm-stats   Show LLM latency and token usage per model and census year")
+    print("  transcribe  Run a census transcription batch headless (transcribe --help)")
+    print("  import-time [MODULE]  Show the slowest imports at startup")
+    print("  generate-tree OUT  Write a synthetic RootsMagic database for scale tests")
+    print("  stage-timings  Show batch stage p50/p95 timings or export a session trace")
     print("  help        Show this help message")
     print()
     print("Examples:")
@@ -194,6 +717,16 @@ def print_help() -> None:
     print("  rmcitecraft start -d        # Start in background")
     print("  rmcitecraft status          # Check if running")
     print("  rmcitecraft stop            # Stop the application")
+    print("  rmcitecraft export out.csv --year 1950 --state Ohio")
+    print("  rmcitecraft format-citations 1940 --apply")
+    print("  rmcitecraft llm-stats --days 7")
+    print("  rmcitecraft llm-stats --routing")
+    print("  rmcitecraft transcribe --year 1950 --concurrency 2 > progress.jsonl")
+    print("  rmcitecraft transcribe --resume transcription_1950_20250101_120000")
+    print("  rmcitecraft import-time --top 10")
+    print("  rmcitecraft generate-tree big.rmtree --persons 500000 --census-db big-census.db")
+    print("  rmcitecraft stage-timings --by session --slowest 20")
+    print("  rmcitecraft stage-timings --session batch_1735689600 --trace run.json")
     print()
 
 
@@ -232,6 +765,20 @@ def cli_main(args: list[str] | None = None) -> int:
     elif command == "version":
         print_version()
         return 0
+    elif command == "export":
+        return cmd_export(flags)
+    elif command == "format-citations":
+        return cmd_format_citations(flags)
+    elif command == "llm-stats":
+        return cmd_llm_stats(flags)
+    elif command == "transcribe":
+        return cmd_transcribe(flags)
+    elif command == "import-time":
+        return cmd_import_time(flags)
+    elif command == "generate-tree":
+        return cmd_generate_tree(flags)
+    elif command == "stage-timings":
+        return cmd_stage_timings(flags)
     elif command == "serve":
         # Internal command for daemon mode
         return cmd_serve()
@@ -113,6 +113,12 @@ class Config(BaseSettings):
         default=True,
         description="Enable automatic page crash detection and recovery",
     )
+    findagrave_extraction_tabs: int = Field(
+        default=3,
+        ge=1,
+        le=8,
+        description="Browser tabs extracting Find a Grave memorials concurrently",
+    )
 
     # Census Batch Processing Settings
     census_base_timeout_seconds: int = Field(
@@ -158,6 +164,68 @@ class Config(BaseSettings):
         description="Enable automatic page crash detection and recovery",
     )
 
+    # Shared outbound rate limits and circuit breaker
+    familysearch_requests_per_minute: float = Field(
+        default=20, gt=0, description="FamilySearch page loads per minute across all workers"
+    )
+    findagrave_requests_per_minute: float = Field(
+        default=30, gt=0, description="Find a Grave page loads per minute across all workers"
+    )
+    llm_requests_per_minute: float = Field(
+        default=60, gt=0, description="LLM provider requests per minute across all workers"
+    )
+    outbound_failure_threshold: int = Field(
+        default=5,
+        ge=1,
+        description="Consecutive failures before calls to a target are paused",
+    )
+    outbound_circuit_reset_seconds: int = Field(
+        default=120,
+        ge=1,
+        description="Seconds a paused target waits before a trial request",
+    )
+
+    # Stage timing spans
+    stage_spans_enabled: bool = Field(
+        default=True,
+        description="Record per-stage timings of batch items in performance_metrics",
+    )
+
+    # Census transcription model cascade
+    census_cascade_models: str = Field(
+        default="",
+        description=(
+            "Comma-separated vision models for census transcription, cheapest first; "
+            "later models are used only when earlier results fail validation"
+        ),
+    )
+    census_cascade_max_warnings: int = Field(
+        default=0,
+        ge=0,
+        description="Validation warnings tolerated before escalating to the next model",
+    )
+
+    # Census image viewer tile cache
+    image_tile_cache_dir: str = Field(
+        default="~/.rmcitecraft/image_tiles",
+        description="Directory for cached census image tile pyramids",
+    )
+    image_tile_cache_max_mb: int = Field(
+        default=2048,
+        ge=64,
+        description="Maximum tile cache size (MB); least recently viewed images are evicted",
+    )
+
+    # LLM telemetry
+    llm_telemetry_db_path: str = Field(
+        default="~/.rmcitecraft/llm_telemetry.db",
+        description="SQLite database of per-request LLM latency, token and status records",
+    )
+    llm_telemetry_store_bodies: bool = Field(
+        default=False,
+        description="Also keep full prompts and responses as compressed blobs",
+    )
+
     @field_validator("rm_database_path", "sqlite_icu_extension")
     @classmethod
     def validate_path_exists(cls, v: str) -> str:
@@ -182,7 +250,8 @@ class Config(BaseSettings):
 
     @field_validator(
         "download_folder", "rm_media_root_directory",
-        "findagrave_state_db_path", "census_state_db_path"
+        "findagrave_state_db_path", "census_state_db_path", "image_tile_cache_dir",
+        "llm_telemetry_db_path",
     )
     @classmethod
     def expand_user_path(cls, v: str) -> str:
@@ -11,8 +11,6 @@ from pathlib import Path
 
 from loguru import logger
 
-from rmcitecraft.config import get_config
-
 __all__ = ["is_running", "get_pid", "start_daemon", "stop_daemon", "get_status"]
 
 
@@ -203,6 +201,8 @@ def get_status() -> dict[str, any]:
         - config_path: str
         - database_path: str
     """
+    from rmcitecraft.config import get_config
+
     config = get_config()
     pid = get_pid()
 
@@ -8,29 +8,20 @@ import sqlite3
 from pathlib import Path
 from typing import Any
 
+from rmcitecraft.database.connection import connect_rmtree
+
 
 def _get_db_connection(db_path: str) -> sqlite3.Connection:
-    """Create database connection with ICU extension loaded.
+    """Create read-only database connection with RMNOCASE collation.
 
     Args:
         db_path: Path to RootsMagic database
 
     Returns:
-        Connection with ICU extension and RMNOCASE collation
+        Connection with RMNOCASE collation and sqlite3.Row rows
     """
-    conn = sqlite3.connect(db_path)
+    conn = connect_rmtree(db_path, read_only=True)
     conn.row_factory = sqlite3.Row
-
-    # Load ICU extension for RMNOCASE collation
-    conn.enable_load_extension(True)
-    try:
-        conn.load_extension('./sqlite-extension/icu.dylib')
-        conn.execute(
-            "SELECT icu_load_collation('en_US@colStrength=primary;caseLevel=off;normalization=on','RMNOCASE')"
-        )
-    finally:
-        conn.enable_load_extension(False)
-
     return conn
 
 
@@ -16,6 +16,8 @@ from typing import Any
 
 from loguru import logger
 
+from rmcitecraft.monitoring.spans import STAGES, Span
+
 
 class FindAGraveBatchStateRepository:
     """Repository for Find a Grave batch processing state persistence."""
@@ -80,6 +82,7 @@ class FindAGraveBatchStateRepository:
             "002_create_census_batch_tables.sql",
             "003_schema_improvements.sql",
             "004_create_census_transcription_tables.sql",
+            "006_add_stage_spans.sql",
         ]
 
         for migration_file_name in migrations:
@@ -628,6 +631,24 @@ class FindAGraveBatchStateRepository:
             """, (self._now_iso(), operation, duration_ms, success, session_id))
             conn.commit()
 
+    def record_spans(self, spans: list[Span]) -> None:
+        """Record stage timing spans in one transaction.
+
+        Args:
+            spans: Spans buffered by a SpanRecorder
+        """
+        with self._get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO performance_metrics (
+                    timestamp, operation, duration_ms, success, session_id, item_id, batch_type
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (s.started_at, s.stage, s.duration_ms, s.success, s.session_id, s.item_id,
+                 s.batch_type or 'findagrave')
+                for s in spans
+            ])
+            conn.commit()
+
     def get_recent_metrics(
         self,
         operation: str,
@@ -701,6 +722,52 @@ class FindAGraveBatchStateRepository:
 
             return metrics
 
+    def get_stage_spans(
+        self,
+        session_id: str | None = None,
+        since: str | None = None,
+        batch_type: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get stage timing spans with the name of the item they timed.
+
+        Args:
+            session_id: Optional session identifier (None = all sessions)
+            since: Optional ISO timestamp; only spans started at or after it
+            batch_type: Optional batch type ('findagrave', 'census_transcription')
+
+        Returns:
+            Span rows (id, timestamp, operation, duration_ms, success,
+            session_id, item_id, batch_type, item_name) ordered by start time
+        """
+        query = f"""
+            SELECT
+                pm.id, pm.timestamp, pm.operation, pm.duration_ms, pm.success,
+                pm.session_id, pm.item_id, pm.batch_type,
+                COALESCE(bi.person_name, ti.person_name) as item_name
+            FROM performance_metrics pm
+            LEFT JOIN batch_items bi
+                ON pm.batch_type = 'findagrave' AND bi.id = pm.item_id
+            LEFT JOIN census_transcription_items ti
+                ON pm.batch_type = 'census_transcription' AND ti.item_id = pm.item_id
+            WHERE pm.operation IN ({', '.join('?' for _ in STAGES)})
+        """
+        params: list[Any] = list(STAGES)
+        if session_id:
+            query += " AND pm.session_id = ?"
+            params.append(session_id)
+        if since:
+            query += " AND pm.timestamp >= ?"
+            params.append(since)
+        if batch_type:
+            query += " AND pm.batch_type = ?"
+            params.append(batch_type)
+        query += " ORDER BY pm.timestamp"
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            return [dict(row) for row in cursor.fetchall()]
+
     # =========================================================================
     # Dashboard Query Operations
     # =========================================================================
@@ -14,6 +14,7 @@ Architecture:
 - Optional per-field quality assessment
 """
 
+import re
 import sqlite3
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -22,6 +23,15 @@ from typing import Any
 
 from loguru import logger
 
+from rmcitecraft.database.census_field_projection import (
+    ensure_projection,
+    get_projection_columns,
+    projection_exists,
+    projection_table_name,
+    refresh_projection,
+)
+from rmcitecraft.services.census.schema_registry import CensusSchemaRegistry
+
 # Database location
 CENSUS_DB_PATH = Path.home() / ".rmcitecraft" / "census.db"
 
@@ -572,6 +582,175 @@ CREATE TABLE IF NOT EXISTS schema_version (
 INSERT OR IGNORE INTO schema_version (version) VALUES (3);
 """
 
+# 1950 sample-line fields (columns 21-33). A person is a sample-line person if
+# any of these has a value; sample lines vary by form version, so line numbers
+# cannot be used.
+SAMPLE_LINE_FIELDS_1950 = (
+    "residence_1949_same_house", "residence_1949_on_farm",
+    "residence_1949_same_county", "residence_1949_different_location",
+    "highest_grade_attended", "completed_grade", "school_attendance",
+    "weeks_looking_for_work", "weeks_worked_1949",
+    "income_wages_1949", "income_self_employment_1949", "income_other_1949",
+    "veteran_status", "veteran_ww1", "veteran_ww2",
+)
+
+# Extended (EAV) fields folded into the full-text search index alongside the
+# core name/birthplace/occupation columns.
+SEARCH_INDEX_EAV_FIELDS = ("street_name", "event_place", "mother_tongue")
+
+_SEARCH_EAV_IN = ", ".join(f"'{name}'" for name in SEARCH_INDEX_EAV_FIELDS)
+_SEARCH_EAV_SELECT = f"""
+    SELECT COALESCE(group_concat(field_value, ' '), '') FROM census_person_field
+    WHERE person_id = {{pid}} AND field_name IN ({_SEARCH_EAV_IN})
+"""
+
+SEARCH_INDEX_SQL = f"""
+-- Full-text search over person names, birthplace, occupation and selected
+-- extended fields. rowid = census_person.person_id. The phonetic column holds
+-- Soundex keys ("s"/"g" + code for surname/given tokens). The triggers are
+-- plain SQL so any connection can write census_person: they queue new or
+-- renamed persons in census_phonetic_pending and the repository fills in
+-- their keys (see census_phonetic) before the next write returns or phonetic
+-- search runs.
+CREATE VIRTUAL TABLE IF NOT EXISTS census_person_fts USING fts5(
+    full_name,
+    given_name,
+    surname,
+    birthplace,
+    occupation,
+    extra_fields,
+    phonetic,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+
+CREATE TABLE IF NOT EXISTS census_phonetic_pending (
+    person_id INTEGER PRIMARY KEY
+);
+
+-- Earlier versions of these triggers called an app-registered function
+DROP TRIGGER IF EXISTS census_person_fts_ai;
+DROP TRIGGER IF EXISTS census_person_fts_au;
+DROP TRIGGER IF EXISTS census_person_fts_ad;
+
+CREATE TRIGGER census_person_fts_ai AFTER INSERT ON census_person
+BEGIN
+    INSERT INTO census_person_fts (
+        rowid, full_name, given_name, surname, birthplace, occupation, extra_fields, phonetic
+    ) VALUES (
+        new.person_id, new.full_name, new.given_name, new.surname, new.birthplace,
+        new.occupation, '', ''
+    );
+    INSERT OR IGNORE INTO census_phonetic_pending (person_id) VALUES (new.person_id);
+END;
+
+CREATE TRIGGER census_person_fts_au AFTER UPDATE OF
+    full_name, given_name, surname, birthplace, occupation ON census_person
+BEGIN
+    UPDATE census_person_fts SET
+        full_name = new.full_name,
+        given_name = new.given_name,
+        surname = new.surname,
+        birthplace = new.birthplace,
+        occupation = new.occupation
+    WHERE rowid = new.person_id;
+    INSERT OR IGNORE INTO census_phonetic_pending (person_id)
+    SELECT new.person_id
+    WHERE new.given_name IS NOT old.given_name OR new.surname IS NOT old.surname;
+END;
+
+CREATE TRIGGER census_person_fts_ad AFTER DELETE ON census_person
+BEGIN
+    DELETE FROM census_person_fts WHERE rowid = old.person_id;
+    DELETE FROM census_phonetic_pending WHERE person_id = old.person_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS census_person_field_fts_ai AFTER INSERT ON census_person_field
+WHEN new.field_name IN ({_SEARCH_EAV_IN})
+BEGIN
+    UPDATE census_person_fts SET extra_fields = ({_SEARCH_EAV_SELECT.format(pid="new.person_id")})
+    WHERE rowid = new.person_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS census_person_field_fts_au AFTER UPDATE ON census_person_field
+WHEN new.field_name IN ({_SEARCH_EAV_IN}) OR old.field_name IN ({_SEARCH_EAV_IN})
+BEGIN
+    UPDATE census_person_fts SET extra_fields = ({_SEARCH_EAV_SELECT.format(pid="old.person_id")})
+    WHERE rowid = old.person_id;
+    UPDATE census_person_fts SET extra_fields = ({_SEARCH_EAV_SELECT.format(pid="new.person_id")})
+    WHERE rowid = new.person_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS census_person_field_fts_ad AFTER DELETE ON census_person_field
+WHEN old.field_name IN ({_SEARCH_EAV_IN})
+BEGIN
+    UPDATE census_person_fts SET extra_fields = ({_SEARCH_EAV_SELECT.format(pid="old.person_id")})
+    WHERE rowid = old.person_id;
+END;
+
+INSERT OR IGNORE INTO schema_version (version) VALUES (4);
+"""
+
+
+# =============================================================================
+# Search Helpers
+# =============================================================================
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys("BFPV", "1"),
+    **dict.fromkeys("CGJKQSXZ", "2"),
+    **dict.fromkeys("DT", "3"),
+    "L": "4",
+    **dict.fromkeys("MN", "5"),
+    "R": "6",
+}
+
+_SEARCH_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def soundex(word: str) -> str:
+    """Return the American Soundex code for a word (e.g. "Iams" -> "I520").
+
+    Returns an empty string if the word contains no letters.
+    """
+    letters = [c for c in word.upper() if "A" <= c <= "Z"]
+    if not letters:
+        return ""
+
+    first = letters[0]
+    code = first
+    last_digit = _SOUNDEX_CODES.get(first, "")
+    for char in letters[1:]:
+        digit = _SOUNDEX_CODES.get(char, "")
+        if digit and digit != last_digit:
+            code += digit
+            if len(code) == 4:
+                break
+        # H and W do not separate letters with the same code; vowels do
+        if char not in "HW":
+            last_digit = digit
+    return code.ljust(4, "0")
+
+
+def census_phonetic(given_name: str | None, surname: str | None) -> str:
+    """Build the phonetic column value for the search index.
+
+    Each surname token becomes "s<code>" and each given-name token "g<code>",
+    so phonetic queries can still be restricted to one name part.
+    """
+    keys = []
+    for prefix, value in (("s", surname), ("g", given_name)):
+        for token in _SEARCH_TOKEN_RE.findall(value or ""):
+            code = soundex(token)
+            if code:
+                keys.append(f"{prefix}{code}")
+    return " ".join(keys)
+
+
+def _fts_terms(text: str, prefix: bool) -> list[str]:
+    """Split user input into quoted FTS5 terms (optionally prefix-matching)."""
+    suffix = "*" if prefix else ""
+    return [f'"{token}"{suffix}' for token in _SEARCH_TOKEN_RE.findall(text)]
+
 
 # =============================================================================
 # Repository Class
@@ -584,6 +763,7 @@ class CensusExtractionRepository:
     def __init__(self, db_path: Path | None = None):
         """Initialize repository with database path."""
         self.db_path = db_path or CENSUS_DB_PATH
+        self._projected_years: set[int] = set()
         self._ensure_db_exists()
 
     def _ensure_db_exists(self) -> None:
@@ -592,8 +772,31 @@ class CensusExtractionRepository:
 
         with sqlite3.connect(self.db_path) as conn:
             conn.executescript(SCHEMA_SQL)
+
+            has_search_index = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'census_person_fts'"
+            ).fetchone()
+            conn.executescript(SEARCH_INDEX_SQL)
+            if not has_search_index:
+                # Existing database predating the search index: backfill once
+                self._populate_search_index(conn)
+            self._update_phonetic_keys(conn)
+
+            # Typed per-year projections for every year that already has data
+            years = conn.execute("SELECT DISTINCT census_year FROM census_page").fetchall()
+            for (year,) in years:
+                self._ensure_projection(conn, year)
+
             logger.info(f"Census extraction database initialized: {self.db_path}")
 
+    def _ensure_projection(self, conn: sqlite3.Connection, census_year: int) -> None:
+        """Create the typed field projection for a year if it doesn't exist yet."""
+        if census_year in self._projected_years:
+            return
+        if CensusSchemaRegistry.is_valid_year(census_year):
+            ensure_projection(conn, census_year)
+            self._projected_years.add(census_year)
+
     def _connect(self) -> sqlite3.Connection:
         """Get database connection."""
         conn = sqlite3.connect(self.db_path)
@@ -637,6 +840,7 @@ class CensusExtractionRepository:
     def insert_page(self, page: CensusPage) -> int:
         """Insert a census page record."""
         with self._connect() as conn:
+            self._ensure_projection(conn, page.census_year)
             cursor = conn.execute(
                 """
                 INSERT INTO census_page (
@@ -764,6 +968,7 @@ class CensusExtractionRepository:
                     1 if person.is_target_person else 0,
                 ),
             )
+            self._update_phonetic_keys(conn)
             return cursor.lastrowid
 
     def get_person_by_ark(self, ark: str) -> CensusPerson | None:
@@ -934,6 +1139,77 @@ class CensusExtractionRepository:
                 (new_person_id, field_id),
             )
 
+    def get_person_fields_for_page(
+        self, page_id: int, census_year: int | None = None
+    ) -> dict[int, dict[str, Any]]:
+        """Get extended fields for every person on a page in bulk.
+
+        Loads EAV rows for the whole page in one query (cast by field_type as
+        in get_person_fields). When census_year is given, values from the
+        year's typed projection replace the EAV text for projected fields;
+        values the projection could not convert keep their EAV text.
+
+        Args:
+            page_id: Census page ID
+            census_year: Census year of the page (enables the typed projection)
+
+        Returns:
+            Dict mapping person_id to {field_name: value}
+        """
+        fields: dict[int, dict[str, Any]] = {}
+
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT cpf.person_id, cpf.field_name, cpf.field_value, cpf.field_type
+                FROM census_person_field cpf
+                JOIN census_person cp ON cp.person_id = cpf.person_id
+                WHERE cp.page_id = ?
+                ORDER BY cpf.field_id
+                """,
+                (page_id,),
+            ).fetchall()
+            for row in rows:
+                value = row["field_value"]
+                if row["field_type"] == "integer":
+                    value = int(value) if value else None
+                elif row["field_type"] == "boolean":
+                    value = value == "1"
+                fields.setdefault(row["person_id"], {})[row["field_name"]] = value
+
+            if census_year and projection_exists(conn, census_year):
+                projected_names = [col.name for col in get_projection_columns(census_year)]
+                rows = conn.execute(
+                    f"""
+                    SELECT pf.* FROM {projection_table_name(census_year)} pf
+                    JOIN census_person cp ON cp.person_id = pf.person_id
+                    WHERE cp.page_id = ?
+                    """,
+                    (page_id,),
+                ).fetchall()
+                for row in rows:
+                    person_fields = fields.setdefault(row["person_id"], {})
+                    for name in projected_names:
+                        if row[name] is not None:
+                            person_fields[name] = row[name]
+
+        return fields
+
+    def rebuild_projection(self, census_year: int) -> int:
+        """Recompute a year's typed field projection from the EAV rows.
+
+        Returns:
+            Number of persons projected
+        """
+        with self._connect() as conn:
+            if not projection_exists(conn, census_year):
+                self._projected_years.discard(census_year)
+                self._ensure_projection(conn, census_year)
+            conn.execute(f"DELETE FROM {projection_table_name(census_year)}")
+            count = refresh_projection(conn, census_year)
+        logger.info(f"Rebuilt {projection_table_name(census_year)} ({count} persons)")
+        return count
+
     # -------------------------------------------------------------------------
     # Relationships
     # -------------------------------------------------------------------------
@@ -1232,28 +1508,35 @@ class CensusExtractionRepository:
         county: str | None = None,
         rmtree_person_id: int | None = None,
         limit: int = 100,
+        phonetic: bool = False,
     ) -> list[CensusPerson]:
         """Search for persons with optional filters.
 
+        Name filters use the full-text search index, matching each word of the
+        input as a prefix of a word in the name (e.g. "Iam" finds "Iams").
+
         Args:
-            surname: Filter by surname (partial match)
-            given_name: Filter by given name (partial match)
+            surname: Filter by surname (word prefix match)
+            given_name: Filter by given name (word prefix match)
             census_year: Filter by census year
             state: Filter by state
             county: Filter by county (partial match)
             rmtree_person_id: Filter by RootsMagic person ID (RIN)
             limit: Maximum results to return
+            phonetic: Match names by Soundex code instead of prefix
         """
         conditions = []
-        params = []
+        params: list[Any] = []
         joins = ["JOIN census_page pg ON cp.page_id = pg.page_id"]
 
-        if surname:
-            conditions.append("cp.surname LIKE ?")
-            params.append(f"%{surname}%")
-        if given_name:
-            conditions.append("cp.given_name LIKE ?")
-            params.append(f"%{given_name}%")
+        match_expr = self._build_name_match(surname, given_name, phonetic)
+        if match_expr:
+            joins.append("JOIN census_person_fts ON census_person_fts.rowid = cp.person_id")
+            conditions.append("census_person_fts MATCH ?")
+            params.append(match_expr)
+        elif surname or given_name:
+            # Input had no searchable characters - nothing can match
+            return []
         if census_year:
             conditions.append("pg.census_year = ?")
             params.append(census_year)
@@ -1272,6 +1555,8 @@ class CensusExtractionRepository:
         join_clause = " ".join(joins)
 
         with self._connect() as conn:
+            if phonetic:
+                self._update_phonetic_keys(conn)
             rows = conn.execute(
                 f"""
                 SELECT DISTINCT cp.* FROM census_person cp
@@ -1284,6 +1569,151 @@ class CensusExtractionRepository:
             ).fetchall()
             return [self._row_to_person(row) for row in rows]
 
+    def search_persons_ranked(
+        self,
+        query: str,
+        census_year: int | None = None,
+        state: str | None = None,
+        prefix: bool = True,
+        phonetic: bool = False,
+        limit: int = 100,
+    ) -> list[tuple[CensusPerson, float]]:
+        """Free-text search across names, birthplace, occupation and indexed fields.
+
+        Every word of the query must match (AND). Results are ordered by BM25
+        relevance, best first.
+
+        Args:
+            query: Free-text query (e.g. "John Iams Ohio farmer")
+            census_year: Filter by census year
+            state: Filter by state
+            prefix: Match query words as prefixes
+            phonetic: Also match words by Soundex code against either name part
+            limit: Maximum results to return
+
+        Returns:
+            List of (person, score) tuples; lower scores are more relevant
+        """
+        terms = _fts_terms(query, prefix)
+        if not terms:
+            return []
+
+        if phonetic:
+            groups = []
+            for term, token in zip(terms, _SEARCH_TOKEN_RE.findall(query), strict=True):
+                code = soundex(token).lower()
+                if code:
+                    term = f'({term} OR phonetic : ("s{code}" OR "g{code}"))'
+                groups.append(term)
+            match_expr = " AND ".join(groups)
+        else:
+            match_expr = " AND ".join(terms)
+
+        conditions = ["census_person_fts MATCH ?"]
+        params: list[Any] = [match_expr]
+        if census_year:
+            conditions.append("pg.census_year = ?")
+            params.append(census_year)
+        if state:
+            conditions.append("pg.state = ?")
+            params.append(state)
+
+        with self._connect() as conn:
+            if phonetic:
+                self._update_phonetic_keys(conn)
+            rows = conn.execute(
+                f"""
+                SELECT cp.*, bm25(census_person_fts) AS search_rank
+                FROM census_person_fts
+                JOIN census_person cp ON cp.person_id = census_person_fts.rowid
+                JOIN census_page pg ON cp.page_id = pg.page_id
+                WHERE {" AND ".join(conditions)}
+                ORDER BY search_rank
+                LIMIT ?
+                """,
+                params + [limit],
+            ).fetchall()
+            return [(self._row_to_person(row), row["search_rank"]) for row in rows]
+
+    def rebuild_search_index(self) -> int:
+        """Rebuild the full-text search index from census_person and its fields.
+
+        Returns:
+            Number of persons indexed
+        """
+        with self._connect() as conn:
+            conn.execute("DELETE FROM census_person_fts")
+            count = self._populate_search_index(conn)
+        logger.info(f"Rebuilt census search index ({count} persons)")
+        return count
+
+    @staticmethod
+    def _populate_search_index(conn: sqlite3.Connection) -> int:
+        """Insert every census_person into an empty search index."""
+        cursor = conn.execute(
+            f"""
+            INSERT INTO census_person_fts (
+                rowid, full_name, given_name, surname, birthplace, occupation,
+                extra_fields, phonetic
+            )
+            SELECT cp.person_id, cp.full_name, cp.given_name, cp.surname, cp.birthplace,
+                   cp.occupation, ({_SEARCH_EAV_SELECT.format(pid="cp.person_id")}), ''
+            FROM census_person cp
+            """
+        )
+        conn.execute(
+            "INSERT OR IGNORE INTO census_phonetic_pending (person_id) "
+            "SELECT person_id FROM census_person"
+        )
+        CensusExtractionRepository._update_phonetic_keys(conn)
+        return cursor.rowcount
+
+    @staticmethod
+    def _update_phonetic_keys(conn: sqlite3.Connection) -> int:
+        """Fill in search index phonetic keys for persons queued by the triggers.
+
+        Returns:
+            Number of persons updated
+        """
+        rows = conn.execute(
+            """
+            SELECT p.person_id, cp.given_name, cp.surname
+            FROM census_phonetic_pending p
+            JOIN census_person cp ON cp.person_id = p.person_id
+            """
+        ).fetchall()
+        conn.executemany(
+            "UPDATE census_person_fts SET phonetic = ? WHERE rowid = ?",
+            [(census_phonetic(given, surname), person_id) for person_id, given, surname in rows],
+        )
+        conn.execute("DELETE FROM census_phonetic_pending")
+        return len(rows)
+
+    @staticmethod
+    def _build_name_match(
+        surname: str | None, given_name: str | None, phonetic: bool
+    ) -> str | None:
+        """Build an FTS5 MATCH expression restricted to the surname/given columns."""
+        clauses = []
+        for column, prefix_char, value in (
+            ("surname", "s", surname),
+            ("given_name", "g", given_name),
+        ):
+            if not value:
+                continue
+            if phonetic:
+                terms = [
+                    f'"{prefix_char}{code.lower()}"'
+                    for code in (soundex(t) for t in _SEARCH_TOKEN_RE.findall(value))
+                    if code
+                ]
+                column = "phonetic"
+            else:
+                terms = _fts_terms(value, prefix=True)
+            if terms:
+                clauses.append(f"{column} : ({' AND '.join(terms)})")
+        return " AND ".join(clauses) if clauses else None
+
     def get_pages_with_persons(
         self,
         census_year: int | None = None,
@@ -1386,31 +1816,41 @@ class CensusExtractionRepository:
             ).fetchone()[0]
 
             # Sample line persons (1950 census with sample data)
-            sample_line_field_names = [
-                "residence_1949_same_house", "residence_1949_on_farm",
-                "residence_1949_same_county", "residence_1949_different_location",
-                "highest_grade_attended", "completed_grade", "school_attendance",
-                "weeks_looking_for_work", "weeks_worked_1949",
-                "income_wages_1949", "income_self_employment_1949", "income_other_1949",
-                "veteran_status", "veteran_ww1", "veteran_ww2",
-            ]
-            placeholders = ",".join("?" * len(sample_line_field_names))
-            stats["sample_line_persons"] = conn.execute(
-                f"""
-                SELECT COUNT(DISTINCT cp.person_id)
-                FROM census_person cp
-                JOIN census_page pg ON cp.page_id = pg.page_id
-                JOIN census_person_field cpf ON cp.person_id = cpf.person_id
-                WHERE pg.census_year = 1950
-                  AND cpf.field_name IN ({placeholders})
-                  AND cpf.field_value IS NOT NULL
-                  AND cpf.field_value != ''
-                """,
-                sample_line_field_names,
-            ).fetchone()[0]
+            stats["sample_line_persons"] = self._count_sample_line_persons(conn)
 
             return stats
 
+    @staticmethod
+    def _count_sample_line_persons(conn: sqlite3.Connection) -> int:
+        """Count 1950 persons with any sample-line field data."""
+        if projection_exists(conn, 1950):
+            # Presence of the raw text, like the EAV count below: values that
+            # don't convert (e.g. "10,000+") are NULL in typed columns
+            projected = {col.name: col for col in get_projection_columns(1950)}
+            has_sample = " OR ".join(
+                f"{projected[name].present_column} IS NOT NULL"
+                for name in SAMPLE_LINE_FIELDS_1950
+                if name in projected
+            )
+            return conn.execute(
+                f"SELECT COUNT(*) FROM {projection_table_name(1950)} WHERE {has_sample}"
+            ).fetchone()[0]
+
+        placeholders = ",".join("?" * len(SAMPLE_LINE_FIELDS_1950))
+        return conn.execute(
+            f"""
+            SELECT COUNT(DISTINCT cp.person_id)
+            FROM census_person cp
+            JOIN census_page pg ON cp.page_id = pg.page_id
+            JOIN census_person_field cpf ON cp.person_id = cpf.person_id
+            WHERE pg.census_year = 1950
+              AND cpf.field_name IN ({placeholders})
+              AND cpf.field_value IS NOT NULL
+              AND cpf.field_value != ''
+            """,
+            SAMPLE_LINE_FIELDS_1950,
+        ).fetchone()[0]
+
     # -------------------------------------------------------------------------
     # Match Attempt Operations
     # -------------------------------------------------------------------------
@@ -0,0 +1,328 @@
+"""
+Typed per-year projections of the census_person_field EAV store.
+
+census_person_field stores every extended field as text, one row per field.
+That keeps extraction flexible, but aggregate queries must filter the whole
+EAV table by field_name and re-cast every value by field_type.
+
+For each census year with data, this module maintains a wide table
+(census_fields_<year>) with one row per person and one typed column per
+extended field defined in that year's YAML schema. Integer and boolean
+fields also keep their raw text in a <name>_text column, so values that do
+not convert (e.g. "10,000+") still count as present. The EAV table remains
+the source of truth: projection rows are recomputed by triggers whenever a
+person's EAV rows change or the person moves to another page, and can be
+rebuilt from EAV at any time.
+
+Fields not defined in the schema (or PROJECTION_EXTRA_FIELDS) stay EAV-only.
+"""
+
+import re
+import sqlite3
+from dataclasses import dataclass
+from functools import cache
+
+from loguru import logger
+
+from rmcitecraft.services.census.schema_registry import CensusSchemaRegistry
+
+# Extended fields captured by the FamilySearch extractor that are not columns
+# in the year's YAML schema but are still worth typed access.
+PROJECTION_EXTRA_FIELDS: dict[int, tuple[tuple[str, str], ...]] = {
+    1950: (("veteran_ww1", "string"), ("veteran_ww2", "string")),
+}
+
+# Schema columns stored in census_person core columns rather than EAV rows
+CORE_PERSON_COLUMNS = frozenset({
+    # census_person column names
+    "line_number", "dwelling_number", "family_number", "household_id",
+    "full_name", "given_name", "surname", "name_suffix",
+    "relationship_to_head", "sex", "race", "age", "age_months",
+    "marital_status", "birthplace", "birthplace_father", "birthplace_mother",
+    "occupation", "industry", "worker_class",
+    "familysearch_ark", "familysearch_person_id",
+    # Schema names for the same core columns
+    "name", "relationship", "father_birthplace", "mother_birthplace", "class_of_worker",
+})
+
+_SQL_TYPES = {"integer": "INTEGER", "boolean": "INTEGER", "string": "TEXT"}
+_IDENTIFIER_RE = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+
+@dataclass(frozen=True)
+class ProjectionColumn:
+    """A typed column in a per-year projection table."""
+
+    name: str
+    data_type: str  # string, integer, boolean (as in the YAML schema)
+
+    @property
+    def sql_type(self) -> str:
+        """SQLite column type for this field."""
+        return _SQL_TYPES.get(self.data_type, "TEXT")
+
+    @property
+    def text_name(self) -> str | None:
+        """Column holding the raw text of a converted field (None for strings)."""
+        return f"{self.name}_text" if self.sql_type == "INTEGER" else None
+
+    @property
+    def present_column(self) -> str:
+        """Column that is non-NULL exactly when the field has a non-empty value."""
+        return self.text_name or self.name
+
+    def cast_expr(self, value: str) -> str:
+        """SQL expression converting the EAV text value to the column type.
+
+        Values that cannot be converted (e.g. "unknown" for an integer field)
+        project as NULL; the original text is still available in EAV.
+        """
+        if self.data_type == "integer":
+            cleaned = f"replace(replace(trim({value}), ',', ''), '$', '')"
+            return (
+                f"CASE WHEN {cleaned} GLOB '[0-9]*' AND {cleaned} NOT GLOB '*[^0-9]*' "
+                f"THEN CAST({cleaned} AS INTEGER) END"
+            )
+        if self.data_type == "boolean":
+            lowered = f"lower(trim({value}))"
+            return (
+                f"CASE WHEN {lowered} IN ('1', 'true', 'yes', 'y', 'x') THEN 1 "
+                f"WHEN {lowered} IN ('0', 'false', 'no', 'n') THEN 0 END"
+            )
+        return f"NULLIF({value}, '')"
+
+
+def projection_table_name(census_year: int) -> str:
+    """Name of the projection table for a census year."""
+    return f"census_fields_{int(census_year)}"
+
+
+@cache
+def get_projection_columns(census_year: int) -> tuple[ProjectionColumn, ...]:
+    """Get the typed projection columns for a census year.
+
+    Built from the year's YAML schema: person-level columns that are not
+    stored in census_person core columns, plus PROJECTION_EXTRA_FIELDS.
+
+    Raises:
+        ValueError: If census_year is not a valid census year
+    """
+    schema = CensusSchemaRegistry.get_schema(census_year)
+
+    columns: dict[str, ProjectionColumn] = {}
+    for col in schema.columns:
+        if col.is_metadata or col.name in CORE_PERSON_COLUMNS:
+            continue
+        columns[col.name] = ProjectionColumn(col.name, col.data_type)
+    for name, data_type in PROJECTION_EXTRA_FIELDS.get(census_year, ()):
+        columns.setdefault(name, ProjectionColumn(name, data_type))
+
+    for name in columns:
+        if not _IDENTIFIER_RE.match(name):
+            raise ValueError(f"Invalid projection column name in {census_year} schema: {name}")
+    for col in columns.values():
+        if col.text_name in columns:
+            raise ValueError(f"Projection column {col.text_name} clashes with a schema field")
+
+    return tuple(columns.values())
+
+
+def _table_columns(census_year: int) -> list[tuple[str, str]]:
+    """(name, SQL type) of every projection table column after person_id."""
+    table_columns = []
+    for col in get_projection_columns(census_year):
+        table_columns.append((col.name, col.sql_type))
+        if col.text_name:
+            table_columns.append((col.text_name, "TEXT"))
+    return table_columns
+
+
+def _refresh_sql(census_year: int, person_filter: str) -> str:
+    """Build the INSERT OR REPLACE statement recomputing projection rows.
+
+    Each column takes the most recently inserted EAV value for the field,
+    matching CensusExtractionRepository.get_person_fields.
+    """
+    def latest(col: ProjectionColumn, expr: str) -> str:
+        return f"""(SELECT {expr} FROM (
+                SELECT field_value AS v FROM census_person_field
+                WHERE person_id = cp.person_id AND field_name = '{col.name}'
+                ORDER BY field_id DESC LIMIT 1))"""
+
+    names = []
+    value_exprs = []
+    for col in get_projection_columns(census_year):
+        names.append(col.name)
+        value_exprs.append(latest(col, col.cast_expr("v")))
+        if col.text_name:
+            names.append(col.text_name)
+            value_exprs.append(latest(col, "NULLIF(v, '')"))
+    column_list = ", ".join(["person_id", *names])
+    return f"""
+        INSERT OR REPLACE INTO {projection_table_name(census_year)} ({column_list})
+        SELECT cp.person_id, {", ".join(value_exprs)}
+        FROM census_person cp
+        JOIN census_page pg ON pg.page_id = cp.page_id
+        WHERE pg.census_year = {int(census_year)} AND {person_filter}
+    """
+
+
+def _field_insert_sql(census_year: int) -> str:
+    """Build the UPDATE applying one inserted EAV row (``new``) to its person.
+
+    A new row has the highest field_id, so it is the field's latest value:
+    only its own column changes and nothing needs to be re-read from EAV.
+    """
+    assignments = []
+    for col in get_projection_columns(census_year):
+        when = f"CASE new.field_name WHEN '{col.name}'"
+        assignments.append(
+            f"{col.name} = {when} THEN {col.cast_expr('new.field_value')} ELSE {col.name} END"
+        )
+        if col.text_name:
+            assignments.append(
+                f"{col.text_name} = {when} THEN NULLIF(new.field_value, '') "
+                f"ELSE {col.text_name} END"
+            )
+    return f"""UPDATE {projection_table_name(census_year)}
+    SET {", ".join(assignments)}
+    WHERE person_id = new.person_id;"""
+
+
+def projection_schema_sql(census_year: int) -> str:
+    """DDL for a year's projection table and the triggers that maintain it."""
+    table = projection_table_name(census_year)
+    columns = get_projection_columns(census_year)
+    field_names = ", ".join(f"'{col.name}'" for col in columns)
+    column_defs = ",\n    ".join(f"{name} {sql_type}" for name, sql_type in _table_columns(census_year))
+
+    def refresh(pid: str) -> str:
+        return _refresh_sql(census_year, f"cp.person_id = {pid}").strip() + ";"
+
+    return f"""
+CREATE TABLE IF NOT EXISTS {table} (
+    person_id INTEGER PRIMARY KEY REFERENCES census_person(person_id),
+    {column_defs}
+);
+
+CREATE TRIGGER IF NOT EXISTS {table}_person_ai AFTER INSERT ON census_person
+BEGIN
+    {refresh("new.person_id")}
+END;
+
+CREATE TRIGGER IF NOT EXISTS {table}_person_au AFTER UPDATE OF page_id ON census_person
+BEGIN
+    DELETE FROM {table} WHERE person_id = old.person_id;
+    {refresh("new.person_id")}
+END;
+
+CREATE TRIGGER IF NOT EXISTS {table}_person_ad AFTER DELETE ON census_person
+BEGIN
+    DELETE FROM {table} WHERE person_id = old.person_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS {table}_field_ai AFTER INSERT ON census_person_field
+WHEN new.field_name IN ({field_names})
+BEGIN
+    {_field_insert_sql(census_year)}
+END;
+
+CREATE TRIGGER IF NOT EXISTS {table}_field_au AFTER UPDATE ON census_person_field
+WHEN new.field_name IN ({field_names}) OR old.field_name IN ({field_names})
+BEGIN
+    {refresh("old.person_id")}
+    {refresh("new.person_id")}
+END;
+
+CREATE TRIGGER IF NOT EXISTS {table}_field_ad AFTER DELETE ON census_person_field
+WHEN old.field_name IN ({field_names})
+BEGIN
+    {refresh("old.person_id")}
+END;
+"""
+
+
+def projection_exists(conn: sqlite3.Connection, census_year: int) -> bool:
+    """Check whether the projection table for a year has been created."""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (projection_table_name(census_year),),
+    ).fetchone()
+    return row is not None
+
+
+def _projection_current(conn: sqlite3.Connection, census_year: int) -> bool:
+    """Check an existing projection has this version's columns and triggers."""
+    table = projection_table_name(census_year)
+    columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+    expected = ["person_id", *(name for name, _ in _table_columns(census_year))]
+    triggers = dict(conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name GLOB ?",
+        (f"{table}_*",),
+    ).fetchall())
+    # Field inserts update one column instead of recomputing the person
+    field_insert = triggers.get(f"{table}_field_ai") or ""
+    return (
+        columns == expected
+        and f"{table}_person_au" in triggers
+        and f"UPDATE {table}" in field_insert
+    )
+
+
+def _drop_projection(conn: sqlite3.Connection, census_year: int) -> None:
+    """Drop a year's projection table and its triggers."""
+    table = projection_table_name(census_year)
+    triggers = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name GLOB ?",
+        (f"{table}_*",),
+    ).fetchall()
+    for (name,) in triggers:
+        conn.execute(f"DROP TRIGGER {name}")
+    conn.execute(f"DROP TABLE {table}")
+
+
+def ensure_projection(conn: sqlite3.Connection, census_year: int) -> bool:
+    """Create a year's projection table and triggers, backfilling from EAV.
+
+    A projection built by an older version (different columns or triggers)
+    is dropped and rebuilt.
+
+    Args:
+        conn: Connection to census.db
+        census_year: Census year
+
+    Returns:
+        True if the projection was created by this call
+    """
+    if projection_exists(conn, census_year):
+        if _projection_current(conn, census_year):
+            return False
+        logger.info(f"Rebuilding outdated {projection_table_name(census_year)} projection")
+        _drop_projection(conn, census_year)
+
+    conn.executescript(projection_schema_sql(census_year))
+    count = refresh_projection(conn, census_year)
+    logger.info(f"Created {projection_table_name(census_year)} projection ({count} persons)")
+    return True
+
+
+def refresh_projection(
+    conn: sqlite3.Connection, census_year: int, person_ids: list[int] | None = None
+) -> int:
+    """Recompute projection rows from EAV.
+
+    Args:
+        conn: Connection to census.db
+        census_year: Census year
+        person_ids: Persons to recompute (all persons of that year if None)
+
+    Returns:
+        Number of rows written
+    """
+    if person_ids is None:
+        cursor = conn.execute(_refresh_sql(census_year, "1=1"))
+        return cursor.rowcount
+
+    sql = _refresh_sql(census_year, "cp.person_id = ?")
+    cursor = conn.executemany(sql, [(pid,) for pid in person_ids])
+    return cursor.rowcount
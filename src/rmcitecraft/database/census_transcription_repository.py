@@ -25,6 +25,8 @@ from typing import Any
 
 from loguru import logger
 
+from rmcitecraft.monitoring.spans import Span
+
 
 @dataclass
 class TranscriptionItem:
@@ -497,13 +499,18 @@ class CensusTranscriptionRepository:
             return [self._row_to_item(row) for row in cursor.fetchall()]
 
     def get_pending_items(self, session_id: str) -> list[TranscriptionItem]:
-        """Get items that need processing (queued or error with retries left)."""
+        """Get items that need processing.
+
+        Includes queued items, errors with retries left, and items left in
+        'extracting' by an interrupted run.
+        """
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT * FROM census_transcription_items
                 WHERE session_id = ?
-                  AND (status = 'queued' OR (status = 'error' AND retry_count < 3))
+                  AND (status IN ('queued', 'extracting')
+                       OR (status = 'error' AND retry_count < 3))
                 ORDER BY item_id
             """, (session_id,))
             return [self._row_to_item(row) for row in cursor.fetchall()]
@@ -681,6 +688,23 @@ class CensusTranscriptionRepository:
             row = cursor.fetchone()
             return dict(row) if row else None
 
+    # =========================================================================
+    # Performance Metrics
+    # =========================================================================
+
+    def record_spans(self, spans: list[Span]) -> None:
+        """Record stage timing spans for transcription items in one transaction."""
+        with self._get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO performance_metrics (
+                    timestamp, operation, duration_ms, success, session_id, item_id, batch_type
+                ) VALUES (?, ?, ?, ?, ?, ?, 'census_transcription')
+            """, [
+                (s.started_at, s.stage, s.duration_ms, s.success, s.session_id, s.item_id)
+                for s in spans
+            ])
+            conn.commit()
+
     # =========================================================================
     # Analytics Queries
     # =========================================================================
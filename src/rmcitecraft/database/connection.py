@@ -1,39 +1,54 @@
 """RootsMagic database connection with RMNOCASE collation support.
 
 This module provides connection utilities for RootsMagic databases,
-including ICU extension loading for the RMNOCASE collation.
+including the RMNOCASE collation (ICU extension or pure-Python fallback).
 """
 
 import sqlite3
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from loguru import logger
 
+from rmcitecraft.database.rmnocase import register_rmnocase
+
 
 def connect_rmtree(
     db_path: str | Path,
     extension_path: str | Path = "./sqlite-extension/icu.dylib",
     read_only: bool = True,
+    collation: Literal["auto", "icu", "python"] = "auto",
 ) -> sqlite3.Connection:
     """Connect to RootsMagic database with RMNOCASE collation support.
 
     CRITICAL: Always use this function instead of raw sqlite3.connect() to ensure
     RMNOCASE collation is available for text fields (Surname, Given, Name, etc.).
 
+    RMNOCASE comes from the ICU extension or from the pure-Python collation in
+    rmnocase.py, which approximates ICU's ordering but differs for a few
+    characters (see rmnocase.py). With collation="auto", ICU is used whenever
+    the extension loads; read-only connections fall back to the Python
+    collation when it cannot be loaded, and writable connections require
+    ICU: writing through a different collation would leave RootsMagic's
+    RMNOCASE indexes out of order. The Python collation is never used on
+    writable connections.
+
     Args:
         db_path: Path to .rmtree database file
         extension_path: Path to ICU extension library (default: ./sqlite-extension/icu.dylib)
         read_only: Open database in read-only mode (default: True for safety)
+        collation: "auto", "icu" (require the extension) or "python"
 
     Returns:
         sqlite3.Connection object with RMNOCASE collation registered
 
     Raises:
-        sqlite3.OperationalError: If extension cannot be loaded
-        FileNotFoundError: If database or extension file not found
+        sqlite3.OperationalError: If ICU is required and the extension cannot be loaded
+        FileNotFoundError: If database not found, or ICU is required and the
+            extension file is missing
+        ValueError: If collation="python" is requested for a writable connection
     """
     db_path = Path(db_path)
     extension_path = Path(extension_path)
@@ -41,8 +56,10 @@ def connect_rmtree(
     if not db_path.exists():
         raise FileNotFoundError(f"Database not found: {db_path}")
 
-    if not extension_path.exists():
+    if _requires_icu(read_only, collation) and not extension_path.exists():
         raise FileNotFoundError(f"ICU extension not found: {extension_path}")
+    if collation == "python" and not read_only:
+        raise ValueError("Python RMNOCASE collation is only allowed on read-only connections")
 
     logger.debug(f"Connecting to RootsMagic database: {db_path} (read_only={read_only})")
 
@@ -53,6 +70,64 @@ def connect_rmtree(
     else:
         conn = sqlite3.connect(str(db_path))
 
+    try:
+        setup_rmnocase(conn, extension_path, read_only=read_only, collation=collation)
+    except (sqlite3.OperationalError, AttributeError, OSError):
+        conn.close()
+        raise
+
+    return conn
+
+
+def setup_rmnocase(
+    conn: sqlite3.Connection,
+    extension_path: str | Path = "./sqlite-extension/icu.dylib",
+    read_only: bool = True,
+    collation: Literal["auto", "icu", "python"] = "auto",
+) -> str:
+    """Register RMNOCASE on an open RootsMagic connection.
+
+    See connect_rmtree() for how collation="auto" chooses.
+
+    Args:
+        conn: Open connection
+        extension_path: Path to ICU extension library
+        read_only: Whether the connection only reads
+        collation: "auto", "icu" (require the extension) or "python"
+
+    Returns:
+        "icu" or "python", whichever was registered
+
+    Raises:
+        sqlite3.OperationalError: If ICU is required and the extension cannot be loaded
+        FileNotFoundError: If ICU is required and the extension file is missing
+        ValueError: If collation="python" is requested for a writable connection
+    """
+    extension_path = Path(extension_path)
+    if collation != "python":
+        try:
+            if not extension_path.exists():
+                raise FileNotFoundError(f"ICU extension not found: {extension_path}")
+            _load_icu_collation(conn, extension_path)
+            return "icu"
+        except (sqlite3.OperationalError, AttributeError, OSError) as e:
+            if _requires_icu(read_only, collation):
+                raise
+            logger.debug(f"ICU extension unavailable ({e}); using Python RMNOCASE collation")
+    if not read_only:
+        raise ValueError("Python RMNOCASE collation is only allowed on read-only connections")
+
+    register_rmnocase(conn)
+    return "python"
+
+
+def _requires_icu(read_only: bool, collation: str) -> bool:
+    """Whether RMNOCASE must come from the ICU extension."""
+    return collation == "icu" or (collation == "auto" and not read_only)
+
+
+def _load_icu_collation(conn: sqlite3.Connection, extension_path: Path) -> None:
+    """Load the ICU extension and register RMNOCASE from it."""
     # Enable extension loading
     conn.enable_load_extension(True)
 
@@ -78,8 +153,6 @@ def connect_rmtree(
         # Disable extension loading (security best practice)
         conn.enable_load_extension(False)
 
-    return conn
-
 
 @contextmanager
 def atomic_batch_operation(
@@ -36,11 +36,15 @@ def find_findagrave_people(db_path: str, limit: int | None = None, offset: int =
             - 'excluded': Number excluded (already have citations)
     """
     from rmcitecraft.database.connection import connect_rmtree
+    from rmcitecraft.database.shadow_index import attach_shadow_index
 
     conn = connect_rmtree(db_path)
     cursor = conn.cursor()
 
     try:
+        # URLTable has no index; the shadow index has one on (Name, OwnerType, OwnerID)
+        attach_shadow_index(conn, db_path)
+
         # Find all people with "Find a Grave" URLs
         # IMPORTANT: Use GROUP BY OwnerID to handle edge cases:
         # 1. People can have multiple names in NameTable -> filter IsPrimary=1
@@ -57,7 +61,7 @@ def find_findagrave_people(db_path: str, limit: int | None = None, offset: int =
                 MAX(n.BirthYear) as BirthYear,
                 MAX(n.DeathYear) as DeathYear,
                 MAX(p.Sex) as Sex
-            FROM URLTable u
+            FROM shadow.url_link u
             JOIN PersonTable p ON u.OwnerID = p.PersonID
             JOIN NameTable n ON p.PersonID = n.OwnerID
             WHERE u.OwnerType = 0
@@ -152,6 +156,7 @@ def get_findagrave_people_by_ids(db_path: str, person_ids: list[int]) -> list[di
         List of person dictionaries with Find a Grave data
     """
     from rmcitecraft.database.connection import connect_rmtree
+    from rmcitecraft.database.shadow_index import attach_shadow_index
 
     if not person_ids:
         return []
@@ -160,6 +165,8 @@ def get_findagrave_people_by_ids(db_path: str, person_ids: list[int]) -> list[di
     cursor = conn.cursor()
 
     try:
+        attach_shadow_index(conn, db_path)
+
         # Create placeholders for SQL IN clause
         placeholders = ','.join('?' * len(person_ids))
 
@@ -175,7 +182,7 @@ def get_findagrave_people_by_ids(db_path: str, person_ids: list[int]) -> list[di
                 n.BirthYear,
                 n.DeathYear,
                 p.Sex
-            FROM URLTable u
+            FROM shadow.url_link u
             JOIN PersonTable p ON u.OwnerID = p.PersonID
             JOIN NameTable n ON p.PersonID = n.OwnerID
             WHERE u.OwnerType = 0
@@ -537,7 +544,10 @@ def load_people_for_findagrave_batch(db_path: str) -> list[dict[str, Any]]:
 
     Looks for people who:
     1. Don't have a Find a Grave source (even if they have Find a Grave references)
-    2. Have birth, death, or burial events
+    2. Have a birth or death year
+
+    Reads from the local RootsMagic cache, which only pulls rows changed
+    since the last load.
 
     Args:
         db_path: Path to RootsMagic database
@@ -549,109 +559,23 @@ def load_people_for_findagrave_batch(db_path: str) -> list[dict[str, Any]]:
             - given_name
             - birth_year
             - death_year
-            - memorial_id (if found in WebTagTable RefNumber field)
+            - memorial_id (from the person's Find a Grave URL, if any)
     """
-    from rmcitecraft.database.connection import connect_rmtree
+    from rmcitecraft.database.rmtree_cache import RootsMagicCache
 
-    conn = connect_rmtree(db_path, read_only=True)
-    cursor = conn.cursor()
+    people = []
+    for row in RootsMagicCache(db_path).people_for_findagrave_batch():
+        people.append({
+            'person_id': row['PersonID'],
+            'surname': row['Surname'] or '',
+            'given_name': row['Given'] or '',
+            'birth_year': row['BirthYear'],
+            'death_year': row['DeathYear'],
+            'memorial_id': _extract_memorial_id(row['URL']) if row['URL'] else None,
+        })
 
-    try:
-        # Query for people with birth, death, or burial events
-        # but WITHOUT Find a Grave sources
-        cursor.execute("""
-            WITH person_names AS (
-                SELECT
-                    p.PersonID,
-                    n.Surname,
-                    n.Given,
-                    n.IsPrimary
-                FROM PersonTable p
-                LEFT JOIN NameTable n ON p.PersonID = n.OwnerID
-                WHERE n.IsPrimary = 1
-            ),
-            birth_years AS (
-                SELECT
-                    e.OwnerID AS PersonID,
-                    SUBSTR(e.SortDate, 1, 4) AS BirthYear
-                FROM EventTable e
-                JOIN FactTypeTable ft ON e.EventType = ft.FactTypeID
-                WHERE ft.Name = 'Birth' AND e.OwnerType = 0
-            ),
-            death_years AS (
-                SELECT
-                    e.OwnerID AS PersonID,
-                    SUBSTR(e.SortDate, 1, 4) AS DeathYear
-                FROM EventTable e
-                JOIN FactTypeTable ft ON e.EventType = ft.FactTypeID
-                WHERE ft.Name = 'Death' AND e.OwnerType = 0
-            ),
-            findagrave_sources AS (
-                -- People who already have Find a Grave sources
-                SELECT DISTINCT ct.PersonID
-                FROM CitationTable c
-                JOIN SourceTable s ON c.SourceID = s.SourceID
-                JOIN CitationLinkTable cl ON c.CitationID = cl.CitationID
-                JOIN (
-                    -- Link to person directly or through events
-                    SELECT cl2.CitationID, e.OwnerID AS PersonID
-                    FROM CitationLinkTable cl2
-                    JOIN EventTable e ON cl2.OwnerID = e.EventID AND cl2.OwnerType = 2
-                    WHERE e.OwnerType = 0  -- Person events
-
-                    UNION
-
-                    SELECT cl2.CitationID, cl2.OwnerID AS PersonID
-                    FROM CitationLinkTable cl2
-                    WHERE cl2.OwnerType = 0  -- Direct person links
-                ) ct ON cl.CitationID = ct.CitationID
-                WHERE UPPER(s.Name) LIKE '%FIND A GRAVE%'
-                   OR UPPER(s.Name) LIKE '%FINDAGRAVE%'
-            ),
-            memorial_ids AS (
-                -- Extract memorial IDs from WebTagTable RefNumber field
-                SELECT
-                    wt.OwnerID AS PersonID,
-                    wt.RefNumber AS MemorialID
-                FROM WebTagTable wt
-                WHERE wt.OwnerType = 0  -- Person
-                  AND wt.URL LIKE '%findagrave.com%'
-                  AND wt.RefNumber IS NOT NULL
-                  AND wt.RefNumber != ''
-            )
-            SELECT
-                pn.PersonID,
-                pn.Surname,
-                pn.Given AS GivenName,
-                by.BirthYear,
-                dy.DeathYear,
-                mi.MemorialID
-            FROM person_names pn
-            LEFT JOIN birth_years by ON pn.PersonID = by.PersonID
-            LEFT JOIN death_years dy ON pn.PersonID = dy.PersonID
-            LEFT JOIN memorial_ids mi ON pn.PersonID = mi.PersonID
-            LEFT JOIN findagrave_sources fs ON pn.PersonID = fs.PersonID
-            WHERE fs.PersonID IS NULL  -- No Find a Grave source yet
-              AND (by.BirthYear IS NOT NULL OR dy.DeathYear IS NOT NULL)  -- Has vital dates
-            ORDER BY pn.Surname COLLATE RMNOCASE, pn.Given COLLATE RMNOCASE
-        """)
-
-        people = []
-        for row in cursor.fetchall():
-            people.append({
-                'person_id': row[0],
-                'surname': row[1] or '',
-                'given_name': row[2] or '',
-                'birth_year': row[3],
-                'death_year': row[4],
-                'memorial_id': row[5],
-            })
-
-        logger.info(f"Loaded {len(people)} people for Find a Grave batch processing")
-        return people
-
-    finally:
-        conn.close()
+    logger.info(f"Loaded {len(people)} people for Find a Grave batch processing")
+    return people
 
 
 def get_spouse_surname(db_path: str, person_id: int) -> str | None:
@@ -757,9 +681,9 @@ def create_findagrave_source_and_citation(
 
         cursor.execute("""
             UPDATE SourceTable
-            SET Fields = ?
+            SET Fields = ?, UTCModDate = ?
             WHERE SourceID = ?
-        """, (xml_content.encode('utf-8'), source_id))
+        """, (xml_content.encode('utf-8'), get_utc_mod_date(), source_id))
 
         # Create citation linking to person
         # For free-form sources, leave citation fields empty (they're in source)
@@ -1885,11 +1809,17 @@ def create_findagrave_image_record(
 
     Returns:
         Dictionary with created IDs:
-            - 'media_id': Created MediaID
+            - 'media_id': Created MediaID (or existing MediaID if reused)
             - 'media_link_id': Created MediaLinkID
+            - 'image_path': Path of the linked file (the existing copy if reused)
+            - 'reused_media': True if the download was byte-identical to an
+              existing image, which was linked instead and the download deleted
+            - 'similar_media': Paths of existing images that look the same
+              (perceptual hash) for the user to confirm; the download is kept
     """
     from rmcitecraft.database.connection import connect_rmtree
     from rmcitecraft.database.image_repository import ImageRepository
+    from rmcitecraft.database.media_hash_index import get_media_hash_index
 
     conn = connect_rmtree(db_path, read_only=False)
 
@@ -1961,6 +1891,29 @@ def create_findagrave_image_record(
         # Create image repository
         img_repo = ImageRepository(conn)
 
+        # Same file already in the media folder? Link that record instead of a copy.
+        # Only byte-identical files count; look-alikes are reported, never merged.
+        hash_index = None
+        duplicate = None
+        similar_media: list[Path] = []
+        try:
+            hash_index = get_media_hash_index(media_root)
+            if hash_index.ready_for_lookup():
+                duplicate = hash_index.find_duplicate_media(image_path, img_repo)
+                if not duplicate:
+                    similar_media = hash_index.find_similar(image_path)
+            else:
+                logger.info("Media hash index is still being built, skipping duplicate check")
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Media hash index lookup failed, skipping duplicate check: {e}")
+
+        if similar_media:
+            logger.warning(
+                f"Downloaded photo {media_file} looks like existing media "
+                f"{[p.name for p in similar_media]}; kept as a new record, "
+                "please confirm whether it is a duplicate"
+            )
+
         # Check for existing images with old caption format
         cursor = conn.cursor()
         cursor.execute("""
@@ -1970,7 +1923,7 @@ def create_findagrave_image_record(
         """, (media_file,))
 
         existing_image = cursor.fetchone()
-        if existing_image:
+        if existing_image and not duplicate:
             existing_id, existing_caption, existing_file = existing_image
             # Check if existing caption uses old format
             if existing_caption and not existing_caption.startswith('FindaGrave-'):
@@ -2001,15 +1954,28 @@ def create_findagrave_image_record(
             description += f" and {contributor}"
         description += f", ({photo_url} : downloaded {download_date})"
 
-        # Create media record
-        media_id = img_repo.create_media_record(
-            media_path=directory_path,
-            media_file=media_file,
-            caption=caption,
-            ref_number=f"https://www.findagrave.com/memorial/{memorial_id}" if memorial_id else '',
-            census_date='',  # Find a Grave photos don't have census dates
-            description=description,
-        )
+        if duplicate:
+            media_id, existing_path = duplicate
+            image_path.unlink()
+            logger.info(
+                f"Downloaded photo duplicates {existing_path.name}, reusing MediaID {media_id}"
+            )
+            image_path = existing_path
+        else:
+            # Create media record
+            media_id = img_repo.create_media_record(
+                media_path=directory_path,
+                media_file=media_file,
+                caption=caption,
+                ref_number=f"https://www.findagrave.com/memorial/{memorial_id}" if memorial_id else '',
+                census_date='',  # Find a Grave photos don't have census dates
+                description=description,
+            )
+            if hash_index:
+                try:
+                    hash_index.add_file(image_path)
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning(f"Failed to add {media_file} to media hash index: {e}")
 
         # Link to citation (always)
         media_link_id = img_repo.link_media_to_citation(media_id, citation_id)
@@ -2075,6 +2041,9 @@ def create_findagrave_image_record(
         return {
             'media_id': media_id,
             'media_link_id': media_link_id,
+            'image_path': str(image_path),
+            'reused_media': duplicate is not None,
+            'similar_media': [str(p) for p in similar_media],
         }
 
     except Exception as e:
@@ -578,6 +578,41 @@ class ImageRepository:
         result = cursor.fetchone()
         return result[0] if result else None
 
+    def find_media_by_location(self, media_path: str, media_file: str) -> int | None:
+        """
+        Find existing media record by directory and filename.
+
+        Used to map a file found by content hash back to its MediaID.
+        Directory comparison ignores case and path separator style, since
+        RootsMagic stores both "?/dir" and "?\\dir" forms.
+
+        Args:
+            media_path: Symbolic directory path (e.g., "?/Records - Census/1930 Federal")
+            media_file: Filename only
+
+        Returns:
+            MediaID if found, None otherwise
+        """
+        cursor = self.conn.cursor()
+
+        cursor.execute(
+            """
+            SELECT MediaID, MediaPath FROM MultimediaTable
+            WHERE MediaFile = ? COLLATE RMNOCASE
+            ORDER BY MediaID
+            """,
+            (media_file,),
+        )
+
+        def normalize(path: str | None) -> str:
+            return (path or "").replace("\\", "/").rstrip("/").lower()
+
+        wanted = normalize(media_path)
+        for media_id, existing_path in cursor.fetchall():
+            if normalize(existing_path) == wanted:
+                return media_id
+        return None
+
     def get_media_for_citation(self, citation_id: int) -> list[dict]:
         """
         Get all media linked to a citation.
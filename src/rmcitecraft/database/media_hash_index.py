@@ -0,0 +1,437 @@
+"""
+Content-hash index of media files for duplicate detection.
+
+Sidecar database (~/.rmcitecraft/media_hashes.db) mapping each file under
+the RootsMagic media root to its SHA-256 digest and, when Pillow is
+installed, a 64-bit perceptual difference hash (dHash) that survives JPEG
+re-encoding. Both digests are indexed, so checking whether a newly
+downloaded image is already on disk is a single lookup.
+
+Only a SHA-256 match is an exact duplicate. A 9x8 dHash cannot tell apart
+images that share a layout (census pages of one form differ by a few bits),
+so dHash matches are only reported as similar for the user to confirm.
+
+The index is built incrementally: update() walks the media root and only
+re-hashes files whose size or mtime changed since they were indexed. The
+first walk of a large library takes minutes, so ingest code never runs it
+inline: ready_for_lookup() starts it on a background thread and callers skip
+the duplicate check until some complete walk has finished. Ingest code adds
+files as they are created with add_file().
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from loguru import logger
+
+MEDIA_HASH_DB_PATH = Path.home() / ".rmcitecraft" / "media_hashes.db"
+
+# File types indexed (images and PDFs attached to RootsMagic records)
+INDEXED_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".tif", ".tiff", ".gif", ".bmp", ".pdf"})
+
+# Extensions eligible for perceptual hashing
+PERCEPTUAL_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".tif", ".tiff", ".bmp"})
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS media_file (
+    rel_path TEXT PRIMARY KEY,        -- Path relative to media root (POSIX separators)
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    sha256 TEXT NOT NULL,
+    dhash TEXT                        -- 16 hex digits, NULL if not computed
+);
+
+CREATE INDEX IF NOT EXISTS idx_media_file_sha256 ON media_file(sha256);
+CREATE INDEX IF NOT EXISTS idx_media_file_dhash ON media_file(dhash);
+
+CREATE TABLE IF NOT EXISTS index_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+@dataclass
+class IndexedMediaFile:
+    """A file in the media hash index."""
+
+    rel_path: str
+    size: int
+    mtime: float
+    sha256: str
+    dhash: str | None = None
+
+    def absolute_path(self, media_root: Path) -> Path:
+        """Absolute path of the file under a media root."""
+        return media_root / self.rel_path
+
+
+@dataclass
+class IndexUpdateStats:
+    """Counts from an incremental index update."""
+
+    scanned: int = 0
+    hashed: int = 0
+    removed: int = 0
+
+
+def compute_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Compute the SHA-256 digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compute_dhash(path: Path) -> str | None:
+    """Compute a 64-bit difference hash of an image.
+
+    Returns:
+        16 hex digits, or None if Pillow is not installed or the file is not
+        a readable image
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+
+    try:
+        with Image.open(path) as img:
+            pixels = img.convert("L").resize((9, 8), Image.Resampling.LANCZOS).tobytes()
+    except (OSError, ValueError) as e:
+        logger.debug(f"Cannot compute perceptual hash for {path}: {e}")
+        return None
+
+    bits = 0
+    for row in range(8):
+        for col in range(8):
+            left = pixels[row * 9 + col]
+            right = pixels[row * 9 + col + 1]
+            bits = (bits << 1) | (left > right)
+    return f"{bits:016x}"
+
+
+class MediaHashIndex:
+    """SQLite sidecar index of media file content hashes."""
+
+    def __init__(
+        self,
+        media_root: Path | str,
+        db_path: Path | None = None,
+        perceptual: bool = True,
+    ):
+        """
+        Initialize index.
+
+        Args:
+            media_root: RootsMagic media root directory
+            db_path: Index database path (defaults to ~/.rmcitecraft/media_hashes.db)
+            perceptual: Compute perceptual hashes for images (requires Pillow)
+        """
+        self.media_root = Path(media_root)
+        self.db_path = db_path or MEDIA_HASH_DB_PATH
+        self.perceptual = perceptual
+        self._updated = False
+        self._lock = threading.Lock()  # held for a whole update() walk
+        self._thread_lock = threading.Lock()
+        self._update_thread: threading.Thread | None = None
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA_SQL)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a short-lived connection, committing on success."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _rel_path(self, path: Path) -> str | None:
+        """Path relative to the media root, or None if outside it."""
+        try:
+            return Path(path).resolve().relative_to(self.media_root.resolve()).as_posix()
+        except ValueError:
+            return None
+
+    def _hash_file(self, path: Path) -> tuple[str, str | None]:
+        sha256 = compute_sha256(path)
+        dhash = None
+        if self.perceptual and path.suffix.lower() in PERCEPTUAL_EXTENSIONS:
+            dhash = compute_dhash(path)
+        return sha256, dhash
+
+    # -------------------------------------------------------------------------
+    # Building the index
+    # -------------------------------------------------------------------------
+
+    def update(self) -> IndexUpdateStats:
+        """
+        Bring the index up to date with the media root.
+
+        Files are re-hashed only if new or if their size or mtime changed;
+        rows for files that no longer exist are removed.
+
+        Returns:
+            Counts of files scanned, hashed and removed
+        """
+        stats = IndexUpdateStats()
+        with self._connect() as conn:
+            known = {
+                row["rel_path"]: (row["size"], row["mtime"])
+                for row in conn.execute("SELECT rel_path, size, mtime FROM media_file")
+            }
+            seen: set[str] = set()
+            rows = []
+
+            for dirpath, dirnames, filenames in os.walk(self.media_root):
+                dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+                for name in filenames:
+                    if name.startswith(".") or Path(name).suffix.lower() not in INDEXED_EXTENSIONS:
+                        continue
+                    path = Path(dirpath) / name
+                    try:
+                        st = path.stat()
+                    except OSError:
+                        continue
+                    rel_path = path.relative_to(self.media_root).as_posix()
+                    seen.add(rel_path)
+                    stats.scanned += 1
+
+                    if known.get(rel_path) == (st.st_size, st.st_mtime):
+                        continue
+                    try:
+                        sha256, dhash = self._hash_file(path)
+                    except OSError as e:
+                        logger.warning(f"Cannot hash media file {path}: {e}")
+                        continue
+                    rows.append((rel_path, st.st_size, st.st_mtime, sha256, dhash))
+                    stats.hashed += 1
+
+            removed = [(p,) for p in known if p not in seen]
+            stats.removed = len(removed)
+            conn.executemany(
+                "INSERT OR REPLACE INTO media_file (rel_path, size, mtime, sha256, dhash) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.executemany("DELETE FROM media_file WHERE rel_path = ?", removed)
+            conn.execute(
+                "INSERT OR REPLACE INTO index_meta (key, value) VALUES ('last_full_update', ?)",
+                (str(time.time()),),
+            )
+
+        self._updated = True
+        logger.info(
+            f"Media hash index updated: {stats.scanned} files, "
+            f"{stats.hashed} hashed, {stats.removed} removed"
+        )
+        return stats
+
+    def ensure_updated(self) -> None:
+        """Run update() once per index instance (later changes come via add_file).
+
+        Blocks for the whole walk; ingest paths use ready_for_lookup() instead.
+        """
+        with self._lock:
+            if not self._updated:
+                self.update()
+
+    @property
+    def ready(self) -> bool:
+        """True once a complete walk of the media root has been recorded."""
+        if self._updated:
+            return True
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM index_meta WHERE key = 'last_full_update'"
+            ).fetchone()
+        return row is not None
+
+    def start_background_update(self) -> None:
+        """Run update() on a daemon thread, once per index instance."""
+        with self._thread_lock:
+            if self._updated or (self._update_thread and self._update_thread.is_alive()):
+                return
+            self._update_thread = threading.Thread(
+                target=self._background_update, name="media-hash-index", daemon=True
+            )
+            self._update_thread.start()
+
+    def _background_update(self) -> None:
+        try:
+            with self._lock:
+                if not self._updated:
+                    self.update()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Background media hash index update failed: {e}")
+
+    def ready_for_lookup(self) -> bool:
+        """
+        Check whether duplicate lookups can be used now, without blocking.
+
+        Starts a background update if this process has not run one. An
+        index completed by an earlier run is usable meanwhile: exact matches
+        are re-checked against the file's size and mtime.
+
+        Returns:
+            True if a complete index exists, False while the first one builds
+        """
+        self.start_background_update()
+        return self.ready
+
+    def add_file(self, path: Path | str) -> IndexedMediaFile | None:
+        """
+        Hash a file and add it to the index.
+
+        Args:
+            path: File under the media root
+
+        Returns:
+            The indexed entry, or None if the file is outside the media root
+        """
+        path = Path(path)
+        rel_path = self._rel_path(path)
+        if rel_path is None:
+            logger.debug(f"Not indexing file outside media root: {path}")
+            return None
+
+        st = path.stat()
+        sha256, dhash = self._hash_file(path)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO media_file (rel_path, size, mtime, sha256, dhash) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (rel_path, st.st_size, st.st_mtime, sha256, dhash),
+            )
+        return IndexedMediaFile(rel_path, st.st_size, st.st_mtime, sha256, dhash)
+
+    def remove_file(self, path: Path | str) -> None:
+        """Remove a file from the index."""
+        rel_path = self._rel_path(Path(path))
+        if rel_path is not None:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM media_file WHERE rel_path = ?", (rel_path,))
+
+    # -------------------------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------------------------
+
+    def find_by_sha256(self, sha256: str) -> list[IndexedMediaFile]:
+        """Get all indexed files with a SHA-256 digest."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM media_file WHERE sha256 = ? ORDER BY rel_path", (sha256,)
+            ).fetchall()
+        return [IndexedMediaFile(**dict(row)) for row in rows]
+
+    def find_by_dhash(self, dhash: str) -> list[IndexedMediaFile]:
+        """Get all indexed files with a perceptual hash."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM media_file WHERE dhash = ? ORDER BY rel_path", (dhash,)
+            ).fetchall()
+        return [IndexedMediaFile(**dict(row)) for row in rows]
+
+    def find_duplicate(self, path: Path | str) -> Path | None:
+        """
+        Find an already indexed byte-identical copy of a file (SHA-256 match).
+
+        Args:
+            path: File to check (typically a fresh download)
+
+        Returns:
+            Absolute path of an existing copy that is unchanged on disk since
+            it was indexed, or None. The file itself is never reported as its
+            own duplicate.
+        """
+        path = Path(path)
+        own_rel_path = self._rel_path(path)
+
+        for candidate in self.find_by_sha256(compute_sha256(path)):
+            if candidate.rel_path == own_rel_path:
+                continue
+            existing = candidate.absolute_path(self.media_root)
+            try:
+                st = existing.stat()
+            except OSError:
+                continue
+            if (st.st_size, st.st_mtime) == (candidate.size, candidate.mtime):
+                return existing
+        return None
+
+    def find_similar(self, path: Path | str) -> list[Path]:
+        """
+        Find indexed images that look like a file (same perceptual hash).
+
+        These are candidates for the user to confirm, never duplicates to act
+        on: unrelated images with the same layout can share a dHash.
+
+        Args:
+            path: Image to check
+
+        Returns:
+            Absolute paths of existing files with the same dHash, excluding
+            the file itself
+        """
+        path = Path(path)
+        if not self.perceptual or path.suffix.lower() not in PERCEPTUAL_EXTENSIONS:
+            return []
+        dhash = compute_dhash(path)
+        if not dhash:
+            return []
+
+        own_rel_path = self._rel_path(path)
+        return [
+            existing
+            for candidate in self.find_by_dhash(dhash)
+            if candidate.rel_path != own_rel_path
+            and (existing := candidate.absolute_path(self.media_root)).exists()
+        ]
+
+    def find_duplicate_media(self, path: Path | str, image_repo) -> tuple[int, Path] | None:
+        """
+        Find an existing RootsMagic media record whose file matches a file's content.
+
+        Args:
+            path: File to check (typically a fresh download)
+            image_repo: ImageRepository for the open RootsMagic database
+
+        Returns:
+            (MediaID, existing file path), or None if no copy is on disk or the
+            copy is not referenced by a MultimediaTable record
+        """
+        existing = self.find_duplicate(path)
+        if existing is None:
+            return None
+
+        rel_dir = existing.relative_to(self.media_root).parent.as_posix()
+        media_path = "?" if rel_dir == "." else f"?/{rel_dir}"
+        media_id = image_repo.find_media_by_location(media_path, existing.name)
+        if media_id is None:
+            logger.debug(f"Duplicate file {existing} has no media record")
+            return None
+        return media_id, existing
+
+
+_shared_indexes: dict[Path, MediaHashIndex] = {}
+
+
+def get_media_hash_index(media_root: Path | str) -> MediaHashIndex:
+    """Get the process-wide index for a media root."""
+    key = Path(media_root)
+    if key not in _shared_indexes:
+        _shared_indexes[key] = MediaHashIndex(key)
+    return _shared_indexes[key]
@@ -0,0 +1,144 @@
+"""Pure-Python RMNOCASE collation.
+
+RootsMagic declares its name and place columns with the RMNOCASE collation,
+which connect_rmtree() normally provides by loading the ICU SQLite extension
+(en_US, primary strength). That extension is a macOS binary and costs a
+library load per connection. This module approximates that ordering in
+Python so RootsMagic databases can be read anywhere:
+
+- Unicode compatibility decomposition, dropping combining marks (accents
+  are secondary differences, ignored at primary strength)
+- casefold (case is a tertiary difference; ß folds to "ss")
+- letters with strokes fold to their base letter, æ/œ expand to ae/oe,
+  as in the Unicode Collation Algorithm's default table
+- spaces, punctuation and symbols are not ignorable and sort before
+  digits, digits before letters, in DUCET order
+
+It is not identical to ICU. Known differences: ð/Ð, dotless ı, ŋ and ĸ
+(which ICU sorts as separate letters or expansions), and Latin-1 symbols
+such as ¢ £ ¥ § © ° (ICU orders them by DUCET weight, not code point). Two
+names that differ only in these characters can compare differently, so
+connect_rmtree() only uses this collation on read-only connections where
+the ICU extension cannot be loaded; writes go through ICU so RootsMagic's
+RMNOCASE indexes stay in order.
+
+Sort keys are memoized: the same surnames and place names are compared over
+and over during ORDER BY and index lookups.
+
+verify_against_icu() compares this ordering with the ICU collation on a
+list of names when the extension is available.
+"""
+
+import sqlite3
+import unicodedata
+from functools import lru_cache
+from itertools import pairwise
+from pathlib import Path
+
+# Non-ignorable characters in DUCET order; anything unlisted that is not a
+# digit or letter sorts after these, by code point
+_VARIABLE_ORDER = "\t\n\v\f\r _-,;:!?.'\"()[]{}@*/\\&#%`^+<=>|~$"
+_VARIABLE_WEIGHTS = {char: index for index, char in enumerate(_VARIABLE_ORDER)}
+
+# Letters that carry their difference at secondary strength without
+# decomposing under NFKD
+_LETTER_FOLDS = str.maketrans({
+    "ø": "o",
+    "đ": "d",
+    "ł": "l",
+    "ħ": "h",
+    "ŧ": "t",
+    "ƀ": "b",
+    "æ": "ae",
+    "œ": "oe",
+})
+
+_SYMBOL_BASE = 0x100
+_DIGIT_BASE = 0x20000
+_LETTER_BASE = 0x30000
+
+
+def _weight(char: str) -> int:
+    """Primary weight of one folded character."""
+    if char in _VARIABLE_WEIGHTS:
+        return _VARIABLE_WEIGHTS[char]
+    if char.isdigit():
+        return _DIGIT_BASE + unicodedata.digit(char, 0)
+    if char.isalpha():
+        return _LETTER_BASE + ord(char)
+    return _SYMBOL_BASE + ord(char)
+
+
+@lru_cache(maxsize=65536)
+def rmnocase_key(text: str) -> tuple[int, ...]:
+    """Primary-strength sort key; equal keys compare equal under RMNOCASE."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    folded = "".join(
+        char for char in decomposed if not unicodedata.combining(char)
+    ).casefold().translate(_LETTER_FOLDS)
+    return tuple(_weight(char) for char in folded)
+
+
+def rmnocase_compare(left: str, right: str) -> int:
+    """Collation callable for sqlite3.Connection.create_collation()."""
+    if left == right:
+        return 0
+    left_key, right_key = rmnocase_key(left), rmnocase_key(right)
+    return (left_key > right_key) - (left_key < right_key)
+
+
+def register_rmnocase(conn: sqlite3.Connection) -> None:
+    """Register the Python RMNOCASE collation on a connection."""
+    conn.create_collation("RMNOCASE", rmnocase_compare)
+
+
+def verify_against_icu(
+    names: list[str],
+    extension_path: str | Path = "./sqlite-extension/icu.dylib",
+) -> list[tuple[str, str]]:
+    """Compare the Python collation with the ICU extension on a list of names.
+
+    Every pair of names must compare the same way (less, equal or greater)
+    under both collations.
+
+    Args:
+        names: Names to compare (e.g. every Surname and Given in a tree)
+        extension_path: Path to the ICU SQLite extension
+
+    Returns:
+        Pairs of names the two collations order differently (empty when
+        they agree)
+
+    Raises:
+        sqlite3.OperationalError: If the ICU extension cannot be loaded
+    """
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.enable_load_extension(True)
+        conn.load_extension(str(extension_path))
+        conn.enable_load_extension(False)
+        conn.execute(
+            "SELECT icu_load_collation("
+            "'en_US@colStrength=primary;caseLevel=off;normalization=on',"
+            "'ICU_RMNOCASE')"
+        )
+        conn.execute("CREATE TABLE names (name TEXT)")
+        conn.executemany("INSERT INTO names VALUES (?)", [(name,) for name in set(names)])
+        icu_order = [
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM names ORDER BY name COLLATE ICU_RMNOCASE, name"
+            )
+        ]
+        # Adjacent pairs decide the whole order: check each one's relation
+        mismatches = []
+        for left, right in pairwise(icu_order):
+            icu_equal = conn.execute(
+                "SELECT ? = ? COLLATE ICU_RMNOCASE", (left, right)
+            ).fetchone()[0]
+            python_result = rmnocase_compare(left, right)
+            if (python_result == 0) != bool(icu_equal) or python_result > 0:
+                mismatches.append((left, right))
+        return mismatches
+    finally:
+        conn.close()
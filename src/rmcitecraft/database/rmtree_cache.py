@@ -0,0 +1,268 @@
+"""
+Local cache of RootsMagic data for the batch tabs.
+
+Opening the Find a Grave, census transcription or citation manager tabs used
+to re-read the same people, events, sources and citations from the .rmtree
+every time. RootsMagicCache answers those reads from the shadow index
+sidecar (see shadow_index.py), syncing it first: the sync reads nothing when
+the tree file is untouched and otherwise copies only rows whose UTCModDate
+moved since the last sync, so after the first one a tab costs the delta.
+
+Writes still go to the .rmtree; they stamp UTCModDate so the next sync
+picks them up.
+
+When the sidecar cannot be written (a tree in a read-only folder), the cache
+lives in memory for the life of the RootsMagicCache instead, synced the
+same way.
+"""
+
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from loguru import logger
+
+from rmcitecraft.database.rmnocase import register_rmnocase
+from rmcitecraft.database.shadow_index import RefreshStats, ShadowIndex, build_shadow_tables
+
+
+class RootsMagicCache:
+    """Read API over the synced local cache of one RootsMagic tree."""
+
+    def __init__(self, rmtree_path: str | Path, path: str | Path | None = None):
+        """Initialize for a tree.
+
+        Args:
+            rmtree_path: RootsMagic .rmtree file (only ever read)
+            path: Cache database (default: the tree's shadow index sidecar)
+        """
+        self.index = ShadowIndex(rmtree_path, path)
+        # In-memory cache, used once the sidecar turns out not to be writable
+        self._memory: sqlite3.Connection | None = None
+        self._memory_lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self.index.path
+
+    def sync(self, full: bool = False) -> RefreshStats:
+        """Pull changes from the tree into the cache.
+
+        Args:
+            full: Rebuild the cache instead of applying changes
+
+        Returns:
+            RefreshStats with the rows written per table
+        """
+        if self._memory is None:
+            if not self.index.rmtree_path.exists():
+                raise FileNotFoundError(f"Database not found: {self.index.rmtree_path}")
+            try:
+                stats = self.index.refresh(full)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(
+                    f"Cannot write RootsMagic cache {self.path} ({e}); caching in memory instead"
+                )
+                self._memory = self._open_memory()
+        if self._memory is not None:
+            with self._memory_lock:
+                stats = build_shadow_tables(
+                    self._memory, src="rm", dst="main", full=full,
+                    fingerprint=self.index.fingerprint(),
+                )
+        if not stats.unchanged and not stats.full:
+            logger.info(f"Synced RootsMagic changes into cache: {stats.rows}")
+        return stats
+
+    @contextmanager
+    def connect(self, sync: bool = True) -> Iterator[sqlite3.Connection]:
+        """Read-only connection to the cache (rows as sqlite3.Row).
+
+        Args:
+            sync: Sync with the tree before connecting
+        """
+        if sync:
+            self.sync()
+        if self._memory is not None:
+            with self._memory_lock:
+                self._memory.row_factory = sqlite3.Row
+                try:
+                    yield self._memory
+                finally:
+                    self._memory.row_factory = None
+            return
+
+        conn = sqlite3.connect(self.path.resolve().as_uri() + "?mode=ro", uri=True)
+        try:
+            register_rmnocase(conn)
+            conn.row_factory = sqlite3.Row
+            yield conn
+        finally:
+            conn.close()
+
+    def _open_memory(self) -> sqlite3.Connection:
+        """In-memory cache database with the tree attached read-only as ``rm``."""
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        register_rmnocase(conn)
+        conn.execute(
+            "ATTACH DATABASE ? AS rm", (self.index.rmtree_path.resolve().as_uri() + "?mode=ro",)
+        )
+        return conn
+
+    def people_for_findagrave_batch(self) -> list[sqlite3.Row]:
+        """People with a birth or death year and no Find a Grave source yet.
+
+        Returns:
+            Rows with PersonID, Surname, Given, BirthYear, DeathYear and the
+            person's Find a Grave URL (or None), ordered by name
+        """
+        with self.connect() as conn:
+            return conn.execute("""
+                WITH vital_years AS (
+                    SELECT
+                        e.OwnerID AS PersonID,
+                        MIN(CASE WHEN ft.Name = 'Birth' THEN CAST(substr(e.Date, 4, 4) AS INTEGER) END)
+                            AS BirthYear,
+                        MIN(CASE WHEN ft.Name = 'Death' THEN CAST(substr(e.Date, 4, 4) AS INTEGER) END)
+                            AS DeathYear
+                    FROM event e
+                    JOIN fact_type ft ON e.EventType = ft.FactTypeID
+                    WHERE e.OwnerType = 0
+                      AND ft.Name IN ('Birth', 'Death')
+                      AND CAST(substr(e.Date, 4, 4) AS INTEGER) > 0
+                    GROUP BY e.OwnerID
+                ),
+                findagrave_citations AS (
+                    SELECT c.CitationID
+                    FROM citation c
+                    JOIN source s ON c.SourceID = s.SourceID
+                    WHERE UPPER(s.Name) LIKE '%FIND A GRAVE%'
+                       OR UPPER(s.Name) LIKE '%FINDAGRAVE%'
+                ),
+                findagrave_persons AS (
+                    -- Linked to the person through an event or directly
+                    SELECT e.OwnerID AS PersonID
+                    FROM citation_link cl
+                    JOIN event e ON cl.OwnerID = e.EventID AND cl.OwnerType = 2
+                    WHERE e.OwnerType = 0
+                      AND cl.CitationID IN findagrave_citations
+
+                    UNION
+
+                    SELECT cl.OwnerID
+                    FROM citation_link cl
+                    WHERE cl.OwnerType = 0
+                      AND cl.CitationID IN findagrave_citations
+                ),
+                memorial_urls AS (
+                    SELECT OwnerID AS PersonID, MIN(URL) AS URL
+                    FROM url_link
+                    WHERE OwnerType = 0 AND URL LIKE '%findagrave.com%'
+                    GROUP BY OwnerID
+                )
+                SELECT
+                    n.OwnerID AS PersonID,
+                    n.Surname,
+                    n.Given,
+                    vy.BirthYear,
+                    vy.DeathYear,
+                    mu.URL
+                FROM name n
+                JOIN vital_years vy ON n.OwnerID = vy.PersonID
+                LEFT JOIN memorial_urls mu ON n.OwnerID = mu.PersonID
+                WHERE n.IsPrimary = 1
+                  AND n.OwnerID NOT IN findagrave_persons
+                ORDER BY n.Surname COLLATE RMNOCASE, n.Given COLLATE RMNOCASE
+            """).fetchall()
+
+    def census_sources(
+        self, census_year: int | None = None, state: str | None = None
+    ) -> list[sqlite3.Row]:
+        """Population schedule census sources with a FamilySearch ARK.
+
+        Args:
+            census_year: Only this census year
+            state: Only this state (case-insensitive)
+
+        Returns:
+            Rows with SourceID, Name, CensusYear, State, County and Ark
+        """
+        query = """
+            SELECT cs.SourceID, s.Name, cs.CensusYear, cs.State, cs.County, cs.Ark
+            FROM census_source cs
+            JOIN source s ON s.SourceID = cs.SourceID
+            WHERE cs.TemplateID = 0
+              AND cs.Schedule = 'population'
+              AND cs.Ark IS NOT NULL
+        """
+        params: list = []
+        if census_year:
+            query += " AND cs.CensusYear = ?"
+            params.append(census_year)
+        if state:
+            query += " AND upper(cs.State) = ?"
+            params.append(state.upper())
+        with self.connect() as conn:
+            return conn.execute(query, params).fetchall()
+
+    def source_primary_persons(self) -> dict[int, tuple[str, str, int]]:
+        """First person cited by each source through an event.
+
+        Returns:
+            Mapping of SourceID to (full name, surname, PersonID)
+        """
+        with self.connect() as conn:
+            rows = conn.execute("""
+                SELECT ce.SourceID,
+                       TRIM(COALESCE(n.Given, '') || ' ' || COALESCE(n.Surname, '')),
+                       COALESCE(n.Surname, ''),
+                       n.OwnerID
+                FROM citation_event ce
+                JOIN name n ON ce.EventOwnerID = n.OwnerID AND n.IsPrimary = 1
+                GROUP BY ce.SourceID
+            """).fetchall()
+        return {row[0]: (row[1], row[2], row[3]) for row in rows}
+
+    def citations_by_year(self, census_year: int) -> list[sqlite3.Row]:
+        """Federal census citations for a year, ordered by source name.
+
+        Includes population, slave and mortality schedules.
+
+        Args:
+            census_year: Census year (1790-1950)
+
+        Returns:
+            Rows with CitationID, CitationName, ActualText, RefNumber,
+            Footnote, ShortFootnote, Bibliography, CitationFields,
+            SourceName, TemplateID and SourceFields
+        """
+        with self.connect() as conn:
+            return conn.execute(
+                """
+                SELECT
+                    c.CitationID,
+                    c.CitationName,
+                    c.ActualText,
+                    c.RefNumber,
+                    c.Footnote,
+                    c.ShortFootnote,
+                    c.Bibliography,
+                    c.Fields AS CitationFields,
+                    s.Name AS SourceName,
+                    s.TemplateID,
+                    s.Fields AS SourceFields
+                FROM citation c
+                JOIN source s ON c.SourceID = s.SourceID
+                WHERE s.Name LIKE ?
+                   OR s.Name LIKE ?
+                   OR s.Name LIKE ?
+                ORDER BY s.Name COLLATE RMNOCASE
+                """,
+                (
+                    f"Fed Census: {census_year}%",
+                    f"Fed Census Slave Schedule: {census_year}%",
+                    f"Fed Census Mortality Schedule: {census_year}%",
+                ),
+            ).fetchall()
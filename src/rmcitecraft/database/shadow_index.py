@@ -0,0 +1,562 @@
+"""
+Shadow index database kept next to a RootsMagic tree.
+
+RootsMagic's schema has no index for several of our hot lookups: URLTable
+is scanned for every Find a Grave queue, CitationLinkTable has no index on
+CitationID, and census sources are found with LIKE over SourceTable.Name
+and parsed in Python on every queue build. The .rmtree belongs to the user
+and is never altered, so the indexes live in a sidecar SQLite file
+(Tree.rmtree -> Tree.rmtree.shadow.db) that is ATTACHed read-only as
+``shadow`` to connections that need it. It doubles as the local cache
+behind rmtree_cache.RootsMagicCache:
+
+- person, name, fact_type, event, family, child, citation: normalized
+  copies of the columns we read from the matching RootsMagic tables
+- source: SourceTable plus schedule, year, state, county and ARK parsed
+  once from the name and Fields (the census_source view lists the
+  "Fed Census" ones)
+- url_link, citation_link, witness: narrow copies of URLTable,
+  CitationLinkTable and WitnessTable with covering indexes
+- citation_event: citation -> census/other event -> source, event owner
+  and year; the citation_person view adds witnesses
+
+refresh() is incremental. If the tree file's modification time and size
+are unchanged it reads nothing. Otherwise rows whose UTCModDate is newer
+than the last refresh are copied, and a row count mismatch triggers a key
+diff so deletions (and rows saved without UTCModDate) are picked up. A
+full rebuild happens on first use, on a schema change, or when the tree
+looks older than the index (e.g. a restored backup).
+
+When the sidecar cannot be written (read-only folder), attach_shadow_index()
+builds the same tables in an attached in-memory database instead, so
+callers always query the same ``shadow`` schema.
+"""
+
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import NamedTuple
+
+from loguru import logger
+
+from rmcitecraft.database.rmnocase import register_rmnocase
+
+SHADOW_SCHEMA_VERSION = 3
+
+SHADOW_SCHEMA = """
+CREATE TABLE IF NOT EXISTS {s}.shadow_meta (key TEXT PRIMARY KEY, value);
+
+CREATE TABLE IF NOT EXISTS {s}.person (PersonID INTEGER PRIMARY KEY, Sex INTEGER, Living INTEGER);
+
+CREATE TABLE IF NOT EXISTS {s}.name (
+    NameID INTEGER PRIMARY KEY, OwnerID INTEGER, Surname TEXT, Given TEXT, Prefix TEXT,
+    Suffix TEXT, Nickname TEXT, NameType INTEGER, IsPrimary INTEGER,
+    BirthYear INTEGER, DeathYear INTEGER
+);
+CREATE INDEX IF NOT EXISTS {s}.idx_name_owner ON name (OwnerID, IsPrimary);
+
+CREATE TABLE IF NOT EXISTS {s}.fact_type (FactTypeID INTEGER PRIMARY KEY, OwnerType INTEGER, Name TEXT);
+
+CREATE TABLE IF NOT EXISTS {s}.event (
+    EventID INTEGER PRIMARY KEY, EventType INTEGER, OwnerType INTEGER, OwnerID INTEGER,
+    FamilyID INTEGER, PlaceID INTEGER, Date TEXT, SortDate INTEGER, IsPrimary INTEGER
+);
+CREATE INDEX IF NOT EXISTS {s}.idx_event_owner ON event (OwnerID, EventType);
+CREATE INDEX IF NOT EXISTS {s}.idx_event_type ON event (EventType, OwnerType);
+
+CREATE TABLE IF NOT EXISTS {s}.family (
+    FamilyID INTEGER PRIMARY KEY, FatherID INTEGER, MotherID INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS {s}.child (
+    RecID INTEGER PRIMARY KEY, ChildID INTEGER, FamilyID INTEGER, ChildOrder INTEGER,
+    RelFather INTEGER, RelMother INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS {s}.source (
+    SourceID INTEGER PRIMARY KEY, Name TEXT, TemplateID INTEGER, Fields BLOB,
+    Schedule TEXT, CensusYear INTEGER, State TEXT, County TEXT, Ark TEXT
+);
+CREATE INDEX IF NOT EXISTS {s}.idx_source_census ON source (CensusYear, Schedule, State, County);
+CREATE INDEX IF NOT EXISTS {s}.idx_source_ark ON source (Ark);
+
+CREATE TABLE IF NOT EXISTS {s}.citation (
+    CitationID INTEGER PRIMARY KEY, SourceID INTEGER, CitationName TEXT, ActualText TEXT,
+    RefNumber TEXT, Footnote TEXT, ShortFootnote TEXT, Bibliography TEXT, Comments TEXT,
+    Fields BLOB
+);
+CREATE INDEX IF NOT EXISTS {s}.idx_citation_source ON citation (SourceID);
+
+CREATE TABLE IF NOT EXISTS {s}.url_link (
+    LinkID INTEGER PRIMARY KEY, OwnerType INTEGER, OwnerID INTEGER,
+    Name TEXT, URL TEXT, Note TEXT
+);
+CREATE INDEX IF NOT EXISTS {s}.idx_url_link_name_owner ON url_link (Name, OwnerType, OwnerID);
+
+CREATE TABLE IF NOT EXISTS {s}.citation_link (
+    LinkID INTEGER PRIMARY KEY, CitationID INTEGER, OwnerType INTEGER, OwnerID INTEGER
+);
+CREATE INDEX IF NOT EXISTS {s}.idx_citation_link_citation
+    ON citation_link (CitationID, OwnerType, OwnerID);
+CREATE INDEX IF NOT EXISTS {s}.idx_citation_link_owner
+    ON citation_link (OwnerType, OwnerID, CitationID);
+
+CREATE TABLE IF NOT EXISTS {s}.witness (
+    WitnessID INTEGER PRIMARY KEY, EventID INTEGER, PersonID INTEGER, Role INTEGER
+);
+CREATE INDEX IF NOT EXISTS {s}.idx_witness_event ON witness (EventID, PersonID, Role);
+CREATE INDEX IF NOT EXISTS {s}.idx_witness_person ON witness (PersonID, EventID);
+
+CREATE TABLE IF NOT EXISTS {s}.citation_event (
+    CitationID INTEGER, EventID INTEGER, SourceID INTEGER, EventType INTEGER,
+    EventOwnerType INTEGER, EventOwnerID INTEGER, CensusYear INTEGER,
+    PRIMARY KEY (CitationID, EventID)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS {s}.idx_citation_event_event ON citation_event (EventID);
+CREATE INDEX IF NOT EXISTS {s}.idx_citation_event_source
+    ON citation_event (SourceID, EventType, EventID);
+CREATE INDEX IF NOT EXISTS {s}.idx_citation_event_owner
+    ON citation_event (EventOwnerID, EventType);
+
+CREATE VIEW IF NOT EXISTS {s}.census_source AS
+    SELECT SourceID, TemplateID, Schedule, CensusYear, State, County, Ark
+    FROM source WHERE Name LIKE 'Fed Census%';
+
+CREATE VIEW IF NOT EXISTS {s}.citation_person AS
+    SELECT CitationID, EventID, EventOwnerID AS PersonID, NULL AS Role
+    FROM citation_event WHERE EventOwnerType = 0
+    UNION ALL
+    SELECT ce.CitationID, ce.EventID, w.PersonID, w.Role
+    FROM citation_event ce JOIN witness w ON w.EventID = ce.EventID
+    WHERE w.PersonID > 0;
+"""
+
+
+# One refresh at a time per process (batch workers share a sidecar)
+_refresh_lock = threading.Lock()
+
+
+class _Mirror(NamedTuple):
+    """How one RootsMagic table is copied into the shadow index."""
+
+    rm_table: str
+    table: str
+    key: str
+    columns: str
+    # Row transform for columns parsed in Python (rm columns -> shadow row)
+    parse: Callable[[tuple], tuple] | None = None
+    rm_columns: str | None = None
+    # Column whose old and new values go to a temp dirty table for citation_event
+    dirty: tuple[str, str] | None = None
+
+
+def _parse_source_row(row: tuple) -> tuple:
+    source_id, name, template_id, fields = row
+    parsed = parse_census_source(name, fields)
+    return (source_id, name, template_id, fields, *parsed.values())
+
+
+_MIRRORS = (
+    _Mirror("PersonTable", "person", "PersonID", "PersonID, Sex, Living"),
+    _Mirror(
+        "NameTable", "name", "NameID",
+        "NameID, OwnerID, Surname, Given, Prefix, Suffix, Nickname, NameType, IsPrimary, "
+        "BirthYear, DeathYear",
+    ),
+    _Mirror("FactTypeTable", "fact_type", "FactTypeID", "FactTypeID, OwnerType, Name"),
+    _Mirror(
+        "EventTable", "event", "EventID",
+        "EventID, EventType, OwnerType, OwnerID, FamilyID, PlaceID, Date, SortDate, IsPrimary",
+        dirty=("shadow_dirty_events", "EventID"),
+    ),
+    _Mirror("FamilyTable", "family", "FamilyID", "FamilyID, FatherID, MotherID"),
+    _Mirror(
+        "ChildTable", "child", "RecID",
+        "RecID, ChildID, FamilyID, ChildOrder, RelFather, RelMother",
+    ),
+    _Mirror(
+        "SourceTable", "source", "SourceID",
+        "SourceID, Name, TemplateID, Fields, Schedule, CensusYear, State, County, Ark",
+        parse=_parse_source_row,
+        rm_columns="SourceID, Name, TemplateID, Fields",
+    ),
+    _Mirror(
+        "CitationTable", "citation", "CitationID",
+        "CitationID, SourceID, CitationName, ActualText, RefNumber, Footnote, ShortFootnote, "
+        "Bibliography, Comments, Fields",
+        dirty=("shadow_dirty_citations", "CitationID"),
+    ),
+    _Mirror("URLTable", "url_link", "LinkID", "LinkID, OwnerType, OwnerID, Name, URL, Note"),
+    _Mirror(
+        "CitationLinkTable", "citation_link", "LinkID", "LinkID, CitationID, OwnerType, OwnerID",
+        dirty=("shadow_dirty_citations", "CitationID"),
+    ),
+    _Mirror("WitnessTable", "witness", "WitnessID", "WitnessID, EventID, PersonID, Role"),
+)
+
+# RootsMagic stamps UTCModDate in days (~45000); some of our own writes use
+# Unix seconds. Each kind gets its own watermark so neither hides the other.
+_UNIX_STAMP_MIN = 1e6
+
+# Source name formats:
+#   - Population: "Fed Census: 1950, Arizona, Pima [citing ...]"
+#   - Slave: "Fed Census Slave Schedule: 1850, North Carolina, Davie [...]"
+#   - Mortality: "Fed Census Mortality Schedule: 1850, New Jersey, Warren [...]"
+_CENSUS_NAME_RE = re.compile(
+    r"Fed Census(?: (Slave|Mortality) Schedule)?:\s*(\d{4}),\s*([^,]+),\s*([^\s\[]+)",
+    re.IGNORECASE,
+)
+_ARK_RE = re.compile(r"familysearch\.org/ark:/61903/(1:1:[A-Z0-9-]+)")
+
+# Census year from RootsMagic's date format (D.+YYYYMMDD...)
+_CITATION_EVENT_SELECT = """
+    SELECT cl.CitationID, cl.OwnerID, c.SourceID, e.EventType, e.OwnerType, e.OwnerID,
+           CASE WHEN length(e.Date) >= 7 THEN CAST(substr(e.Date, 4, 4) AS INTEGER) ELSE 0 END
+    FROM {dst}.citation_link cl
+    JOIN {dst}.event e ON e.EventID = cl.OwnerID
+    LEFT JOIN {dst}.citation c ON c.CitationID = cl.CitationID
+    WHERE cl.OwnerType = 2
+"""
+
+
+def shadow_index_path(rmtree_path: str | Path) -> Path:
+    """Sidecar path for a tree: Tree.rmtree -> Tree.rmtree.shadow.db."""
+    rmtree_path = Path(rmtree_path)
+    return rmtree_path.with_name(rmtree_path.name + ".shadow.db")
+
+
+def parse_census_source(name: str, fields: bytes | str | None) -> dict[str, object]:
+    """Parse schedule, year, state, county and ARK of a census source.
+
+    Args:
+        name: SourceTable.Name
+        fields: SourceTable.Fields blob
+
+    Returns:
+        Dict with Schedule ('population', 'slave' or 'mortality'), CensusYear,
+        State, County and Ark (None for anything that does not parse)
+    """
+    parsed: dict[str, object] = dict.fromkeys(("Schedule", "CensusYear", "State", "County", "Ark"))
+    name_match = _CENSUS_NAME_RE.match(name or "")
+    if name_match:
+        schedule, year, state, county = name_match.groups()
+        parsed.update(
+            Schedule=(schedule or "population").lower(),
+            CensusYear=int(year),
+            State=state.strip(),
+            County=county.strip(),
+        )
+    if fields:
+        fields_str = fields.decode("utf-8", "replace") if isinstance(fields, bytes) else fields
+        ark_match = _ARK_RE.search(fields_str)
+        if ark_match:
+            parsed["Ark"] = ark_match.group(1)
+    return parsed
+
+
+@dataclass
+class RefreshStats:
+    """Outcome of one shadow index refresh."""
+
+    full: bool
+    unchanged: bool = False  # tree file untouched since the last refresh
+    elapsed_ms: float = 0.0
+    rows: dict[str, int] = field(default_factory=dict)
+
+
+class ShadowIndex:
+    """Builds and refreshes the shadow index of one RootsMagic tree."""
+
+    def __init__(self, rmtree_path: str | Path, path: str | Path | None = None):
+        """Initialize for a tree.
+
+        Args:
+            rmtree_path: RootsMagic .rmtree file (only ever read)
+            path: Sidecar database (default: shadow_index_path(rmtree_path))
+        """
+        self.rmtree_path = Path(rmtree_path)
+        self.path = Path(path) if path else shadow_index_path(self.rmtree_path)
+
+    def refresh(self, full: bool = False) -> RefreshStats:
+        """Bring the sidecar up to date with the tree.
+
+        Args:
+            full: Rebuild every table instead of applying changes
+
+        Returns:
+            RefreshStats with the rows written per table
+
+        Raises:
+            FileNotFoundError: If the tree does not exist
+            sqlite3.Error / OSError: If the sidecar cannot be written
+        """
+        if not self.rmtree_path.exists():
+            raise FileNotFoundError(f"Database not found: {self.rmtree_path}")
+
+        fingerprint = self.fingerprint()
+        with _refresh_lock:
+            conn = sqlite3.connect(self.path.resolve().as_uri(), uri=True)
+            try:
+                register_rmnocase(conn)
+                conn.execute(
+                    "ATTACH DATABASE ? AS rm", (self.rmtree_path.resolve().as_uri() + "?mode=ro",)
+                )
+                stats = build_shadow_tables(
+                    conn, src="rm", dst="main", full=full, fingerprint=fingerprint
+                )
+                conn.execute("DETACH DATABASE rm")
+            finally:
+                conn.close()
+        if not stats.unchanged:
+            logger.debug(
+                f"Shadow index refreshed ({'full' if stats.full else 'incremental'}, "
+                f"{stats.elapsed_ms:.0f} ms): {stats.rows}"
+            )
+        return stats
+
+    def fingerprint(self) -> str:
+        """Modification time and size of the tree and its WAL file."""
+        parts = []
+        for path in (self.rmtree_path, self.rmtree_path.with_name(self.rmtree_path.name + "-wal")):
+            if path.exists():
+                stat = path.stat()
+                parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+        return "/".join(parts)
+
+    def attach(self, conn: sqlite3.Connection, name: str = "shadow") -> None:
+        """ATTACH the sidecar read-only to a connection opened with uri=True."""
+        conn.execute(
+            f"ATTACH DATABASE ? AS {name}", (self.path.resolve().as_uri() + "?mode=ro",)
+        )
+
+
+def build_shadow_tables(
+    conn: sqlite3.Connection,
+    src: str,
+    dst: str,
+    full: bool = False,
+    fingerprint: str | None = None,
+) -> RefreshStats:
+    """Create or update the shadow tables in schema ``dst`` from schema ``src``.
+
+    Args:
+        conn: Connection with both schemas attached
+        src: Schema name of the RootsMagic tree
+        dst: Schema name of the shadow tables
+        full: Rebuild every table instead of applying changes
+        fingerprint: Identity of the tree file's current contents; when it
+            matches the last refresh, nothing is read from the tree
+
+    Returns:
+        RefreshStats with the rows written per table
+    """
+    start = time.perf_counter()
+    conn.execute(f"CREATE TABLE IF NOT EXISTS {dst}.shadow_meta (key TEXT PRIMARY KEY, value)")
+    meta = dict(conn.execute(f"SELECT key, value FROM {dst}.shadow_meta"))
+    if meta.get("schema_version") != SHADOW_SCHEMA_VERSION:
+        _drop_shadow_objects(conn, dst)
+        meta = {}
+    elif not full and fingerprint and meta.get("fingerprint") == fingerprint:
+        return RefreshStats(
+            full=False, unchanged=True, elapsed_ms=(time.perf_counter() - start) * 1000
+        )
+    conn.executescript(SHADOW_SCHEMA.format(s=dst))
+
+    # (latest RootsMagic stamp, latest Unix stamp, row count) per table
+    state = {
+        mirror.rm_table: conn.execute(
+            f"SELECT MAX(CASE WHEN UTCModDate < {_UNIX_STAMP_MIN} THEN UTCModDate END), "
+            f"MAX(CASE WHEN UTCModDate >= {_UNIX_STAMP_MIN} THEN UTCModDate END), COUNT(*) "
+            f"FROM {src}.{mirror.rm_table}"
+        ).fetchone()
+        for mirror in _MIRRORS
+    }
+    full = (
+        full
+        or not meta
+        # The tree went back in time: restored backup or a different file
+        or any(
+            (modified or 0) < (meta.get(f"modified:{table}") or 0)
+            or (modified_unix or 0) < (meta.get(f"modified_unix:{table}") or 0)
+            for table, (modified, modified_unix, _) in state.items()
+        )
+    )
+    stats = RefreshStats(full=full)
+
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS shadow_dirty_citations (id INTEGER PRIMARY KEY)")
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS shadow_dirty_events (id INTEGER PRIMARY KEY)")
+    try:
+        with conn:
+            if full:
+                for mirror in _MIRRORS:
+                    conn.execute(f"DELETE FROM {dst}.{mirror.table}")
+                meta = {}
+            for mirror in _MIRRORS:
+                watermarks = None if full else (
+                    meta.get(f"modified:{mirror.rm_table}") or 0,
+                    meta.get(f"modified_unix:{mirror.rm_table}") or _UNIX_STAMP_MIN,
+                )
+                stats.rows[mirror.table] = _refresh_mirror(
+                    conn, src, dst, mirror, watermarks, state[mirror.rm_table][2]
+                )
+            stats.rows["citation_event"] = _refresh_citation_events(conn, dst, full)
+
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {dst}.shadow_meta (key, value) VALUES (?, ?)",
+                [
+                    ("schema_version", SHADOW_SCHEMA_VERSION),
+                    ("refreshed_at", time.time()),
+                    ("fingerprint", fingerprint),
+                    *((f"modified:{table}", modified) for table, (modified, _, _) in state.items()),
+                    *(
+                        (f"modified_unix:{table}", modified_unix)
+                        for table, (_, modified_unix, _) in state.items()
+                    ),
+                ],
+            )
+    finally:
+        conn.execute("DROP TABLE IF EXISTS temp.shadow_dirty_citations")
+        conn.execute("DROP TABLE IF EXISTS temp.shadow_dirty_events")
+
+    stats.elapsed_ms = (time.perf_counter() - start) * 1000
+    return stats
+
+
+def _drop_shadow_objects(conn: sqlite3.Connection, dst: str) -> None:
+    """Drop every table and view of an older shadow schema."""
+    objects = conn.execute(
+        f"SELECT type, name FROM {dst}.sqlite_master "
+        "WHERE type IN ('table', 'view') AND name NOT LIKE 'sqlite_%'"
+    ).fetchall()
+    for object_type, name in objects:
+        conn.execute(f"DROP {object_type.upper()} IF EXISTS {dst}.{name}")
+
+
+def _copy_rows(
+    conn: sqlite3.Connection, src: str, dst: str, mirror: _Mirror, where: str, params: tuple = ()
+) -> int:
+    """Copy the RootsMagic rows matching ``where`` into the shadow table."""
+    if mirror.parse is None:
+        return conn.execute(
+            f"INSERT OR REPLACE INTO {dst}.{mirror.table} ({mirror.columns}) "
+            f"SELECT {mirror.columns} FROM {src}.{mirror.rm_table} WHERE {where}",
+            params,
+        ).rowcount
+    rows = conn.execute(
+        f"SELECT {mirror.rm_columns} FROM {src}.{mirror.rm_table} WHERE {where}", params
+    ).fetchall()
+    placeholders = ", ".join("?" * len(mirror.columns.split(",")))
+    conn.executemany(
+        f"INSERT OR REPLACE INTO {dst}.{mirror.table} ({mirror.columns}) VALUES ({placeholders})",
+        (mirror.parse(row) for row in rows),
+    )
+    return len(rows)
+
+
+def _mark_dirty(conn: sqlite3.Connection, mirror: _Mirror, select: str, params: tuple = ()) -> None:
+    """Record the dirty column of the rows selected by ``select`` (which yields that column)."""
+    dirty_table, _ = mirror.dirty
+    conn.execute(f"INSERT OR IGNORE INTO temp.{dirty_table} {select}", params)
+
+
+def _refresh_mirror(
+    conn: sqlite3.Connection,
+    src: str,
+    dst: str,
+    mirror: _Mirror,
+    watermarks: tuple[float, float] | None,
+    source_count: int,
+) -> int:
+    """Copy changed rows of one RootsMagic table; returns rows written.
+
+    ``watermarks`` are the latest RootsMagic and Unix UTCModDate stamps
+    already copied, or None to copy every row.
+    """
+    rm_table, table, key = mirror.rm_table, mirror.table, mirror.key
+    dirty_column = mirror.dirty[1] if mirror.dirty else None
+
+    if watermarks is None:
+        written = _copy_rows(conn, src, dst, mirror, "1")
+    else:
+        # Unix stamps only have whole seconds: a row written later in the same
+        # second as the watermark row carries the same stamp, so take rows at
+        # the watermark again (INSERT OR REPLACE makes that harmless)
+        newer = f"((UTCModDate > ? AND UTCModDate < {_UNIX_STAMP_MIN}) OR UTCModDate >= ?)"
+        changed = f"SELECT {key} FROM {src}.{rm_table} WHERE {newer}"
+        if dirty_column:
+            # Old values too: a relinked citation loses its old event
+            _mark_dirty(
+                conn, mirror,
+                f"SELECT {dirty_column} FROM {dst}.{table} WHERE {key} IN ({changed})",
+                watermarks,
+            )
+            _mark_dirty(
+                conn, mirror,
+                f"SELECT {dirty_column} FROM {src}.{rm_table} WHERE {newer}",
+                watermarks,
+            )
+        written = _copy_rows(conn, src, dst, mirror, newer, watermarks)
+
+    shadow_count = conn.execute(f"SELECT COUNT(*) FROM {dst}.{table}").fetchone()[0]
+    if shadow_count != source_count:
+        # Deleted rows, or rows saved without a newer UTCModDate
+        gone = f"SELECT {key} FROM {dst}.{table} WHERE {key} NOT IN (SELECT {key} FROM {src}.{rm_table})"
+        missing = f"{key} NOT IN (SELECT {key} FROM {dst}.{table})"
+        if dirty_column:
+            _mark_dirty(
+                conn, mirror,
+                f"SELECT {dirty_column} FROM {dst}.{table} WHERE {key} IN ({gone}) "
+                f"UNION SELECT {dirty_column} FROM {src}.{rm_table} WHERE {missing}",
+            )
+        written += conn.execute(f"DELETE FROM {dst}.{table} WHERE {key} IN ({gone})").rowcount
+        written += _copy_rows(conn, src, dst, mirror, missing)
+    return written
+
+
+def _refresh_citation_events(conn: sqlite3.Connection, dst: str, full: bool) -> int:
+    """Recompute citation_event rows touched by link, event or citation changes."""
+    select = _CITATION_EVENT_SELECT.format(dst=dst)
+    if full:
+        conn.execute(f"DELETE FROM {dst}.citation_event")
+        return conn.execute(f"INSERT OR IGNORE INTO {dst}.citation_event {select}").rowcount
+
+    conn.execute(
+        f"DELETE FROM {dst}.citation_event "
+        "WHERE CitationID IN (SELECT id FROM temp.shadow_dirty_citations) "
+        "OR EventID IN (SELECT id FROM temp.shadow_dirty_events)"
+    )
+    return conn.execute(
+        f"INSERT OR IGNORE INTO {dst}.citation_event {select} "
+        "AND (cl.CitationID IN (SELECT id FROM temp.shadow_dirty_citations) "
+        "OR cl.OwnerID IN (SELECT id FROM temp.shadow_dirty_events))"
+    ).rowcount
+
+
+def attach_shadow_index(conn: sqlite3.Connection, rmtree_path: str | Path) -> bool:
+    """ATTACH the tree's shadow index to a read-only RootsMagic connection as ``shadow``.
+
+    The sidecar is refreshed first; when the tree file is untouched since
+    the last refresh that costs a stat() call. If the sidecar cannot be
+    written, the shadow tables are built in memory for this connection.
+
+    Args:
+        conn: Connection from connect_rmtree(read_only=True)
+        rmtree_path: Path of the tree ``conn`` is connected to
+
+    Returns:
+        True if the sidecar file was attached, False for the in-memory fallback
+    """
+    index = ShadowIndex(rmtree_path)
+    try:
+        index.refresh()
+        index.attach(conn)
+        return True
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Shadow index unavailable ({e}); building it in memory")
+        conn.execute("ATTACH DATABASE ':memory:' AS shadow")
+        build_shadow_tables(conn, src="main", dst="shadow", full=True)
+        return False
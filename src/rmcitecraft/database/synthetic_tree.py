@@ -0,0 +1,769 @@
+"""
+Synthetic RootsMagic database generator for scale testing.
+
+Builds a schema-valid .rmtree SQLite file (the RM11 schema shipped in
+schemas/rmtree/rmtree_schema.sql) filled with deterministic, seeded data
+shaped like a real genealogy tree, plus an optional matching census.db:
+
+- PersonTable and NameTable, including alternate names (maiden, AKA)
+- FamilyTable and ChildTable rows linking each household's couple and
+  children
+- Birth and Death events, census events owned by the household head with
+  the other members attached as WitnessTable rows (some without a RIN)
+- Free-form "Fed Census: ..." sources whose Fields XML carries the
+  FamilySearch ARK, with citations linked to the census events
+- Find a Grave URLTable links, some already cited by a Find a Grave source
+- MultimediaTable census images and memorial photos with MediaLinkTable rows
+
+The census.db contains extractions for a share of the households, keyed by
+the same ARKs and linked back to the tree with rmtree_link rows, so queue
+building, matching and the batch tabs see a realistic mix of done and
+pending work. Rows are written with executemany in batches so a 500k-person
+tree builds in a couple of minutes.
+
+Example:
+    stats = generate_synthetic_tree(
+        Path("/tmp/scale.rmtree"),
+        SyntheticTreeConfig(persons=100_000, seed=7),
+        census_db_path=Path("/tmp/scale-census.db"),
+    )
+"""
+
+import random
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from xml.sax.saxutils import escape
+
+from loguru import logger
+
+from rmcitecraft.database.census_extraction_db import CensusExtractionRepository
+from rmcitecraft.database.rmnocase import register_rmnocase
+
+RMTREE_SCHEMA_PATH = Path(__file__).parent.parent / "schemas" / "rmtree" / "rmtree_schema.sql"
+
+# Built-in RootsMagic fact types used by the generator
+FACT_BIRTH = 1
+FACT_DEATH = 2
+FACT_CENSUS = 18
+
+# NameTable.NameType values
+NAME_TYPE_AKA = 1
+NAME_TYPE_MAIDEN = 4
+
+# CitationLinkTable / MediaLinkTable owner types
+OWNER_PERSON = 0
+OWNER_EVENT = 2
+
+# Fixed UTCModDate keeps output reproducible: 2025-01-01 12:00 as a
+# Delphi/OLE date (days since 1899-12-30)
+UTC_MOD_DATE = 45658.5
+
+# Characters FamilySearch uses in ARK identifiers
+ARK_ALPHABET = "0123456789BCDFGHJKLMNPQRSTVWXZ"
+
+SURNAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Miller", "Davis", "Wilson",
+    "Anderson", "Taylor", "Thomas", "Moore", "Martin", "Jackson", "Thompson", "White",
+    "Harris", "Clark", "Lewis", "Robinson", "Walker", "Young", "Allen", "King",
+    "Wright", "Scott", "Hill", "Green", "Adams", "Baker", "Nelson", "Carter",
+    "Mitchell", "Roberts", "Turner", "Phillips", "Campbell", "Parker", "Evans", "Edwards",
+    "Collins", "Stewart", "Morris", "Murphy", "Cook", "Rogers", "Morgan", "Cooper",
+    "Peterson", "Reed", "Bailey", "Bell", "Kelly", "Howard", "Ward", "Cox",
+    "Richardson", "Wood", "Watson", "Brooks", "Bennett", "Gray", "Hughes", "Price",
+    "Sanders", "Myers", "Long", "Ross", "Foster", "Ijams", "Iams", "Mueller",
+    "Schneider", "Fischer", "Weber", "Wagner", "Becker", "Hoffmann", "O'Brien", "McDonald",
+]
+
+MALE_GIVEN = [
+    "John", "William", "James", "George", "Charles", "Frank", "Joseph", "Henry",
+    "Robert", "Thomas", "Edward", "Harry", "Walter", "Arthur", "Fred", "Albert",
+    "Samuel", "Clarence", "Louis", "David", "Joe", "Charlie", "Richard", "Ernest",
+    "Roy", "Will", "Andrew", "Jesse", "Oscar", "Willie", "Daniel", "Benjamin",
+]
+
+FEMALE_GIVEN = [
+    "Mary", "Anna", "Emma", "Elizabeth", "Margaret", "Minnie", "Ida", "Bertha",
+    "Clara", "Alice", "Annie", "Florence", "Bessie", "Grace", "Ethel", "Sarah",
+    "Ella", "Martha", "Nellie", "Mabel", "Laura", "Carrie", "Mamie", "Lillie",
+    "Helen", "Ruth", "Dorothy", "Mildred", "Frances", "Edna", "Marie", "Lena",
+]
+
+NICKNAMES = {
+    "William": "Bill", "James": "Jim", "Robert": "Bob", "Charles": "Charley",
+    "Joseph": "Joe", "Thomas": "Tom", "Edward": "Ed", "Henry": "Harry",
+    "Elizabeth": "Lizzie", "Margaret": "Maggie", "Mary": "Polly", "Sarah": "Sallie",
+}
+
+COUNTIES = {
+    "Ohio": ["Noble", "Guernsey", "Washington", "Monroe", "Belmont", "Muskingum"],
+    "Pennsylvania": ["Greene", "Washington", "Fayette", "Allegheny", "Westmoreland"],
+    "Maryland": ["Baltimore", "Frederick", "Howard", "Montgomery", "Carroll"],
+    "West Virginia": ["Marshall", "Wetzel", "Tyler", "Ohio", "Monongalia"],
+    "Indiana": ["Marion", "Wayne", "Randolph", "Delaware", "Grant"],
+    "Illinois": ["Cook", "Sangamon", "Peoria", "McLean", "Champaign"],
+    "Iowa": ["Polk", "Linn", "Scott", "Story", "Jasper"],
+    "Texas": ["Harris", "Dallas", "Travis", "Bexar", "Tarrant"],
+}
+
+CEMETERIES = [
+    "Olive Cemetery", "Mount Zion Cemetery", "Greenwood Cemetery", "Oak Hill Cemetery",
+    "Riverside Cemetery", "Fairview Cemetery", "Evergreen Cemetery", "Union Cemetery",
+]
+
+# Household sizes and their weights (head alone through head, spouse, six children)
+HOUSEHOLD_SIZES = [1, 2, 3, 4, 5, 6, 7, 8]
+HOUSEHOLD_WEIGHTS = [10, 20, 20, 18, 13, 9, 6, 4]
+
+WITNESS_ROLES = ["Wife", "Husband", "Son", "Daughter", "Boarder"]
+
+
+@dataclass
+class SyntheticTreeConfig:
+    """Shape of a generated tree.
+
+    Attributes:
+        persons: Number of PersonTable rows
+        seed: Random seed; the same seed always produces the same tree
+        census_years: Census years households are enumerated in
+        alternate_name_rate: Share of persons with an alternate name
+        non_rin_witness_rate: Share of households with an extra witness who
+            has no RIN (WitnessTable.PersonID = 0)
+        findagrave_rate: Share of deceased persons with a Find a Grave link
+        findagrave_cited_rate: Share of Find a Grave links already cited
+        media_rate: Share of census events with an attached census image
+        extracted_rate: Share of census households present in census.db
+        batch_size: Rows buffered per table before each executemany
+    """
+
+    persons: int = 10_000
+    seed: int = 0
+    census_years: tuple[int, ...] = (1900, 1910, 1920, 1930, 1940, 1950)
+    alternate_name_rate: float = 0.15
+    non_rin_witness_rate: float = 0.1
+    findagrave_rate: float = 0.3
+    findagrave_cited_rate: float = 0.4
+    media_rate: float = 0.5
+    extracted_rate: float = 0.5
+    batch_size: int = 5_000
+
+
+@dataclass
+class SyntheticTreeStats:
+    """Row counts written by generate_synthetic_tree()."""
+
+    persons: int = 0
+    names: int = 0
+    events: int = 0
+    witnesses: int = 0
+    families: int = 0
+    sources: int = 0
+    citations: int = 0
+    urls: int = 0
+    media: int = 0
+    households: int = 0
+    census_persons: int = 0
+    table_rows: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class _Member:
+    """A generated person within a household."""
+
+    person_id: int
+    given: str
+    surname: str
+    sex: int
+    birth_year: int
+    role: str
+    death_year: int | None = None
+
+
+def rm_date(year: int, month: int = 0, day: int = 0) -> str:
+    """Encode a simple date in RootsMagic's EventTable.Date format."""
+    return f"D.+{year:04d}{month:02d}{day:02d}..+00000000.."
+
+
+def rm_sort_date(year: int, month: int = 0, day: int = 0) -> int:
+    """Encode a simple date as a RootsMagic SortDate."""
+    return ((year + 10000) << 49) + (month << 45) + (day << 39) + 17178820620
+
+
+class _TableWriter:
+    """Buffers rows per table and flushes them with executemany."""
+
+    def __init__(self, conn: sqlite3.Connection, batch_size: int):
+        self.conn = conn
+        self.batch_size = batch_size
+        self.counts: dict[str, int] = {}
+        self._sql: dict[str, str] = {}
+        self._rows: dict[str, list[tuple[Any, ...]]] = {}
+
+    def add(self, table: str, columns: str, row: tuple[Any, ...]) -> None:
+        if table not in self._sql:
+            placeholders = ", ".join("?" * len(row))
+            self._sql[table] = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+            self._rows[table] = []
+        rows = self._rows[table]
+        rows.append(row)
+        if len(rows) >= self.batch_size:
+            self._flush_table(table)
+
+    def _flush_table(self, table: str) -> None:
+        rows = self._rows[table]
+        if rows:
+            self.conn.executemany(self._sql[table], rows)
+            self.counts[table] = self.counts.get(table, 0) + len(rows)
+            rows.clear()
+
+    def flush(self) -> None:
+        for table in self._rows:
+            self._flush_table(table)
+
+
+class SyntheticTreeGenerator:
+    """Writes a synthetic RootsMagic tree and matching census.db."""
+
+    def __init__(self, config: SyntheticTreeConfig | None = None):
+        self.config = config or SyntheticTreeConfig()
+        self.rng = random.Random(self.config.seed)
+        self._arks: set[str] = set()
+        self._ids: dict[str, int] = {}
+        self._places: dict[str, int] = {}
+        # Extracted households queued for census.db: (citation_id, event_id,
+        # year, state, county, ED, sheet, line, family, members, member ARKs)
+        self._census_households: list[tuple[Any, ...]] = []
+
+    def generate(self, rmtree_path: Path, census_db_path: Path | None = None) -> SyntheticTreeStats:
+        """Generate the tree (and census.db if a path is given).
+
+        Args:
+            rmtree_path: Output .rmtree path (must not exist)
+            census_db_path: Output census.db path (must not exist), or None
+
+        Returns:
+            Row counts written
+
+        Raises:
+            FileExistsError: If an output file already exists
+        """
+        for path in (rmtree_path, census_db_path):
+            if path is not None and path.exists():
+                raise FileExistsError(f"Refusing to overwrite {path}")
+
+        stats = SyntheticTreeStats()
+        conn = sqlite3.connect(rmtree_path)
+        try:
+            register_rmnocase(conn)
+            conn.execute("PRAGMA journal_mode = OFF")
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.executescript(RMTREE_SCHEMA_PATH.read_text())
+
+            writer = _TableWriter(conn, self.config.batch_size)
+            self._write_reference_rows(writer)
+
+            person_id = 0
+            while person_id < self.config.persons:
+                size = self.rng.choices(HOUSEHOLD_SIZES, HOUSEHOLD_WEIGHTS)[0]
+                size = min(size, self.config.persons - person_id)
+                census_year, members = self._make_household(person_id, size)
+                person_id += size
+                self._write_household(writer, census_year, members)
+                stats.households += 1
+
+            writer.flush()
+            conn.commit()
+            stats.table_rows = dict(writer.counts)
+        finally:
+            conn.close()
+
+        counts = stats.table_rows
+        stats.persons = counts.get("PersonTable", 0)
+        stats.names = counts.get("NameTable", 0)
+        stats.events = counts.get("EventTable", 0)
+        stats.witnesses = counts.get("WitnessTable", 0)
+        stats.families = counts.get("FamilyTable", 0)
+        stats.sources = counts.get("SourceTable", 0)
+        stats.citations = counts.get("CitationTable", 0)
+        stats.urls = counts.get("URLTable", 0)
+        stats.media = counts.get("MultimediaTable", 0)
+
+        if census_db_path is not None:
+            stats.census_persons = self._write_census_db(census_db_path, rmtree_path)
+
+        logger.info(
+            f"Generated synthetic tree {rmtree_path}: {stats.persons} persons, "
+            f"{stats.households} households, {stats.sources} sources"
+        )
+        return stats
+
+    # -------------------------------------------------------------------------
+    # Helpers
+    # -------------------------------------------------------------------------
+
+    def _next_id(self, table: str) -> int:
+        self._ids[table] = self._ids.get(table, 0) + 1
+        return self._ids[table]
+
+    def _new_ark(self) -> str:
+        while True:
+            ark = "1:1:{}-{}".format(
+                "".join(self.rng.choices(ARK_ALPHABET, k=4)),
+                "".join(self.rng.choices(ARK_ALPHABET, k=3)),
+            )
+            if ark not in self._arks:
+                self._arks.add(ark)
+                return ark
+
+    def _place_id(self, writer: _TableWriter, name: str) -> int:
+        place_id = self._places.get(name)
+        if place_id is None:
+            place_id = self._next_id("PlaceTable")
+            self._places[name] = place_id
+            writer.add(
+                "PlaceTable",
+                "PlaceID, PlaceType, Name, Abbrev, Normalized, MasterID, Reverse, UTCModDate",
+                (place_id, 0, name, "", name, 0, ", ".join(reversed(name.split(", "))),
+                 UTC_MOD_DATE),
+            )
+        return place_id
+
+    def _write_reference_rows(self, writer: _TableWriter) -> None:
+        """Fact types and witness roles referenced by generated rows."""
+        for fact_id, name, abbrev, tag in (
+            (FACT_BIRTH, "Birth", "Birth", "BIRT"),
+            (FACT_DEATH, "Death", "Death", "DEAT"),
+            (FACT_CENSUS, "Census", "Census", "CENS"),
+        ):
+            writer.add(
+                "FactTypeTable",
+                "FactTypeID, OwnerType, Name, Abbrev, GedcomTag, UseValue, UseDate, "
+                "UsePlace, Sentence, Flags, UTCModDate",
+                (fact_id, 0, name, abbrev, tag, 0, 1, 1, "", -1, UTC_MOD_DATE),
+            )
+        for role_name in WITNESS_ROLES:
+            writer.add(
+                "RoleTable",
+                "RoleID, RoleName, EventType, RoleType, Sentence, UTCModDate",
+                (self._next_id("RoleTable"), role_name, FACT_CENSUS, 0, "", UTC_MOD_DATE),
+            )
+        self._role_ids = {name: i for i, name in enumerate(WITNESS_ROLES, start=1)}
+
+    def _make_household(self, first_id: int, size: int) -> tuple[int, list[_Member]]:
+        """Census year and members of a household (everyone born by the census)."""
+        rng = self.rng
+        year = rng.choice(self.config.census_years)
+        surname = rng.choice(SURNAMES)
+        head_sex = 0 if size > 1 or rng.random() < 0.7 else 1
+        head_birth = year - rng.randint(25, 60)
+        given = rng.choice(MALE_GIVEN if head_sex == 0 else FEMALE_GIVEN)
+        members = [_Member(first_id + 1, given, surname, head_sex, head_birth, "Head")]
+
+        if size > 1:
+            spouse_sex = 1 - head_sex
+            members.append(
+                _Member(
+                    first_id + 2,
+                    rng.choice(FEMALE_GIVEN if spouse_sex == 1 else MALE_GIVEN),
+                    surname,
+                    spouse_sex,
+                    head_birth + rng.randint(-3, 8),
+                    "Wife" if spouse_sex == 1 else "Husband",
+                )
+            )
+        youngest_parent = max(m.birth_year for m in members)
+        for offset in range(2, size):
+            sex = rng.randint(0, 1)
+            birth = min(year, youngest_parent + rng.randint(18, 40))
+            members.append(
+                _Member(
+                    first_id + offset + 1,
+                    rng.choice(MALE_GIVEN if sex == 0 else FEMALE_GIVEN),
+                    surname,
+                    sex,
+                    birth,
+                    "Son" if sex == 0 else "Daughter",
+                )
+            )
+
+        for member in members:
+            death = member.birth_year + rng.randint(40, 98)
+            if death <= 2020:
+                member.death_year = max(death, year + 1)
+        return year, members
+
+    # -------------------------------------------------------------------------
+    # Row writers
+    # -------------------------------------------------------------------------
+
+    def _write_household(
+        self, writer: _TableWriter, census_year: int, members: list[_Member]
+    ) -> None:
+        rng = self.rng
+        config = self.config
+        head = members[0]
+        state = rng.choice(list(COUNTIES))
+        county = rng.choice(COUNTIES[state])
+        place_id = self._place_id(writer, f"{county}, {state}, United States")
+
+        for member in members:
+            self._write_person(writer, member, place_id)
+        if len(members) > 1:
+            self._write_family(writer, members)
+
+        # Census event owned by the head; the rest of the household are witnesses
+        event_id = self._next_id("EventTable")
+        self._write_event(writer, event_id, FACT_CENSUS, head.person_id, place_id,
+                          census_year, 4, 1)
+        for order, member in enumerate(members[1:], start=1):
+            writer.add(
+                "WitnessTable",
+                "WitnessID, EventID, PersonID, WitnessOrder, Role, Sentence, Note, "
+                "Given, Surname, Prefix, Suffix, UTCModDate",
+                (self._next_id("WitnessTable"), event_id, member.person_id, order,
+                 self._role_ids[member.role], "", "", "", "", "", "", UTC_MOD_DATE),
+            )
+        if rng.random() < config.non_rin_witness_rate:
+            boarder_sex = rng.randint(0, 1)
+            writer.add(
+                "WitnessTable",
+                "WitnessID, EventID, PersonID, WitnessOrder, Role, Sentence, Note, "
+                "Given, Surname, Prefix, Suffix, UTCModDate",
+                (self._next_id("WitnessTable"), event_id, 0, len(members),
+                 self._role_ids["Boarder"], "", "",
+                 rng.choice(MALE_GIVEN if boarder_sex == 0 else FEMALE_GIVEN),
+                 rng.choice(SURNAMES), "", "", UTC_MOD_DATE),
+            )
+
+        # Source and citation for the household's census record
+        ark = self._new_ark()
+        ark_url = f"https://www.familysearch.org/ark:/61903/{ark}"
+        sheet = f"{rng.randint(1, 30)}{rng.choice('AB')}"
+        family = rng.randint(1, 400)
+        ed = f"{rng.randint(1, 99)}-{rng.randint(1, 60)}"
+        line = rng.randint(1, 50)
+        name = f"{head.given} {head.surname}"
+        source_id = self._next_id("SourceTable")
+        footnote = (
+            f"{census_year} U.S. census, {county} County, {state}, population schedule, "
+            f"enumeration district (ED) {ed}, sheet {sheet}, line {line}, {name}; imaged, "
+            f'"United States Census, {census_year}," <i>FamilySearch</i> '
+            f"({ark_url} : accessed 2 January 2025)."
+        )
+        short_footnote = f"{census_year} U.S. census, {county} Co., {state}, sheet {sheet}, {name}."
+        bibliography = (
+            f"U.S. {state}. {county} County. {census_year} U.S Census. Population Schedule. "
+            f'Imaged. "United States Census, {census_year}." <i>FamilySearch</i>.'
+        )
+        writer.add(
+            "SourceTable",
+            "SourceID, Name, RefNumber, ActualText, Comments, IsPrivate, TemplateID, Fields, "
+            "UTCModDate",
+            (source_id,
+             f"Fed Census: {census_year}, {state}, {county} "
+             f"[citing sheet {sheet}, family {family}] {head.surname}, {head.given}",
+             "", "", "", 0, 0, _fields_xml(footnote, short_footnote, bibliography),
+             UTC_MOD_DATE),
+        )
+        citation_id = self._write_citation(writer, source_id, ark_url, OWNER_EVENT, event_id)
+
+        if rng.random() < config.media_rate:
+            media_id = self._write_media(
+                writer,
+                f"?\\Records - Census\\{census_year} Federal\\",
+                f"{census_year}, {state}, {county} - {head.surname}, {head.given}.jpg",
+                f"{census_year} census, {head.given} {head.surname}",
+                ark_url,
+            )
+            self._link_media(writer, media_id, OWNER_EVENT, event_id)
+
+        for member in members:
+            if member.death_year and rng.random() < config.findagrave_rate:
+                self._write_findagrave(writer, member)
+
+        if rng.random() < config.extracted_rate:
+            self._census_households.append(
+                (citation_id, event_id, census_year, state, county, ed, sheet,
+                 line, family, members, [ark] + [self._new_ark() for _ in members[1:]])
+            )
+
+    def _write_family(self, writer: _TableWriter, members: list[_Member]) -> None:
+        """Family of the head and spouse, children numbered oldest first."""
+        head, spouse, *children = members
+        father, mother = (head, spouse) if head.sex == 0 else (spouse, head)
+        children.sort(key=lambda child: (child.birth_year, child.person_id))
+        family_id = self._next_id("FamilyTable")
+        writer.add(
+            "FamilyTable",
+            "FamilyID, FatherID, MotherID, ChildID, HusbOrder, WifeOrder, IsPrivate, Proof, "
+            "SpouseLabel, FatherLabel, MotherLabel, SpouseLabelStr, FatherLabelStr, "
+            "MotherLabelStr, Note, UTCModDate",
+            (family_id, father.person_id, mother.person_id,
+             children[0].person_id if children else 0, 0, 0, 0, 0, 0, 0, 0, "", "", "", "",
+             UTC_MOD_DATE),
+        )
+        for order, child in enumerate(children, start=1):
+            writer.add(
+                "ChildTable",
+                "RecID, ChildID, FamilyID, RelFather, RelMother, ChildOrder, IsPrivate, "
+                "ProofFather, ProofMother, Note, UTCModDate",
+                (self._next_id("ChildTable"), child.person_id, family_id, 0, 0, order, 0, 0, 0,
+                 "", UTC_MOD_DATE),
+            )
+
+    def _write_person(self, writer: _TableWriter, member: _Member, place_id: int) -> None:
+        rng = self.rng
+        living = 0 if member.death_year else 1
+        writer.add(
+            "PersonTable",
+            "PersonID, UniqueID, Sex, ParentID, SpouseID, Color, Relate1, Relate2, Flags, "
+            "Living, IsPrivate, Proof, Bookmark, Note, UTCModDate",
+            (member.person_id, f"{rng.getrandbits(128):032X}", member.sex, 0, 0, 0, 0, 0, 0,
+             living, 0, 0, 0, "", UTC_MOD_DATE),
+        )
+        death = member.death_year or 0
+        self._write_name(writer, member.person_id, member.given, member.surname, 0, 1,
+                         member.birth_year, death)
+        if rng.random() < self.config.alternate_name_rate:
+            if member.sex == 1 and member.role != "Daughter":
+                given, surname, name_type = member.given, rng.choice(SURNAMES), NAME_TYPE_MAIDEN
+            else:
+                given = NICKNAMES.get(member.given, member.given[:-1] or member.given)
+                surname, name_type = member.surname, NAME_TYPE_AKA
+            self._write_name(writer, member.person_id, given, surname, name_type, 0,
+                             member.birth_year, death)
+
+        self._write_event(writer, self._next_id("EventTable"), FACT_BIRTH, member.person_id,
+                          place_id, member.birth_year, rng.randint(1, 12), rng.randint(1, 28))
+        if member.death_year:
+            self._write_event(writer, self._next_id("EventTable"), FACT_DEATH,
+                              member.person_id, place_id, member.death_year,
+                              rng.randint(1, 12), rng.randint(1, 28))
+
+    def _write_name(
+        self,
+        writer: _TableWriter,
+        person_id: int,
+        given: str,
+        surname: str,
+        name_type: int,
+        is_primary: int,
+        birth_year: int,
+        death_year: int,
+    ) -> None:
+        writer.add(
+            "NameTable",
+            "NameID, OwnerID, Surname, Given, Prefix, Suffix, Nickname, NameType, Date, "
+            "SortDate, IsPrimary, IsPrivate, Proof, Sentence, Note, BirthYear, DeathYear, "
+            "Display, Language, UTCModDate, SurnameMP, GivenMP, NicknameMP",
+            (self._next_id("NameTable"), person_id, surname, given, "", "", "", name_type,
+             ".", 0, is_primary, 0, 0, "", "", birth_year, death_year, 0, "", UTC_MOD_DATE,
+             surname.upper(), given.upper(), ""),
+        )
+
+    def _write_event(
+        self,
+        writer: _TableWriter,
+        event_id: int,
+        event_type: int,
+        person_id: int,
+        place_id: int,
+        year: int,
+        month: int,
+        day: int,
+    ) -> None:
+        writer.add(
+            "EventTable",
+            "EventID, EventType, OwnerType, OwnerID, FamilyID, PlaceID, SiteID, Date, "
+            "SortDate, IsPrimary, IsPrivate, Proof, Status, Sentence, Details, Note, UTCModDate",
+            (event_id, event_type, OWNER_PERSON, person_id, 0, place_id, 0,
+             rm_date(year, month, day), rm_sort_date(year, month, day), 0, 0, 0, 0, "", "",
+             "", UTC_MOD_DATE),
+        )
+
+    def _write_citation(
+        self,
+        writer: _TableWriter,
+        source_id: int,
+        ref_number: str,
+        owner_type: int,
+        owner_id: int,
+    ) -> int:
+        citation_id = self._next_id("CitationTable")
+        writer.add(
+            "CitationTable",
+            "CitationID, SourceID, Comments, ActualText, RefNumber, Footnote, ShortFootnote, "
+            "Bibliography, Fields, UTCModDate, CitationName",
+            (citation_id, source_id, "", "", ref_number, "", "", "",
+             b"<Root><Fields></Fields></Root>", UTC_MOD_DATE, ""),
+        )
+        writer.add(
+            "CitationLinkTable",
+            "LinkID, CitationID, OwnerType, OwnerID, SortOrder, Quality, IsPrivate, Flags, "
+            "UTCModDate",
+            (self._next_id("CitationLinkTable"), citation_id, owner_type, owner_id, 0, "~~~",
+             0, 0, UTC_MOD_DATE),
+        )
+        return citation_id
+
+    def _write_media(
+        self,
+        writer: _TableWriter,
+        media_path: str,
+        media_file: str,
+        caption: str,
+        ref_number: str,
+    ) -> int:
+        media_id = self._next_id("MultimediaTable")
+        writer.add(
+            "MultimediaTable",
+            "MediaID, MediaType, MediaPath, MediaFile, URL, Caption, RefNumber, Date, "
+            "SortDate, Description, UTCModDate",
+            (media_id, 1, media_path, media_file, "", caption, ref_number, ".", 0, "",
+             UTC_MOD_DATE),
+        )
+        return media_id
+
+    def _link_media(self, writer: _TableWriter, media_id: int, owner_type: int, owner_id: int) -> None:
+        writer.add(
+            "MediaLinkTable",
+            "LinkID, MediaID, OwnerType, OwnerID, IsPrimary, Include1, Include2, Include3, "
+            "Include4, SortOrder, RectLeft, RectTop, RectRight, RectBottom, Comments, UTCModDate",
+            (self._next_id("MediaLinkTable"), media_id, owner_type, owner_id, 0, 1, 0, 0, 0,
+             0, 0, 0, 0, 0, "", UTC_MOD_DATE),
+        )
+
+    def _write_findagrave(self, writer: _TableWriter, member: _Member) -> None:
+        rng = self.rng
+        memorial_id = rng.randint(1_000_000, 280_000_000)
+        slug = f"{member.given}-{member.surname}".lower().replace("'", "")
+        url = f"https://www.findagrave.com/memorial/{memorial_id}/{slug}"
+        cemetery = rng.choice(CEMETERIES)
+        writer.add(
+            "URLTable",
+            "LinkID, OwnerType, OwnerID, LinkType, Name, URL, Note, UTCModDate",
+            (self._next_id("URLTable"), OWNER_PERSON, member.person_id, 0, "Find a Grave",
+             url, cemetery, UTC_MOD_DATE),
+        )
+        if rng.random() >= self.config.findagrave_cited_rate:
+            return
+
+        name = f"{member.given} {member.surname}"
+        source_id = self._next_id("SourceTable")
+        footnote = (
+            f"<i>Find a Grave</i>, database and images ({url} : accessed 2 January 2025), "
+            f"memorial page for {name} ({member.birth_year}–{member.death_year}), "
+            f"Find a Grave Memorial ID {memorial_id}, in {cemetery}."
+        )
+        writer.add(
+            "SourceTable",
+            "SourceID, Name, RefNumber, ActualText, Comments, IsPrivate, TemplateID, Fields, "
+            "UTCModDate",
+            (source_id,
+             f"Find a Grave: {member.surname}, {member.given} "
+             f"({member.birth_year}-{member.death_year}) RIN {member.person_id}",
+             "", "", "", 0, 0,
+             _fields_xml(footnote, f"<i>Find a Grave</i>, {name}.",
+                         "<i>Find a Grave</i>. Online database."),
+             UTC_MOD_DATE),
+        )
+        self._write_citation(writer, source_id, url, OWNER_PERSON, member.person_id)
+        media_id = self._write_media(
+            writer,
+            "?\\Pictures - Cemetaries\\",
+            f"{member.surname}, {member.given} ({member.birth_year}-{member.death_year}).jpg",
+            f"Grave of {name}",
+            url,
+        )
+        self._link_media(writer, media_id, OWNER_PERSON, member.person_id)
+
+    # -------------------------------------------------------------------------
+    # census.db
+    # -------------------------------------------------------------------------
+
+    def _write_census_db(self, census_db_path: Path, rmtree_path: Path) -> int:
+        """Write extracted households into a new census.db; returns persons written."""
+        repo = CensusExtractionRepository(census_db_path)
+        batch_id = repo.create_batch(notes="synthetic tree generator")
+        with repo._connect() as conn:
+            page_id = conn.execute("SELECT COALESCE(MAX(page_id), 0) FROM census_page").fetchone()[0]
+            census_person_id = 0
+            pages, census_persons, links = [], [], []
+            for (citation_id, event_id, year, state, county, ed, sheet, line,
+                 family, members, arks) in self._census_households:
+                page_id += 1
+                pages.append(
+                    (page_id, batch_id, year, state, county, ed, sheet[:-1], sheet[-1],
+                     f"https://www.familysearch.org/ark:/61903/3:1:{arks[0][4:]}")
+                )
+                head_birth = members[0].birth_year
+                for offset, (member, ark) in enumerate(zip(members, arks, strict=True)):
+                    census_person_id += 1
+                    relationship = "Head" if offset == 0 else member.role
+                    age = max(0, year - member.birth_year)
+                    census_persons.append(
+                        (census_person_id, page_id, line + offset, family, family,
+                         f"{member.given} {member.surname}", member.given, member.surname,
+                         relationship, "M" if member.sex == 0 else "F", "W", age,
+                         "M" if offset < 2 and len(members) > 1 else "S", state,
+                         f"https://www.familysearch.org/ark:/61903/{ark}",
+                         1 if offset == 0 else 0)
+                    )
+                    links.append(
+                        (census_person_id, member.person_id, citation_id, event_id,
+                         str(rmtree_path), 0.95 if member.birth_year == head_birth else 0.9,
+                         "url_match" if offset == 0 else "name_match")
+                    )
+
+            conn.executemany(
+                "INSERT INTO census_page (page_id, batch_id, census_year, state, county, "
+                "enumeration_district, sheet_number, sheet_letter, familysearch_image_url) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                pages,
+            )
+            conn.executemany(
+                "INSERT INTO census_person (person_id, page_id, line_number, dwelling_number, "
+                "family_number, full_name, given_name, surname, relationship_to_head, sex, "
+                "race, age, marital_status, birthplace, familysearch_ark, is_target_person) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                census_persons,
+            )
+            conn.executemany(
+                "INSERT INTO rmtree_link (census_person_id, rmtree_person_id, "
+                "rmtree_citation_id, rmtree_event_id, rmtree_database, match_confidence, "
+                "match_method) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                links,
+            )
+            persons = len(census_persons)
+        repo.complete_batch(batch_id)
+        return persons
+
+
+def _fields_xml(footnote: str, short_footnote: str, bibliography: str) -> bytes:
+    """Build a free-form SourceTable.Fields BLOB."""
+    return (
+        "<Root><Fields>"
+        f"<Field><Name>Footnote</Name><Value>{escape(footnote)}</Value></Field>"
+        f"<Field><Name>ShortFootnote</Name><Value>{escape(short_footnote)}</Value></Field>"
+        f"<Field><Name>Bibliography</Name><Value>{escape(bibliography)}</Value></Field>"
+        "</Fields></Root>"
+    ).encode()
+
+
+def generate_synthetic_tree(
+    rmtree_path: Path,
+    config: SyntheticTreeConfig | None = None,
+    census_db_path: Path | None = None,
+) -> SyntheticTreeStats:
+    """Generate a synthetic RootsMagic tree (and optional census.db).
+
+    Args:
+        rmtree_path: Output .rmtree path (must not exist)
+        config: Tree shape (defaults to 10,000 persons, seed 0)
+        census_db_path: Output census.db path (must not exist), or None
+
+    Returns:
+        Row counts written
+    """
+    return SyntheticTreeGenerator(config).generate(rmtree_path, census_db_path)
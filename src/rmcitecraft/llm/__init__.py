@@ -18,6 +18,12 @@ from .base import (
     ConfigurationError,
 )
 from .factory import create_provider, get_available_providers
+from .telemetry import (
+    LLMTelemetryStore,
+    ModelUsageSummary,
+    get_telemetry_store,
+    llm_call_context,
+)
 
 __all__ = [
     'LLMProvider',
@@ -31,4 +37,8 @@ __all__ = [
     'ConfigurationError',
     'create_provider',
     'get_available_providers',
+    'LLMTelemetryStore',
+    'ModelUsageSummary',
+    'get_telemetry_store',
+    'llm_call_context',
 ]
\ No newline at end of file
@@ -193,6 +193,62 @@ class LLMProvider(ABC):
         """
         return capability in self.get_capabilities(model)
 
+    def complete_with_image_prefix(
+        self,
+        prefix: str,
+        prompt: str,
+        image_path: str,
+        model: Optional[str] = None,
+        **kwargs
+    ) -> CompletionResponse:
+        """
+        Vision completion with a stable prompt prefix.
+
+        The prefix is identical across many requests (e.g. census schema and
+        rules for one year). Providers with prompt caching override this to
+        mark the prefix cacheable; the default sends prefix and prompt as one
+        text prompt.
+
+        Args:
+            prefix: Stable leading text, sent first
+            prompt: Request-specific text
+            image_path: Path to image file
+            model: Model to use (must support vision)
+            **kwargs: Provider-specific parameters
+
+        Returns:
+            CompletionResponse with generated text
+        """
+        full_prompt = "\n\n".join(part for part in (prefix, prompt) if part)
+        return self.complete_with_image(full_prompt, image_path, model, **kwargs)
+
+    def stream_complete_with_image_prefix(
+        self,
+        prefix: str,
+        prompt: str,
+        image_path: str,
+        model: Optional[str] = None,
+        **kwargs
+    ) -> Iterator[str]:
+        """
+        Stream a vision completion with a stable prompt prefix.
+
+        Providers that can stream vision responses override this. The default
+        makes a blocking request and yields the whole response as one chunk,
+        so callers can always use the streaming path.
+
+        Args:
+            prefix: Stable leading text, sent first
+            prompt: Request-specific text
+            image_path: Path to image file
+            model: Model to use (must support vision)
+            **kwargs: Provider-specific parameters
+
+        Yields:
+            Text chunks as they're generated
+        """
+        yield self.complete_with_image_prefix(prefix, prompt, image_path, model, **kwargs).text
+
     # High-level task methods
     def classify_image(
         self,
@@ -8,6 +8,8 @@ from typing import Any, Iterator, Optional
 
 from loguru import logger
 
+from rmcitecraft.services.retry_strategy import get_outbound_guard
+
 from .base import (
     CompletionResponse,
     ConfigurationError,
@@ -57,6 +59,8 @@ class LLMDatasette(LLMProvider):
     ) -> CompletionResponse:
         """Generate a text completion using LLM."""
         model_name = model or self.default_model
+        guard = get_outbound_guard("llm")
+        guard.acquire()
 
         try:
             llm_model = self._llm.get_model(model_name)
@@ -69,8 +73,9 @@ class LLMDatasette(LLMProvider):
                 options['max_tokens'] = max_tokens
 
             # Execute prompt
-            response = llm_model.prompt(prompt, **options)
-            text = response.text()
+            with guard.outcome():
+                response = llm_model.prompt(prompt, **options)
+                text = response.text()
 
             # Try to get token count if available
             tokens = None
@@ -92,6 +97,8 @@ class LLMDatasette(LLMProvider):
             if 'rate' in str(e).lower() or '429' in str(e):
                 raise RateLimitError(f"Rate limit exceeded: {e}") from e
             raise LLMError(f"LLM completion failed: {e}") from e
+        finally:
+            guard.settle()
 
     def stream_complete(
         self,
@@ -103,6 +110,8 @@ class LLMDatasette(LLMProvider):
     ) -> Iterator[str]:
         """Stream a text completion using LLM."""
         model_name = model or self.default_model
+        guard = get_outbound_guard("llm")
+        guard.acquire()
 
         try:
             llm_model = self._llm.get_model(model_name)
@@ -115,12 +124,13 @@ class LLMDatasette(LLMProvider):
             if max_tokens is not None:
                 options['max_tokens'] = max_tokens
 
-            # Execute prompt with streaming
-            response = llm_model.prompt(prompt, **options)
+            with guard.outcome():
+                # Execute prompt with streaming
+                response = llm_model.prompt(prompt, **options)
 
-            # Stream chunks
-            for chunk in response:
-                yield chunk
+                # Stream chunks
+                for chunk in response:
+                    yield chunk
 
         except self._llm.UnknownModelError as e:
             raise ModelNotFoundError(f"Model not found: {model_name}") from e
@@ -128,6 +138,8 @@ class LLMDatasette(LLMProvider):
             if 'rate' in str(e).lower() or '429' in str(e):
                 raise RateLimitError(f"Rate limit exceeded: {e}") from e
             raise LLMError(f"LLM streaming failed: {e}") from e
+        finally:
+            guard.settle()
 
     def complete_with_image(
         self,
@@ -157,12 +169,19 @@ class LLMDatasette(LLMProvider):
 
         # Build options, filtering out None values
         options = {k: v for k, v in kwargs.items() if v is not None}
+        prompt_kwargs = {}
+        system = options.pop("system", None)
+        if system:
+            prompt_kwargs["system"] = system
+
+        guard = get_outbound_guard("llm")
+        guard.acquire()
 
         # Log the request
         request_id = log_llm_request(
             provider="llm",
             model=model_name,
-            prompt=prompt,
+            prompt=f"{system}\n\n{prompt}" if system else prompt,
             image_path=image_path,
             options=options,
             context=kwargs.get("context"),
@@ -186,14 +205,16 @@ class LLMDatasette(LLMProvider):
 
             # Execute prompt with image attachment
             logger.info("Calling llm_model.prompt()...")
-            response = llm_model.prompt(
-                prompt,
-                attachments=[attachment],
-                **options
-            )
-
-            logger.info("Getting response text...")
-            text = response.text()
+            with guard.outcome():
+                response = llm_model.prompt(
+                    prompt,
+                    attachments=[attachment],
+                    **prompt_kwargs,
+                    **options
+                )
+
+                logger.info("Getting response text...")
+                text = response.text()
             duration = time.time() - start_time
             logger.info(f"Response received, length={len(text)} chars, duration={duration:.2f}s")
 
@@ -247,6 +268,91 @@ class LLMDatasette(LLMProvider):
             import traceback
             logger.error(traceback.format_exc())
             raise LLMError(f"Vision completion failed: {e}") from e
+        finally:
+            guard.settle()
+
+    def complete_with_image_prefix(
+        self,
+        prefix: str,
+        prompt: str,
+        image_path: str,
+        model: Optional[str] = None,
+        **kwargs
+    ) -> CompletionResponse:
+        """Vision completion with the stable prefix sent as the system prompt.
+
+        Keeping the prefix in the system prompt gives every request for the
+        same census year an identical leading context, which models with
+        implicit prefix caching (e.g. Gemini) reuse across a batch.
+        """
+        return self.complete_with_image(prompt, image_path, model, system=prefix, **kwargs)
+
+    def stream_complete_with_image_prefix(
+        self,
+        prefix: str,
+        prompt: str,
+        image_path: str,
+        model: Optional[str] = None,
+        **kwargs
+    ) -> Iterator[str]:
+        """Stream a vision completion with the prefix as the system prompt."""
+        import time
+        from .llm_logger import log_llm_request, log_llm_response
+
+        model_name = model or "gemini-3-pro-preview"
+        options = {k: v for k, v in kwargs.items() if v is not None}
+        guard = get_outbound_guard("llm")
+        guard.acquire()
+
+        request_id = log_llm_request(
+            provider="llm",
+            model=model_name,
+            prompt=f"{prefix}\n\n{prompt}",
+            image_path=image_path,
+            options=options,
+            context=kwargs.get("context"),
+        )
+        start_time = time.time()
+        chunks: list[str] = []
+
+        try:
+            llm_model = self._llm.get_model(model_name)
+            with guard.outcome():
+                response = llm_model.prompt(
+                    prompt,
+                    attachments=[self._llm.Attachment(path=image_path)],
+                    system=prefix,
+                    **options
+                )
+                for chunk in response:
+                    chunks.append(chunk)
+                    yield chunk
+
+            log_llm_response(
+                request_id=request_id,
+                response_text="".join(chunks),
+                duration_seconds=time.time() - start_time,
+                metadata={
+                    'input_tokens': getattr(response, 'input_tokens', None),
+                    'output_tokens': getattr(response, 'output_tokens', None),
+                },
+            )
+
+        except self._llm.UnknownModelError as e:
+            log_llm_response(request_id=request_id, response_text="", error=str(e))
+            raise ModelNotFoundError(f"Model not found: {model_name}") from e
+        except Exception as e:
+            log_llm_response(
+                request_id=request_id,
+                response_text="".join(chunks),
+                error=str(e),
+                duration_seconds=time.time() - start_time,
+            )
+            if 'rate' in str(e).lower() or '429' in str(e):
+                raise RateLimitError(f"Rate limit exceeded: {e}") from e
+            raise LLMError(f"Vision streaming failed: {e}") from e
+        finally:
+            guard.settle()
 
     def list_models(self) -> list[str]:
         """List available models in LLM."""
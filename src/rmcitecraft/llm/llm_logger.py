@@ -1,17 +1,24 @@
 """Dedicated LLM interaction logger.
 
-Logs all prompts, responses, and metadata to a separate log file
-for analysis and debugging of LLM interactions.
+Each request and response is recorded as a structured row in the LLM
+telemetry store (see telemetry.py), which keeps sizes, token counts,
+latency and status in a queryable form. The text log receives one compact
+line per event for tailing; full prompts and responses are kept only when
+the telemetry store is configured to save compressed bodies.
 """
 
 import json
-import os
-from datetime import datetime
+import sqlite3
+import uuid
 from pathlib import Path
 from typing import Any
 
 from loguru import logger
 
+from rmcitecraft.monitoring.spans import record_span
+
+from .telemetry import get_telemetry_store
+
 # Configure dedicated LLM log file
 LLM_LOG_DIR = Path.home() / ".rmcitecraft" / "logs"
 LLM_LOG_FILE = LLM_LOG_DIR / "llm_interactions.log"
@@ -54,21 +61,23 @@ def log_llm_request(
     Returns:
         Request ID for correlation with response
     """
-    request_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-
-    llm_logger.info("=" * 80)
-    llm_logger.info(f"LLM REQUEST: {request_id}")
-    llm_logger.info(f"Timestamp: {datetime.now().isoformat()}")
-    llm_logger.info(f"Provider: {provider}")
-    llm_logger.info(f"Model: {model}")
-    llm_logger.info(f"Image: {image_path or 'None'}")
-    llm_logger.info(f"Options: {json.dumps(options or {})}")
-    llm_logger.info(f"Context: {json.dumps(context or {})}")
-    llm_logger.info("-" * 40)
-    llm_logger.info("PROMPT:")
-    llm_logger.info(prompt)
-    llm_logger.info("=" * 80)
-
+    try:
+        request_id = get_telemetry_store().start(
+            provider=provider,
+            model=model,
+            prompt=prompt,
+            image_path=image_path,
+            context=context,
+        )
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"LLM telemetry unavailable: {e}")
+        request_id = uuid.uuid4().hex
+
+    llm_logger.info(
+        f"REQUEST {request_id} provider={provider} model={model} "
+        f"prompt_chars={len(prompt)} image={Path(image_path).name if image_path else '-'} "
+        f"options={json.dumps(options or {}, default=str)}"
+    )
     return request_id
 
 
@@ -87,26 +96,36 @@ def log_llm_response(
         response_text: The full response text
         tokens_used: Total tokens consumed
         duration_seconds: Request duration
-        metadata: Additional response metadata
+        metadata: Additional response metadata (input_tokens, output_tokens,
+            cached_tokens)
         error: Error message if request failed
     """
-    llm_logger.info("=" * 80)
-    llm_logger.info(f"LLM RESPONSE: {request_id}")
-    llm_logger.info(f"Timestamp: {datetime.now().isoformat()}")
+    metadata = metadata or {}
+    try:
+        get_telemetry_store().finish(
+            request_id,
+            response_text=response_text,
+            input_tokens=metadata.get("input_tokens"),
+            output_tokens=metadata.get("output_tokens"),
+            cached_tokens=metadata.get("cached_tokens"),
+            duration_seconds=duration_seconds,
+            error=error,
+        )
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"LLM telemetry unavailable: {e}")
+
+    # Timed by the provider; attributed to the batch item being processed, if any
+    if duration_seconds is not None:
+        record_span("llm_call", duration_seconds * 1000, success=error is None)
 
     if error:
-        llm_logger.error(f"ERROR: {error}")
+        llm_logger.error(f"RESPONSE {request_id} error={error}")
     else:
-        llm_logger.info(f"Duration: {duration_seconds:.2f}s" if duration_seconds else "Duration: N/A")
-        llm_logger.info(f"Tokens: {tokens_used or 'N/A'}")
-        llm_logger.info(f"Response length: {len(response_text)} chars")
-        if metadata:
-            llm_logger.info(f"Metadata: {json.dumps(metadata)}")
-        llm_logger.info("-" * 40)
-        llm_logger.info("RESPONSE:")
-        llm_logger.info(response_text)
-
-    llm_logger.info("=" * 80)
+        duration = f"{duration_seconds:.2f}s" if duration_seconds else "N/A"
+        llm_logger.info(
+            f"RESPONSE {request_id} duration={duration} tokens={tokens_used or 'N/A'} "
+            f"response_chars={len(response_text)}"
+        )
 
 
 def log_llm_validation(
@@ -121,16 +140,12 @@ def log_llm_validation(
         validation_warnings: List of validation warning messages
         parsed_records: Number of records successfully parsed
     """
-    llm_logger.info(f"VALIDATION: {request_id}")
-    llm_logger.info(f"Records parsed: {parsed_records}")
-    llm_logger.info(f"Warnings: {len(validation_warnings)}")
-
-    if validation_warnings:
-        llm_logger.warning("Validation warnings:")
-        for warning in validation_warnings[:50]:  # Limit to first 50
-            llm_logger.warning(f"  - {warning}")
-        if len(validation_warnings) > 50:
-            llm_logger.warning(f"  ... and {len(validation_warnings) - 50} more")
+    llm_logger.info(
+        f"VALIDATION {request_id} records={parsed_records} "
+        f"warnings={len(validation_warnings)}"
+    )
+    for warning in validation_warnings[:10]:
+        llm_logger.debug(f"  - {warning}")
 
 
 def get_log_file_path() -> Path:
@@ -5,11 +5,14 @@ Uses OpenRouter API for access to multiple LLM models.
 """
 
 import base64
+import time
 from pathlib import Path
 from typing import Any, Iterator, Optional
 
 from loguru import logger
 
+from rmcitecraft.services.retry_strategy import get_outbound_guard
+
 from .base import (
     CompletionResponse,
     ConfigurationError,
@@ -168,6 +171,8 @@ class OpenRouterProvider(LLMProvider):
     ) -> CompletionResponse:
         """Generate a text completion using OpenRouter."""
         model_name = model or self.default_model
+        guard = get_outbound_guard("llm")
+        guard.acquire()
 
         try:
             # Build request
@@ -184,10 +189,11 @@ class OpenRouterProvider(LLMProvider):
             request_params.update(kwargs)
 
             # Make request
-            response = self.client.chat.completions.create(
-                **request_params,
-                extra_headers=self.extra_headers if self.extra_headers else None,
-            )
+            with guard.outcome():
+                response = self.client.chat.completions.create(
+                    **request_params,
+                    extra_headers=self.extra_headers if self.extra_headers else None,
+                )
 
             # Extract response
             text = response.choices[0].message.content
@@ -217,6 +223,8 @@ class OpenRouterProvider(LLMProvider):
             raise RateLimitError(f"Rate limit exceeded: {e}") from e
         except Exception as e:
             raise LLMError(f"OpenRouter completion failed: {e}") from e
+        finally:
+            guard.settle()
 
     def stream_complete(
         self,
@@ -228,6 +236,8 @@ class OpenRouterProvider(LLMProvider):
     ) -> Iterator[str]:
         """Stream a text completion using OpenRouter."""
         model_name = model or self.default_model
+        guard = get_outbound_guard("llm")
+        guard.acquire()
 
         try:
             # Build request
@@ -244,16 +254,17 @@ class OpenRouterProvider(LLMProvider):
             # Add any extra kwargs
             request_params.update(kwargs)
 
-            # Make streaming request
-            stream = self.client.chat.completions.create(
-                **request_params,
-                extra_headers=self.extra_headers if self.extra_headers else None,
-            )
+            with guard.outcome():
+                # Make streaming request
+                stream = self.client.chat.completions.create(
+                    **request_params,
+                    extra_headers=self.extra_headers if self.extra_headers else None,
+                )
 
-            # Stream chunks
-            for chunk in stream:
-                if chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+                # Stream chunks
+                for chunk in stream:
+                    if chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
 
         except self._openai.NotFoundError as e:
             raise ModelNotFoundError(f"Model not found: {model_name}") from e
@@ -261,6 +272,8 @@ class OpenRouterProvider(LLMProvider):
             raise RateLimitError(f"Rate limit exceeded: {e}") from e
         except Exception as e:
             raise LLMError(f"OpenRouter streaming failed: {e}") from e
+        finally:
+            guard.settle()
 
     def complete_with_image(
         self,
@@ -270,73 +283,231 @@ class OpenRouterProvider(LLMProvider):
         **kwargs
     ) -> CompletionResponse:
         """Generate completion with image input using OpenRouter."""
-        model_name = model or self.default_model
+        return self._complete_vision(
+            [{"type": "text", "text": prompt}], image_path, model, **kwargs
+        )
 
-        # Check if model supports vision
-        if not self._model_supports_vision(model_name):
-            raise NotImplementedError(
-                f"Model {model_name} doesn't support vision. "
-                f"Try one of: {self._get_vision_models()}"
-            )
+    def complete_with_image_prefix(
+        self,
+        prefix: str,
+        prompt: str,
+        image_path: str,
+        model: Optional[str] = None,
+        **kwargs
+    ) -> CompletionResponse:
+        """Vision completion with the prefix marked as a prompt-cache breakpoint.
+
+        OpenRouter forwards cache_control to providers with explicit caching
+        (Anthropic); providers with automatic prefix caching (OpenAI, Gemini)
+        ignore it but still benefit from the identical leading text.
+        """
+        return self._complete_vision(
+            self._prefix_parts(prefix, prompt), image_path, model, **kwargs
+        )
+
+    def _complete_vision(
+        self,
+        text_parts: list[dict[str, Any]],
+        image_path: str,
+        model: Optional[str] = None,
+        **kwargs
+    ) -> CompletionResponse:
+        """Send text content parts followed by an image."""
+        from .llm_logger import log_llm_request, log_llm_response
+
+        model_name = model or self.default_model
+        self._check_vision_model(model_name)
+        guard = get_outbound_guard("llm")
+        guard.acquire()
+
+        request_id = log_llm_request(
+            provider="openrouter",
+            model=model_name,
+            prompt="\n\n".join(part["text"] for part in text_parts),
+            image_path=str(image_path),
+            options=kwargs,
+        )
+        start_time = time.time()
 
         try:
-            # Read and encode image
-            image_path = Path(image_path)
-            if not image_path.exists():
-                raise FileNotFoundError(f"Image not found: {image_path}")
-
-            with open(image_path, 'rb') as f:
-                image_data = base64.b64encode(f.read()).decode()
-
-            # Determine MIME type
-            mime_type = "image/jpeg"
-            if image_path.suffix.lower() == '.png':
-                mime_type = "image/png"
-            elif image_path.suffix.lower() in ['.gif', '.webp']:
-                mime_type = f"image/{image_path.suffix[1:].lower()}"
-
-            # Build message with image
-            messages = [{
-                "role": "user",
-                "content": [
-                    {"type": "text", "text": prompt},
-                    {
-                        "type": "image_url",
-                        "image_url": {
-                            "url": f"data:{mime_type};base64,{image_data}"
-                        }
-                    }
-                ]
-            }]
+            messages = self._vision_messages(text_parts, image_path)
 
             # Make request
-            response = self.client.chat.completions.create(
-                model=model_name,
-                messages=messages,
-                **kwargs,
-                extra_headers=self.extra_headers if self.extra_headers else None,
-            )
+            with guard.outcome():
+                response = self.client.chat.completions.create(
+                    model=model_name,
+                    messages=messages,
+                    **kwargs,
+                    extra_headers=self.extra_headers if self.extra_headers else None,
+                )
 
             # Extract response
             text = response.choices[0].message.content
-            tokens = None
-            if hasattr(response, 'usage'):
-                tokens = response.usage.total_tokens
+            usage = self._usage_metadata(response)
+            log_llm_response(
+                request_id=request_id,
+                response_text=text or "",
+                tokens_used=usage['total_tokens'],
+                duration_seconds=time.time() - start_time,
+                metadata=usage,
+            )
 
             return CompletionResponse(
                 text=text,
                 model=model_name,
                 provider="openrouter",
-                tokens_used=tokens,
-                metadata={'image_path': str(image_path)}
+                tokens_used=usage['total_tokens'],
+                metadata={
+                    'image_path': str(image_path),
+                    'cached_tokens': usage['cached_tokens'],
+                    'input_tokens': usage['input_tokens'],
+                    'output_tokens': usage['output_tokens'],
+                    'request_id': request_id,
+                }
             )
 
         except self._openai.NotFoundError as e:
+            log_llm_response(request_id=request_id, response_text="", error=str(e))
             raise ModelNotFoundError(f"Model not found: {model_name}") from e
         except self._openai.RateLimitError as e:
+            log_llm_response(request_id=request_id, response_text="", error=str(e))
             raise RateLimitError(f"Rate limit exceeded: {e}") from e
         except Exception as e:
+            log_llm_response(request_id=request_id, response_text="", error=str(e))
             raise LLMError(f"OpenRouter vision completion failed: {e}") from e
+        finally:
+            guard.settle()
+
+    def stream_complete_with_image_prefix(
+        self,
+        prefix: str,
+        prompt: str,
+        image_path: str,
+        model: Optional[str] = None,
+        **kwargs
+    ) -> Iterator[str]:
+        """Stream a vision completion, with the prefix as a prompt-cache breakpoint."""
+        from .llm_logger import log_llm_request, log_llm_response
+
+        model_name = model or self.default_model
+        self._check_vision_model(model_name)
+        guard = get_outbound_guard("llm")
+        guard.acquire()
+
+        request_id = log_llm_request(
+            provider="openrouter",
+            model=model_name,
+            prompt=f"{prefix}\n\n{prompt}",
+            image_path=str(image_path),
+            options=kwargs,
+        )
+        start_time = time.time()
+        chunks: list[str] = []
+        usage = None
+
+        try:
+            with guard.outcome():
+                stream = self.client.chat.completions.create(
+                    model=model_name,
+                    messages=self._vision_messages(
+                        self._prefix_parts(prefix, prompt), image_path
+                    ),
+                    stream=True,
+                    stream_options={"include_usage": True},
+                    **kwargs,
+                    extra_headers=self.extra_headers if self.extra_headers else None,
+                )
+
+                for chunk in stream:
+                    if getattr(chunk, 'usage', None):
+                        usage = self._usage_metadata(chunk)
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        chunks.append(chunk.choices[0].delta.content)
+                        yield chunk.choices[0].delta.content
+
+            usage = usage or self._usage_metadata(None)
+            log_llm_response(
+                request_id=request_id,
+                response_text="".join(chunks),
+                tokens_used=usage['total_tokens'],
+                duration_seconds=time.time() - start_time,
+                metadata=usage,
+            )
+
+        except self._openai.NotFoundError as e:
+            log_llm_response(request_id=request_id, response_text="", error=str(e))
+            raise ModelNotFoundError(f"Model not found: {model_name}") from e
+        except self._openai.RateLimitError as e:
+            log_llm_response(request_id=request_id, response_text="", error=str(e))
+            raise RateLimitError(f"Rate limit exceeded: {e}") from e
+        except Exception as e:
+            log_llm_response(request_id=request_id, response_text="".join(chunks), error=str(e))
+            raise LLMError(f"OpenRouter vision streaming failed: {e}") from e
+        finally:
+            guard.settle()
+
+    @staticmethod
+    def _usage_metadata(response: Any) -> dict[str, Optional[int]]:
+        """Token counts from a response (or final stream chunk) usage block."""
+        usage = getattr(response, 'usage', None)
+        details = getattr(usage, 'prompt_tokens_details', None)
+        return {
+            'total_tokens': getattr(usage, 'total_tokens', None),
+            'input_tokens': getattr(usage, 'prompt_tokens', None),
+            'output_tokens': getattr(usage, 'completion_tokens', None),
+            'cached_tokens': getattr(details, 'cached_tokens', None),
+        }
+
+    @staticmethod
+    def _prefix_parts(prefix: str, prompt: str) -> list[dict[str, Any]]:
+        """Text parts with the stable prefix marked as a cache breakpoint."""
+        text_parts = [{
+            "type": "text",
+            "text": prefix,
+            "cache_control": {"type": "ephemeral"},
+        }]
+        if prompt:
+            text_parts.append({"type": "text", "text": prompt})
+        return text_parts
+
+    def _check_vision_model(self, model_name: str) -> None:
+        """Raise NotImplementedError if the model cannot take images."""
+        if not self._model_supports_vision(model_name):
+            raise NotImplementedError(
+                f"Model {model_name} doesn't support vision. "
+                f"Try one of: {self._get_vision_models()}"
+            )
+
+    def _vision_messages(
+        self, text_parts: list[dict[str, Any]], image_path: str
+    ) -> list[dict[str, Any]]:
+        """Build a user message of text parts followed by the base64 image."""
+        image_path = Path(image_path)
+        if not image_path.exists():
+            raise FileNotFoundError(f"Image not found: {image_path}")
+
+        with open(image_path, 'rb') as f:
+            image_data = base64.b64encode(f.read()).decode()
+
+        # Determine MIME type
+        mime_type = "image/jpeg"
+        if image_path.suffix.lower() == '.png':
+            mime_type = "image/png"
+        elif image_path.suffix.lower() in ['.gif', '.webp']:
+            mime_type = f"image/{image_path.suffix[1:].lower()}"
+
+        return [{
+            "role": "user",
+            "content": [
+                *text_parts,
+                {
+                    "type": "image_url",
+                    "image_url": {
+                        "url": f"data:{mime_type};base64,{image_data}"
+                    }
+                }
+            ]
+        }]
 
     def list_models(self) -> list[str]:
         """List available models from OpenRouter."""
@@ -0,0 +1,505 @@
+"""
+Structured telemetry for LLM calls.
+
+Every provider request is recorded as one row in a SQLite sidecar database
+(~/.rmcitecraft/llm_telemetry.db): request id, provider, model, census year,
+prompt and response sizes, input/output/cached tokens, duration, status and
+whether the prompt cache was hit. summarize() turns these rows into p50/p95
+latency and token totals per model and census year.
+
+Prompt and response bodies are not stored by default. With store_bodies
+enabled they are written gzip-compressed to a content-addressed blob
+directory, so the long census prompt prefixes shared by many requests are
+stored once.
+
+Call context that providers cannot see (census year, task name) is attached
+with llm_call_context(), which tags every call made inside the block.
+"""
+
+import gzip
+import hashlib
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+TELEMETRY_DB_PATH = Path.home() / ".rmcitecraft" / "llm_telemetry.db"
+TELEMETRY_BLOB_DIR = Path.home() / ".rmcitecraft" / "llm_blobs"
+# Start times of requests never finished (abandoned streams, cancelled
+# calls) are dropped after this long
+STALE_REQUEST_SECONDS = 3600.0
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS llm_call (
+    request_id TEXT PRIMARY KEY,
+    started_at TEXT NOT NULL,         -- ISO 8601 UTC
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    census_year INTEGER,
+    task TEXT,
+    image_path TEXT,
+    prompt_chars INTEGER NOT NULL DEFAULT 0,
+    response_chars INTEGER,
+    input_tokens INTEGER,
+    output_tokens INTEGER,
+    cached_tokens INTEGER,
+    cache_hit INTEGER,                -- 1 if any prompt tokens were served from cache
+    duration_seconds REAL,
+    status TEXT NOT NULL,             -- pending, ok, error
+    error TEXT,
+    prompt_blob TEXT,                 -- SHA-256 of the gzip blob, if stored
+    response_blob TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_llm_call_model_year ON llm_call(model, census_year);
+CREATE INDEX IF NOT EXISTS idx_llm_call_started ON llm_call(started_at);
+
+-- One row per model attempt in a model cascade
+CREATE TABLE IF NOT EXISTS llm_routing (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    decided_at TEXT NOT NULL,         -- ISO 8601 UTC
+    cascade_id TEXT NOT NULL,         -- Shared by all attempts for one image
+    tier INTEGER NOT NULL,            -- 0 = cheapest model
+    model TEXT NOT NULL,
+    census_year INTEGER,
+    task TEXT,
+    image_path TEXT,
+    outcome TEXT NOT NULL,            -- accepted, escalated, failed
+    warnings INTEGER NOT NULL DEFAULT 0,
+    persons INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    duration_seconds REAL
+);
+
+CREATE INDEX IF NOT EXISTS idx_llm_routing_model_year ON llm_routing(model, census_year);
+"""
+
+_call_context: ContextVar[dict[str, Any] | None] = ContextVar("llm_call_context", default=None)
+
+
+@contextmanager
+def llm_call_context(**fields: Any) -> Iterator[None]:
+    """Tag LLM calls made inside the block (e.g. census_year=1940, task="transcribe").
+
+    Nested blocks add to (and override) the enclosing context.
+    """
+    token = _call_context.set({**current_call_context(), **fields})
+    try:
+        yield
+    finally:
+        _call_context.reset(token)
+
+
+def current_call_context() -> dict[str, Any]:
+    """Fields set by the enclosing llm_call_context blocks."""
+    return dict(_call_context.get() or {})
+
+
+@dataclass
+class ModelUsageSummary:
+    """Latency and token totals for one model and census year."""
+
+    model: str
+    census_year: int | None
+    calls: int
+    errors: int
+    p50_seconds: float | None
+    p95_seconds: float | None
+    input_tokens: int
+    output_tokens: int
+    cached_tokens: int
+    cache_hits: int
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of calls that reused cached prompt tokens."""
+        return self.cache_hits / self.calls if self.calls else 0.0
+
+
+@dataclass
+class RoutingSummary:
+    """Cascade outcomes for one model and census year."""
+
+    model: str
+    census_year: int | None
+    attempts: int
+    accepted: int
+    escalated: int
+    failed: int
+    mean_warnings: float
+
+    @property
+    def acceptance_rate(self) -> float:
+        """Fraction of attempts whose result was kept."""
+        return self.accepted / self.attempts if self.attempts else 0.0
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float | None:
+    """Linearly interpolated percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    weight = position - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+class LLMTelemetryStore:
+    """SQLite store of LLM call telemetry."""
+
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        blob_dir: Path | None = None,
+        store_bodies: bool = False,
+    ):
+        """
+        Initialize store.
+
+        Args:
+            db_path: Telemetry database (defaults to ~/.rmcitecraft/llm_telemetry.db)
+            blob_dir: Directory for compressed bodies (defaults to ~/.rmcitecraft/llm_blobs)
+            store_bodies: Keep full prompts and responses as compressed blobs
+        """
+        self.db_path = db_path or TELEMETRY_DB_PATH
+        self.blob_dir = blob_dir or TELEMETRY_BLOB_DIR
+        self.store_bodies = store_bodies
+        self._lock = threading.Lock()
+        self._started: dict[str, float] = {}
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA_SQL)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a short-lived connection, committing on success."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    def start(
+        self,
+        provider: str,
+        model: str,
+        prompt: str,
+        image_path: str | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> str:
+        """
+        Record a request before it is sent.
+
+        Args:
+            provider: Provider name (e.g. "llm", "openrouter")
+            model: Model identifier
+            prompt: Full prompt text (only its size is kept unless store_bodies)
+            image_path: Image sent with a vision request
+            context: Extra call context; merged over llm_call_context()
+
+        Returns:
+            Request ID to pass to finish()
+        """
+        request_id = uuid.uuid4().hex
+        fields = {**current_call_context(), **(context or {})}
+        prompt_blob = self._write_blob(prompt) if self.store_bodies else None
+
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO llm_call (
+                    request_id, started_at, provider, model, census_year, task,
+                    image_path, prompt_chars, status, prompt_blob
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'pending', ?)
+                """,
+                (
+                    request_id,
+                    datetime.now(UTC).isoformat(),
+                    provider,
+                    model,
+                    fields.get("census_year"),
+                    fields.get("task"),
+                    image_path,
+                    len(prompt),
+                    prompt_blob,
+                ),
+            )
+            now = time.perf_counter()
+            # Insertion order is start order, so stale entries are at the front
+            while self._started:
+                oldest = next(iter(self._started))
+                if now - self._started[oldest] < STALE_REQUEST_SECONDS:
+                    break
+                del self._started[oldest]
+            self._started[request_id] = now
+        return request_id
+
+    def finish(
+        self,
+        request_id: str,
+        response_text: str = "",
+        input_tokens: int | None = None,
+        output_tokens: int | None = None,
+        cached_tokens: int | None = None,
+        duration_seconds: float | None = None,
+        error: str | None = None,
+    ) -> None:
+        """
+        Record the outcome of a request.
+
+        Args:
+            request_id: ID returned by start()
+            response_text: Response text (only its size is kept unless store_bodies)
+            input_tokens: Prompt tokens billed
+            output_tokens: Completion tokens billed
+            cached_tokens: Prompt tokens served from the provider's cache
+            duration_seconds: Request duration (measured from start() if omitted)
+            error: Error message if the request failed
+        """
+        with self._lock:
+            started = self._started.pop(request_id, None)
+        if duration_seconds is None and started is not None:
+            duration_seconds = time.perf_counter() - started
+
+        response_blob = (
+            self._write_blob(response_text) if self.store_bodies and response_text else None
+        )
+        cache_hit = None if cached_tokens is None else int(cached_tokens > 0)
+
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                """
+                UPDATE llm_call SET
+                    response_chars = ?, input_tokens = ?, output_tokens = ?,
+                    cached_tokens = ?, cache_hit = ?, duration_seconds = ?,
+                    status = ?, error = ?, response_blob = ?
+                WHERE request_id = ?
+                """,
+                (
+                    len(response_text),
+                    input_tokens,
+                    output_tokens,
+                    cached_tokens,
+                    cache_hit,
+                    duration_seconds,
+                    "error" if error else "ok",
+                    error,
+                    response_blob,
+                    request_id,
+                ),
+            )
+
+    def record_routing(
+        self,
+        cascade_id: str,
+        tier: int,
+        model: str,
+        outcome: str,
+        warnings: int = 0,
+        persons: int = 0,
+        error: str | None = None,
+        duration_seconds: float | None = None,
+        image_path: str | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Record one model attempt of a cascade.
+
+        Args:
+            cascade_id: Identifier shared by all attempts for one request
+            tier: Position of the model in the cascade (0 = first tried)
+            model: Model identifier
+            outcome: "accepted", "escalated" or "failed"
+            warnings: Validation warnings raised by the attempt
+            persons: Person records extracted
+            error: Parse or provider error, if any
+            duration_seconds: Time spent on the attempt
+            image_path: Image transcribed
+            context: Extra call context; merged over llm_call_context()
+        """
+        fields = {**current_call_context(), **(context or {})}
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO llm_routing (
+                    decided_at, cascade_id, tier, model, census_year, task,
+                    image_path, outcome, warnings, persons, error, duration_seconds
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    datetime.now(UTC).isoformat(),
+                    cascade_id,
+                    tier,
+                    model,
+                    fields.get("census_year"),
+                    fields.get("task"),
+                    image_path,
+                    outcome,
+                    warnings,
+                    persons,
+                    error,
+                    duration_seconds,
+                ),
+            )
+
+    def _write_blob(self, text: str) -> str:
+        """Store text gzip-compressed under its SHA-256; returns the digest."""
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.blob_dir / digest[:2] / f"{digest}.gz"
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(gzip.compress(data))
+            tmp_path.replace(path)
+        return digest
+
+    def read_blob(self, digest: str) -> str | None:
+        """Load a stored prompt or response body."""
+        path = self.blob_dir / digest[:2] / f"{digest}.gz"
+        try:
+            return gzip.decompress(path.read_bytes()).decode("utf-8")
+        except OSError:
+            return None
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def get_call(self, request_id: str) -> dict[str, Any] | None:
+        """Get one recorded call as a dict."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM llm_call WHERE request_id = ?", (request_id,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def recent_calls(self, limit: int = 50) -> list[dict[str, Any]]:
+        """Most recent calls, newest first."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM llm_call ORDER BY started_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def summarize(self, since: datetime | None = None) -> list[ModelUsageSummary]:
+        """
+        Latency percentiles and token totals per model and census year.
+
+        Pending calls are ignored; failed calls count toward calls and errors
+        but not latency.
+
+        Args:
+            since: Only include calls started at or after this time
+
+        Returns:
+            One summary per (model, census_year), ordered by model then year
+        """
+        query = """
+            SELECT model, census_year, status, duration_seconds,
+                   input_tokens, output_tokens, cached_tokens, cache_hit
+            FROM llm_call
+            WHERE status != 'pending'
+        """
+        params: list[Any] = []
+        if since is not None:
+            if since.tzinfo is None:
+                since = since.astimezone()
+            query += " AND started_at >= ?"
+            params.append(since.astimezone(UTC).isoformat())
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        groups: dict[tuple[str, int | None], list[sqlite3.Row]] = {}
+        for row in rows:
+            groups.setdefault((row["model"], row["census_year"]), []).append(row)
+
+        summaries = []
+        for (model, census_year), group in groups.items():
+            durations = sorted(
+                row["duration_seconds"]
+                for row in group
+                if row["status"] == "ok" and row["duration_seconds"] is not None
+            )
+            summaries.append(
+                ModelUsageSummary(
+                    model=model,
+                    census_year=census_year,
+                    calls=len(group),
+                    errors=sum(1 for row in group if row["status"] == "error"),
+                    p50_seconds=percentile(durations, 0.50),
+                    p95_seconds=percentile(durations, 0.95),
+                    input_tokens=sum(row["input_tokens"] or 0 for row in group),
+                    output_tokens=sum(row["output_tokens"] or 0 for row in group),
+                    cached_tokens=sum(row["cached_tokens"] or 0 for row in group),
+                    cache_hits=sum(row["cache_hit"] or 0 for row in group),
+                )
+            )
+
+        summaries.sort(key=lambda s: (s.model, s.census_year or 0))
+        return summaries
+
+    def routing_summary(self) -> list[RoutingSummary]:
+        """
+        Cascade outcomes per model and census year.
+
+        A model with a high acceptance rate for a year can take more traffic
+        (or a looser warning threshold); a low rate means the escalation costs
+        more than starting with the stronger model.
+
+        Returns:
+            One summary per (model, census_year), ordered by model then year
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT model, census_year,
+                       COUNT(*) AS attempts,
+                       SUM(outcome = 'accepted') AS accepted,
+                       SUM(outcome = 'escalated') AS escalated,
+                       SUM(outcome = 'failed') AS failed,
+                       AVG(warnings) AS mean_warnings
+                FROM llm_routing
+                GROUP BY model, census_year
+                ORDER BY model, COALESCE(census_year, 0)
+                """
+            ).fetchall()
+        return [RoutingSummary(**dict(row)) for row in rows]
+
+
+_telemetry_store: LLMTelemetryStore | None = None
+_telemetry_lock = threading.Lock()
+
+
+def get_telemetry_store() -> LLMTelemetryStore:
+    """Get the process-wide telemetry store configured from settings."""
+    global _telemetry_store
+    with _telemetry_lock:
+        if _telemetry_store is None:
+            from rmcitecraft.config import get_config
+
+            config = get_config()
+            _telemetry_store = LLMTelemetryStore(
+                Path(config.llm_telemetry_db_path),
+                store_bodies=config.llm_telemetry_store_bodies,
+            )
+            logger.debug(f"LLM telemetry store: {_telemetry_store.db_path}")
+    return _telemetry_store
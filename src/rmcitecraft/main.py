@@ -1,7 +1,15 @@
-"""Main application entry point for RMCitecraft."""
+"""Main application entry point for RMCitecraft.
+
+Tab modules (and the Playwright, SciPy and LLM stacks behind them) are
+imported when a view is first opened, not at startup. Run
+`rmcitecraft import-time` to see which imports dominate startup.
+"""
+
+from __future__ import annotations
 
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
@@ -9,14 +17,13 @@ from nicegui import app, ui
 
 from rmcitecraft.api import create_api_router
 from rmcitecraft.config import get_config
+from rmcitecraft.services import image_tiles
 from rmcitecraft.services.file_watcher import FileWatcher
 from rmcitecraft.services.image_processing import get_image_processing_service
 from rmcitecraft.ui.components.error_panel import create_error_panel
-from rmcitecraft.ui.tabs.batch_processing import BatchProcessingTab
-from rmcitecraft.ui.tabs.census_batch_transcription import CensusBatchTranscriptionTab
-from rmcitecraft.ui.tabs.census_extraction_viewer import CensusExtractionViewerTab
-from rmcitecraft.ui.tabs.citation_manager import CitationManagerTab
-from rmcitecraft.ui.tabs.findagrave_batch import FindAGraveBatchTab
+
+if TYPE_CHECKING:
+    from rmcitecraft.ui.tabs.citation_manager import CitationManagerTab
 
 
 def _cleanup_services(file_watcher: FileWatcher | None) -> None:
@@ -68,6 +75,12 @@ def setup_app() -> None:
 
     logger.info("REST API endpoints configured")
 
+    # Serve census image tiles for the image viewer
+    if image_tiles.is_available():
+        tile_cache = image_tiles.get_image_tile_cache()
+        app.add_static_files(image_tiles.TILE_URL_PREFIX, tile_cache.cache_dir)
+        app.on_shutdown(tile_cache.shutdown)
+
     # Initialize file watcher for image downloads (if configured)
     file_watcher: FileWatcher | None = None
     try:
@@ -502,6 +515,8 @@ def setup_app() -> None:
 
         def show_batch_processing() -> None:
             """Show census batch processing view."""
+            from rmcitecraft.ui.tabs.batch_processing import BatchProcessingTab
+
             view_container.clear()
             with view_container:
                 batch_processing = BatchProcessingTab()
@@ -509,6 +524,8 @@ def setup_app() -> None:
 
         def show_findagrave_batch() -> None:
             """Show Find a Grave batch processing view."""
+            from rmcitecraft.ui.tabs.findagrave_batch import FindAGraveBatchTab
+
             view_container.clear()
             with view_container:
                 findagrave_batch = FindAGraveBatchTab()
@@ -516,6 +533,8 @@ def setup_app() -> None:
 
         def show_citation_manager() -> None:
             """Show citation manager view."""
+            from rmcitecraft.ui.tabs.citation_manager import CitationManagerTab
+
             nonlocal citation_manager
             view_container.clear()
             with view_container:
@@ -524,6 +543,10 @@ def setup_app() -> None:
 
         def show_census_batch_transcription() -> None:
             """Show census batch transcription view."""
+            from rmcitecraft.ui.tabs.census_batch_transcription import (
+                CensusBatchTranscriptionTab,
+            )
+
             view_container.clear()
             with view_container:
                 census_batch_transcription = CensusBatchTranscriptionTab()
@@ -531,6 +554,8 @@ def setup_app() -> None:
 
         def show_census_extraction_viewer() -> None:
             """Show census extraction viewer."""
+            from rmcitecraft.ui.tabs.census_extraction_viewer import CensusExtractionViewerTab
+
             view_container.clear()
             with view_container:
                 census_viewer = CensusExtractionViewerTab()
@@ -75,6 +75,11 @@ class ImageMetadata(BaseModel):
     media_id: int | None = Field(default=None, description="RootsMagic MediaID after linking")
     event_id: int | None = Field(default=None, description="RootsMagic EventID for census event")
 
+    # Existing media with the same perceptual hash (reported, never merged)
+    similar_media: list[Path] = Field(
+        default_factory=list, description="Look-alike media files for the user to confirm"
+    )
+
     # Error Tracking
     error_message: str | None = Field(default=None, description="Error details if failed")
     retry_count: int = Field(default=0, description="Number of retry attempts")
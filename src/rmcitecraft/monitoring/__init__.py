@@ -0,0 +1,13 @@
+"""Runtime monitoring for batch processing."""
+
+from .spans import STAGES, Span, SpanRecorder, record_span, span, span_context, traced
+
+__all__ = [
+    'STAGES',
+    'Span',
+    'SpanRecorder',
+    'record_span',
+    'span',
+    'span_context',
+    'traced',
+]
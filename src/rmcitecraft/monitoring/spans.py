@@ -0,0 +1,255 @@
+"""
+Per-stage timing spans for batch processing.
+
+A span times one stage of one batch item (navigate, wait, extract, parse,
+match, db_write, image_download, llm_call). Spans are buffered by a
+SpanRecorder and written in bulk to the performance_metrics table of the
+batch state database, tagged with the session and item they belong to.
+
+Code that does the work only marks stages:
+
+    with span("navigate"):
+        await page.goto(url)
+
+    @traced("parse")
+    def parse(raw): ...
+
+The batch loop decides where spans go:
+
+    recorder = SpanRecorder(state_repo.record_spans, batch_type="census_transcription")
+    with span_context(recorder, session_id=session_id):
+        ...
+        with span_context(item_id=item.item_id):
+            await process(item)
+    recorder.flush()
+
+Outside a span_context (or with a disabled recorder) span() returns a shared
+no-op context manager, so instrumented code costs one context variable lookup.
+"""
+
+import functools
+import inspect
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any, TypeVar
+
+from loguru import logger
+
+STAGES = (
+    "navigate",
+    "wait",
+    "extract",
+    "parse",
+    "match",
+    "db_write",
+    "image_download",
+    "llm_call",
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class Span:
+    """Timing of one stage of one batch item."""
+
+    stage: str
+    started_at: str  # ISO 8601 UTC
+    duration_ms: float
+    success: bool = True
+    session_id: str | None = None
+    item_id: int | None = None
+    batch_type: str | None = None
+
+
+class SpanRecorder:
+    """Buffers spans and hands them to a sink in batches.
+
+    The sink receives a list of spans, typically a repository's
+    record_spans(). Sink errors are logged and the batch is dropped: timing
+    data must never fail the work it measures.
+    """
+
+    def __init__(
+        self,
+        sink: Callable[[list[Span]], None],
+        batch_type: str,
+        flush_size: int = 200,
+        enabled: bool = True,
+    ):
+        """Initialize recorder.
+
+        Args:
+            sink: Callable that persists a batch of spans
+            batch_type: performance_metrics batch_type for every span
+            flush_size: Buffered spans that trigger a write
+            enabled: When False, span() inside this recorder's context is a no-op
+        """
+        self.sink = sink
+        self.batch_type = batch_type
+        self.flush_size = flush_size
+        self.enabled = enabled
+        self._buffer: list[Span] = []
+        # Spans also arrive from asyncio.to_thread workers
+        self._lock = threading.Lock()
+
+    def add(self, span: Span) -> None:
+        """Buffer a span, writing the buffer once it reaches flush_size."""
+        span.batch_type = self.batch_type
+        with self._lock:
+            self._buffer.append(span)
+            full = len(self._buffer) >= self.flush_size
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write buffered spans to the sink.
+
+        Returns:
+            Number of spans written
+        """
+        with self._lock:
+            spans, self._buffer = self._buffer, []
+        if not spans:
+            return 0
+        try:
+            self.sink(spans)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not record {len(spans)} timing spans: {e}")
+            return 0
+        return len(spans)
+
+    @property
+    def pending(self) -> int:
+        """Number of spans waiting to be written."""
+        return len(self._buffer)
+
+
+@dataclass(frozen=True)
+class _Scope:
+    recorder: SpanRecorder
+    session_id: str | None
+    item_id: int | None
+
+
+_scope: ContextVar[_Scope | None] = ContextVar("span_scope", default=None)
+_NO_SPAN = nullcontext()
+
+
+@contextmanager
+def span_context(
+    recorder: SpanRecorder | None = None,
+    session_id: str | None = None,
+    item_id: int | None = None,
+) -> Iterator[None]:
+    """Send spans opened inside the block to a recorder.
+
+    Nested blocks inherit the enclosing recorder and ids and override the
+    ones they pass, so a batch loop sets the recorder and session once and
+    each item adds its item_id. Tasks and to_thread calls started inside the
+    block inherit it.
+    """
+    enclosing = _scope.get()
+    recorder = recorder or (enclosing.recorder if enclosing else None)
+    if recorder is None:
+        yield
+        return
+    if enclosing:
+        session_id = session_id if session_id is not None else enclosing.session_id
+        item_id = item_id if item_id is not None else enclosing.item_id
+    token = _scope.set(_Scope(recorder, session_id, item_id))
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+class _TimedSpan:
+    """Context manager that times one stage and records it on exit."""
+
+    __slots__ = ("scope", "stage", "started_at", "start")
+
+    def __init__(self, scope: _Scope, stage: str):
+        self.scope = scope
+        self.stage = stage
+
+    def __enter__(self) -> "_TimedSpan":
+        self.started_at = datetime.now(UTC)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        duration_ms = (time.perf_counter() - self.start) * 1000
+        self.scope.recorder.add(
+            Span(
+                stage=self.stage,
+                started_at=self.started_at.isoformat(),
+                duration_ms=duration_ms,
+                success=exc_type is None,
+                session_id=self.scope.session_id,
+                item_id=self.scope.item_id,
+            )
+        )
+        return False
+
+
+def span(stage: str):
+    """Time the enclosed block as one stage of the current item.
+
+    The span is marked unsuccessful if the block raises; the exception
+    propagates unchanged.
+    """
+    scope = _scope.get()
+    if scope is None or not scope.recorder.enabled:
+        return _NO_SPAN
+    return _TimedSpan(scope, stage)
+
+
+def record_span(stage: str, duration_ms: float, success: bool = True) -> None:
+    """Record a stage that was timed elsewhere (e.g. an LLM call's latency)."""
+    scope = _scope.get()
+    if scope is None or not scope.recorder.enabled:
+        return
+    started_at = datetime.now(UTC) - timedelta(milliseconds=duration_ms)
+    scope.recorder.add(
+        Span(
+            stage=stage,
+            started_at=started_at.isoformat(),
+            duration_ms=duration_ms,
+            success=success,
+            session_id=scope.session_id,
+            item_id=scope.item_id,
+        )
+    )
+
+
+def traced(stage: str) -> Callable[[F], F]:
+    """Decorator that times every call of a function as a span.
+
+    Works for plain functions and coroutine functions.
+    """
+
+    def decorator(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with span(stage):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(stage):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,212 @@
+"""
+Stage timing reports built from recorded spans.
+
+Turns the span rows stored in performance_metrics (see spans.py) into
+per-stage p50/p95 tables bucketed by hour or by session, a ranking of the
+slowest items, and a Chrome Trace Event file of one session that opens in
+speedscope (https://www.speedscope.app), Perfetto or chrome://tracing.
+
+A stage can run several times for one item (one image_download per photo,
+one db_write per table group), so percentiles are taken over each item's
+total time in the stage rather than over individual spans.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Literal
+
+from rmcitecraft.llm.telemetry import percentile
+from rmcitecraft.monitoring.spans import STAGES
+
+Bucket = Literal["hour", "session", "all"]
+
+
+@dataclass
+class StageStats:
+    """Timing of one stage within one hour or session."""
+
+    bucket: str
+    stage: str
+    items: int
+    failures: int
+    p50_ms: float | None
+    p95_ms: float | None
+    total_ms: float
+
+
+@dataclass
+class ItemTiming:
+    """Total stage time of one batch item."""
+
+    session_id: str | None
+    item_id: int | None
+    item_name: str
+    started_at: str
+    total_ms: float
+    failures: int
+    stages: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def slowest_stage(self) -> str | None:
+        """Stage that took the most time for this item."""
+        return max(self.stages, key=self.stages.get) if self.stages else None
+
+
+def _hour(timestamp: str) -> str:
+    """Local 'YYYY-MM-DD HH:00' bucket of an ISO timestamp."""
+    return datetime.fromisoformat(timestamp).astimezone().strftime("%Y-%m-%d %H:00")
+
+
+def _item_key(row: dict[str, Any]) -> tuple:
+    """Spans without an item id stand alone."""
+    if row["item_id"] is None:
+        return (row["session_id"], None, row["id"])
+    return (row["session_id"], row["item_id"], None)
+
+
+def stage_percentiles(spans: list[dict[str, Any]], by: Bucket = "hour") -> list[StageStats]:
+    """Per-stage p50/p95 of item time, bucketed by hour or session.
+
+    Args:
+        spans: Span rows (id, timestamp, operation, duration_ms, success,
+            session_id, item_id) as returned by get_stage_spans()
+        by: 'hour' (local time of the span start), 'session', or 'all'
+            for a single bucket
+
+    Returns:
+        StageStats ordered by bucket, then by pipeline order of the stage
+    """
+    # (bucket, stage) -> item -> [total ms, failures]
+    totals: dict[tuple[str, str], dict[tuple, list[float]]] = defaultdict(dict)
+    for row in spans:
+        if by == "hour":
+            bucket = _hour(row["timestamp"])
+        elif by == "session":
+            bucket = row["session_id"] or "-"
+        else:
+            bucket = "all"
+        per_item = totals[(bucket, row["operation"])]
+        entry = per_item.setdefault(_item_key(row), [0.0, 0])
+        entry[0] += row["duration_ms"]
+        entry[1] += 0 if row["success"] else 1
+
+    stats = []
+    for (bucket, stage), per_item in totals.items():
+        durations = sorted(total for total, _ in per_item.values())
+        stats.append(
+            StageStats(
+                bucket=bucket,
+                stage=stage,
+                items=len(durations),
+                failures=sum(1 for _, failed in per_item.values() if failed),
+                p50_ms=percentile(durations, 0.50),
+                p95_ms=percentile(durations, 0.95),
+                total_ms=sum(durations),
+            )
+        )
+    order = {stage: i for i, stage in enumerate(STAGES)}
+    stats.sort(key=lambda s: (s.bucket, order.get(s.stage, len(order)), s.stage))
+    return stats
+
+
+def item_timings(spans: list[dict[str, Any]]) -> list[ItemTiming]:
+    """Per-item stage totals, slowest item first.
+
+    Args:
+        spans: Span rows as returned by get_stage_spans(); an item_name
+            column is used when present
+
+    Returns:
+        One ItemTiming per (session, item)
+    """
+    items: dict[tuple, ItemTiming] = {}
+    for row in spans:
+        key = _item_key(row)
+        timing = items.get(key)
+        if timing is None:
+            timing = items[key] = ItemTiming(
+                session_id=row["session_id"],
+                item_id=row["item_id"],
+                item_name=row.get("item_name") or "",
+                started_at=row["timestamp"],
+                total_ms=0.0,
+                failures=0,
+            )
+        timing.started_at = min(timing.started_at, row["timestamp"])
+        timing.total_ms += row["duration_ms"]
+        timing.failures += 0 if row["success"] else 1
+        stage = row["operation"]
+        timing.stages[stage] = timing.stages.get(stage, 0.0) + row["duration_ms"]
+    return sorted(items.values(), key=lambda t: t.total_ms, reverse=True)
+
+
+def to_chrome_trace(spans: list[dict[str, Any]], name: str = "rmcitecraft") -> dict[str, Any]:
+    """Chrome Trace Event document of a session's spans.
+
+    Each item gets its own track (thread) with an enclosing item event, so
+    flame views show item → stage. Timestamps are microseconds since the
+    first span.
+
+    Args:
+        spans: Span rows as returned by get_stage_spans()
+        name: Process name shown by the trace viewer
+
+    Returns:
+        JSON-serializable trace ({"traceEvents": [...]})
+    """
+    if not spans:
+        return {"traceEvents": [], "displayTimeUnit": "ms"}
+
+    def start_us(row: dict[str, Any]) -> float:
+        return datetime.fromisoformat(row["timestamp"]).timestamp() * 1_000_000
+
+    origin = min(start_us(row) for row in spans)
+    events: list[dict[str, Any]] = [
+        {"name": "process_name", "ph": "M", "pid": 1, "tid": 0, "args": {"name": name}}
+    ]
+    tracks: dict[tuple, int] = {}
+    bounds: dict[int, list[float]] = {}
+
+    for row in sorted(spans, key=start_us):
+        key = _item_key(row)
+        tid = tracks.get(key)
+        if tid is None:
+            tid = tracks[key] = len(tracks) + 1
+            label = row.get("item_name") or f"item {row['item_id']}"
+            events.append(
+                {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": label}}
+            )
+        ts = start_us(row) - origin
+        dur = row["duration_ms"] * 1000
+        events.append({
+            "name": row["operation"],
+            "cat": row.get("batch_type") or "batch",
+            "ph": "X",
+            "ts": round(ts, 3),
+            "dur": round(dur, 3),
+            "pid": 1,
+            "tid": tid,
+            "args": {
+                "session_id": row["session_id"],
+                "item_id": row["item_id"],
+                "success": bool(row["success"]),
+            },
+        })
+        span_bounds = bounds.setdefault(tid, [ts, ts + dur])
+        span_bounds[0] = min(span_bounds[0], ts)
+        span_bounds[1] = max(span_bounds[1], ts + dur)
+
+    for key, tid in tracks.items():
+        start, end = bounds[tid]
+        events.append({
+            "name": "item" if key[1] is None else f"item {key[1]}",
+            "cat": "item",
+            "ph": "X",
+            "ts": round(start, 3),
+            "dur": round(end - start, 3),
+            "pid": 1,
+            "tid": tid,
+        })
+
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
@@ -5,6 +5,8 @@ import xml.etree.ElementTree as ET
 
 from loguru import logger
 
+from rmcitecraft.database.findagrave_queries import get_utc_mod_date
+from rmcitecraft.database.rmtree_cache import RootsMagicCache
 from rmcitecraft.repositories.database import DatabaseConnection
 
 
@@ -77,40 +79,12 @@ class CitationRepository:
             census_year: Census year (e.g., 1900, 1910, etc.)
 
         Returns:
-            List of citation rows matching the census year.
+            List of citation rows matching the census year, read from the
+            local RootsMagic cache (synced first).
         """
-        with self.db.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT
-                    c.CitationID,
-                    c.CitationName,
-                    c.ActualText,
-                    c.RefNumber,
-                    c.Footnote,
-                    c.ShortFootnote,
-                    c.Bibliography,
-                    c.Fields AS CitationFields,
-                    s.Name AS SourceName,
-                    s.TemplateID,
-                    s.Fields AS SourceFields
-                FROM CitationTable c
-                JOIN SourceTable s ON c.SourceID = s.SourceID
-                WHERE s.Name LIKE ?
-                   OR s.Name LIKE ?
-                   OR s.Name LIKE ?
-                ORDER BY s.Name COLLATE RMNOCASE
-                """,
-                (
-                    f"Fed Census: {census_year}%",
-                    f"Fed Census Slave Schedule: {census_year}%",
-                    f"Fed Census Mortality Schedule: {census_year}%",
-                ),
-            )
-            results = cursor.fetchall()
-            logger.debug(f"Found {len(results)} citations for year {census_year}")
-            return results
+        results = RootsMagicCache(self.db.db_path).citations_by_year(census_year)
+        logger.debug(f"Found {len(results)} citations for year {census_year}")
+        return results
 
     def get_citation_by_id(self, citation_id: int) -> sqlite3.Row | None:
         """Get a single citation by ID.
@@ -170,10 +144,11 @@ class CitationRepository:
                     UPDATE CitationTable
                     SET Footnote = ?,
                         ShortFootnote = ?,
-                        Bibliography = ?
+                        Bibliography = ?,
+                        UTCModDate = ?
                     WHERE CitationID = ?
                     """,
-                    (footnote, short_footnote, bibliography, citation_id),
+                    (footnote, short_footnote, bibliography, get_utc_mod_date(), citation_id),
                 )
                 rows_affected = cursor.rowcount
 
@@ -8,6 +8,7 @@ from pathlib import Path
 from loguru import logger
 
 from rmcitecraft.config import get_config
+from rmcitecraft.database.connection import setup_rmnocase
 
 
 class DatabaseConnection:
@@ -33,10 +34,6 @@ class DatabaseConnection:
         # Validate paths
         if not self.db_path.exists():
             raise FileNotFoundError(f"Database file not found: {self.db_path}")
-        if not self.icu_extension_path.exists():
-            raise FileNotFoundError(
-                f"ICU extension not found: {self.icu_extension_path}"
-            )
 
         self._connection: sqlite3.Connection | None = None
 
@@ -63,27 +60,18 @@ class DatabaseConnection:
         self._connection.row_factory = sqlite3.Row  # Enable column access by name
 
         try:
-            # Load ICU extension for RMNOCASE collation
-            self._connection.enable_load_extension(True)
-            self._connection.load_extension(str(self.icu_extension_path))
-
-            # Register RMNOCASE collation
-            self._connection.execute(
-                "SELECT icu_load_collation("
-                "'en_US@colStrength=primary;caseLevel=off;normalization=on',"
-                "'RMNOCASE'"
-                ")"
+            # ICU when it loads; pure-Python RMNOCASE only for read-only connections
+            collation = setup_rmnocase(
+                self._connection, self.icu_extension_path, read_only=read_only
             )
 
-            self._connection.enable_load_extension(False)
-
             logger.info(
                 f"Connected to RootsMagic database: {self.db_path} "
-                f"(read_only={read_only})"
+                f"(read_only={read_only}, collation={collation})"
             )
 
-        except sqlite3.Error as e:
-            logger.error(f"Failed to load ICU extension: {e}")
+        except (sqlite3.Error, OSError, AttributeError) as e:
+            logger.error(f"Failed to register RMNOCASE collation: {e}")
             if self._connection:
                 self._connection.close()
                 self._connection = None
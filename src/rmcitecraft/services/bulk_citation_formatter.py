@@ -0,0 +1,370 @@
+"""Bulk citation formatting for a whole census year.
+
+Parses every census citation for a year with FamilySearchParser, formats it
+with CitationFormatter, and compares the result with what is stored in the
+RootsMagic database. The comparison is returned as a report (usable as a
+dry run), and applying the report writes every change in one transaction
+with executemany.
+
+Where formatted citations are stored depends on the source:
+- Free-form sources (TemplateID=0): SourceTable.Fields XML BLOB, plus empty
+  "[]" brackets in SourceTable.Name are filled in with citation details
+- Template-based sources: CitationTable Footnote/ShortFootnote/Bibliography
+"""
+
+import difflib
+import sqlite3
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+
+from loguru import logger
+
+from rmcitecraft.database.findagrave_queries import get_utc_mod_date
+from rmcitecraft.parsers.citation_formatter import CitationFormatter
+from rmcitecraft.parsers.familysearch_parser import FamilySearchParser
+from rmcitecraft.repositories.citation_repository import CitationRepository
+from rmcitecraft.validation.data_quality import is_citation_needs_processing
+
+CITATION_FORMS = ("Footnote", "ShortFootnote", "Bibliography")
+
+
+@dataclass
+class CitationChange:
+    """Old and newly formatted values for one citation."""
+
+    citation_id: int
+    source_id: int
+    template_id: int
+    source_name: str
+    old_footnote: str | None
+    old_short_footnote: str | None
+    old_bibliography: str | None
+    footnote: str
+    short_footnote: str
+    bibliography: str
+    new_source_name: str | None = None  # Set when empty brackets get filled in
+    source_fields: bytes | None = None  # Existing SourceTable.Fields (free-form only)
+
+    @property
+    def is_free_form(self) -> bool:
+        """Whether the formatted citation is stored in SourceTable.Fields."""
+        return self.template_id == 0
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether applying this change would modify the database."""
+        return (
+            (self.old_footnote or "") != self.footnote
+            or (self.old_short_footnote or "") != self.short_footnote
+            or (self.old_bibliography or "") != self.bibliography
+            or self.new_source_name is not None
+        )
+
+    def diff(self) -> str:
+        """Unified diff of the stored and newly formatted values."""
+        pairs = [
+            ("Footnote", self.old_footnote, self.footnote),
+            ("ShortFootnote", self.old_short_footnote, self.short_footnote),
+            ("Bibliography", self.old_bibliography, self.bibliography),
+        ]
+        if self.new_source_name is not None:
+            pairs.insert(0, ("SourceName", self.source_name, self.new_source_name))
+
+        lines: list[str] = []
+        for name, old, new in pairs:
+            if (old or "") == new:
+                continue
+            lines.extend(
+                difflib.unified_diff(
+                    [old] if old else [],
+                    [new],
+                    fromfile=f"{name} (database)",
+                    tofile=f"{name} (formatted)",
+                    lineterm="",
+                )
+            )
+        return "\n".join(lines)
+
+
+@dataclass
+class BulkFormatReport:
+    """Result of formatting all citations for a census year."""
+
+    census_year: int
+    changes: list[CitationChange] = field(default_factory=list)
+    unchanged: list[int] = field(default_factory=list)  # CitationIDs already up to date
+    already_processed: list[int] = field(default_factory=list)
+    skipped: dict[int, str] = field(default_factory=dict)  # CitationID -> reason
+    applied: bool = False
+
+    def summary(self) -> str:
+        """One-line summary of the report."""
+        return (
+            f"{self.census_year}: {len(self.changes)} to update, "
+            f"{len(self.unchanged)} unchanged, "
+            f"{len(self.already_processed)} already processed, "
+            f"{len(self.skipped)} skipped"
+        )
+
+    def to_text(self) -> str:
+        """Full dry-run report: summary, per-citation diffs and skip reasons."""
+        lines = [self.summary()]
+        for change in self.changes:
+            lines.append("")
+            lines.append(f"Citation {change.citation_id} (Source {change.source_id})")
+            lines.append(change.diff())
+        if self.skipped:
+            lines.append("")
+            lines.append("Skipped:")
+            for citation_id, reason in self.skipped.items():
+                lines.append(f"  Citation {citation_id}: {reason}")
+        return "\n".join(lines)
+
+
+class BulkCitationFormatter:
+    """Formats and writes back all census citations for a year at once."""
+
+    def __init__(self, db_connection: sqlite3.Connection):
+        """Initialize bulk formatter.
+
+        Args:
+            db_connection: RootsMagic database connection (read-write for apply)
+        """
+        self.conn = db_connection
+        self.parser = FamilySearchParser()
+        self.formatter = CitationFormatter()
+
+    def plan(self, census_year: int, include_processed: bool = False) -> BulkFormatReport:
+        """Format every citation for a census year without writing anything.
+
+        Args:
+            census_year: Census year (e.g., 1940)
+            include_processed: Also reformat citations that already pass
+                validation (e.g. after a template fix)
+
+        Returns:
+            Report of changes that apply() would write
+        """
+        report = BulkFormatReport(census_year=census_year)
+
+        for row in self._load_citations(census_year):
+            citation_id = row["CitationID"]
+            template_id = row["TemplateID"]
+            source_fields = row["SourceFields"]
+
+            if template_id == 0:
+                old = [CitationRepository.extract_field_from_blob(source_fields, name)
+                       for name in CITATION_FORMS]
+            else:
+                old = [row["Footnote"], row["ShortFootnote"], row["Bibliography"]]
+
+            if not include_processed and not is_citation_needs_processing(*old, census_year):
+                report.already_processed.append(citation_id)
+                continue
+
+            entry = self._get_familysearch_entry(row)
+            if not entry:
+                report.skipped[citation_id] = "No FamilySearch entry"
+                continue
+
+            parsed = self.parser.parse(row["SourceName"], entry, citation_id)
+            if parsed.errors:
+                report.skipped[citation_id] = "; ".join(parsed.errors)
+                continue
+            if not parsed.is_complete:
+                report.skipped[citation_id] = f"Missing: {', '.join(parsed.missing_fields)}"
+                continue
+
+            footnote, short_footnote, bibliography = self.formatter.format(parsed)
+
+            change = CitationChange(
+                citation_id=citation_id,
+                source_id=row["SourceID"],
+                template_id=template_id,
+                source_name=row["SourceName"],
+                old_footnote=old[0],
+                old_short_footnote=old[1],
+                old_bibliography=old[2],
+                footnote=footnote,
+                short_footnote=short_footnote,
+                bibliography=bibliography,
+                source_fields=source_fields if template_id == 0 else None,
+            )
+            if template_id == 0 and "[]" in row["SourceName"]:
+                bracket = self.formatter.generate_source_name_bracket(parsed)
+                if bracket and bracket != "[]":
+                    change.new_source_name = fill_source_name_brackets(row["SourceName"], bracket)
+
+            if change.has_changes:
+                report.changes.append(change)
+            else:
+                report.unchanged.append(citation_id)
+
+        logger.info(f"Bulk citation format plan for {report.summary()}")
+        return report
+
+    def apply(self, report: BulkFormatReport) -> int:
+        """Write all changes in a report in a single transaction.
+
+        Args:
+            report: Report from plan()
+
+        Returns:
+            Number of citations updated
+
+        Raises:
+            sqlite3.Error: If the write fails (nothing is written)
+        """
+        if not report.changes:
+            return 0
+
+        utc_mod_date = get_utc_mod_date()
+        source_rows = []
+        name_rows = []
+        citation_rows = []
+        for change in report.changes:
+            if change.is_free_form:
+                source_rows.append((
+                    build_source_fields_blob(
+                        change.source_fields,
+                        change.footnote,
+                        change.short_footnote,
+                        change.bibliography,
+                    ),
+                    utc_mod_date,
+                    change.source_id,
+                ))
+                if change.new_source_name is not None:
+                    name_rows.append((change.new_source_name, utc_mod_date, change.source_id))
+            else:
+                citation_rows.append((
+                    change.footnote,
+                    change.short_footnote,
+                    change.bibliography,
+                    utc_mod_date,
+                    change.citation_id,
+                ))
+
+        cursor = self.conn.cursor()
+        try:
+            cursor.executemany(
+                "UPDATE SourceTable SET Fields = ?, UTCModDate = ? WHERE SourceID = ?",
+                source_rows,
+            )
+            cursor.executemany(
+                "UPDATE SourceTable SET Name = ?, UTCModDate = ? WHERE SourceID = ?",
+                name_rows,
+            )
+            cursor.executemany(
+                """
+                UPDATE CitationTable
+                SET Footnote = ?, ShortFootnote = ?, Bibliography = ?, UTCModDate = ?
+                WHERE CitationID = ?
+                """,
+                citation_rows,
+            )
+            self.conn.commit()
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            logger.error(f"Bulk citation update for {report.census_year} rolled back: {e}")
+            raise
+
+        report.applied = True
+        logger.info(
+            f"Bulk citation update for {report.census_year}: "
+            f"{len(source_rows)} sources, {len(citation_rows)} citations, "
+            f"{len(name_rows)} source names"
+        )
+        return len(report.changes)
+
+    def _load_citations(self, census_year: int) -> list[sqlite3.Row]:
+        """Load all citations for a census year with their source data."""
+        cursor = self.conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        cursor.execute(
+            """
+            SELECT
+                c.CitationID,
+                c.SourceID,
+                c.ActualText,
+                c.Footnote,
+                c.ShortFootnote,
+                c.Bibliography,
+                c.Fields AS CitationFields,
+                s.Name AS SourceName,
+                s.TemplateID,
+                s.Fields AS SourceFields
+            FROM CitationTable c
+            JOIN SourceTable s ON c.SourceID = s.SourceID
+            WHERE s.Name LIKE ?
+               OR s.Name LIKE ?
+               OR s.Name LIKE ?
+            ORDER BY c.CitationID
+            """,
+            (
+                f"Fed Census: {census_year}%",
+                f"Fed Census Slave Schedule: {census_year}%",
+                f"Fed Census Mortality Schedule: {census_year}%",
+            ),
+        )
+        return cursor.fetchall()
+
+    @staticmethod
+    def _get_familysearch_entry(row: sqlite3.Row) -> str | None:
+        """Get the FamilySearch citation text to parse.
+
+        Priority: CitationTable.Fields "Page" (free-form) > ActualText.
+        """
+        entry = CitationRepository.extract_freeform_text(row["CitationFields"])
+        return entry or row["ActualText"] or None
+
+
+def fill_source_name_brackets(source_name: str, bracket_content: str) -> str:
+    """Replace empty "[]" brackets in a source name with citation details.
+
+    Matches ImageRepository.update_source_name_brackets: a comma directly
+    after the empty brackets is dropped.
+    """
+    if "[], " in source_name:
+        return source_name.replace("[], ", f"{bracket_content} ")
+    return source_name.replace("[]", bracket_content)
+
+
+def build_source_fields_blob(
+    existing_blob: bytes | None,
+    footnote: str,
+    short_footnote: str,
+    bibliography: str,
+) -> bytes:
+    """Set the three citation forms in a SourceTable.Fields BLOB.
+
+    Other fields in the existing BLOB are kept. Values are XML-escaped.
+    """
+    root = None
+    if existing_blob:
+        blob = existing_blob[3:] if existing_blob[:3] == b"\xef\xbb\xbf" else existing_blob
+        try:
+            root = ET.fromstring(blob)
+        except ET.ParseError as e:
+            logger.warning(f"Replacing unparseable SourceTable.Fields BLOB: {e}")
+    if root is None:
+        root = ET.Element("Root")
+
+    fields = root.find("Fields")
+    if fields is None:
+        fields = ET.SubElement(root, "Fields")
+
+    values = dict(zip(CITATION_FORMS, (footnote, short_footnote, bibliography), strict=True))
+    for field_elem in fields.findall("Field"):
+        name = field_elem.findtext("Name")
+        if name in values:
+            value_elem = field_elem.find("Value")
+            if value_elem is None:
+                value_elem = ET.SubElement(field_elem, "Value")
+            value_elem.text = values.pop(name)
+    for name, value in values.items():
+        field_elem = ET.SubElement(fields, "Field")
+        ET.SubElement(field_elem, "Name").text = name
+        ET.SubElement(field_elem, "Value").text = value
+
+    return ET.tostring(root, encoding="unicode").encode("utf-8")
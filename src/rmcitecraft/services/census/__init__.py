@@ -1,15 +1,29 @@
 """Census transcription services with separated concerns."""
 
 from rmcitecraft.services.census.schema_registry import CensusSchemaRegistry
-from rmcitecraft.services.census.prompt_builder import CensusPromptBuilder
-from rmcitecraft.services.census.response_parser import CensusResponseParser
+from rmcitecraft.services.census.prompt_builder import CensusPrompt, CensusPromptBuilder
+from rmcitecraft.services.census.response_parser import (
+    CensusResponseParser,
+    IncrementalPersonParser,
+)
 from rmcitecraft.services.census.data_validator import CensusDataValidator
+from rmcitecraft.services.census.image_preprocessor import (
+    CensusImagePreprocessor,
+    PreprocessSettings,
+)
 from rmcitecraft.services.census.transcription_service import CensusTranscriptionService
+from rmcitecraft.services.census.model_cascade import CascadeTier, CensusModelCascade
 
 __all__ = [
     "CensusSchemaRegistry",
+    "CensusPrompt",
     "CensusPromptBuilder",
     "CensusResponseParser",
+    "IncrementalPersonParser",
     "CensusDataValidator",
+    "CensusImagePreprocessor",
+    "PreprocessSettings",
     "CensusTranscriptionService",
+    "CascadeTier",
+    "CensusModelCascade",
 ]
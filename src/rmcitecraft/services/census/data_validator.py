@@ -39,7 +39,7 @@ class CensusDataValidator:
 
         # Validate metadata
         metadata = data.get("metadata", {})
-        warnings.extend(self._validate_metadata(metadata, schema))
+        warnings.extend(self.validate_metadata(metadata, schema))
 
         # Validate persons
         persons = data.get("persons", [])
@@ -47,12 +47,12 @@ class CensusDataValidator:
             warnings.append("No persons found in transcription")
 
         for i, person in enumerate(persons):
-            person_warnings = self._validate_person(person, schema, i + 1)
+            person_warnings = self.validate_person(person, schema, i + 1)
             warnings.extend(person_warnings)
 
         return warnings
 
-    def _validate_metadata(
+    def validate_metadata(
         self,
         metadata: dict[str, Any],
         schema: CensusYearSchema,
@@ -86,13 +86,25 @@ class CensusDataValidator:
 
         return warnings
 
-    def _validate_person(
+    def validate_person(
         self,
         person: dict[str, Any],
         schema: CensusYearSchema,
         person_number: int,
     ) -> list[str]:
-        """Validate a single person record."""
+        """Validate a single person record.
+
+        Used per record while a response is still streaming, as well as by
+        validate() for complete responses.
+
+        Args:
+            person: Extracted person record
+            schema: Census year schema
+            person_number: 1-based position, used in warning messages
+
+        Returns:
+            List of warning messages for this person
+        """
         warnings: list[str] = []
         prefix = f"Person {person_number}"
 
@@ -0,0 +1,280 @@
+"""Image preprocessing for census transcription.
+
+Full-resolution census scans are far larger than a vision model needs, and
+every extra pixel costs upload time and image tokens. This stage produces a
+smaller variant of the scan before it is sent to the LLM:
+
+1. Auto-crop the microfilm margins (the border colour is the most common
+   colour of the four image corners, so both black and white borders are
+   trimmed)
+2. Optionally convert to grayscale
+3. Optionally, when the target line number is known, keep the form header
+   (ED, sheet, enumerator) plus a band of lines around the target line
+4. Downscale to a maximum long edge and re-encode as JPEG
+
+Line cropping is off by default. Line positions are only estimated
+proportionally from the schema's lines_per_side and a fixed data region of
+the page, which does not match every year's form (1940 and 1950 differ), and
+a band of line_context lines can cut off large households that the
+transcription prompt asks for. Enable it only for layouts where the
+data_top/data_bottom/header_fraction settings have been checked.
+
+Preprocessed variants are cached on disk, keyed by the source file's path,
+size and modification time and the settings used. The cache is bounded in
+size; the least recently used variants are evicted first. Pillow is
+optional: without it (or for files Pillow cannot read) the original image is
+used unchanged.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import Counter
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from loguru import logger
+
+from rmcitecraft.models.census_schema import CensusYearSchema
+
+PREPROCESSED_CACHE_DIR = Path.home() / ".rmcitecraft" / "preprocessed_images"
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024**2
+
+
+@dataclass(frozen=True)
+class PreprocessSettings:
+    """Preprocessing options.
+
+    Attributes:
+        max_long_edge: Longest side of the output image in pixels
+        grayscale: Convert to grayscale (census forms carry no colour information)
+        autocrop: Trim uniform margins around the scanned page
+        autocrop_tolerance: Per-channel difference from the border colour
+            still treated as margin
+        crop_to_line: Crop to the target line's region when a line is known
+            (off by default; the band geometry is an estimate)
+        line_context: Lines kept above and below the target line
+        header_fraction: Top fraction of the page kept as the form header
+        data_top: Fraction of page height where the first data line starts
+        data_bottom: Fraction of page height where the last data line ends
+        jpeg_quality: JPEG quality of the output
+    """
+
+    max_long_edge: int = 2400
+    grayscale: bool = True
+    autocrop: bool = True
+    autocrop_tolerance: int = 40
+    crop_to_line: bool = False
+    line_context: int = 5
+    header_fraction: float = 0.14
+    data_top: float = 0.18
+    data_bottom: float = 0.97
+    jpeg_quality: int = 85
+
+    def cache_token(self) -> str:
+        """Stable string identifying these settings."""
+        return json.dumps(asdict(self), sort_keys=True)
+
+
+class CensusImagePreprocessor:
+    """Shrinks census scans before they are sent to a vision LLM.
+
+    Example:
+        preprocessor = CensusImagePreprocessor()
+        path = preprocessor.preprocess("/path/to/census.jpg", schema, target_line=23)
+    """
+
+    def __init__(
+        self,
+        settings: PreprocessSettings | None = None,
+        cache_dir: Path | None = None,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ):
+        """Initialize preprocessor.
+
+        Args:
+            settings: Preprocessing options (defaults to PreprocessSettings())
+            cache_dir: Directory for preprocessed variants
+                (defaults to ~/.rmcitecraft/preprocessed_images)
+            max_bytes: Cache size limit; least recently used variants are
+                evicted beyond it
+        """
+        self.settings = settings or PreprocessSettings()
+        self.cache_dir = cache_dir or PREPROCESSED_CACHE_DIR
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        # Running estimate of the cache size; the directory is only rescanned
+        # on first use and when the estimate exceeds max_bytes
+        self._cache_bytes: int | None = None
+
+    def preprocess(
+        self,
+        image_path: str | Path,
+        schema: CensusYearSchema | None = None,
+        target_line: int | None = None,
+    ) -> Path:
+        """Get the preprocessed variant of an image, creating it if needed.
+
+        Args:
+            image_path: Original census image
+            schema: Census year schema (provides lines per side for line cropping)
+            target_line: Target line number, if known
+
+        Returns:
+            Path to the preprocessed image, or the original path if the image
+            cannot be preprocessed
+        """
+        image_path = Path(image_path)
+        try:
+            from PIL import Image  # noqa: F401
+        except ImportError:
+            return image_path
+
+        line_band = self._line_band(schema, target_line)
+        try:
+            cache_path = self._cache_path(image_path, line_band)
+            if cache_path.exists():
+                os.utime(cache_path)  # LRU: last used time
+                return cache_path
+            self._process(image_path, cache_path, line_band)
+            self._account(cache_path.stat().st_size)
+        except OSError as e:
+            # Includes PIL.UnidentifiedImageError for files that are not images
+            logger.debug(f"Preprocessing skipped for {image_path.name}: {e}")
+            return image_path
+
+        logger.debug(
+            f"Preprocessed {image_path.name}: {image_path.stat().st_size:,} -> "
+            f"{cache_path.stat().st_size:,} bytes"
+        )
+        return cache_path
+
+    def _line_band(
+        self, schema: CensusYearSchema | None, target_line: int | None
+    ) -> tuple[float, float] | None:
+        """Vertical band (fractions of page height) around the target line."""
+        if not (self.settings.crop_to_line and schema and target_line and target_line > 0):
+            return None
+        lines_per_side = schema.form_structure.lines_per_side
+        if not lines_per_side:
+            return None
+
+        # Sheet sides are numbered continuously (1940: A = 1-40, B = 41-80)
+        row = (target_line - 1) % lines_per_side
+        s = self.settings
+        line_height = (s.data_bottom - s.data_top) / lines_per_side
+        top = s.data_top + (row - s.line_context) * line_height
+        bottom = s.data_top + (row + 1 + s.line_context) * line_height
+        if top <= s.header_fraction:
+            top = s.header_fraction
+        return (round(top, 4), round(min(bottom, 1.0), 4))
+
+    def _cache_path(self, image_path: Path, line_band: tuple[float, float] | None) -> Path:
+        # stat() rather than hashing the scan: this runs on every transcription
+        st = image_path.stat()
+        identity = f"{os.path.abspath(image_path)}|{st.st_size}|{st.st_mtime_ns}"
+        key = hashlib.sha256(
+            f"{identity}|{self.settings.cache_token()}|{line_band}".encode()
+        ).hexdigest()[:32]
+        return self.cache_dir / f"{key}.jpg"
+
+    def _process(
+        self, image_path: Path, output_path: Path, line_band: tuple[float, float] | None
+    ) -> None:
+        """Run the preprocessing pipeline and write the result."""
+        from PIL import Image, ImageChops
+
+        s = self.settings
+        with Image.open(image_path) as source:
+            img = source.convert("L" if s.grayscale else "RGB")
+
+        if s.autocrop:
+            border = Image.new(img.mode, img.size, self._border_colour(img))
+            diff = ImageChops.difference(img, border).convert("L")
+            bbox = diff.point(lambda p: 255 if p > s.autocrop_tolerance else 0).getbbox()
+            if bbox:
+                img = img.crop(bbox)
+
+        if line_band:
+            header_height = int(img.height * s.header_fraction)
+            band_top = int(img.height * line_band[0])
+            band_bottom = int(img.height * line_band[1])
+            header = img.crop((0, 0, img.width, header_height))
+            band = img.crop((0, band_top, img.width, band_bottom))
+            img = Image.new(img.mode, (img.width, header.height + band.height))
+            img.paste(header, (0, 0))
+            img.paste(band, (0, header.height))
+
+        if max(img.size) > s.max_long_edge:
+            img.thumbnail((s.max_long_edge, s.max_long_edge), Image.Resampling.LANCZOS)
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp name: concurrent runs may produce the same variant
+        with tempfile.NamedTemporaryFile(
+            dir=output_path.parent, suffix=".tmp", delete=False
+        ) as tmp:
+            tmp_path = Path(tmp.name)
+            try:
+                img.save(tmp, "JPEG", quality=s.jpeg_quality, optimize=True)
+            except BaseException:
+                tmp.close()
+                tmp_path.unlink(missing_ok=True)
+                raise
+        tmp_path.replace(output_path)
+
+    @staticmethod
+    def _border_colour(img):
+        """Most common colour of the four corners (a label may cover one)."""
+        right, bottom = img.width - 1, img.height - 1
+        corners = [img.getpixel(xy) for xy in ((0, 0), (right, 0), (0, bottom), (right, bottom))]
+        return Counter(corners).most_common(1)[0][0]
+
+    # -------------------------------------------------------------------------
+    # Eviction
+    # -------------------------------------------------------------------------
+
+    def _account(self, added: int) -> None:
+        """Add a new variant to the running size and evict if over the limit."""
+        with self._lock:
+            if self._cache_bytes is None:
+                self._cache_bytes = sum(size for _, _, size in self._scan_entries())
+            else:
+                self._cache_bytes += added
+            if self._cache_bytes > self.max_bytes:
+                self._cache_bytes = self._evict()
+
+    def _evict(self) -> int:
+        """Remove least recently used variants until the cache fits max_bytes.
+
+        Returns:
+            Cache size after eviction
+        """
+        entries = sorted(self._scan_entries(), key=lambda e: e[1])  # oldest first
+        total = sum(size for _, _, size in entries)
+        removed = 0
+        for path, _, size in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.info(f"Evicted {removed} preprocessed images from cache")
+        return total
+
+    def _scan_entries(self) -> list[tuple[Path, float, int]]:
+        """(path, last used, bytes) for each cached variant."""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if not entry.name.endswith(".jpg"):
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue  # Evicted by another process
+            entries.append((Path(entry.path), st.st_mtime, st.st_size))
+        return entries
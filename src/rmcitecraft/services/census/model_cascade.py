@@ -0,0 +1,282 @@
+"""Model cascade for census transcription.
+
+Most clean census pages are transcribed correctly by a cheap, fast vision
+model. The cascade sends each image to the cheapest configured model first
+and only escalates to the next (stronger, more expensive) model when the
+result is not trusted:
+
+- the response could not be parsed, or the provider call failed
+- CensusDataValidator raised more warnings than the tier's threshold,
+  counting validate_household warnings for every transcribed household
+  (or for the extracted family)
+
+The last model's result is always returned. Every attempt is recorded in
+the LLM telemetry store (llm_routing table), so acceptance rates per model
+and census year can be reviewed with LLMTelemetryStore.routing_summary()
+and thresholds tuned from data.
+"""
+
+import sqlite3
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from rmcitecraft.llm.telemetry import LLMTelemetryStore, get_telemetry_store, llm_call_context
+from rmcitecraft.services.census.data_validator import CensusDataValidator
+from rmcitecraft.services.census.image_preprocessor import CensusImagePreprocessor
+from rmcitecraft.services.census.schema_registry import CensusSchemaRegistry
+from rmcitecraft.services.census.transcription_service import (
+    CensusTranscriptionService,
+    TranscriptionResult,
+)
+
+
+@dataclass(frozen=True)
+class CascadeTier:
+    """One model in the cascade.
+
+    Attributes:
+        model: Model identifier passed to the provider
+        max_warnings: Most validation warnings accepted from this model
+            before escalating (ignored for the last tier)
+    """
+
+    model: str
+    max_warnings: int = 0
+
+
+class CensusModelCascade:
+    """Routes census transcription through models from cheapest to strongest.
+
+    Offers the same transcribe() and extract_family() calls as
+    CensusTranscriptionService.
+
+    Example:
+        cascade = CensusModelCascade(
+            provider,
+            [CascadeTier("google/gemini-flash-1.5"), CascadeTier("google/gemini-pro-1.5")],
+        )
+        result = cascade.transcribe("/path/to/census.jpg", 1940)
+        print(result.model)
+    """
+
+    def __init__(
+        self,
+        provider: Any,
+        tiers: list[CascadeTier],
+        preprocessor: CensusImagePreprocessor | None = None,
+        telemetry: LLMTelemetryStore | None = None,
+    ):
+        """Initialize cascade.
+
+        Args:
+            provider: LLM provider with vision capabilities
+            tiers: Models to try, cheapest first
+            preprocessor: Image preprocessor shared by all tiers
+            telemetry: Store for routing decisions (defaults to the shared store)
+
+        Raises:
+            ValueError: If no tiers are given
+        """
+        if not tiers:
+            raise ValueError("Model cascade needs at least one model")
+        self.tiers = list(tiers)
+        self._telemetry = telemetry
+        self._validator = CensusDataValidator()
+        preprocessor = preprocessor or CensusImagePreprocessor()
+        self._services = [
+            CensusTranscriptionService(provider=provider, model=tier.model, preprocessor=preprocessor)
+            for tier in self.tiers
+        ]
+
+    @classmethod
+    def from_config(
+        cls, provider: Any, preprocessor: CensusImagePreprocessor | None = None
+    ) -> "CensusModelCascade | None":
+        """Build a cascade from census_cascade_models in settings.
+
+        Args:
+            provider: LLM provider with vision capabilities
+            preprocessor: Image preprocessor shared by all tiers
+
+        Returns:
+            Configured cascade, or None if no cascade models are configured
+        """
+        from rmcitecraft.config import get_config
+
+        config = get_config()
+        models = [m.strip() for m in config.census_cascade_models.split(",") if m.strip()]
+        if not models:
+            return None
+        return cls(
+            provider,
+            [CascadeTier(model, config.census_cascade_max_warnings) for model in models],
+            preprocessor=preprocessor,
+        )
+
+    def transcribe(
+        self,
+        image_path: str | Path,
+        census_year: int,
+        target_names: list[str] | None = None,
+        target_line: int | None = None,
+        sheet: str | None = None,
+        enumeration_district: str | None = None,
+    ) -> TranscriptionResult:
+        """Transcribe a census image, escalating until a result is trusted.
+
+        Args:
+            image_path: Path to census image file
+            census_year: Census year (1790-1950)
+            target_names: Names to look for (helps LLM focus)
+            target_line: Specific line number to find
+            sheet: Expected sheet number
+            enumeration_district: Expected ED number
+
+        Returns:
+            TranscriptionResult from the first accepted model (or the last model)
+        """
+        def attempt(service: CensusTranscriptionService) -> TranscriptionResult:
+            result = service.transcribe(
+                image_path,
+                census_year,
+                target_names=target_names,
+                target_line=target_line,
+                sheet=sheet,
+                enumeration_district=enumeration_district,
+            )
+            if result.success:
+                result.warnings.extend(self._page_household_warnings(result, census_year))
+            return result
+
+        return self._run(image_path, census_year, "transcribe", attempt)
+
+    def extract_family(
+        self,
+        image_path: str | Path,
+        census_year: int,
+        target_names: list[str],
+    ) -> TranscriptionResult:
+        """Extract a household, escalating on data or household warnings.
+
+        Args:
+            image_path: Path to census image
+            census_year: Census year
+            target_names: Names of people in the family to find
+
+        Returns:
+            TranscriptionResult from the first accepted model (or the last model)
+        """
+        return self._run(
+            image_path,
+            census_year,
+            "extract_family",
+            lambda service: service.extract_family(image_path, census_year, target_names),
+        )
+
+    def _run(
+        self,
+        image_path: str | Path,
+        census_year: int,
+        task: str,
+        attempt: Callable[[CensusTranscriptionService], TranscriptionResult],
+    ) -> TranscriptionResult:
+        """Try each tier in turn until one result is accepted."""
+        if not CensusSchemaRegistry.is_valid_year(census_year):
+            # No model can fix an unsupported year; don't spend calls on it
+            return TranscriptionResult(
+                success=False, error=f"Schema not found for year {census_year}"
+            )
+
+        cascade_id = uuid.uuid4().hex
+        last_tier = len(self.tiers) - 1
+        result = TranscriptionResult(success=False)
+
+        with llm_call_context(census_year=census_year, task=task):
+            for tier_index, (tier, service) in enumerate(zip(self.tiers, self._services, strict=True)):
+                start = time.perf_counter()
+                result = attempt(service)
+                duration = time.perf_counter() - start
+
+                accepted = self._accept(result, tier)
+                if accepted:
+                    outcome = "accepted"
+                elif tier_index < last_tier:
+                    outcome = "escalated"
+                else:
+                    outcome = "failed"
+                self._record(cascade_id, tier_index, tier, outcome, result, duration, image_path)
+
+                if accepted:
+                    break
+                if tier_index < last_tier:
+                    reason = result.error or f"{len(result.warnings)} validation warnings"
+                    logger.info(
+                        f"Escalating {Path(image_path).name} from {tier.model} "
+                        f"to {self.tiers[tier_index + 1].model}: {reason}"
+                    )
+
+        return result
+
+    def _page_household_warnings(self, result: TranscriptionResult, census_year: int) -> list[str]:
+        """validate_household warnings for each transcribed household.
+
+        A household starts at each head. Persons before the first head
+        continue a household from the previous page (or were picked out by
+        a targeting hint), so they are not expected to start with one.
+        """
+        households: list[list[dict[str, Any]]] = [[]]
+        for person in result.persons:
+            if str(person.get("relationship", "")).lower() in ("head", "h") and households[-1]:
+                households.append([])
+            households[-1].append(person)
+
+        schema = CensusSchemaRegistry.get_schema(census_year)
+        warnings = []
+        for index, household in enumerate(households):
+            if not household:
+                continue
+            household_warnings = self._validator.validate_household(household, schema)
+            if index == 0:
+                household_warnings = [
+                    w for w in household_warnings if not w.startswith("First person in household")
+                ]
+            warnings.extend(household_warnings)
+        return warnings
+
+    @staticmethod
+    def _accept(result: TranscriptionResult, tier: CascadeTier) -> bool:
+        """Whether a tier's result is trusted without escalating."""
+        return result.success and len(result.warnings) <= tier.max_warnings
+
+    def _record(
+        self,
+        cascade_id: str,
+        tier_index: int,
+        tier: CascadeTier,
+        outcome: str,
+        result: TranscriptionResult,
+        duration: float,
+        image_path: str | Path,
+    ) -> None:
+        """Record a routing decision; telemetry failures never block transcription."""
+        try:
+            telemetry = self._telemetry or get_telemetry_store()
+            telemetry.record_routing(
+                cascade_id,
+                tier_index,
+                tier.model,
+                outcome,
+                warnings=len(result.warnings),
+                persons=len(result.persons),
+                error=result.error,
+                duration_seconds=duration,
+                image_path=str(image_path),
+            )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Cannot record cascade decision: {e}")
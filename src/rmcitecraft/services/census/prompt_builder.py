@@ -2,13 +2,38 @@
 
 This module builds detailed prompts from census schemas, including
 targeting hints for specific households or individuals.
+
+Prompts are split into a prefix and a suffix. The prefix (task, output
+schema, year instructions and rules) depends only on the census year and is
+memoized, so every request for the same year starts with byte-identical
+text that providers can serve from their prompt cache. The suffix holds the
+small per-request part (targeting hints, family names).
 """
 
 import json
+from dataclasses import dataclass
 
 from rmcitecraft.models.census_schema import CensusEra, CensusYearSchema
 
 
+@dataclass(frozen=True)
+class CensusPrompt:
+    """A prompt split into a cacheable prefix and a per-request suffix.
+
+    Attributes:
+        prefix: Stable text for the census year (safe to cache provider-side)
+        suffix: Request-specific text (may be empty)
+    """
+
+    prefix: str
+    suffix: str = ""
+
+    @property
+    def text(self) -> str:
+        """Full prompt as a single string."""
+        return "\n\n".join(part for part in (self.prefix, self.suffix) if part)
+
+
 class CensusPromptBuilder:
     """Builds LLM prompts from census schemas.
 
@@ -19,6 +44,10 @@ class CensusPromptBuilder:
     - Transcription rules and abbreviation guides
     """
 
+    def __init__(self) -> None:
+        # Memoized prefixes keyed by (prompt kind, census year)
+        self._prefix_cache: dict[tuple[str, int], str] = {}
+
     def build_transcription_prompt(
         self,
         schema: CensusYearSchema,
@@ -39,16 +68,51 @@ class CensusPromptBuilder:
         Returns:
             Complete prompt string for LLM
         """
+        return self.build_transcription_prompt_parts(
+            schema, target_names, target_line, sheet, enumeration_district
+        ).text
+
+    def build_transcription_prompt_parts(
+        self,
+        schema: CensusYearSchema,
+        target_names: list[str] | None = None,
+        target_line: int | None = None,
+        sheet: str | None = None,
+        enumeration_district: str | None = None,
+    ) -> CensusPrompt:
+        """Build transcription prompt as a cacheable prefix plus targeting suffix.
+
+        Args:
+            schema: Census year schema
+            target_names: Names to look for (helps LLM focus)
+            target_line: Specific line number to find
+            sheet: Sheet number (for 1880-1940)
+            enumeration_district: ED number
+
+        Returns:
+            CensusPrompt whose prefix is identical for every call with the same year
+        """
+        prefix = self._get_prefix("transcription", schema, self._build_transcription_prefix)
+        suffix = self._build_targeting_section(
+            schema, target_names, target_line, sheet, enumeration_district
+        )
+        return CensusPrompt(prefix=prefix, suffix=suffix)
+
+    def _get_prefix(self, kind: str, schema: CensusYearSchema, build) -> str:
+        """Get a memoized prefix, building it on first use."""
+        key = (kind, schema.year)
+        if key not in self._prefix_cache:
+            self._prefix_cache[key] = build(schema)
+        return self._prefix_cache[key]
+
+    def _build_transcription_prefix(self, schema: CensusYearSchema) -> str:
+        """Year-only sections of the transcription prompt."""
         sections = [
             self._build_header_section(schema),
             self._build_schema_section(schema),
-            self._build_targeting_section(
-                schema, target_names, target_line, sheet, enumeration_district
-            ),
             self._build_instructions_section(schema),
             self._build_rules_section(schema),
         ]
-
         return "\n\n".join(section for section in sections if section)
 
     def _build_header_section(self, schema: CensusYearSchema) -> str:
@@ -237,19 +301,40 @@ FIELD DEFINITIONS:
         Returns:
             Prompt optimized for family extraction
         """
+        return self.build_family_extraction_prompt_parts(schema, target_names).text
+
+    def build_family_extraction_prompt_parts(
+        self,
+        schema: CensusYearSchema,
+        target_names: list[str],
+    ) -> CensusPrompt:
+        """Build family extraction prompt as a cacheable prefix plus names suffix.
+
+        Args:
+            schema: Census year schema
+            target_names: Names of people to find
+
+        Returns:
+            CensusPrompt whose prefix is identical for every call with the same year
+        """
+        prefix = self._get_prefix("family", schema, self._build_family_prefix)
         names_str = ", ".join(target_names)
+        suffix = f"""TARGET HOUSEHOLD: Extract the complete household containing: {names_str}
+
+Return the complete household as JSON."""
+        return CensusPrompt(prefix=prefix, suffix=suffix)
 
-        return f"""TASK: Extract the complete household containing: {names_str}
+    def _build_family_prefix(self, schema: CensusYearSchema) -> str:
+        """Year-only sections of the family extraction prompt."""
+        return f"""TASK: Extract one complete household from the {schema.year} census image.
 
 Census Year: {schema.year}
 
 INSTRUCTIONS:
-1. Find the household containing the named individual(s)
+1. Find the household containing the named individual(s) given at the end of this prompt
 2. Extract ALL persons in that household (same dwelling/family number)
 3. Include household metadata (ED, sheet/page, line numbers)
 
 {self._build_schema_section(schema)}
 
-{self._build_rules_section(schema)}
-
-Return the complete household as JSON."""
+{self._build_rules_section(schema)}"""
@@ -10,6 +10,9 @@ from typing import Any
 
 from loguru import logger
 
+# Array keys whose object elements are person records (see extract_persons)
+PERSON_ARRAY_KEYS = frozenset({"persons", "members"})
+
 
 class CensusResponseParser:
     """Parses LLM responses into structured census data.
@@ -264,3 +267,134 @@ class CensusResponseParser:
                 metadata[field] = data[field]
 
         return metadata
+
+
+class IncrementalPersonParser:
+    """Tolerant incremental JSON parser that yields person records early.
+
+    Fed streamed response chunks, it tracks JSON structure character by
+    character and returns each person object as soon as its closing brace
+    arrives, without waiting for the rest of the response. Person objects are
+    elements of a "persons" or "members" array, or of a top-level array.
+
+    Text before the first brace (prose, markdown code fences) is skipped and
+    scanning stops once the top-level value closes. Each person is decoded on
+    its own, so a malformed record is skipped without losing the others; the
+    complete text (``text``) should still be parsed with
+    CensusResponseParser.parse_response for metadata and the final record list.
+
+    Example:
+        parser = IncrementalPersonParser()
+        for chunk in provider.stream_complete_with_image_prefix(...):
+            for person in parser.feed(chunk):
+                handle(person)
+    """
+
+    def __init__(self) -> None:
+        self._buffer: list[str] = []
+        self._text = ""
+        self._pos = 0
+        # Open containers: (bracket, key the container is the value of, start index)
+        self._stack: list[tuple[str, str | None, int]] = []
+        self._started = False
+        self._done = False
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_string: str | None = None
+        self._prev_token = ""
+        self._fixer = CensusResponseParser()
+        self.persons_found = 0
+
+    @property
+    def text(self) -> str:
+        """All text fed so far."""
+        if self._buffer:
+            self._text += "".join(self._buffer)
+            self._buffer.clear()
+        return self._text
+
+    def feed(self, chunk: str) -> list[dict[str, Any]]:
+        """Add a chunk of response text.
+
+        Args:
+            chunk: Next piece of the streamed response
+
+        Returns:
+            Person records completed by this chunk (often empty)
+        """
+        self._buffer.append(chunk)
+        if self._done:
+            return []
+
+        text = self.text
+        persons: list[dict[str, Any]] = []
+        pos = self._pos
+        end = len(text)
+
+        while pos < end and not self._done:
+            char = text[pos]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    self._last_string = text[self._string_start + 1 : pos]
+                    self._prev_token = '"'
+                pos += 1
+                continue
+
+            if not self._started:
+                if char in "{[":
+                    self._started = True
+                else:
+                    pos += 1
+                    continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = pos
+            elif char in "{[":
+                key = self._last_string if self._prev_token == ":" else None
+                self._stack.append((char, key, pos))
+                self._prev_token = char
+            elif char in "}]":
+                if self._stack:
+                    _, _, start = self._stack.pop()
+                    if char == "}" and self._is_person_container():
+                        person = self._decode(text[start : pos + 1])
+                        if person is not None:
+                            persons.append(person)
+                if not self._stack:
+                    self._done = True
+                self._prev_token = char
+            elif not char.isspace():
+                self._prev_token = char
+            pos += 1
+
+        self._pos = pos
+        self.persons_found += len(persons)
+        return persons
+
+    def _is_person_container(self) -> bool:
+        """Whether the innermost open container holds person objects."""
+        if not self._stack:
+            return False
+        bracket, key, _ = self._stack[-1]
+        if bracket != "[":
+            return False
+        return key in PERSON_ARRAY_KEYS or (key is None and len(self._stack) == 1)
+
+    def _decode(self, fragment: str) -> dict[str, Any] | None:
+        try:
+            return json.loads(fragment)
+        except json.JSONDecodeError:
+            pass
+        try:
+            return json.loads(self._fixer._fix_common_json_errors(fragment))
+        except json.JSONDecodeError as e:
+            logger.debug(f"Skipping malformed streamed record: {e}")
+            return None
@@ -4,16 +4,22 @@ This module provides the main service for transcribing census images using
 vision LLMs, coordinating schema loading, prompt building, and response parsing.
 """
 
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from loguru import logger
 
+from rmcitecraft.llm.telemetry import llm_call_context
 from rmcitecraft.models.census_schema import CensusYearSchema
 from rmcitecraft.services.census.data_validator import CensusDataValidator
-from rmcitecraft.services.census.prompt_builder import CensusPromptBuilder
-from rmcitecraft.services.census.response_parser import CensusResponseParser
+from rmcitecraft.services.census.image_preprocessor import CensusImagePreprocessor
+from rmcitecraft.services.census.prompt_builder import CensusPrompt, CensusPromptBuilder
+from rmcitecraft.services.census.response_parser import (
+    CensusResponseParser,
+    IncrementalPersonParser,
+)
 from rmcitecraft.services.census.schema_registry import CensusSchemaRegistry
 
 
@@ -29,6 +35,7 @@ class TranscriptionResult:
         warnings: List of validation warnings
         error: Error message if failed
         raw_response: Raw LLM response text
+        model: Model that produced the result (None for the provider default)
     """
 
     success: bool
@@ -38,6 +45,7 @@ class TranscriptionResult:
     warnings: list[str] = field(default_factory=list)
     error: str | None = None
     raw_response: str = ""
+    model: str | None = None
 
 
 class CensusTranscriptionService:
@@ -45,6 +53,7 @@ class CensusTranscriptionService:
 
     This service coordinates:
     - Loading year-specific schemas from YAML
+    - Shrinking the image before upload (crop, grayscale, downscale)
     - Building LLM prompts with targeting hints
     - Parsing LLM responses into structured data
     - Validating extracted data against schema
@@ -65,15 +74,21 @@ class CensusTranscriptionService:
         self,
         provider: Any | None = None,
         model: str | None = None,
+        preprocessor: CensusImagePreprocessor | None = None,
+        preprocess_images: bool = True,
     ):
         """Initialize transcription service.
 
         Args:
             provider: LLM provider with vision capabilities (e.g., Gemini)
             model: Specific model to use (optional)
+            preprocessor: Image preprocessor (defaults to CensusImagePreprocessor())
+            preprocess_images: Send a cropped, downscaled variant of the image
+                instead of the original scan
         """
         self.provider = provider
         self.model = model
+        self.preprocessor = (preprocessor or CensusImagePreprocessor()) if preprocess_images else None
         self.prompt_builder = CensusPromptBuilder()
         self.response_parser = CensusResponseParser()
         self.validator = CensusDataValidator()
@@ -105,7 +120,7 @@ class CensusTranscriptionService:
             schema = CensusSchemaRegistry.get_schema(census_year)
 
             # Build prompt
-            prompt = self.prompt_builder.build_transcription_prompt(
+            prompt = self.prompt_builder.build_transcription_prompt_parts(
                 schema=schema,
                 target_names=target_names,
                 target_line=target_line,
@@ -120,7 +135,9 @@ class CensusTranscriptionService:
                     error="No LLM provider configured",
                 )
 
-            response = self._call_llm(prompt, str(image_path))
+            llm_image = self._prepare_image(image_path, schema, target_line)
+            with llm_call_context(census_year=census_year, task="transcribe"):
+                response = self._call_llm(prompt, str(llm_image))
 
             # Parse response
             data = self.response_parser.parse_response(response)
@@ -140,6 +157,7 @@ class CensusTranscriptionService:
                 metadata=metadata,
                 warnings=warnings,
                 raw_response=response,
+                model=self.model,
             )
 
         except FileNotFoundError as e:
@@ -161,24 +179,155 @@ class CensusTranscriptionService:
                 error=f"Transcription failed: {e}",
             )
 
-    def _call_llm(self, prompt: str, image_path: str) -> str:
+    def transcribe_streaming(
+        self,
+        image_path: str | Path,
+        census_year: int,
+        on_person: Callable[[dict[str, Any], list[str]], None] | None = None,
+        target_names: list[str] | None = None,
+        target_line: int | None = None,
+        sheet: str | None = None,
+        enumeration_district: str | None = None,
+    ) -> TranscriptionResult:
+        """Transcribe a census image, handling persons while the LLM is still writing.
+
+        The response is streamed and parsed incrementally; each person record
+        is validated and passed to on_person as soon as it is complete, so
+        callers can store or display records while later lines of the page are
+        still being generated. Providers without streaming deliver the whole
+        response as one chunk, which behaves like transcribe().
+
+        Args:
+            image_path: Path to census image file
+            census_year: Census year (1790-1950)
+            on_person: Called with (person, warnings) for each streamed record
+            target_names: Names to look for (helps LLM focus)
+            target_line: Specific line number to find
+            sheet: Expected sheet number
+            enumeration_district: Expected ED number
+
+        Returns:
+            TranscriptionResult built from the complete response
+        """
+        if self.provider is None:
+            return TranscriptionResult(success=False, error="No LLM provider configured")
+
+        try:
+            schema = CensusSchemaRegistry.get_schema(census_year)
+            prompt = self.prompt_builder.build_transcription_prompt_parts(
+                schema=schema,
+                target_names=target_names,
+                target_line=target_line,
+                sheet=sheet,
+                enumeration_district=enumeration_district,
+            )
+            llm_image = self._prepare_image(image_path, schema, target_line)
+
+            stream_parser = IncrementalPersonParser()
+            streamed: list[dict[str, Any]] = []
+            person_warnings: list[str] = []
+            with llm_call_context(census_year=census_year, task="transcribe_streaming"):
+                for chunk in self._stream_llm(prompt, str(llm_image)):
+                    for person in stream_parser.feed(chunk):
+                        streamed.append(person)
+                        warnings = self.validator.validate_person(person, schema, len(streamed))
+                        person_warnings.extend(warnings)
+                        if on_person is not None:
+                            on_person(person, warnings)
+
+            response = stream_parser.text
+            data = self.response_parser.parse_response(response)
+            persons = self.response_parser.extract_persons(data)
+            metadata = self.response_parser.extract_metadata(data)
+
+            if persons and persons == streamed:
+                # Persons were already validated as they arrived
+                warnings = self.validator.validate_metadata(metadata, schema) + person_warnings
+            else:
+                warnings = self.validator.validate(
+                    {"metadata": metadata, "persons": persons}, schema
+                )
+
+            return TranscriptionResult(
+                success=True,
+                data=data,
+                persons=persons,
+                metadata=metadata,
+                warnings=warnings,
+                raw_response=response,
+                model=self.model,
+            )
+
+        except FileNotFoundError as e:
+            logger.error(f"Schema not found: {e}")
+            return TranscriptionResult(
+                success=False,
+                error=f"Schema not found for year {census_year}: {e}",
+            )
+        except ValueError as e:
+            logger.error(f"Streaming transcription failed: {e}")
+            return TranscriptionResult(success=False, error=str(e))
+        except Exception as e:
+            logger.exception(f"Unexpected error during streaming transcription: {e}")
+            return TranscriptionResult(success=False, error=f"Transcription failed: {e}")
+
+    def _stream_llm(self, prompt: CensusPrompt, image_path: str) -> Iterator[str]:
+        """Stream the LLM response, falling back to a single blocking call."""
+        if hasattr(self.provider, "stream_complete_with_image_prefix"):
+            yield from self.provider.stream_complete_with_image_prefix(
+                prefix=prompt.prefix,
+                prompt=prompt.suffix,
+                image_path=image_path,
+                model=self.model,
+                temperature=0.2,
+            )
+        else:
+            yield self._call_llm(prompt, image_path)
+
+    def _prepare_image(
+        self,
+        image_path: str | Path,
+        schema: CensusYearSchema,
+        target_line: int | None = None,
+    ) -> Path:
+        """Get the image to send to the LLM (preprocessed variant if enabled)."""
+        if self.preprocessor is None:
+            return Path(image_path)
+        return self.preprocessor.preprocess(image_path, schema, target_line)
+
+    def _call_llm(self, prompt: CensusPrompt | str, image_path: str) -> str:
         """Call LLM with image and prompt.
 
         This method should be overridden or the provider should implement
         a compatible interface.
 
         Args:
-            prompt: Text prompt
+            prompt: Prompt parts (the year-stable prefix is sent as a cacheable
+                prefix when the provider supports it) or plain text prompt
             image_path: Path to image file
 
         Returns:
             LLM response text
         """
+        if isinstance(prompt, str):
+            prompt = CensusPrompt(prefix=prompt)
+
         # Try different provider interfaces
-        if hasattr(self.provider, "complete_with_image"):
+        if hasattr(self.provider, "complete_with_image_prefix"):
+            # LLMProvider with prompt-cache support
+            response = self.provider.complete_with_image_prefix(
+                prefix=prompt.prefix,
+                prompt=prompt.suffix,
+                image_path=image_path,
+                model=self.model,
+                temperature=0.2,
+            )
+            return response.text if hasattr(response, "text") else str(response)
+
+        elif hasattr(self.provider, "complete_with_image"):
             # Gemini-style provider
             response = self.provider.complete_with_image(
-                prompt=prompt,
+                prompt=prompt.text,
                 image_path=image_path,
                 model=self.model,
                 temperature=0.2,
@@ -189,7 +338,7 @@ class CensusTranscriptionService:
             # Generic vision provider
             return self.provider.transcribe_image(
                 image_path=image_path,
-                prompt=prompt,
+                prompt=prompt.text,
             )
 
         else:
@@ -217,13 +366,15 @@ class CensusTranscriptionService:
         """
         schema = CensusSchemaRegistry.get_schema(census_year)
 
-        prompt = self.prompt_builder.build_family_extraction_prompt(
+        prompt = self.prompt_builder.build_family_extraction_prompt_parts(
             schema=schema,
             target_names=target_names,
         )
 
         try:
-            response = self._call_llm(prompt, str(image_path))
+            llm_image = self._prepare_image(image_path, schema)
+            with llm_call_context(census_year=census_year, task="extract_family"):
+                response = self._call_llm(prompt, str(llm_image))
             data = self.response_parser.parse_response(response)
             persons = self.response_parser.extract_persons(data)
             metadata = self.response_parser.extract_metadata(data)
@@ -242,6 +393,7 @@ class CensusTranscriptionService:
                 metadata=metadata,
                 warnings=household_warnings + data_warnings,
                 raw_response=response,
+                model=self.model,
             )
 
         except Exception as e:
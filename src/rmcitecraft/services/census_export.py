@@ -0,0 +1,333 @@
+"""Streaming bulk export of extracted census data.
+
+Exports census.db as one flat row per census person: page metadata, core
+person fields, the person's extended (EAV) fields pivoted into columns, and
+the best RootsMagic link. Rows are read through a chunked cursor and written
+incrementally, so memory use stays constant regardless of database size.
+
+Supported formats:
+- csv: Header row plus one row per person
+- jsonl: One JSON object per line
+- parquet: Requires the optional pyarrow package
+"""
+
+import csv
+import json
+import sqlite3
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from rmcitecraft.database.census_extraction_db import CENSUS_DB_PATH
+
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+
+# Output columns and their types, in export order
+PAGE_COLUMNS: dict[str, str] = {
+    "page_id": "integer",
+    "batch_id": "integer",
+    "census_year": "integer",
+    "state": "string",
+    "county": "string",
+    "township_city": "string",
+    "enumeration_district": "string",
+    "supervisor_district": "string",
+    "sheet_number": "string",
+    "sheet_letter": "string",
+    "page_number": "string",
+    "stamp_number": "string",
+    "enumeration_date": "string",
+    "enumerator_name": "string",
+    "familysearch_film": "string",
+    "familysearch_image_url": "string",
+}
+
+PERSON_COLUMNS: dict[str, str] = {
+    "person_id": "integer",
+    "line_number": "integer",
+    "dwelling_number": "integer",
+    "family_number": "integer",
+    "household_id": "string",
+    "full_name": "string",
+    "given_name": "string",
+    "surname": "string",
+    "name_suffix": "string",
+    "relationship_to_head": "string",
+    "sex": "string",
+    "race": "string",
+    "age": "integer",
+    "age_months": "integer",
+    "marital_status": "string",
+    "birthplace": "string",
+    "birthplace_father": "string",
+    "birthplace_mother": "string",
+    "occupation": "string",
+    "industry": "string",
+    "worker_class": "string",
+    "familysearch_ark": "string",
+    "familysearch_person_id": "string",
+    "is_target_person": "integer",
+    "extracted_at": "string",
+}
+
+LINK_COLUMNS: dict[str, str] = {
+    "rmtree_person_id": "integer",
+    "rmtree_citation_id": "integer",
+    "rmtree_event_id": "integer",
+    "match_confidence": "float",
+    "match_method": "string",
+}
+
+# Prefix for pivoted EAV columns, avoiding collisions with core columns
+FIELD_PREFIX = "field_"
+
+
+@dataclass
+class CensusExportFilter:
+    """Filters selecting which census persons to export."""
+
+    census_year: int | None = None
+    state: str | None = None
+    county: str | None = None
+    batch_id: int | None = None
+
+    def where_clause(self) -> tuple[str, list[Any]]:
+        """Build the SQL WHERE clause (over census_page pg) and its parameters."""
+        conditions = []
+        params: list[Any] = []
+        if self.census_year:
+            conditions.append("pg.census_year = ?")
+            params.append(self.census_year)
+        if self.state:
+            conditions.append("pg.state = ?")
+            params.append(self.state)
+        if self.county:
+            conditions.append("pg.county = ?")
+            params.append(self.county)
+        if self.batch_id:
+            conditions.append("pg.batch_id = ?")
+            params.append(self.batch_id)
+        return (" AND ".join(conditions) if conditions else "1=1"), params
+
+
+class CensusExporter:
+    """Streams census.db rows to CSV, JSONL or Parquet files."""
+
+    def __init__(self, db_path: Path | None = None, chunk_size: int = 500):
+        """Initialize exporter.
+
+        Args:
+            db_path: Path to census.db (defaults to ~/.rmcitecraft/census.db)
+            chunk_size: Number of persons fetched per cursor round-trip (also the
+                number of bound parameters in the per-chunk field/link lookups)
+        """
+        self.db_path = db_path or CENSUS_DB_PATH
+        self.chunk_size = chunk_size
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a read-only connection to census.db."""
+        conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def get_field_names(
+        self, conn: sqlite3.Connection, filters: CensusExportFilter
+    ) -> list[str]:
+        """Get the sorted distinct EAV field names present in the selection."""
+        where, params = filters.where_clause()
+        rows = conn.execute(
+            f"""
+            SELECT DISTINCT cpf.field_name
+            FROM census_person_field cpf
+            JOIN census_person cp ON cp.person_id = cpf.person_id
+            JOIN census_page pg ON pg.page_id = cp.page_id
+            WHERE {where}
+            ORDER BY cpf.field_name
+            """,
+            params,
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def get_columns(self, field_names: list[str]) -> dict[str, str]:
+        """Get the ordered output columns and their types."""
+        columns = dict(PAGE_COLUMNS)
+        columns.update(PERSON_COLUMNS)
+        columns.update(LINK_COLUMNS)
+        columns.update({f"{FIELD_PREFIX}{name}": "string" for name in field_names})
+        return columns
+
+    def iter_rows(
+        self, conn: sqlite3.Connection, filters: CensusExportFilter
+    ) -> Iterator[dict[str, Any]]:
+        """Yield one flat dict per census person, in person_id order."""
+        where, params = filters.where_clause()
+        page_select = ", ".join(f"pg.{name}" for name in PAGE_COLUMNS)
+        person_select = ", ".join(f"cp.{name}" for name in PERSON_COLUMNS)
+
+        cursor = conn.execute(
+            f"""
+            SELECT {page_select}, {person_select}
+            FROM census_person cp
+            JOIN census_page pg ON pg.page_id = cp.page_id
+            WHERE {where}
+            ORDER BY cp.person_id
+            """,
+            params,
+        )
+
+        while True:
+            chunk = cursor.fetchmany(self.chunk_size)
+            if not chunk:
+                break
+
+            person_ids = [row["person_id"] for row in chunk]
+            fields = self._load_fields(conn, person_ids)
+            links = self._load_links(conn, person_ids)
+
+            for row in chunk:
+                record = dict(row)
+                record.update(links.get(row["person_id"], dict.fromkeys(LINK_COLUMNS)))
+                for name, value in fields.get(row["person_id"], {}).items():
+                    record[f"{FIELD_PREFIX}{name}"] = value
+                yield record
+
+    def _load_fields(
+        self, conn: sqlite3.Connection, person_ids: list[int]
+    ) -> dict[int, dict[str, str]]:
+        """Load EAV fields for a chunk of persons (last value wins per field)."""
+        placeholders = ",".join("?" * len(person_ids))
+        rows = conn.execute(
+            f"""
+            SELECT person_id, field_name, field_value FROM census_person_field
+            WHERE person_id IN ({placeholders})
+            ORDER BY field_id
+            """,
+            person_ids,
+        )
+        fields: dict[int, dict[str, str]] = {}
+        for person_id, name, value in rows:
+            fields.setdefault(person_id, {})[name] = value
+        return fields
+
+    def _load_links(
+        self, conn: sqlite3.Connection, person_ids: list[int]
+    ) -> dict[int, dict[str, Any]]:
+        """Load the best RootsMagic link for a chunk of persons.
+
+        Links with a RIN are preferred over citation-only links, then the
+        highest match confidence, then the most recent link.
+        """
+        placeholders = ",".join("?" * len(person_ids))
+        rows = conn.execute(
+            f"""
+            SELECT census_person_id, rmtree_person_id, rmtree_citation_id, rmtree_event_id,
+                   match_confidence, match_method
+            FROM rmtree_link
+            WHERE census_person_id IN ({placeholders})
+            ORDER BY census_person_id,
+                     rmtree_person_id IS NULL,
+                     match_confidence DESC,
+                     link_id DESC
+            """,
+            person_ids,
+        )
+        links: dict[int, dict[str, Any]] = {}
+        for row in rows:
+            links.setdefault(
+                row["census_person_id"], {name: row[name] for name in LINK_COLUMNS}
+            )
+        return links
+
+    def export(
+        self,
+        output_path: Path,
+        fmt: str | None = None,
+        filters: CensusExportFilter | None = None,
+    ) -> int:
+        """Export census data to a file.
+
+        Args:
+            output_path: Destination file
+            fmt: "csv", "jsonl" or "parquet" (inferred from the suffix if None)
+            filters: Optional selection filters
+
+        Returns:
+            Number of persons exported
+
+        Raises:
+            ValueError: If the format is unknown
+            RuntimeError: If parquet is requested and pyarrow is not installed
+        """
+        fmt = (fmt or output_path.suffix.lstrip(".")).lower()
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {fmt!r} (use {', '.join(EXPORT_FORMATS)})")
+        filters = filters or CensusExportFilter()
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            columns = self.get_columns(self.get_field_names(conn, filters))
+            rows = self.iter_rows(conn, filters)
+
+            if fmt == "csv":
+                count = self._write_csv(output_path, columns, rows)
+            elif fmt == "jsonl":
+                count = self._write_jsonl(output_path, rows)
+            else:
+                count = self._write_parquet(output_path, columns, rows)
+
+        logger.info(f"Exported {count} census persons to {output_path} ({fmt})")
+        return count
+
+    @staticmethod
+    def _write_csv(
+        output_path: Path, columns: dict[str, str], rows: Iterator[dict[str, Any]]
+    ) -> int:
+        count = 0
+        with open(output_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(columns), extrasaction="ignore")
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+        return count
+
+    @staticmethod
+    def _write_jsonl(output_path: Path, rows: Iterator[dict[str, Any]]) -> int:
+        count = 0
+        with open(output_path, "w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False))
+                f.write("\n")
+                count += 1
+        return count
+
+    def _write_parquet(
+        self, output_path: Path, columns: dict[str, str], rows: Iterator[dict[str, Any]]
+    ) -> int:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError(
+                "Parquet export requires pyarrow. Run: pip install pyarrow"
+            ) from None
+
+        arrow_types = {"integer": pa.int64(), "float": pa.float64(), "string": pa.string()}
+        schema = pa.schema([(name, arrow_types[data_type]) for name, data_type in columns.items()])
+
+        count = 0
+        with pq.ParquetWriter(output_path, schema) as writer:
+            batch: list[dict[str, Any]] = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= self.chunk_size:
+                    writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                    count += len(batch)
+                    batch = []
+            if batch:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                count += len(batch)
+        return count
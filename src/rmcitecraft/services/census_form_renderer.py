@@ -14,7 +14,6 @@ Usage:
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
 from loguru import logger
 
 from rmcitecraft.models.census_form_data import CensusFormContext
@@ -46,7 +45,9 @@ class CensusFormRenderer:
         self.data_service = data_service or get_form_service()
         self.templates_dir = templates_dir or TEMPLATES_DIR
 
-        # Initialize Jinja2 environment
+        # Initialize Jinja2 environment (imported on first renderer use)
+        from jinja2 import Environment, FileSystemLoader, select_autoescape
+
         self.env = Environment(
             loader=FileSystemLoader(str(self.templates_dir)),
             autoescape=select_autoescape(["html", "xml"]),
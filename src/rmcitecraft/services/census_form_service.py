@@ -78,7 +78,7 @@ class CensusFormDataService:
             return None
 
         # Load persons for this page
-        persons = self._load_persons_for_page(page_id, include_quality)
+        persons = self._load_persons_for_page(page_id, include_quality, page_data.census_year)
 
         # Attach persons to page
         page_data.persons = persons
@@ -184,7 +184,9 @@ class CensusFormDataService:
         for page_id in page_ids:
             page_data = self._load_page(page_id)
             if page_data:
-                persons = self._load_persons_for_page(page_id, include_quality)
+                persons = self._load_persons_for_page(
+                    page_id, include_quality, page_data.census_year
+                )
                 page_data.persons = persons
                 pages.append(page_data)
                 all_persons.extend(persons)
@@ -266,17 +268,18 @@ class CensusFormDataService:
             return page
 
     def _load_persons_for_page(
-        self, page_id: int, include_quality: bool
+        self, page_id: int, include_quality: bool, census_year: int | None = None
     ) -> list[FormPersonRow]:
         """Load all persons for a page and convert to FormPersonRow."""
         persons = self.repo.get_persons_on_page(page_id)
+        page_fields = self.repo.get_person_fields_for_page(page_id, census_year)
         form_persons = []
 
         for person in persons:
             form_person = self._convert_person(person)
 
-            # Load extended fields (EAV)
-            extended_fields = self.repo.get_person_fields(person.person_id)
+            # Extended fields (typed projection + remaining EAV), loaded once per page
+            extended_fields = page_fields.get(person.person_id, {})
             for field_name, field_value in extended_fields.items():
                 if field_value is not None:
                     form_person.fields[field_name] = FieldValue(
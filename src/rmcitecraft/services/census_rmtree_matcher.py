@@ -50,9 +50,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import numpy as np
 from loguru import logger
-from scipy.optimize import linear_sum_assignment
 
 from rmcitecraft.database.census_extraction_db import (
     CensusExtractionRepository,
@@ -60,7 +58,9 @@ from rmcitecraft.database.census_extraction_db import (
     get_census_repository,
 )
 from rmcitecraft.database.connection import connect_rmtree
+from rmcitecraft.database.shadow_index import attach_shadow_index
 from rmcitecraft.services.familysearch_census_extractor import names_match_fuzzy, names_match_score
+from rmcitecraft.services.household_graph import HouseholdGraph, load_household_graph
 
 # =============================================================================
 # WEIGHT CONFIGURATION
@@ -235,6 +235,67 @@ RELATIONSHIP_COMPATIBLE_GROUPS = {
 }
 
 
+# =============================================================================
+# HOUSEHOLD GRAPH RELATIONS
+# =============================================================================
+# Witness roles grouped the way build_position_map orders a household, and
+# normalized relationships mapped to the relations HouseholdGraph derives
+# from FamilyTable/ChildTable.
+
+SPOUSE_ROLES = ("wife", "husband", "spouse")
+CHILD_ROLES = ("son", "daughter", "child", "step-son", "step-daughter")
+RELATIVE_ROLES = (
+    "mother",
+    "father",
+    "mother-in-law",
+    "father-in-law",
+    "brother",
+    "sister",
+    "grandson",
+    "granddaughter",
+    "nephew",
+    "niece",
+    "aunt",
+    "uncle",
+    "cousin",
+)
+
+GRAPH_RELATIONS = {
+    "wife": "spouse",
+    "husband": "spouse",
+    "partner": "spouse",
+    "son": "child",
+    "daughter": "child",
+    "child": "child",
+    "step-son": "stepchild",
+    "step-daughter": "stepchild",
+    "step-child": "stepchild",
+    "mother": "parent",
+    "father": "parent",
+    "parent": "parent",
+    "brother": "sibling",
+    "sister": "sibling",
+    "sibling": "sibling",
+    "half-brother": "sibling",
+    "half-sister": "sibling",
+    "grandson": "grandchild",
+    "granddaughter": "grandchild",
+    "grandchild": "grandchild",
+}
+
+
+def _role_kind(relationship: str) -> str | None:
+    """Household graph relation implied by a witness role (see ENUMERATION_RANK)."""
+    rel = relationship.lower()
+    if rel in SPOUSE_ROLES:
+        return "spouse"
+    if rel in CHILD_ROLES:
+        return "child"
+    if rel in RELATIVE_ROLES:
+        return "relative"
+    return None
+
+
 def relationships_compatible(rel1: str, rel2: str) -> tuple[bool, float]:
     """Check if two relationships are compatible for matching.
 
@@ -479,6 +540,25 @@ class CensusRMTreeMatcher:
         self.icu_extension_path = icu_extension_path
         self.census_repo = census_repo or get_census_repository()
         self._statistics: dict[int, MatchStatistics] = {}  # By census year
+        # Family structure of the whole tree; see load_household_graph()
+        self.household_graph: HouseholdGraph | None = None
+
+    def load_household_graph(self, reload: bool = False) -> HouseholdGraph:
+        """Load the tree's families once for position scoring and validation.
+
+        Batch runs call this up front; single matches work without it from
+        witness roles alone.
+
+        Args:
+            reload: Load again even if a graph is already loaded (picks up
+                family changes made in RootsMagic since)
+
+        Returns:
+            The loaded HouseholdGraph
+        """
+        if reload or self.household_graph is None:
+            self.household_graph = load_household_graph(self.rmtree_path)
+        return self.household_graph
 
     # =========================================================================
     # ROOTSMAGIC DATA RETRIEVAL
@@ -511,16 +591,16 @@ class CensusRMTreeMatcher:
         conn = connect_rmtree(self.rmtree_path, self.icu_extension_path)
         try:
             cursor = conn.cursor()
+            attach_shadow_index(conn, self.rmtree_path)
 
             # Step 1: Find the census event linked to this citation
+            # (CitationLinkTable has no CitationID index; the shadow index does)
             cursor.execute(
                 """
-                SELECT cl.OwnerID, e.Date
-                FROM CitationLinkTable cl
-                JOIN EventTable e ON cl.OwnerID = e.EventID
-                WHERE cl.CitationID = ?
-                  AND cl.OwnerType = 2  -- Event
-                  AND e.EventType = 18  -- Census
+                SELECT EventID, CensusYear
+                FROM shadow.citation_event
+                WHERE CitationID = ?
+                  AND EventType = 18  -- Census
                 LIMIT 1
             """,
                 (citation_id,),
@@ -531,14 +611,7 @@ class CensusRMTreeMatcher:
                 logger.warning(f"No census event found for citation {citation_id}")
                 return [], [], 0, 0
 
-            event_id = event_row[0]
-            date_str = event_row[1] or ""
-
-            # Parse census year from RootsMagic date format (D.+YYYYMMDD...)
-            census_year = 0
-            if len(date_str) >= 7:
-                with contextlib.suppress(ValueError):
-                    census_year = int(date_str[3:7])
+            event_id, census_year = event_row
 
             persons_with_rin: list[RMPersonData] = []
             persons_no_rin: list[RMPersonData] = []
@@ -741,17 +814,15 @@ class CensusRMTreeMatcher:
         conn = connect_rmtree(self.rmtree_path, self.icu_extension_path)
         try:
             cursor = conn.cursor()
+            attach_shadow_index(conn, self.rmtree_path)
 
             # Find all census events linked via citations from this source
             cursor.execute(
                 """
-                SELECT DISTINCT cl.OwnerID as EventID, e.Date
-                FROM CitationTable c
-                JOIN CitationLinkTable cl ON c.CitationID = cl.CitationID
-                JOIN EventTable e ON cl.OwnerID = e.EventID
-                WHERE c.SourceID = ?
-                  AND cl.OwnerType = 2  -- Event
-                  AND e.EventType = 18  -- Census
+                SELECT DISTINCT EventID, CensusYear
+                FROM shadow.citation_event
+                WHERE SourceID = ?
+                  AND EventType = 18  -- Census
             """,
                 (source_id,),
             )
@@ -762,13 +833,7 @@ class CensusRMTreeMatcher:
                 return [], [], 0, 0
 
             # Use the first event for census year
-            event_id = event_rows[0][0]
-            date_str = event_rows[0][1] or ""
-
-            census_year = 0
-            if len(date_str) >= 7:
-                with contextlib.suppress(ValueError):
-                    census_year = int(date_str[3:7])
+            event_id, census_year = event_rows[0]
 
             # Collect all unique persons from all census events
             all_event_ids = [row[0] for row in event_rows]
@@ -1299,6 +1364,10 @@ class CensusRMTreeMatcher:
         4. Other relatives
         5. Non-relatives (servants, boarders, etc.)
 
+        When the household graph is loaded, family links from the tree
+        decide who is the head's spouse or child (witness roles fill in for
+        people without links) and birth order breaks ties between children.
+
         Args:
             rm_persons: List of RM persons in the household
             census_year: Census year (for age ordering)
@@ -1306,6 +1375,14 @@ class CensusRMTreeMatcher:
         Returns:
             Dict mapping person_id to expected position (1-based)
         """
+        graph = self.household_graph
+        head_id = next((p.person_id for p in rm_persons if p.relationship.lower() == "head"), None)
+        if graph is not None and head_id in graph:
+            household = [p for p in rm_persons if not p.is_non_rin]
+            relations = {p.person_id: _role_kind(p.relationship) for p in household}
+            order = graph.expected_order(head_id, [p.person_id for p in household], relations)
+            return {person_id: position for position, person_id in enumerate(order, start=1)}
+
         position_map = {}
         position = 1
 
@@ -1324,25 +1401,11 @@ class CensusRMTreeMatcher:
 
             if rel == "head":
                 head = p
-            elif rel in ("wife", "husband", "spouse"):
+            elif rel in SPOUSE_ROLES:
                 spouse = p
-            elif rel in ("son", "daughter", "child", "step-son", "step-daughter"):
+            elif rel in CHILD_ROLES:
                 children.append(p)
-            elif rel in (
-                "mother",
-                "father",
-                "mother-in-law",
-                "father-in-law",
-                "brother",
-                "sister",
-                "grandson",
-                "granddaughter",
-                "nephew",
-                "niece",
-                "aunt",
-                "uncle",
-                "cousin",
-            ):
+            elif rel in RELATIVE_ROLES:
                 relatives.append(p)
             else:
                 others.append(p)
@@ -1425,6 +1488,10 @@ class CensusRMTreeMatcher:
         # Build position map for positional scoring
         position_map = self.build_position_map(rm_with_rin, census_year)
 
+        # NumPy/SciPy are imported here so loading the matcher stays cheap
+        import numpy as np
+        from scipy.optimize import linear_sum_assignment
+
         # Build score matrix for Hungarian algorithm
         # Rows = RM persons, Columns = Census persons
         n_rm = len(rm_with_rin)
@@ -1642,6 +1709,8 @@ class CensusRMTreeMatcher:
         1. If RM has a wife, census should have wife/spouse
         2. Child count should roughly match
         3. Sex/relationship consistency (sons should be male, etc.)
+        4. Census relationships to the head match FamilyTable/ChildTable
+           (when the household graph is loaded)
 
         Args:
             matches: List of matched candidates
@@ -1703,9 +1772,42 @@ class CensusRMTreeMatcher:
                     f"Sex mismatch: '{m.rm_person.full_name}' is RM daughter (F) but census shows M"
                 )
 
+        # Check 4: Census relationships agree with the tree's families
+        warnings.extend(self._family_link_warnings(matches))
+
         is_valid = len(warnings) == 0
         return FamilyValidationResult(is_valid=is_valid, warnings=warnings)
 
+    def _family_link_warnings(self, matches: list[MatchCandidate]) -> list[str]:
+        """Warn where a census relationship to the head contradicts the tree.
+
+        Uses the household graph when loaded: a census "wife" should be the
+        head's spouse in FamilyTable, a "son" the child of one of the head's
+        families, and so on.
+        """
+        graph = self.household_graph
+        head = next((m for m in matches if m.rm_person.relationship.lower() == "head"), None)
+        if graph is None or head is None:
+            return []
+
+        by_person = {m.rm_person.person_id: m for m in matches if not m.rm_person.is_non_rin}
+        claimed = {}
+        for person_id, m in by_person.items():
+            census_rel = m.census_person.relationship.lower()
+            kind = GRAPH_RELATIONS.get(RELATIONSHIP_ALIASES.get(census_rel, census_rel))
+            if kind:
+                claimed[person_id] = kind
+
+        warnings = []
+        for person_id, _, actual in graph.check_household(head.rm_person.person_id, claimed):
+            m = by_person[person_id]
+            in_tree = f"records them as {actual}" if actual else "has no family link to the head"
+            warnings.append(
+                f"Family link mismatch: census lists '{m.rm_person.full_name}' as "
+                f"{m.census_person.relationship.lower()} but RootsMagic {in_tree}"
+            )
+        return warnings
+
     # =========================================================================
     # CONTEXTUAL THRESHOLD
     # =========================================================================
@@ -2065,12 +2167,15 @@ class CensusRMTreeMatcher:
 def create_matcher(
     rmtree_path: str | Path | None = None,
     icu_extension_path: str | Path | None = None,
+    household_graph: bool = False,
 ) -> CensusRMTreeMatcher:
     """Create a matcher with default paths.
 
     Args:
         rmtree_path: Path to RootsMagic database (uses config if not provided)
         icu_extension_path: Path to ICU extension (uses config if not provided)
+        household_graph: Load the tree's family graph up front (for matchers
+            reused across many citations)
 
     Returns:
         Configured CensusRMTreeMatcher
@@ -2084,7 +2189,10 @@ def create_matcher(
     if icu_extension_path is None:
         icu_extension_path = settings.sqlite_icu_extension
 
-    return CensusRMTreeMatcher(
+    matcher = CensusRMTreeMatcher(
         rmtree_path=Path(rmtree_path),
         icu_extension_path=Path(icu_extension_path),
     )
+    if household_graph:
+        matcher.load_household_graph()
+    return matcher
@@ -8,6 +8,7 @@ rmcitecraft.services.census.transcription_service.
 """
 
 import os
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -15,8 +16,8 @@ from loguru import logger
 
 from rmcitecraft.llm import ExtractionResponse, LLMProvider, create_provider
 from rmcitecraft.services.census.data_validator import CensusDataValidator
-from rmcitecraft.services.census.prompt_builder import CensusPromptBuilder
-from rmcitecraft.services.census.response_parser import CensusResponseParser
+from rmcitecraft.services.census.image_preprocessor import CensusImagePreprocessor
+from rmcitecraft.services.census.model_cascade import CensusModelCascade
 from rmcitecraft.services.census.schema_registry import CensusSchemaRegistry
 from rmcitecraft.services.census.transcription_service import (
     CensusTranscriptionService,
@@ -49,12 +50,15 @@ class CensusTranscriber:
         self,
         provider: LLMProvider | None = None,
         model: str | None = None,
+        cascade: CensusModelCascade | None = None,
     ):
         """Initialize census transcriber.
 
         Args:
             provider: LLM provider to use (or create from config)
-            model: Model to use for transcription
+            model: Model to use for transcription when no cascade is configured
+            cascade: Model cascade to transcribe with (defaults to the one
+                configured in census_cascade_models, if any)
         """
         if provider:
             self.provider = provider
@@ -67,12 +71,21 @@ class CensusTranscriber:
         self.model = model or os.getenv("CENSUS_TRANSCRIPTION_MODEL")
 
         # Initialize the new service with direct provider access
-        self._prompt_builder = CensusPromptBuilder()
-        self._response_parser = CensusResponseParser()
         self._validator = CensusDataValidator()
+        self._preprocessor = CensusImagePreprocessor()
+        self._service = CensusTranscriptionService(
+            provider=self.provider, model=self.model, preprocessor=self._preprocessor
+        )
+        self._cascade = cascade or CensusModelCascade.from_config(
+            self.provider, preprocessor=self._preprocessor
+        )
 
         logger.info(f"Census transcriber initialized with {self.provider.name}")
-        if self.model:
+        if self._cascade:
+            logger.info(
+                f"Using model cascade: {' -> '.join(t.model for t in self._cascade.tiers)}"
+            )
+        elif self.model:
             logger.info(f"Using model: {self.model}")
 
     def _load_config(self) -> dict:
@@ -107,9 +120,17 @@ class CensusTranscriber:
         target_line: int | None = None,
         sheet: str | None = None,
         enumeration_district: str | None = None,
+        on_person: Callable[[dict[str, Any], list[str]], None] | None = None,
     ) -> ExtractionResponse:
         """Transcribe census image and extract structured data.
 
+        The LLM response is streamed, so on_person sees each person record
+        (with its validation warnings) as soon as the model has written it.
+        When a model cascade is configured the image goes through the
+        cascade instead; escalation may discard a tier's records, so
+        on_person then receives the accepted result's persons (without
+        per-person warnings) once the cascade has finished.
+
         Args:
             image_path: Path to census image
             census_year: Year of the census (1790-1950)
@@ -117,6 +138,7 @@ class CensusTranscriber:
             target_line: Known line number from footnote
             sheet: Sheet identifier from footnote (e.g., "9A")
             enumeration_district: ED from footnote (e.g., "93-76")
+            on_person: Called with (person, warnings) for each streamed record
 
         Returns:
             ExtractionResponse with extracted census data
@@ -124,6 +146,7 @@ class CensusTranscriber:
         Raises:
             FileNotFoundError: If image doesn't exist
             ValueError: If census year is invalid
+            RuntimeError: If the LLM call or response parsing fails
         """
         image_path = Path(image_path)
         if not image_path.exists():
@@ -150,6 +173,7 @@ class CensusTranscriber:
             target_line=target_line,
             sheet=sheet,
             enumeration_district=enumeration_district,
+            on_person=on_person,
         )
 
     def _transcribe_with_yaml_schema(
@@ -160,6 +184,7 @@ class CensusTranscriber:
         target_line: int | None = None,
         sheet: str | None = None,
         enumeration_district: str | None = None,
+        on_person: Callable[[dict[str, Any], list[str]], None] | None = None,
     ) -> ExtractionResponse:
         """Transcribe using YAML schema-based extraction."""
         try:
@@ -168,38 +193,43 @@ class CensusTranscriber:
             schema = CensusSchemaRegistry.get_schema(census_year)
             logger.info(f"Schema loaded: {schema.year}, era={schema.era}")
 
-            # Build prompt using the new builder
-            logger.info("Building transcription prompt...")
-            prompt = self._prompt_builder.build_transcription_prompt(
-                schema=schema,
-                target_names=target_names,
-                target_line=target_line,
-                sheet=sheet,
-                enumeration_district=enumeration_district,
-            )
-            logger.info(f"Prompt built, length={len(prompt)} chars")
-
-            # Call LLM
-            logger.info(f"Calling LLM provider: {self.provider.name}, model={self.model}")
             logger.info(f"Image path: {image_path}")
-            response = self.provider.complete_with_image(
-                prompt,
-                str(image_path),
-                model=self.model,
-                temperature=0.2,
+            if self._cascade:
+                logger.info(f"Calling LLM provider: {self.provider.name} via model cascade")
+                result = self._cascade.transcribe(
+                    image_path,
+                    census_year,
+                    target_names=target_names,
+                    target_line=target_line,
+                    sheet=sheet,
+                    enumeration_district=enumeration_district,
+                )
+                if on_person is not None and result.success:
+                    for person in result.persons:
+                        on_person(person, [])
+            else:
+                # Stream the response through the schema-based service
+                logger.info(f"Calling LLM provider: {self.provider.name}, model={self.model}")
+                result = self._service.transcribe_streaming(
+                    image_path,
+                    census_year,
+                    on_person=on_person,
+                    target_names=target_names,
+                    target_line=target_line,
+                    sheet=sheet,
+                    enumeration_district=enumeration_district,
+                )
+            if not result.success:
+                raise RuntimeError(result.error or "Transcription failed")
+            logger.info(
+                f"LLM response received from {result.model or 'default model'}, "
+                f"length={len(result.raw_response)} chars"
             )
-            logger.info(f"LLM response received, length={len(response.text)} chars")
 
-            # Parse response
-            data = self._response_parser.parse_response(response.text)
-            persons = self._response_parser.extract_persons(data)
-            metadata = self._response_parser.extract_metadata(data)
-
-            # Validate
-            warnings = self._validator.validate(
-                {"metadata": metadata, "persons": persons},
-                schema,
-            )
+            data = result.data
+            persons = result.persons
+            metadata = result.metadata
+            warnings = result.warnings
 
             if warnings:
                 logger.warning(f"Validation warnings: {warnings}")
@@ -218,8 +248,9 @@ class CensusTranscriber:
                     "census_year": census_year,
                     "target_names": target_names,
                     "target_line": target_line,
-                    "raw_response": response.text,
+                    "raw_response": result.raw_response,
                     "warnings": warnings,
+                    "model": result.model,
                 },
             )
 
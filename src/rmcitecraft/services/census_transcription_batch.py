@@ -13,11 +13,14 @@ Key features:
 - Checkpoint/resume support for crash recovery
 """
 
+from __future__ import annotations
+
+import asyncio
 import re
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
@@ -26,13 +29,18 @@ from rmcitecraft.database.census_transcription_repository import (
     CensusTranscriptionRepository,
     TranscriptionItem,
 )
-from rmcitecraft.database.connection import connect_rmtree
+from rmcitecraft.database.rmtree_cache import RootsMagicCache
+from rmcitecraft.monitoring.spans import SpanRecorder, span, span_context
 from rmcitecraft.services.census_edge_detection import detect_edge_conditions
 from rmcitecraft.services.census_rmtree_matcher import create_matcher
 from rmcitecraft.services.familysearch_automation import CDPConnectionError
 from rmcitecraft.services.familysearch_census_extractor import (
     FamilySearchCensusExtractor,
 )
+from rmcitecraft.services.retry_strategy import CircuitOpenError
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
 
 
 @dataclass
@@ -45,7 +53,7 @@ class BatchResult:
     skipped: int = 0
     edge_warnings: int = 0
     error_messages: list[str] | None = None
-    connection_error: bool = False  # True if stopped due to CDPConnectionError
+    connection_error: bool = False  # True if stopped due to CDPConnectionError/CircuitOpenError
     connection_error_message: str | None = None
 
     @property
@@ -162,7 +170,7 @@ class CensusTranscriptionBatchService:
         """
         Build queue of sources to transcribe.
 
-        Queries from SourceTable (not Citations) to avoid duplicates.
+        Reads census sources (not Citations) to avoid duplicates.
         Each Source with a FamilySearch ARK represents one census page to process.
 
         Args:
@@ -181,70 +189,18 @@ class CensusTranscriptionBatchService:
         stats = QueueStats()
 
         try:
-            conn = connect_rmtree(
-                self.settings.rm_database_path,
-                self.settings.sqlite_icu_extension,
-            )
-            cursor = conn.cursor()
-
-            # Build query with year filter in SQL for efficiency
-            # Source name formats:
-            #   - Population: "Fed Census: 1950, Arizona, Pima [citing ...]"
-            #   - Slave: "Fed Census Slave Schedule: 1850, North Carolina, Davie [...]"
-            #   - Mortality: "Fed Census Mortality Schedule: 1850, New Jersey, Warren [...]"
-            year_clause = ""
-            if census_year:
-                year_clause = f"""AND (
-                    s.Name LIKE 'Fed Census: {census_year},%'
-                    OR s.Name LIKE 'Fed Census Slave Schedule: {census_year},%'
-                    OR s.Name LIKE 'Fed Census Mortality Schedule: {census_year},%'
-                )"""
-
-            # Query 1: Get all matching sources (fast)
-            source_query = f"""
-                SELECT s.SourceID, s.Name, s.Fields
-                FROM SourceTable s
-                WHERE s.TemplateID = 0
-                  AND (s.Name LIKE 'Fed Census:%'
-                       OR s.Name LIKE 'Fed Census Slave Schedule:%'
-                       OR s.Name LIKE 'Fed Census Mortality Schedule:%')
-                  {year_clause}
-            """
-            cursor.execute(source_query)
-            source_rows = cursor.fetchall()
+            # Census sources come pre-parsed (year, state, county, ARK) from
+            # the local cache, which only pulls rows changed since the last
+            # queue build; see rmcitecraft.database.rmtree_cache
+            cache = RootsMagicCache(self.settings.rm_database_path)
 
+            # Population schedule sources with a FamilySearch ARK
+            source_rows = cache.census_sources(census_year, state_filter)
             logger.debug(f"Found {len(source_rows)} census sources in RootsMagic")
 
-            # Query 2: Get person names and RINs for all sources in one query
-            # Group by SourceID, take first match (the primary target person)
-            person_query = """
-                SELECT
-                    c.SourceID,
-                    TRIM(COALESCE(n.Given, '') || ' ' || COALESCE(n.Surname, '')) as person_name,
-                    n.Surname,
-                    n.OwnerID as person_id
-                FROM CitationTable c
-                JOIN CitationLinkTable cl ON c.CitationID = cl.CitationID
-                JOIN EventTable e ON cl.OwnerID = e.EventID AND cl.OwnerType = 2
-                JOIN NameTable n ON e.OwnerID = n.OwnerID AND n.IsPrimary = 1
-                GROUP BY c.SourceID
-            """
-            cursor.execute(person_query)
-            person_rows = cursor.fetchall()
-            conn.close()
-
-            # Build lookup dict for person names and RINs
-            # Key: SourceID, Value: (person_name, surname, person_id/RIN)
-            person_lookup: dict[int, tuple[str, str, int | None]] = {}
-            for prow in person_rows:
-                person_lookup[prow[0]] = (prow[1] or "", prow[2] or "", prow[3])
-
-            # Combine into rows format
-            rows = []
-            for srow in source_rows:
-                source_id = srow[0]
-                pname, surname, person_id = person_lookup.get(source_id, ("", "", None))
-                rows.append((source_id, srow[1], srow[2], pname, surname, person_id))
+            # Key: SourceID, Value: (person_name, surname, person_id/RIN) of
+            # the first person cited (the primary target person)
+            person_lookup: dict[int, tuple[str, str, int | None]] = cache.source_primary_persons()
 
             # Pre-load all processed ARKs from census.db into a set for O(1) lookup
             from rmcitecraft.database.census_extraction_db import get_census_repository
@@ -260,49 +216,9 @@ class CensusTranscriptionBatchService:
 
             logger.debug(f"Loaded {len(processed_arks)} processed ARKs")
 
-            # Process rows - now just string parsing, no additional queries
-            for row in rows:
-                source_id = row[0]
-                source_name = row[1] or ""
-                source_fields = row[2]
-                person_name = row[3] or source_name
-                surname = row[4] or ""
-                person_id = row[5]  # RIN from RootsMagic (primary target)
-
-                # Extract year, state, county from source name
-                name_match = re.match(
-                    r"Fed Census:\s*(\d{4}),\s*([^,]+),\s*([^\s\[]+)",
-                    source_name,
-                    re.IGNORECASE,
-                )
-                if not name_match:
-                    continue
-
-                year = int(name_match.group(1))
-                state = name_match.group(2).strip()
-                county = name_match.group(3).strip()
-
-                # Apply state filter if provided
-                if state_filter and state.upper() != state_filter.upper():
-                    continue
-
-                # Extract ARK from Fields blob (simple string search, no XML parsing)
-                if not source_fields:
-                    continue
-
-                fields_str = (
-                    source_fields.decode("utf-8")
-                    if isinstance(source_fields, bytes)
-                    else source_fields
-                )
-
-                ark_match = re.search(
-                    r"familysearch\.org/ark:/61903/(1:1:[A-Z0-9-]+)", fields_str
-                )
-                if not ark_match:
-                    continue
-
-                fs_ark = ark_match.group(1)
+            for source_id, source_name, year, state, county, fs_ark in source_rows:
+                person_name, surname, person_id = person_lookup.get(source_id, ("", "", None))
+                person_name = person_name or source_name or ""
                 full_ark = f"https://www.familysearch.org/ark:/61903/{fs_ark}"
 
                 # Count for stats
@@ -402,15 +318,25 @@ class CensusTranscriptionBatchService:
         on_progress: Callable[[int, int, str], None] | None = None,
         on_edge_warning: Callable[[str, dict], None] | None = None,
         max_retries: int = 3,
+        concurrency: int = 1,
+        on_item_done: Callable[[TranscriptionItem, dict[str, Any]], None] | None = None,
     ) -> BatchResult:
         """
         Process all items in a session.
 
+        With concurrency > 1, each worker extracts in its own FamilySearch
+        tab, so page loads, RootsMagic lookups and census.db writes of
+        several items overlap. Navigation from every tab goes through the
+        "familysearch" outbound guard, which caps the global request rate.
+        With one worker the user's FamilySearch tab is used.
+
         Args:
             session_id: Session to process
             on_progress: Callback(completed, total, current_name) for progress updates
             on_edge_warning: Callback(message, item_data) for edge warnings
             max_retries: Maximum retry attempts for failed items
+            concurrency: Number of items (and browser tabs) processed concurrently
+            on_item_done: Callback(item, item_result) after each item finishes
 
         Returns:
             BatchResult with processing statistics
@@ -425,20 +351,40 @@ class CensusTranscriptionBatchService:
         items = self.state_repo.get_pending_items(session_id)
         result.total_items = len(items)
 
-        logger.info(f"Processing batch {session_id}: {len(items)} items")
+        logger.info(
+            f"Processing batch {session_id}: {len(items)} items (concurrency={concurrency})"
+        )
+
+        queue: asyncio.Queue[TranscriptionItem] = asyncio.Queue()
+        for item in items:
+            queue.put_nowait(item)
+        started = 0
+        finished = False
+        recorder = SpanRecorder(
+            self.state_repo.record_spans,
+            batch_type="census_transcription",
+            enabled=self.settings.stage_spans_enabled,
+        )
 
-        # Ensure extractor is connected
-        await self.extractor.connect()
+        pages: list[Page | None] = []
+
+        async def worker(page: Page | None) -> None:
+            nonlocal started
+            while not result.connection_error:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
 
-        try:
-            for idx, item in enumerate(items):
                 try:
                     # Report progress
                     if on_progress:
-                        on_progress(idx, result.total_items, item.person_name)
+                        on_progress(started, result.total_items, item.person_name)
+                    started += 1
 
-                    # Process the item
-                    item_result = await self._process_item(item)
+                    # Process the item (its stage spans carry the item id)
+                    with span_context(item_id=item.item_id):
+                        item_result = await self._process_item(item, page)
 
                     if item_result.get("success"):
                         result.completed += 1
@@ -477,14 +423,17 @@ class CensusTranscriptionBatchService:
                         edge_warning_count=result.edge_warnings,
                     )
 
-                except CDPConnectionError as e:
-                    # Browser connection failed - stop batch immediately
+                    if on_item_done:
+                        on_item_done(item, item_result)
+
+                except (CDPConnectionError, CircuitOpenError) as e:
+                    # Browser connection failed or FamilySearch keeps failing -
+                    # stop batch (other workers stop before taking their next item)
                     logger.error(f"Browser connection failed: {e}")
                     result.connection_error = True
                     result.connection_error_message = str(e)
                     result.error_messages.append(f"CONNECTION ERROR: {str(e)}")
-                    # Break out of the loop - don't continue processing
-                    break
+                    return
 
                 except Exception as e:
                     logger.error(f"Error processing item {item.item_id}: {e}")
@@ -497,6 +446,19 @@ class CensusTranscriptionBatchService:
                         error_message=str(e),
                     )
 
+        try:
+            # Ensure extractor is connected
+            await self.extractor.connect()
+
+            # Create the matcher before workers share it, with the tree's
+            # families loaded once for this batch
+            await asyncio.to_thread(self.matcher.load_household_graph, reload=True)
+
+            pages = await self._open_tabs(max(1, concurrency))
+            with span_context(recorder, session_id=session_id):
+                await asyncio.gather(*(worker(page) for page in pages))
+            finished = True
+
         except CDPConnectionError as e:
             # Catch CDPConnectionError from extractor.connect() or initial setup
             logger.error(f"Browser connection failed during batch setup: {e}")
@@ -505,8 +467,15 @@ class CensusTranscriptionBatchService:
             result.error_messages.append(f"CONNECTION ERROR: {str(e)}")
 
         finally:
-            # Complete session
-            self.state_repo.complete_session(session_id)
+            for page in pages:
+                if page is not None:
+                    await self._close_tab(page)
+            recorder.flush()
+            # Interrupted sessions stay resumable
+            if finished and not result.connection_error:
+                self.state_repo.complete_session(session_id)
+            else:
+                self.state_repo.pause_session(session_id)
 
         # Final progress report
         if on_progress:
@@ -520,7 +489,40 @@ class CensusTranscriptionBatchService:
 
         return result
 
-    async def _process_item(self, item: TranscriptionItem) -> dict[str, Any]:
+    async def _open_tabs(self, count: int) -> list[Page | None]:
+        """One tab per worker; None stands for the user's FamilySearch tab.
+
+        A single worker uses the user's tab. Otherwise the batch opens (and
+        later closes) its own tabs, falling back to the user's tab if none
+        can be opened.
+        """
+        if count == 1:
+            return [None]
+
+        pages: list[Page | None] = []
+        for _ in range(count):
+            try:
+                page = await self.extractor.automation.new_page()
+            except Exception as e:
+                logger.warning(f"Could not open extraction tab: {e}")
+                page = None
+            if page is None:
+                break
+            pages.append(page)
+        if len(pages) < count:
+            logger.warning(f"Opened {len(pages)} of {count} extraction tabs")
+        return pages or [None]
+
+    @staticmethod
+    async def _close_tab(page: Page) -> None:
+        try:
+            await page.close()
+        except Exception as e:
+            logger.debug(f"Error closing extraction tab: {e}")
+
+    async def _process_item(
+        self, item: TranscriptionItem, page: Page | None = None
+    ) -> dict[str, Any]:
         """
         Process a single transcription item.
 
@@ -532,6 +534,10 @@ class CensusTranscriptionBatchService:
         6. Detect edge conditions and flag for review
         7. Mark image as processed
 
+        Args:
+            item: Item to process
+            page: Tab to extract in (default: the user's FamilySearch tab)
+
         Returns:
             Dict with keys: success, skipped, error, edge_warning, edge_message
         """
@@ -554,14 +560,18 @@ class CensusTranscriptionBatchService:
             # Note: rmtree_citation_id is actually a SourceID when using source-based queue
             rm_persons = []
             try:
-                rm_persons, _, _ = self.matcher.get_rm_persons_for_source(
-                    item.rmtree_citation_id  # This is a SourceID
-                )
+                # Runs in a thread so it overlaps other tabs' browser work
+                with span("match"):
+                    rm_persons, _, _ = await asyncio.to_thread(
+                        self.matcher.get_rm_persons_for_source,
+                        item.rmtree_citation_id,  # This is a SourceID
+                    )
                 logger.info(f"Found {len(rm_persons)} RM persons for source {item.rmtree_citation_id}")
             except Exception as e:
                 logger.warning(f"Could not get RM persons for source {item.rmtree_citation_id}: {e}")
 
             # Extract census data
+            image_ark = ""
             extraction_result = await self.extractor.extract_from_ark(
                 ark_url=ark_url,
                 census_year=item.census_year,
@@ -569,7 +579,14 @@ class CensusTranscriptionBatchService:
                 rmtree_person_id=item.rmtree_person_id,
                 extract_household=True,
                 rm_persons_filter=rm_persons if rm_persons else None,
+                page=page,
             )
+            if extraction_result.success:
+                page = page or await self.extractor.automation.get_or_create_page()
+                if page:
+                    image_match = re.search(r"ark:/61903/(3:1:[A-Z0-9-]+)", page.url)
+                    if image_match:
+                        image_ark = image_match.group(1)
 
             if not extraction_result.success:
                 result["error"] = extraction_result.error_message
@@ -598,28 +615,20 @@ class CensusTranscriptionBatchService:
                 relationship_to_head=relationship,
             )
 
-            # Get image ARK from URL or extracted data
-            image_ark = ""
-            page = await self.extractor.automation.get_or_create_page()
-            if page:
-                url = page.url
-                image_match = re.search(r"ark:/61903/(3:1:[A-Z0-9-]+)", url)
-                if image_match:
-                    image_ark = image_match.group(1)
-
             # Update item with extraction results
-            self.state_repo.update_item_extraction(
-                item_id=item.item_id,
-                image_ark=image_ark,
-                census_db_person_id=extraction_result.person_id or 0,
-                census_db_page_id=extraction_result.page_id or 0,
-                household_extracted_count=len(extraction_result.related_persons),
-                extraction_method="table_arks",  # Primary method
-                line_number=line_number,
-                first_line_flag=edge_result.first_line_warning,
-                last_line_flag=edge_result.last_line_warning,
-                edge_warning_message=edge_result.warning_message,
-            )
+            with span("db_write"):
+                self.state_repo.update_item_extraction(
+                    item_id=item.item_id,
+                    image_ark=image_ark,
+                    census_db_person_id=extraction_result.person_id or 0,
+                    census_db_page_id=extraction_result.page_id or 0,
+                    household_extracted_count=len(extraction_result.related_persons),
+                    extraction_method="table_arks",  # Primary method
+                    line_number=line_number,
+                    first_line_flag=edge_result.first_line_warning,
+                    last_line_flag=edge_result.last_line_warning,
+                    edge_warning_message=edge_result.warning_message,
+                )
 
             # Mark image as processed (if we have the image ARK)
             if image_ark and extraction_result.page_id:
@@ -638,18 +647,19 @@ class CensusTranscriptionBatchService:
                             page_info = dict(row)
 
                     if page_info:
-                        self.state_repo.mark_image_processed(
-                            image_ark=image_ark,
-                            census_year=item.census_year,
-                            state=page_info.get("state", ""),
-                            county=page_info.get("county", ""),
-                            enumeration_district=page_info.get("enumeration_district", ""),
-                            sheet_number=page_info.get("sheet_number", ""),
-                            stamp_number=page_info.get("stamp_number", ""),
-                            census_db_page_id=extraction_result.page_id,
-                            person_count=1 + len(extraction_result.related_persons),
-                            session_id=item.session_id,
-                        )
+                        with span("db_write"):
+                            self.state_repo.mark_image_processed(
+                                image_ark=image_ark,
+                                census_year=item.census_year,
+                                state=page_info.get("state", ""),
+                                county=page_info.get("county", ""),
+                                enumeration_district=page_info.get("enumeration_district", ""),
+                                sheet_number=page_info.get("sheet_number", ""),
+                                stamp_number=page_info.get("stamp_number", ""),
+                                census_db_page_id=extraction_result.page_id,
+                                person_count=1 + len(extraction_result.related_persons),
+                                session_id=item.session_id,
+                            )
                 except Exception as e:
                     logger.debug(f"Could not mark image as processed: {e}")
 
@@ -666,6 +676,11 @@ class CensusTranscriptionBatchService:
                 f"household={len(extraction_result.related_persons)}"
             )
 
+        except (CDPConnectionError, CircuitOpenError):
+            # Browser or FamilySearch unavailable: let process_batch stop the batch
+            self.state_repo.update_item_status(item.item_id, "queued")
+            raise
+
         except Exception as e:
             logger.error(f"Error processing item {item.item_id}: {e}")
             result["error"] = str(e)
@@ -682,6 +697,8 @@ class CensusTranscriptionBatchService:
         session_id: str,
         on_progress: Callable[[int, int, str], None] | None = None,
         on_edge_warning: Callable[[str, dict], None] | None = None,
+        concurrency: int = 1,
+        on_item_done: Callable[[TranscriptionItem, dict[str, Any]], None] | None = None,
     ) -> BatchResult:
         """Resume a paused or interrupted session."""
         session = self.state_repo.get_session(session_id)
@@ -697,6 +714,8 @@ class CensusTranscriptionBatchService:
             session_id,
             on_progress=on_progress,
             on_edge_warning=on_edge_warning,
+            concurrency=concurrency,
+            on_item_done=on_item_done,
         )
 
     def get_edge_warnings(self, session_id: str) -> list[TranscriptionItem]:
@@ -10,6 +10,7 @@ from typing import Any
 
 from loguru import logger
 
+from rmcitecraft.database.findagrave_queries import get_utc_mod_date
 from rmcitecraft.models.census_citation import (
     CensusCitation,
     PlaceDetails,
@@ -213,10 +214,10 @@ class CitationGenerationService:
             bibliography=citation.bibliography,
         )
 
-        # Update SourceTable.Fields
+        # Update SourceTable.Fields (UTCModDate lets the local cache sync it)
         cursor.execute(
-            "UPDATE SourceTable SET Fields = ? WHERE SourceID = ?",
-            (new_fields, citation.source_id),
+            "UPDATE SourceTable SET Fields = ?, UTCModDate = ? WHERE SourceID = ?",
+            (new_fields, get_utc_mod_date(), citation.source_id),
         )
 
         self.conn.commit()
@@ -11,11 +11,18 @@ Connection Strategy:
 The persistent profile maintains FamilySearch login across sessions.
 """
 
+from __future__ import annotations
+
 import asyncio
 import os
+from typing import TYPE_CHECKING
 
 from loguru import logger
-from playwright.async_api import BrowserContext, Page, async_playwright
+
+from rmcitecraft.services.retry_strategy import get_outbound_guard
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, Page
 
 # Chrome profile directory for persistent login
 CHROME_PROFILE_DIR = os.path.expanduser("~/chrome-debug-profile")
@@ -72,7 +79,7 @@ class BrowserConnection:
         """Whether connected via CDP (vs launched browser)."""
         return self._is_cdp_connection
 
-    async def __aenter__(self) -> "BrowserConnection":
+    async def __aenter__(self) -> BrowserConnection:
         """Async context manager entry - connect to browser."""
         await self.connect()
         return self
@@ -91,6 +98,8 @@ class BrowserConnection:
         Returns:
             True if connected successfully, False otherwise
         """
+        from playwright.async_api import async_playwright
+
         self._playwright = await async_playwright().start()
 
         # Try CDP connection first
@@ -337,19 +346,29 @@ class BrowserConnection:
             logger.info(f"Already on target page: {page.url}")
         else:
             logger.info(f"Navigating to: {url}")
+            guard = get_outbound_guard("familysearch")
+            await guard.acquire_async()
             try:
-                await asyncio.wait_for(
+                response = await asyncio.wait_for(
                     page.goto(url, wait_until="domcontentloaded"),
                     timeout=timeout
                 )
-            except TimeoutError:
+                if response is not None and response.status == 429:
+                    guard.record_rate_limited()
+                else:
+                    guard.record_success()
+            except TimeoutError as e:
                 logger.warning(f"Navigation timed out after {timeout}s")
                 if "familysearch.org" not in page.url:
+                    guard.record_failure(e)
                     return None
             except Exception as e:
                 logger.warning(f"Navigation failed: {e}")
                 if "familysearch.org" not in page.url:
+                    guard.record_failure(e)
                     return None
+            finally:
+                guard.settle()
 
         # Wait for selector if specified
         if wait_for_selector:
@@ -13,16 +13,20 @@ Usage:
         household = await extractor.extract_household(url, census_year=1910)
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
-from playwright.async_api import Page
 
 from .browser import BrowserConnection
 from .extraction import DetailPageStrategy, HouseholdStrategy, PersonPageStrategy
 from .year_handler import YearSpecificHandler
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 
 @dataclass
 class ExtractionResult:
@@ -108,7 +112,7 @@ class CensusExtractor:
         """Whether browser is connected."""
         return self._browser is not None and self._browser.is_connected
 
-    async def __aenter__(self) -> "CensusExtractor":
+    async def __aenter__(self) -> CensusExtractor:
         """Async context manager entry."""
         await self.connect()
         return self
@@ -30,11 +30,15 @@ Required comment format:
 ================================================================================
 """
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
-from playwright.async_api import Page
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
 
 
 class PlaywrightExtractionStrategy(ABC):
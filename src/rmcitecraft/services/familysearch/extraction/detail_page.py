@@ -11,11 +11,12 @@ place data than the person page. The field labels are consistent even
 though the order may vary.
 """
 
+from __future__ import annotations
+
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
-from playwright.async_api import Page
 
 from ..field_mapping import (
     is_extended_field,
@@ -25,6 +26,9 @@ from ..field_mapping import (
 from ..year_handler import YearSpecificHandler
 from .base import PlaywrightExtractionStrategy
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 
 class DetailPageStrategy(PlaywrightExtractionStrategy):
     """Extracts census data from FamilySearch detail/image view pages.
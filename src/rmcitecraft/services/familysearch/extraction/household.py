@@ -5,15 +5,19 @@ Household data shows all persons enumerated at the same dwelling/family
 in the census.
 """
 
+from __future__ import annotations
+
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
-from playwright.async_api import Page
 
 from ..field_mapping import map_familysearch_field
 from .base import PlaywrightExtractionStrategy
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 
 class HouseholdStrategy(PlaywrightExtractionStrategy):
     """Extracts household member data from FamilySearch census pages.
@@ -7,15 +7,19 @@ provide links to the detail/image view.
 URL Pattern: /ark:/61903/1:1:... (1:1 indicates person record)
 """
 
+from __future__ import annotations
+
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
-from playwright.async_api import Page
 
 from ..field_mapping import map_familysearch_field
 from .base import PlaywrightExtractionStrategy
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
 
 class PersonPageStrategy(PlaywrightExtractionStrategy):
     """Extracts census data from FamilySearch person ARK pages.
@@ -39,16 +39,22 @@ Uses persistent Chrome profile for login persistence:
 Note: Playwright launches and manages Chrome directly (not CDP connection).
 """
 
+from __future__ import annotations
+
 import asyncio
 import os
 import re
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
-from playwright.async_api import BrowserContext, Page, async_playwright
+
+from rmcitecraft.services.retry_strategy import CircuitOpenError, get_outbound_guard
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, Page
 
 # Chrome profile directory (persistent login)
 CHROME_PROFILE_DIR = os.path.expanduser("~/chrome-debug-profile")
@@ -218,6 +224,9 @@ class FamilySearchAutomation:
         """
         self._connection_status = ConnectionStatus.CONNECTING
         self._last_error_message = None
+
+        from playwright.async_api import async_playwright
+
         self.playwright = await async_playwright().start()
 
         # Try connecting to existing Chrome first (via CDP)
@@ -482,6 +491,22 @@ class FamilySearchAutomation:
             )
         return None
 
+    async def new_page(self) -> Page | None:
+        """
+        Open a new tab in the user's Chrome session.
+
+        Used for concurrent extraction, where each worker drives its own tab.
+        The caller closes the tab when done.
+
+        Returns:
+            Page instance or None if connection failed
+        """
+        if not self.browser and not await self.connect_to_chrome():
+            return None
+
+        # self.browser is a BrowserContext (see connect_to_chrome)
+        return await self.browser.new_page()
+
     async def open_new_tab(self, url: str) -> bool:
         """
         Open a new browser tab with the given URL using JavaScript.
@@ -537,21 +562,33 @@ class FamilySearchAutomation:
                 logger.info(f"Already on target page: {page.url}")
             else:
                 logger.info(f"Navigating to FamilySearch record: {url}")
+                # Shared with every other FamilySearch caller: paces page loads
+                # and stops navigating while FamilySearch keeps failing
+                guard = get_outbound_guard("familysearch")
+                await guard.acquire_async()
                 # Note: CDP connections can be slow/unreliable with navigation
                 # Use asyncio.wait_for to enforce timeout (page.goto timeout doesn't work with CDP)
                 try:
-                    await asyncio.wait_for(
+                    response = await asyncio.wait_for(
                         page.goto(url, wait_until="domcontentloaded"), timeout=10.0
                     )
-                except TimeoutError:
+                    if response is not None and response.status == 429:
+                        guard.record_rate_limited()
+                    else:
+                        guard.record_success()
+                except TimeoutError as e:
                     logger.warning("Navigation timed out after 10 seconds")
                     # Check if we're at least on FamilySearch
                     if "familysearch.org" not in page.url:
+                        guard.record_failure(e)
                         raise
                 except Exception as e:
                     logger.warning(f"Navigation failed: {e}")
                     if "familysearch.org" not in page.url:
+                        guard.record_failure(e)
                         raise
+                finally:
+                    guard.settle()
 
             # Wait for census record content to render (FamilySearch is a React SPA)
             # Wait for h1 (person name) to appear - indicates page has rendered
@@ -850,9 +887,14 @@ class FamilySearchAutomation:
 
             return transformed
 
-        except CDPConnectionError:
+        except CDPConnectionError as e:
             # Re-raise connection errors so callers can handle them appropriately
             # (e.g., stop batch processing instead of continuing to next item)
+            get_outbound_guard("familysearch").record_failure(e)
+            raise
+
+        except CircuitOpenError:
+            # FamilySearch is paused after repeated failures; let the batch stop
             raise
 
         except Exception as e:
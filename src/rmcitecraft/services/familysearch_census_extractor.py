@@ -19,14 +19,15 @@ Usage:
     await extractor.disconnect()
 """
 
+from __future__ import annotations
+
 import json
 import re
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import parse_qs, unquote, urlencode, urlparse
 
 from loguru import logger
-from playwright.async_api import Page
 
 from rmcitecraft.database.census_extraction_db import (
     CensusExtractionRepository,
@@ -36,10 +37,15 @@ from rmcitecraft.database.census_extraction_db import (
     RMTreeLink,
     get_census_repository,
 )
+from rmcitecraft.monitoring.spans import span, traced
 from rmcitecraft.services.familysearch_automation import (
     FamilySearchAutomation,
     get_automation_service,
 )
+from rmcitecraft.services.retry_strategy import get_outbound_guard
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
 
 # Forward declare RMPersonData to avoid circular imports
 # The actual class is in census_rmtree_matcher
@@ -870,6 +876,7 @@ class FamilySearchCensusExtractor:
         rm_persons_filter: list[Any] | None = None,
         is_primary_target: bool = True,
         line_number: int | None = None,
+        page: Page | None = None,
     ) -> ExtractionResult:
         """
         Extract census data from a FamilySearch ARK URL.
@@ -886,6 +893,8 @@ class FamilySearchCensusExtractor:
                 This avoids extracting people not in the RootsMagic database.
             is_primary_target: If True, marks this person as the primary target in census.db.
                 Set to False when extracting household members.
+            line_number: Census form line number (from SLS API extraction)
+            page: Tab to use (default: the user's FamilySearch tab)
 
         Returns:
             ExtractionResult with success status and extracted data
@@ -894,7 +903,7 @@ class FamilySearchCensusExtractor:
 
         try:
             # Get browser page
-            page = await self.automation.get_or_create_page()
+            page = page or await self.automation.get_or_create_page()
             if not page:
                 result.error_message = "Failed to get browser page"
                 return result
@@ -952,41 +961,51 @@ class FamilySearchCensusExtractor:
             if not self._batch_id:
                 self.start_batch("Single extraction")
 
-            # Insert or get page
-            page_data.batch_id = self._batch_id
-            existing_page = self.repository.get_page_by_location(
-                census_year,
-                page_data.state,
-                page_data.county,
-                page_data.enumeration_district,
-                page_data.page_number or page_data.sheet_number,
-            )
-            if existing_page:
-                page_id = existing_page.page_id
-            else:
-                page_id = self.repository.insert_page(page_data)
+            # Another tab may have saved this person while this one was loading
+            existing = self.repository.get_person_by_ark(ark_url)
+            if existing:
+                logger.info(f"Already extracted: {ark_url}")
+                result.success = True
+                result.person_id = existing.person_id
+                result.page_id = existing.page_id
+                return result
 
-            result.page_id = page_id
+            with span("db_write"):
+                # Insert or get page
+                page_data.batch_id = self._batch_id
+                existing_page = self.repository.get_page_by_location(
+                    census_year,
+                    page_data.state,
+                    page_data.county,
+                    page_data.enumeration_district,
+                    page_data.page_number or page_data.sheet_number,
+                )
+                if existing_page:
+                    page_id = existing_page.page_id
+                else:
+                    page_id = self.repository.insert_page(page_data)
 
-            # Insert person
-            person_data.page_id = page_id
-            person_data.is_target_person = is_primary_target
-            person_id = self.repository.insert_person(person_data)
-            result.person_id = person_id
+                result.page_id = page_id
 
-            # Insert extended fields
-            if extended_fields:
-                fs_labels = {k: raw_data.get(f"_label_{k}", "") for k in extended_fields}
-                self.repository.insert_person_fields_bulk(
-                    person_id, extended_fields, fs_labels
-                )
+                # Insert person
+                person_data.page_id = page_id
+                person_data.is_target_person = is_primary_target
+                person_id = self.repository.insert_person(person_data)
+                result.person_id = person_id
 
-            # Extract relationships from the data
-            relationships = self._extract_relationships(raw_data)
-            for rel_type, rel_name in relationships:
-                self.repository.insert_relationship(
-                    person_id, rel_type, related_person_name=rel_name
-                )
+                # Insert extended fields
+                if extended_fields:
+                    fs_labels = {k: raw_data.get(f"_label_{k}", "") for k in extended_fields}
+                    self.repository.insert_person_fields_bulk(
+                        person_id, extended_fields, fs_labels
+                    )
+
+                # Extract relationships from the data
+                relationships = self._extract_relationships(raw_data)
+                for rel_type, rel_name in relationships:
+                    self.repository.insert_relationship(
+                        person_id, rel_type, related_person_name=rel_name
+                    )
 
             # Create RootsMagic link if provided
             if rmtree_citation_id or rmtree_person_id:
@@ -1018,7 +1037,8 @@ class FamilySearchCensusExtractor:
                     match_confidence=match_confidence,
                     match_method=match_method,
                 )
-                self.repository.insert_rmtree_link(link)
+                with span("db_write"):
+                    self.repository.insert_rmtree_link(link)
 
             # Extract household members if requested
             if extract_household:
@@ -1315,6 +1335,7 @@ class FamilySearchCensusExtractor:
                             extract_household=False,  # Don't recurse
                             is_primary_target=True,  # Household members share the same Census event
                             line_number=member.get("line_number"),  # Census form line number from SLS API
+                            page=page,
                         )
                         if member_result.success:
                             # Update match_attempt with census_person_id (for validation workflow)
@@ -1379,31 +1400,42 @@ class FamilySearchCensusExtractor:
         - wait_until="domcontentloaded" for initial load
         - Then waits for specific content elements to appear
         """
+        guard = get_outbound_guard("familysearch")
+        await guard.acquire_async()
         try:
             # Use domcontentloaded for faster initial load
-            await page.goto(url, wait_until="domcontentloaded", timeout=15000)
+            with span("navigate"):
+                response = await page.goto(url, wait_until="domcontentloaded", timeout=15000)
 
             # Wait for FamilySearch content to appear (element-based waiting)
             # Person pages have h1 with the person's name
-            try:
-                await page.locator("h1").first.wait_for(state="visible", timeout=10000)
-            except Exception:
-                # Fallback: wait for any main content
-                await page.locator('[class*="personSummary"], [class*="recordDetails"]').first.wait_for(
-                    state="visible", timeout=5000
-                )
+            with span("wait"):
+                try:
+                    await page.locator("h1").first.wait_for(state="visible", timeout=10000)
+                except Exception:
+                    # Fallback: wait for any main content
+                    await page.locator(
+                        '[class*="personSummary"], [class*="recordDetails"]'
+                    ).first.wait_for(state="visible", timeout=5000)
 
             # Verify we arrived at the expected URL (handles redirects)
             if "familysearch.org" not in page.url:
                 raise ValueError(f"Unexpected redirect to: {page.url}")
 
             logger.debug(f"Successfully navigated to: {page.url}")
+            if response is not None and response.status == 429:
+                guard.record_rate_limited()
+            else:
+                guard.record_success()
 
         except Exception as e:
             logger.warning(f"Navigation issue: {e}, checking current state...")
             # Fallback: just wait for domcontentloaded
             if "familysearch.org" not in page.url:
+                guard.record_failure(e)
                 await page.goto(url, wait_until="domcontentloaded", timeout=15000)
+        finally:
+            guard.settle()
 
     def _is_valid_extraction_value(self, key: str, value: str) -> bool:
         """
@@ -1670,6 +1702,7 @@ class FamilySearchCensusExtractor:
 
         return result
 
+    @traced("extract")
     async def _extract_page_data(
         self, page: Page, target_ark: str | None = None, rmtree_person_id: int | None = None,
         census_year: int | None = None
@@ -2876,6 +2909,7 @@ class FamilySearchCensusExtractor:
 
         return ark_to_line
 
+    @traced("extract")
     async def _extract_household_index(
         self, page: Page, require_names: bool = False
     ) -> list[dict[str, Any]]:
@@ -2990,6 +3024,7 @@ class FamilySearchCensusExtractor:
             logger.warning(f"Failed to extract household index: {e}")
             return []
 
+    @traced("extract")
     async def _extract_family_from_detail_page(self, page: Page) -> list[dict[str, Any]]:
         """
         Extract family members from the person detail page's family table.
@@ -3221,6 +3256,7 @@ class FamilySearchCensusExtractor:
 
         return household
 
+    @traced("parse")
     def _parse_extracted_data(
         self, raw_data: dict[str, Any], census_year: int, ark_url: str
     ) -> tuple[CensusPerson, CensusPage, dict[str, Any]]:
@@ -42,14 +42,22 @@ FILE ORGANIZATION BY TYPE:
 - Other → ~/Genealogy/RootsMagic/Files/Pictures - Other
 """
 
+from __future__ import annotations
+
 import asyncio
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
-from playwright.async_api import Browser, Page, async_playwright
+
+from rmcitecraft.monitoring.spans import span, traced
+from rmcitecraft.services.retry_strategy import CircuitOpenError, get_outbound_guard
+from rmcitecraft.utils.media_inventory import get_media_inventory
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Page
 
 # Chrome DevTools Protocol endpoint
 CHROME_CDP_URL = "http://localhost:9222"
@@ -72,6 +80,8 @@ class FindAGraveAutomation:
         """
         try:
             logger.info("Connecting to Chrome browser via CDP...")
+            from playwright.async_api import async_playwright
+
             self.playwright = await async_playwright().start()
             self.browser = await self.playwright.chromium.connect_over_cdp(CHROME_CDP_URL)
             logger.info(f"Connected to Chrome - {len(self.browser.contexts)} context(s)")
@@ -140,19 +150,43 @@ class FindAGraveAutomation:
         logger.error("No browser pages available - cannot proceed")
         return None
 
-    async def extract_memorial_data(self, url: str, timeout: float = 30.0) -> dict[str, Any] | None:
+    async def new_page(self) -> Page | None:
+        """
+        Open a new tab in the user's Chrome session.
+
+        Used for concurrent extraction, where each worker drives its own tab.
+        The caller closes the tab when done.
+
+        Returns:
+            Page instance or None if connection failed
+        """
+        if not self.browser:
+            if not await self.connect_to_chrome():
+                return None
+
+        contexts = self.browser.contexts
+        if not contexts:
+            logger.error("No browser contexts available")
+            return None
+
+        return await contexts[0].new_page()
+
+    async def extract_memorial_data(
+        self, url: str, timeout: float = 30.0, page: Page | None = None
+    ) -> dict[str, Any] | None:
         """
         Navigate to Find a Grave memorial page and extract data.
 
         Args:
             url: Find a Grave memorial URL
             timeout: Page load timeout in seconds (default: 30.0)
+            page: Tab to use (default: the user's Find a Grave tab)
 
         Returns:
             Dictionary with memorial data or None if extraction failed
         """
         try:
-            page = await self.get_or_create_page()
+            page = page or await self.get_or_create_page()
             if not page:
                 return None
 
@@ -164,20 +198,36 @@ class FindAGraveAutomation:
                 logger.info(f"Already on target page: {page.url}")
             else:
                 logger.info(f"Navigating to Find a Grave memorial: {url}")
+                # Shared with every other Find a Grave caller: paces page loads
+                # and stops navigating while Find a Grave keeps failing
+                guard = get_outbound_guard("findagrave")
+                await guard.acquire_async()
                 try:
-                    await asyncio.wait_for(
-                        page.goto(url, wait_until="domcontentloaded"),
-                        timeout=timeout
-                    )
-                except asyncio.TimeoutError:
+                    with span("navigate"):
+                        response = await asyncio.wait_for(
+                            page.goto(url, wait_until="domcontentloaded"),
+                            timeout=timeout
+                        )
+                    if response is not None and response.status == 429:
+                        guard.record_rate_limited()
+                    else:
+                        guard.record_success()
+                except asyncio.TimeoutError as e:
                     logger.warning(f"Navigation timed out after {timeout} seconds")
                     if "findagrave.com" not in page.url:
+                        guard.record_failure(e)
                         raise
+                except Exception as e:
+                    guard.record_failure(e)
+                    raise
+                finally:
+                    guard.settle()
 
             # Wait for memorial content to render
             logger.info("Waiting for page content to render...")
             try:
-                await page.wait_for_selector('h1', timeout=15000)
+                with span("wait"):
+                    await page.wait_for_selector('h1', timeout=15000)
                 logger.info("Page content rendered")
             except Exception as e:
                 logger.warning(f"Timeout waiting for h1: {e}")
@@ -200,162 +250,163 @@ class FindAGraveAutomation:
 
             # Extract memorial data using JavaScript
             logger.info("Extracting memorial data...")
-            memorial_data = await page.evaluate("""
-                () => {
-                    const data = {};
-
-                    // Extract person name from h1
-                    const h1 = document.querySelector('h1');
-                    let personName = h1 ? h1.textContent.trim() : '';
-                    // Remove veteran symbol text (appears as " VVeteran")
-                    personName = personName.replace(/\s*VVeteran\s*/g, '');
-                    data.personName = personName;
-
-                    // Extract memorial ID from URL or page
-                    const memorialIdMatch = window.location.href.match(/memorial\\/(\\d+)/);
-                    data.memorialId = memorialIdMatch ? memorialIdMatch[1] : '';
-
-                    // Extract dates from h1 or meta data
-                    const h1Text = data.personName;
-                    const dateMatch = h1Text.match(/\\((\\d{4}).*?(\\d{4})\\)/);
-                    if (dateMatch) {
-                        data.birthYear = dateMatch[1];
-                        data.deathYear = dateMatch[2];
-                    }
+            with span("extract"):
+                memorial_data = await page.evaluate("""
+                    () => {
+                        const data = {};
+
+                        // Extract person name from h1
+                        const h1 = document.querySelector('h1');
+                        let personName = h1 ? h1.textContent.trim() : '';
+                        // Remove veteran symbol text (appears as " VVeteran")
+                        personName = personName.replace(/\s*VVeteran\s*/g, '');
+                        data.personName = personName;
+
+                        // Extract memorial ID from URL or page
+                        const memorialIdMatch = window.location.href.match(/memorial\\/(\\d+)/);
+                        data.memorialId = memorialIdMatch ? memorialIdMatch[1] : '';
+
+                        // Extract dates from h1 or meta data
+                        const h1Text = data.personName;
+                        const dateMatch = h1Text.match(/\\((\\d{4}).*?(\\d{4})\\)/);
+                        if (dateMatch) {
+                            data.birthYear = dateMatch[1];
+                            data.deathYear = dateMatch[2];
+                        }
 
-                    // Extract cemetery information directly (not from table rows)
-                    // Cemetery link exists on page but not in structured table format
-                    const cemeteryLink = document.querySelector('a[href*="/cemetery/"]');
-                    if (cemeteryLink) {
-                        data.cemeteryName = cemeteryLink.textContent.trim();
-                        console.log(`Cemetery name: ${data.cemeteryName}`);
-                    } else {
-                        console.log('No cemetery link found');
-                    }
+                        // Extract cemetery information directly (not from table rows)
+                        // Cemetery link exists on page but not in structured table format
+                        const cemeteryLink = document.querySelector('a[href*="/cemetery/"]');
+                        if (cemeteryLink) {
+                            data.cemeteryName = cemeteryLink.textContent.trim();
+                            console.log(`Cemetery name: ${data.cemeteryName}`);
+                        } else {
+                            console.log('No cemetery link found');
+                        }
 
-                    // Extract location (city, county, state, country)
-                    const cityElem = document.querySelector('#cemeteryCityName, [itemprop="addressLocality"]');
-                    const countyElem = document.querySelector('#cemeteryCountyName');
-                    const stateElem = document.querySelector('#cemeteryStateName, [itemprop="addressRegion"]');
-                    const countryElem = document.querySelector('#cemeteryCountryName');
+                        // Extract location (city, county, state, country)
+                        const cityElem = document.querySelector('#cemeteryCityName, [itemprop="addressLocality"]');
+                        const countyElem = document.querySelector('#cemeteryCountyName');
+                        const stateElem = document.querySelector('#cemeteryStateName, [itemprop="addressRegion"]');
+                        const countryElem = document.querySelector('#cemeteryCountryName');
 
-                    data.cemeteryCity = cityElem ? cityElem.textContent.trim() : '';
-                    data.cemeteryCounty = countyElem ? countyElem.textContent.trim() : '';
-                    data.cemeteryState = stateElem ? stateElem.textContent.trim() : '';
-                    data.cemeteryCountry = countryElem ? countryElem.textContent.trim() : '';
+                        data.cemeteryCity = cityElem ? cityElem.textContent.trim() : '';
+                        data.cemeteryCounty = countyElem ? countyElem.textContent.trim() : '';
+                        data.cemeteryState = stateElem ? stateElem.textContent.trim() : '';
+                        data.cemeteryCountry = countryElem ? countryElem.textContent.trim() : '';
 
-                    console.log(`Cemetery location: ${data.cemeteryCity}, ${data.cemeteryCounty}, ${data.cemeteryState}, ${data.cemeteryCountry}`);
+                        console.log(`Cemetery location: ${data.cemeteryCity}, ${data.cemeteryCounty}, ${data.cemeteryState}, ${data.cemeteryCountry}`);
 
 
-                    // Extract citation text if available
-                    const citationDiv = document.querySelector('#citationInfo');
-                    data.citationText = citationDiv ? citationDiv.textContent.trim() : '';
+                        // Extract citation text if available
+                        const citationDiv = document.querySelector('#citationInfo');
+                        data.citationText = citationDiv ? citationDiv.textContent.trim() : '';
 
-                    // Extract creator information
-                    // Try simple "Created by:" first, then fall back to "Originally Created by:"
-                    const createdBySimple = document.querySelector('#createdBy');
-                    const createdByOriginal = document.querySelector('#originallyCreatedBy');
+                        // Extract creator information
+                        // Try simple "Created by:" first, then fall back to "Originally Created by:"
+                        const createdBySimple = document.querySelector('#createdBy');
+                        const createdByOriginal = document.querySelector('#originallyCreatedBy');
 
-                    if (createdBySimple && createdBySimple.value) {
-                        data.createdBy = createdBySimple.value;
-                    } else if (createdByOriginal && createdByOriginal.value) {
-                        data.createdBy = createdByOriginal.value;
-                    } else {
-                        data.createdBy = '';
-                    }
+                        if (createdBySimple && createdBySimple.value) {
+                            data.createdBy = createdBySimple.value;
+                        } else if (createdByOriginal && createdByOriginal.value) {
+                            data.createdBy = createdByOriginal.value;
+                        } else {
+                            data.createdBy = '';
+                        }
 
-                    // Extract maintainer information (maintained by)
-                    const maintainedInput = document.querySelector('#maintainedBy');
-                    data.maintainedBy = maintainedInput ? maintainedInput.value : '';
+                        // Extract maintainer information (maintained by)
+                        const maintainedInput = document.querySelector('#maintainedBy');
+                        data.maintainedBy = maintainedInput ? maintainedInput.value : '';
 
-                    // Extract memorial text (biography, inscription, veteran info, etc.)
-                    // Find a Grave stores this in #partBio or #fullBio elements
+                        // Extract memorial text (biography, inscription, veteran info, etc.)
+                        // Find a Grave stores this in #partBio or #fullBio elements
 
-                    // Helper function to extract text while preserving paragraph breaks
-                    const extractTextWithLineBreaks = (element) => {
-                        if (!element) return '';
+                        // Helper function to extract text while preserving paragraph breaks
+                        const extractTextWithLineBreaks = (element) => {
+                            if (!element) return '';
 
-                        // Get innerHTML and convert block elements to text with newlines
-                        let html = element.innerHTML;
+                            // Get innerHTML and convert block elements to text with newlines
+                            let html = element.innerHTML;
 
-                        // Replace closing tags of block elements with blank line separator
-                        // Using newline + space + newline to ensure RootsMagic shows blank line
-                        html = html.replace(/<\\/(p|div|h1|h2|h3|h4|h5|h6)>/gi, '\\n \\n');
+                            // Replace closing tags of block elements with blank line separator
+                            // Using newline + space + newline to ensure RootsMagic shows blank line
+                            html = html.replace(/<\\/(p|div|h1|h2|h3|h4|h5|h6)>/gi, '\\n \\n');
 
-                        // Replace <br> tags with single newline
-                        html = html.replace(/<br\\s*\/?>/gi, '\\n');
+                            // Replace <br> tags with single newline
+                            html = html.replace(/<br\\s*\/?>/gi, '\\n');
 
-                        // Replace list items with newline
-                        html = html.replace(/<\/li>/gi, '\\n');
+                            // Replace list items with newline
+                            html = html.replace(/<\/li>/gi, '\\n');
 
-                        // Remove all remaining HTML tags
-                        html = html.replace(/<[^>]+>/g, '');
+                            // Remove all remaining HTML tags
+                            html = html.replace(/<[^>]+>/g, '');
 
-                        // Decode HTML entities
-                        const textarea = document.createElement('textarea');
-                        textarea.innerHTML = html;
-                        let text = textarea.value;
+                            // Decode HTML entities
+                            const textarea = document.createElement('textarea');
+                            textarea.innerHTML = html;
+                            let text = textarea.value;
 
-                        // Normalize whitespace: collapse multiple spaces/tabs to single space
-                        text = text.replace(/[ \\t]+/g, ' ');
+                            // Normalize whitespace: collapse multiple spaces/tabs to single space
+                            text = text.replace(/[ \\t]+/g, ' ');
 
-                        // Remove leading/trailing spaces from each line, BUT preserve lines with just a space (blank line markers)
-                        const lines = text.split('\\n');
-                        text = lines.map(line => {
-                            // Keep single-space lines as-is (our blank line markers)
-                            if (line === ' ') return line;
-                            // Trim all other lines
-                            return line.trim();
-                        }).join('\\n');
+                            // Remove leading/trailing spaces from each line, BUT preserve lines with just a space (blank line markers)
+                            const lines = text.split('\\n');
+                            text = lines.map(line => {
+                                // Keep single-space lines as-is (our blank line markers)
+                                if (line === ' ') return line;
+                                // Trim all other lines
+                                return line.trim();
+                            }).join('\\n');
 
-                        // Remove excessive consecutive newlines (3+ becomes 2)
-                        text = text.replace(/\\n{3,}/g, '\\n\\n');
+                            // Remove excessive consecutive newlines (3+ becomes 2)
+                            text = text.replace(/\\n{3,}/g, '\\n\\n');
 
-                        return text.trim();
-                    };
+                            return text.trim();
+                        };
 
-                    let memorialText = '';
+                        let memorialText = '';
 
-                    // Primary: Try #fullBio first (contains complete text without truncation)
-                    const fullBio = document.querySelector('#fullBio');
-                    if (fullBio) {
-                        memorialText = extractTextWithLineBreaks(fullBio);
-                    }
+                        // Primary: Try #fullBio first (contains complete text without truncation)
+                        const fullBio = document.querySelector('#fullBio');
+                        if (fullBio) {
+                            memorialText = extractTextWithLineBreaks(fullBio);
+                        }
 
-                    // Fallback 1: Extract from #partBio (visible biography, may be truncated)
-                    if (!memorialText) {
-                        const partBio = document.querySelector('#partBio');
-                        if (partBio) {
-                            memorialText = extractTextWithLineBreaks(partBio);
+                        // Fallback 1: Extract from #partBio (visible biography, may be truncated)
+                        if (!memorialText) {
+                            const partBio = document.querySelector('#partBio');
+                            if (partBio) {
+                                memorialText = extractTextWithLineBreaks(partBio);
+                            }
                         }
-                    }
 
-                    // Fallback 2: .bio-min class
-                    if (!memorialText) {
-                        const bioMin = document.querySelector('.bio-min');
-                        if (bioMin) {
-                            memorialText = extractTextWithLineBreaks(bioMin);
+                        // Fallback 2: .bio-min class
+                        if (!memorialText) {
+                            const bioMin = document.querySelector('.bio-min');
+                            if (bioMin) {
+                                memorialText = extractTextWithLineBreaks(bioMin);
+                            }
                         }
-                    }
 
-                    data.memorialText = memorialText;
-
-                    // Extract photo information
-                    data.photos = [];
-                    const photoElements = document.querySelectorAll('[data-photo-id]');
-                    for (const photoElem of photoElements) {
-                        const photoId = photoElem.getAttribute('data-photo-id');
-                        if (photoId) {
-                            data.photos.push({
-                                photoId: photoId,
-                                url: `https://www.findagrave.com/memorial/${data.memorialId}/photo#view-photo=${photoId}`
-                            });
+                        data.memorialText = memorialText;
+
+                        // Extract photo information
+                        data.photos = [];
+                        const photoElements = document.querySelectorAll('[data-photo-id]');
+                        for (const photoElem of photoElements) {
+                            const photoId = photoElem.getAttribute('data-photo-id');
+                            if (photoId) {
+                                data.photos.push({
+                                    photoId: photoId,
+                                    url: `https://www.findagrave.com/memorial/${data.memorialId}/photo#view-photo=${photoId}`
+                                });
+                            }
                         }
-                    }
 
-                    return data;
-                }
-            """)
+                        return data;
+                    }
+                """)
 
             # Deduplicate photos by photoId
             if memorial_data.get('photos'):
@@ -402,10 +453,15 @@ class FindAGraveAutomation:
 
             return memorial_data
 
+        except CircuitOpenError:
+            # Find a Grave is paused after repeated failures; don't retry this item now
+            raise
+
         except Exception as e:
             logger.error(f"Failed to extract memorial data: {e}", exc_info=True)
             return None
 
+    @traced("extract")
     async def _extract_photo_metadata(self, page: Page, memorial_data: dict) -> list[dict]:
         """
         Extract detailed metadata for each photo from rendered HTML.
@@ -568,6 +624,7 @@ class FindAGraveAutomation:
 
         return photos
 
+    @traced("extract")
     async def _extract_captions_from_json(self, page: Page, photos: list[dict]) -> list[dict]:
         """
         Extract photo captions from Find a Grave's JSON data structures (Phase 2).
@@ -666,6 +723,7 @@ class FindAGraveAutomation:
             # Return photos unchanged - Phase 1 metadata is still valid
             return photos
 
+    @traced("extract")
     async def _extract_source_comment(self, page: Page, memorial_data: dict) -> tuple[str, dict]:
         """
         Extract data for Source Comment field.
@@ -982,6 +1040,7 @@ class FindAGraveAutomation:
         # The actual maiden name detection happens in browser via italics
         return ''
 
+    @traced("image_download")
     async def download_photo(self, photo_url: str, memorial_id: str, download_path: Path) -> bool:
         """
         Download a photo from Find a Grave using browser context.
@@ -1019,6 +1078,7 @@ class FindAGraveAutomation:
             download_path.parent.mkdir(parents=True, exist_ok=True)
             with open(download_path, 'wb') as f:
                 f.write(image_data)
+            get_media_inventory().invalidate(download_path.parent)
 
             logger.info(f"Successfully downloaded photo: {download_path} ({len(image_data)} bytes)")
             return True
@@ -0,0 +1,228 @@
+"""
+Concurrent Find a Grave memorial extraction.
+
+Batch processing used to load one memorial at a time in the user's Find a
+Grave tab, so most of a batch was spent waiting on page loads.
+MemorialExtractionPipeline spreads the loads over several tabs of the shared
+CDP browser:
+
+- a queue of batch items feeds one extraction worker per tab
+- each worker loads and extracts the next memorial in its own tab and hands
+  the result on
+- a single writer takes results in completion order and does everything that
+  touches RootsMagic, so database writes stay serialized
+
+Page loads from every tab go through the "findagrave" outbound guard (see
+retry_strategy.get_outbound_guard), so findagrave_requests_per_minute caps the
+global navigation rate however many tabs are open. With one tab the pipeline
+uses the user's Find a Grave tab, as sequential processing did.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from loguru import logger
+
+from rmcitecraft.services.retry_strategy import CircuitOpenError
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+    from rmcitecraft.services.findagrave_automation import FindAGraveAutomation
+    from rmcitecraft.services.page_health_monitor import PageHealthMonitor
+
+T = TypeVar("T")
+
+
+@dataclass
+class ExtractionResult(Generic[T]):
+    """Outcome of extracting one batch item."""
+
+    item: T
+    data: Any = None
+    error: Exception | None = None
+    elapsed_seconds: float = 0.0
+
+
+@dataclass
+class PipelineStats:
+    """Counts for one pipeline run."""
+
+    tabs: int = 1
+    extracted: int = 0
+    failed: int = 0
+    written: int = 0
+    not_started: int = 0
+    elapsed_seconds: float = 0.0
+    stop_reason: str | None = None
+    write_errors: list[str] = field(default_factory=list)
+
+
+class MemorialExtractionPipeline:
+    """Extract batch items in several browser tabs and write them one at a time."""
+
+    def __init__(
+        self,
+        automation: FindAGraveAutomation,
+        tabs: int = 1,
+        health_monitor: PageHealthMonitor | None = None,
+    ):
+        """Initialize pipeline.
+
+        Args:
+            automation: Find a Grave automation service (shared CDP browser)
+            tabs: Number of tabs extracting concurrently
+            health_monitor: Check each tab before every item and replace
+                crashed tabs (no checks if None)
+        """
+        self.automation = automation
+        self.tabs = max(1, tabs)
+        self.health_monitor = health_monitor
+
+    async def run(
+        self,
+        items: Iterable[T],
+        extract: Callable[[T, Page], Awaitable[Any]],
+        write: Callable[[ExtractionResult[T]], Awaitable[None]],
+    ) -> PipelineStats:
+        """Extract every item and pass each result to the writer.
+
+        A CircuitOpenError from extract (Find a Grave keeps failing) stops
+        the run: workers finish their current item and take no new ones.
+
+        Args:
+            items: Batch items, extracted in this order
+            extract: Coroutine(item, page) returning the extracted data; may
+                raise, in which case the result carries the error
+            write: Coroutine(result) called for every extracted or failed
+                item, never concurrently with itself
+
+        Returns:
+            PipelineStats for the run
+        """
+        stats = PipelineStats(tabs=self.tabs)
+        start = time.perf_counter()
+
+        queue: asyncio.Queue[T] = asyncio.Queue()
+        for item in items:
+            queue.put_nowait(item)
+        # Bounded so extraction runs at most a few items ahead of the writer
+        results: asyncio.Queue[ExtractionResult[T] | None] = asyncio.Queue(maxsize=self.tabs)
+        stopped = asyncio.Event()
+
+        pages, owned = await self._open_pages()
+        if not pages:
+            stats.stop_reason = "No browser page available"
+            stats.not_started = queue.qsize()
+            return stats
+
+        logger.info(f"Extracting {queue.qsize()} memorials in {len(pages)} tab(s)")
+
+        async def worker(slot: int) -> None:
+            try:
+                while not stopped.is_set():
+                    try:
+                        item = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+
+                    item_start = time.perf_counter()
+                    result = ExtractionResult(item)
+                    try:
+                        page = await self._healthy_page(pages, owned, slot)
+                        result.data = await extract(item, page)
+                        stats.extracted += 1
+                    except CircuitOpenError as e:
+                        logger.error(f"Stopping extraction: {e}")
+                        stats.stop_reason = str(e)
+                        stopped.set()
+                        result.error = e
+                        stats.failed += 1
+                    except Exception as e:
+                        result.error = e
+                        stats.failed += 1
+                    result.elapsed_seconds = time.perf_counter() - item_start
+                    await results.put(result)
+            finally:
+                await results.put(None)
+
+        async def writer() -> None:
+            remaining = len(pages)
+            while remaining:
+                result = await results.get()
+                if result is None:
+                    remaining -= 1
+                    continue
+                try:
+                    await write(result)
+                    stats.written += 1
+                except Exception as e:
+                    logger.error(f"Failed to write extraction result: {e}", exc_info=True)
+                    stats.write_errors.append(str(e))
+
+        try:
+            await asyncio.gather(writer(), *(worker(slot) for slot in range(len(pages))))
+        finally:
+            for page, is_owned in zip(pages, owned, strict=True):
+                if is_owned:
+                    await self._close_page(page)
+
+        stats.not_started = queue.qsize()
+        stats.elapsed_seconds = time.perf_counter() - start
+        logger.info(
+            f"Extraction pipeline finished in {stats.elapsed_seconds:.1f}s: "
+            f"{stats.extracted} extracted, {stats.failed} failed, "
+            f"{stats.not_started} not started ({len(pages)} tab(s))"
+        )
+        return stats
+
+    async def _open_pages(self) -> tuple[list[Page], list[bool]]:
+        """Tabs for the workers and whether the pipeline opened (and closes) each."""
+        if self.tabs == 1:
+            page = await self.automation.get_or_create_page()
+            return ([page], [False]) if page else ([], [])
+
+        pages = []
+        for _ in range(self.tabs):
+            try:
+                page = await self.automation.new_page()
+            except Exception as e:
+                logger.warning(f"Could not open extraction tab: {e}")
+                page = None
+            if page is None:
+                break
+            pages.append(page)
+        if len(pages) < self.tabs:
+            logger.warning(f"Opened {len(pages)} of {self.tabs} extraction tabs")
+        return pages, [True] * len(pages)
+
+    async def _healthy_page(self, pages: list[Page], owned: list[bool], slot: int) -> Page:
+        """The worker's tab, replaced by a new one if it has crashed."""
+        page = pages[slot]
+        if self.health_monitor is None:
+            return page
+
+        health = await self.health_monitor.check_page_health(page)
+        if health.is_healthy:
+            return page
+
+        logger.warning(f"Extraction tab {slot + 1} unhealthy ({health.error}), replacing it")
+        replacement = await self.automation.new_page()
+        if replacement is None:
+            raise RuntimeError(f"Failed to recover page: {health.error}")
+        if owned[slot]:
+            await self._close_page(page)
+        pages[slot], owned[slot] = replacement, True
+        return replacement
+
+    @staticmethod
+    async def _close_page(page: Page) -> None:
+        try:
+            await page.close()
+        except Exception as e:
+            logger.debug(f"Error closing extraction tab: {e}")
@@ -0,0 +1,393 @@
+"""
+In-memory family graph of a RootsMagic tree for census matching.
+
+The census matcher scores household position and validates family structure
+for every citation, but a citation's witness list only says which role each
+person was given. Who is whose spouse or child, and in what order children
+were born, lives in FamilyTable and ChildTable. HouseholdGraph loads those
+once per batch (from the local cache, see rmcitecraft.database.rmtree_cache)
+into compact integer arrays:
+
+- PersonID -> index and FamilyID -> index maps
+- per person: birth year and birth order among siblings
+- per family: father and mother indexes
+- children per family and families per spouse or child as offset/target
+  adjacency arrays, children sorted oldest first
+
+Questions about one household ("expected enumeration order", "is this a
+coherent family") then cost O(household), with no queries per citation.
+"""
+
+import time
+from array import array
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from rmcitecraft.database.rmtree_cache import RootsMagicCache
+
+if TYPE_CHECKING:
+    import numpy as np
+
+NO_INDEX = -1
+UNKNOWN_YEAR = 9999
+
+# Enumeration order of each relation to the head: head, spouse, children,
+# other relatives, then everyone else
+ENUMERATION_RANK = {
+    "head": 0,
+    "spouse": 1,
+    "child": 2,
+    "stepchild": 2,
+    "parent": 3,
+    "sibling": 3,
+    "grandchild": 3,
+    "relative": 3,
+}
+_OTHER_RANK = 4
+_CHILD_KINDS = frozenset({"child", "stepchild"})
+
+
+def _index_lookup(ids: "np.ndarray") -> Callable[["np.ndarray"], "np.ndarray"]:
+    """Vectorized id -> row index lookup (NO_INDEX for unknown ids)."""
+    import numpy as np
+
+    order = np.argsort(ids, kind="stable")
+    sorted_ids = ids[order]
+
+    def lookup(values: "np.ndarray") -> "np.ndarray":
+        if not len(sorted_ids):
+            return np.full(len(values), NO_INDEX, dtype=np.int32)
+        positions = np.searchsorted(sorted_ids, values).clip(max=len(sorted_ids) - 1)
+        found = sorted_ids[positions] == values
+        return np.where(found, order[positions], NO_INDEX).astype(np.int32)
+
+    return lookup
+
+
+def _compact(values: "np.ndarray", typecode: str = "i") -> array:
+    """Copy a NumPy vector into an array.array (fast scalar reads, Python ints)."""
+    import numpy as np
+
+    return array(typecode, values.astype(np.dtype(typecode)).tobytes())
+
+
+def _adjacency(sources: "np.ndarray", targets: "np.ndarray", size: int) -> tuple[array, array]:
+    """Offsets and targets for (source, target) pairs sorted by source.
+
+    Targets of source i are targets[offsets[i]:offsets[i + 1]].
+    """
+    import numpy as np
+
+    offsets = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=size), out=offsets[1:])
+    return _compact(offsets), _compact(targets)
+
+
+class HouseholdGraph:
+    """Families, children and spouse links of a tree as integer arrays."""
+
+    def __init__(
+        self,
+        persons: Iterable[tuple[int, int | None]],
+        families: Iterable[tuple[int, int, int]],
+        children: Iterable[tuple[int, int, int]],
+    ):
+        """Build the graph.
+
+        Args:
+            persons: (PersonID, BirthYear) rows; BirthYear None or 0 if unknown
+            families: (FamilyID, FatherID, MotherID) rows; 0 for a missing parent
+            children: (FamilyID, ChildID, ChildOrder) rows
+        """
+        # NumPy builds the arrays; it is imported here so loading the matcher
+        # stays cheap
+        import numpy as np
+
+        person_rows = np.array(
+            [(person_id, birth_year or 0) for person_id, birth_year in persons], dtype=np.int64
+        ).reshape(-1, 2)
+        family_rows = np.array(list(families), dtype=np.int64).reshape(-1, 3)
+        child_rows = np.array(
+            [(family_id, child_id, order or 0) for family_id, child_id, order in children],
+            dtype=np.int64,
+        ).reshape(-1, 3)
+
+        person_ids = person_rows[:, 0]
+        birth_years = person_rows[:, 1]
+        person_count = len(person_ids)
+        self._person_index: dict[int, int] = dict(
+            zip(person_ids.tolist(), range(person_count), strict=True)
+        )
+        family_ids = family_rows[:, 0]
+        self._family_index: dict[int, int] = dict(
+            zip(family_ids.tolist(), range(len(family_ids)), strict=True)
+        )
+        family_count = len(family_ids)
+
+        to_person = _index_lookup(person_ids)
+        to_family = _index_lookup(family_ids)
+        fathers = to_person(family_rows[:, 1])
+        mothers = to_person(family_rows[:, 2])
+
+        # Children grouped by family, oldest first, then ChildOrder
+        child_family = to_family(child_rows[:, 0])
+        child = to_person(child_rows[:, 1])
+        known = (child_family != NO_INDEX) & (child != NO_INDEX)
+        child_family, child, child_order = child_family[known], child[known], child_rows[known, 2]
+        birth = birth_years[child]
+        birth[birth == 0] = UNKNOWN_YEAR
+        by_family = np.lexsort((child, child_order, birth, child_family))
+        child_family, child, child_order = (
+            child_family[by_family], child[by_family], child_order[by_family]
+        )
+        self._children_offsets, self._children = _adjacency(child_family, child, family_count)
+
+        # Birth order within the first family a person is a child of
+        child_orders = np.zeros(person_count, dtype=np.int64)
+        firsts = np.unique(child, return_index=True)[1]
+        child_orders[child[firsts]] = child_order[firsts]
+
+        by_child = np.lexsort((child_family, child))
+        self._parent_family_offsets, self._parent_families = _adjacency(
+            child[by_child], child_family[by_child], person_count
+        )
+
+        spouse = np.concatenate((fathers, mothers))
+        spouse_family = np.concatenate((np.arange(family_count), np.arange(family_count)))
+        linked = spouse != NO_INDEX
+        spouse, spouse_family = spouse[linked], spouse_family[linked]
+        by_spouse = np.lexsort((spouse_family, spouse))
+        self._spouse_family_offsets, self._spouse_families = _adjacency(
+            spouse[by_spouse], spouse_family[by_spouse], person_count
+        )
+
+        self._person_ids = _compact(person_ids)
+        self._birth_year = _compact(birth_years, "h")
+        self._child_order = _compact(child_orders, "h")
+        self._father = _compact(fathers)
+        self._mother = _compact(mothers)
+
+    def __len__(self) -> int:
+        return len(self._person_ids)
+
+    def __contains__(self, person_id: object) -> bool:
+        return person_id in self._person_index
+
+    @property
+    def family_count(self) -> int:
+        return len(self._father)
+
+    # -------------------------------------------------------------------------
+    # Index-level adjacency
+    # -------------------------------------------------------------------------
+
+    def _spouse_families_of(self, person: int) -> array:
+        return self._spouse_families[
+            self._spouse_family_offsets[person]:self._spouse_family_offsets[person + 1]
+        ]
+
+    def _parent_families_of(self, person: int) -> array:
+        return self._parent_families[
+            self._parent_family_offsets[person]:self._parent_family_offsets[person + 1]
+        ]
+
+    def _children_of(self, family: int) -> array:
+        return self._children[self._children_offsets[family]:self._children_offsets[family + 1]]
+
+    def _partner(self, family: int, person: int) -> int:
+        father = self._father[family]
+        return self._mother[family] if father == person else father
+
+    # -------------------------------------------------------------------------
+    # Person-level queries
+    # -------------------------------------------------------------------------
+
+    def birth_year(self, person_id: int) -> int | None:
+        """Birth year, or None if unknown or not in the tree."""
+        person = self._person_index.get(person_id, NO_INDEX)
+        if person == NO_INDEX:
+            return None
+        return self._birth_year[person] or None
+
+    def spouses(self, person_id: int) -> list[int]:
+        """PersonIDs of everyone the person has a family with."""
+        person = self._person_index.get(person_id, NO_INDEX)
+        if person == NO_INDEX:
+            return []
+        return [
+            self._person_ids[partner]
+            for family in self._spouse_families_of(person)
+            if (partner := self._partner(family, person)) != NO_INDEX
+        ]
+
+    def children(self, person_id: int) -> list[int]:
+        """PersonIDs of the person's children, oldest first within each family."""
+        person = self._person_index.get(person_id, NO_INDEX)
+        if person == NO_INDEX:
+            return []
+        return [
+            self._person_ids[child]
+            for family in self._spouse_families_of(person)
+            for child in self._children_of(family)
+        ]
+
+    def relation(self, head_id: int, person_id: int) -> str | None:
+        """How a person is related to a household head.
+
+        Returns:
+            "head", "spouse", "child", "stepchild", "parent", "sibling" or
+            "grandchild", or None if neither or no relation is recorded
+        """
+        head = self._person_index.get(head_id, NO_INDEX)
+        person = self._person_index.get(person_id, NO_INDEX)
+        if head == NO_INDEX or person == NO_INDEX:
+            return None
+        if head == person:
+            return "head"
+
+        head_families = self._spouse_families_of(head)
+        for family in head_families:
+            if self._partner(family, head) == person:
+                return "spouse"
+        for family in head_families:
+            if person in self._children_of(family):
+                return "child"
+        for family in head_families:
+            partner = self._partner(family, head)
+            if partner == NO_INDEX:
+                continue
+            for partner_family in self._spouse_families_of(partner):
+                if partner_family not in head_families and person in self._children_of(
+                    partner_family
+                ):
+                    return "stepchild"
+
+        head_parents = set()
+        for family in self._parent_families_of(head):
+            if person in (self._father[family], self._mother[family]):
+                return "parent"
+            head_parents.update((self._father[family], self._mother[family]))
+        head_parents.discard(NO_INDEX)
+        for family in self._parent_families_of(person):
+            if self._father[family] in head_parents or self._mother[family] in head_parents:
+                return "sibling"
+
+        for family in head_families:
+            for child in self._children_of(family):
+                for child_family in self._spouse_families_of(child):
+                    if person in self._children_of(child_family):
+                        return "grandchild"
+        return None
+
+    # -------------------------------------------------------------------------
+    # Household queries
+    # -------------------------------------------------------------------------
+
+    def expected_order(
+        self,
+        head_id: int,
+        person_ids: Iterable[int],
+        relations: Mapping[int, str] | None = None,
+    ) -> list[int]:
+        """Expected census enumeration order of a household.
+
+        Head, spouse, children oldest first (birth order breaking ties),
+        other relatives, then everyone else in the given order.
+
+        Args:
+            head_id: PersonID of the head of household
+            person_ids: PersonIDs in the household
+            relations: Relation to the head ("spouse", "child", "relative",
+                ...) for people the tree has no family link for, e.g. from
+                their witness role
+
+        Returns:
+            person_ids in expected order
+        """
+        relations = relations or {}
+        keys = []
+        for position, person_id in enumerate(person_ids):
+            kind = self.relation(head_id, person_id) or relations.get(person_id)
+            if person_id == head_id:
+                kind = "head"
+            rank = ENUMERATION_RANK.get(kind, _OTHER_RANK)
+            birth_key = (0, 0)
+            if rank == ENUMERATION_RANK["child"]:
+                person = self._person_index.get(person_id, NO_INDEX)
+                if person != NO_INDEX:
+                    birth_key = (self._birth_year[person] or UNKNOWN_YEAR,
+                                 self._child_order[person])
+                else:
+                    birth_key = (UNKNOWN_YEAR, 0)
+            keys.append((rank, *birth_key, position, person_id))
+        return [key[-1] for key in sorted(keys)]
+
+    def check_household(
+        self, head_id: int, claimed: Mapping[int, str]
+    ) -> list[tuple[int, str, str | None]]:
+        """Compare claimed relations to the head with the tree's families.
+
+        Child and stepchild are treated as compatible (census takers rarely
+        distinguish them). People the tree does not know are skipped.
+
+        Args:
+            head_id: PersonID of the head of household
+            claimed: PersonID -> claimed relation ("spouse", "child",
+                "stepchild", "parent", "sibling" or "grandchild")
+
+        Returns:
+            (PersonID, claimed relation, relation in the tree or None) for
+            each disagreement
+        """
+        if head_id not in self._person_index:
+            return []
+        mismatches = []
+        for person_id, kind in claimed.items():
+            if person_id == head_id or person_id not in self._person_index:
+                continue
+            actual = self.relation(head_id, person_id)
+            if actual == kind or (actual in _CHILD_KINDS and kind in _CHILD_KINDS):
+                continue
+            mismatches.append((person_id, kind, actual))
+        return mismatches
+
+    def is_coherent_family(self, head_id: int, claimed: Mapping[int, str]) -> bool:
+        """True if every claimed relation agrees with the tree (see check_household)."""
+        return not self.check_household(head_id, claimed)
+
+
+def load_household_graph(rmtree_path: str | Path) -> HouseholdGraph:
+    """Load the household graph of a tree from its local cache.
+
+    Args:
+        rmtree_path: RootsMagic .rmtree file
+
+    Returns:
+        HouseholdGraph of every person and family in the tree
+    """
+    start = time.perf_counter()
+    with RootsMagicCache(rmtree_path).connect() as conn:
+        conn.row_factory = None
+        # First Birth event per person, as the matcher reads it
+        births = dict(reversed(conn.execute("""
+            SELECT OwnerID, CAST(substr(Date, 4, 4) AS INTEGER)
+            FROM event
+            WHERE EventType = 1 AND OwnerType = 0
+            ORDER BY EventID
+        """).fetchall()))
+        persons = [
+            (person_id, births.get(person_id))
+            for (person_id,) in conn.execute("SELECT PersonID FROM person")
+        ]
+        families = conn.execute("SELECT FamilyID, FatherID, MotherID FROM family").fetchall()
+        children = conn.execute("SELECT FamilyID, ChildID, ChildOrder FROM child").fetchall()
+
+    graph = HouseholdGraph(persons, families, children)
+    logger.info(
+        f"Loaded household graph: {len(graph)} persons, {graph.family_count} families "
+        f"in {(time.perf_counter() - start) * 1000:.0f} ms"
+    )
+    return graph
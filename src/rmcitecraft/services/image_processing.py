@@ -17,11 +17,13 @@ from pathlib import Path
 from loguru import logger
 
 from rmcitecraft.database.image_repository import ImageRepository
+from rmcitecraft.database.media_hash_index import get_media_hash_index
 from rmcitecraft.models.citation import ParsedCitation
 from rmcitecraft.models.image import ImageMetadata, ImageStatus
 from rmcitecraft.parsers.citation_formatter import CitationFormatter
 from rmcitecraft.services.directory_mapper import DirectoryMapper
 from rmcitecraft.services.filename_generator import FilenameGenerator
+from rmcitecraft.utils.media_inventory import get_media_inventory
 
 
 class ImageProcessingService:
@@ -60,6 +62,12 @@ class ImageProcessingService:
         # Active image tracking (in-memory)
         self._active_images: dict[str, ImageMetadata] = {}
 
+        # Build the media hash index off the ingest path
+        try:
+            get_media_hash_index(self.dir_mapper.media_root).start_background_update()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Cannot open media hash index: {e}")
+
         logger.info("ImageProcessingService initialized")
 
     def _get_db_connection(self) -> sqlite3.Connection:
@@ -228,6 +236,31 @@ class ImageProcessingService:
                 if db_conn:
                     db_conn.close()
 
+            # Same image already in the media folder? Link it instead of adding a copy
+            duplicate = self._find_duplicate_media(file_path)
+            if duplicate:
+                metadata.media_id, existing_path = duplicate
+                metadata.final_path = existing_path
+                metadata.final_filename = existing_path.name
+                self._link_existing_media(metadata)
+                file_path.unlink()
+
+                metadata.update_status(ImageStatus.LINKED)
+                logger.info(
+                    f"Downloaded image duplicates {existing_path.name}, linked existing "
+                    f"MediaID={metadata.media_id} and removed download"
+                )
+                return metadata
+
+            # Look-alikes are only reported; the download is always kept
+            metadata.similar_media = self._find_similar_media(file_path)
+            if metadata.similar_media:
+                logger.warning(
+                    f"Downloaded image looks like existing media "
+                    f"{[p.name for p in metadata.similar_media]}; kept as a new file, "
+                    "please confirm whether it is a duplicate"
+                )
+
             # Generate standardized filename with correct name from database
             extension = self.filename_gen.extract_extension(file_path)
             filename = self.filename_gen.generate_filename(
@@ -270,6 +303,7 @@ class ImageProcessingService:
 
             # Create database records
             self._create_database_records(metadata)
+            self._index_media_file(final_path)
 
             # Success
             metadata.update_status(ImageStatus.LINKED)
@@ -283,6 +317,53 @@ class ImageProcessingService:
                 metadata.update_status(ImageStatus.FAILED, error=str(e))
             return None
 
+    def _find_duplicate_media(self, file_path: Path) -> tuple[int, Path] | None:
+        """
+        Look up a downloaded file in the media content-hash index.
+
+        Only byte-identical files (SHA-256) count. Index failures, and an
+        index still being built, are treated as "no duplicate" so they never
+        block ingest.
+
+        Args:
+            file_path: Downloaded file path
+
+        Returns:
+            (MediaID, existing file path) if the same file is already linked
+            in RootsMagic, None otherwise
+        """
+        try:
+            index = get_media_hash_index(self.dir_mapper.media_root)
+            if not index.ready_for_lookup():
+                logger.info("Media hash index is still being built, skipping duplicate check")
+                return None
+            db_conn = self._get_db_connection()
+            try:
+                return index.find_duplicate_media(file_path, ImageRepository(db_conn))
+            finally:
+                db_conn.close()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Media hash index lookup failed, skipping duplicate check: {e}")
+            return None
+
+    def _find_similar_media(self, file_path: Path) -> list[Path]:
+        """Existing media that looks like a download (perceptual hash), for review."""
+        try:
+            index = get_media_hash_index(self.dir_mapper.media_root)
+            if not index.ready:
+                return []
+            return index.find_similar(file_path)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Media hash index lookup failed, skipping similarity check: {e}")
+            return []
+
+    def _index_media_file(self, final_path: Path) -> None:
+        """Add a newly filed image to the media content-hash index."""
+        try:
+            get_media_hash_index(self.dir_mapper.media_root).add_file(final_path)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Failed to add {final_path.name} to media hash index: {e}")
+
     def _match_to_pending_image(self, file_path: Path) -> ImageMetadata | None:
         """
         Match downloaded file to pending image context.
@@ -330,6 +411,7 @@ class ImageProcessingService:
         # Move file
         logger.debug(f"Moving: {source_path} -> {dest_path}")
         shutil.move(str(source_path), str(dest_path))
+        get_media_inventory().invalidate(dest_dir)
 
         return dest_path
 
@@ -727,6 +809,7 @@ class ImageProcessingService:
                 except OSError as move_error:
                     logger.error(f"Failed to rename file: {move_error}")
                     continue  # Skip database update if file rename failed
+                get_media_inventory().invalidate(new_path.parent)
 
                 # Update database only after successful file rename
                 cursor.execute(
@@ -897,9 +980,12 @@ class ImageProcessingService:
                     f"({metadata.year}). Skipping citation linking for duplicate."
                 )
 
-            # Link to event if provided
-            if metadata.event_id:
-                image_repo.link_media_to_event(metadata.media_id, metadata.event_id)
+            # Link to event if provided, otherwise the citation's census event
+            event_id = metadata.event_id
+            if not event_id and citation_id:
+                event_id = image_repo.find_event_for_citation(citation_id)
+            if event_id:
+                image_repo.link_media_to_event(metadata.media_id, event_id)
 
         finally:
             # Always close connection
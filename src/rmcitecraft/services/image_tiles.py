@@ -0,0 +1,395 @@
+"""
+Tiled image pyramid cache for census image viewing.
+
+Census scans are 5-20 MB each. Instead of sending the full file to the
+browser for every view, each image is cut into a pyramid of JPEG tiles:
+level 0 is full resolution and every further level halves both dimensions
+until the image fits in a single tile. The viewer picks the smallest level
+that covers its on-screen width and loads only the tiles that scroll into
+view.
+
+Pyramids are built on a background thread pool and stored on disk, one
+directory per image, keyed by a digest of the image's path, size and mtime
+(so edited or replaced scans get a fresh pyramid). The cache is bounded in
+size; the least recently viewed pyramids are evicted first, except those a
+viewer currently has on screen (see ImageTileCache.hold).
+
+Pillow is optional. Without it is_available() returns False and callers
+fall back to serving the original image.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from loguru import logger
+
+TILE_URL_PREFIX = "/census-tiles"
+DEFAULT_TILE_SIZE = 512
+TILE_JPEG_QUALITY = 85
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class PyramidLevel:
+    """One resolution level of an image pyramid."""
+
+    level: int
+    width: int
+    height: int
+    cols: int
+    rows: int
+
+
+@dataclass
+class ImagePyramid:
+    """Tile layout of a cached image."""
+
+    key: str
+    width: int
+    height: int
+    tile_size: int
+    levels: list[PyramidLevel] = field(default_factory=list)
+
+    def level_for_width(self, display_width: float) -> PyramidLevel:
+        """Smallest level at least as wide as the displayed image.
+
+        Args:
+            display_width: On-screen image width in device pixels
+
+        Returns:
+            Pyramid level to display (level 0 if even full resolution is
+            narrower than the display)
+        """
+        for level in reversed(self.levels):
+            if level.width >= display_width:
+                return level
+        return self.levels[0]
+
+    def tile_url(self, level: int, col: int, row: int) -> str:
+        """URL of a tile under the mounted tile cache."""
+        return f"{TILE_URL_PREFIX}/{self.key}/{level}/{col}_{row}.jpg"
+
+    def thumbnail_url(self) -> str:
+        """URL of the coarsest level, which is a single tile."""
+        return self.tile_url(self.levels[-1].level, 0, 0)
+
+
+def is_available() -> bool:
+    """Whether Pillow is installed so pyramids can be built."""
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def image_cache_key(image_path: Path) -> str:
+    """Cache key for an image: digest of resolved path, size and mtime."""
+    st = image_path.stat()
+    identity = f"{image_path.resolve()}|{st.st_size}|{st.st_mtime_ns}"
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()[:32]
+
+
+class ImageTileCache:
+    """Size-bounded LRU disk cache of image tile pyramids."""
+
+    def __init__(
+        self,
+        cache_dir: Path | str,
+        max_bytes: int = 2 * 1024**3,
+        tile_size: int = DEFAULT_TILE_SIZE,
+        workers: int = 2,
+    ):
+        """
+        Initialize tile cache.
+
+        Args:
+            cache_dir: Directory holding one subdirectory per image pyramid
+            max_bytes: Cache size limit; older pyramids are evicted beyond it
+            tile_size: Tile edge length in pixels
+            workers: Background tiling threads
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.tile_size = tile_size
+
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tiler")
+        self._pending: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        # Viewer -> key of the pyramid it displays; eviction skips these
+        self._held: weakref.WeakKeyDictionary[object, str] = weakref.WeakKeyDictionary()
+        # Running cache size; the directory is only rescanned on first use and
+        # when a build pushes the total over max_bytes
+        self._total_bytes: int | None = None
+
+    # -------------------------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------------------------
+
+    def get_pyramid(self, image_path: Path) -> ImagePyramid | None:
+        """
+        Get the cached pyramid for an image, if already built.
+
+        Marks the pyramid as recently used.
+
+        Args:
+            image_path: Original image file
+
+        Returns:
+            ImagePyramid, or None if not cached (or the image is missing)
+        """
+        try:
+            key = image_cache_key(image_path)
+        except OSError:
+            return None
+        manifest = self.cache_dir / key / MANIFEST_NAME
+        try:
+            data = json.loads(manifest.read_text())
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != MANIFEST_VERSION:
+            return None
+
+        os.utime(manifest)  # LRU: last viewed time
+        data.pop("version")
+        data.pop("bytes", None)
+        data["levels"] = [PyramidLevel(**level) for level in data["levels"]]
+        return ImagePyramid(**data)
+
+    def hold(self, owner: object, pyramid: ImagePyramid | None) -> None:
+        """
+        Keep a displayed pyramid from being evicted.
+
+        Each owner holds at most one pyramid; holding another (or None)
+        releases the previous one. Holds end when the owner is garbage
+        collected.
+
+        Args:
+            owner: Object displaying the pyramid (e.g. an image viewer)
+            pyramid: Pyramid now on screen, or None to release
+        """
+        with self._lock:
+            if pyramid is None:
+                self._held.pop(owner, None)
+            else:
+                self._held[owner] = pyramid.key
+
+    # -------------------------------------------------------------------------
+    # Building
+    # -------------------------------------------------------------------------
+
+    def request(self, image_path: Path) -> Future:
+        """
+        Get or build an image's pyramid in the background.
+
+        Concurrent requests for the same image share one build.
+
+        Args:
+            image_path: Original image file
+
+        Returns:
+            Future resolving to the ImagePyramid
+        """
+        key = image_cache_key(image_path)
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = self._executor.submit(self._get_or_build, image_path)
+                self._pending[key] = future
+                future.add_done_callback(lambda _f: self._forget(key))
+        return future
+
+    def prefetch(self, image_paths: list[Path]) -> None:
+        """Queue background builds for images the user is likely to view next."""
+        for image_path in image_paths:
+            try:
+                self.request(image_path)
+            except OSError as e:
+                logger.debug(f"Cannot prefetch tiles for {image_path}: {e}")
+
+    def build(self, image_path: Path) -> ImagePyramid:
+        """
+        Build an image's pyramid synchronously, replacing any cached copy.
+
+        Args:
+            image_path: Original image file
+
+        Returns:
+            The new ImagePyramid
+
+        Raises:
+            ImportError: If Pillow is not installed
+            OSError: If the image cannot be read or tiles cannot be written
+        """
+        from PIL import Image
+
+        key = image_cache_key(image_path)
+        final_dir = self.cache_dir / key
+        work_dir = self.cache_dir / f".{key}.tmp"
+        shutil.rmtree(work_dir, ignore_errors=True)
+        work_dir.mkdir(parents=True)
+
+        try:
+            with Image.open(image_path) as source:
+                img = source.convert("L" if source.mode in ("1", "L", "LA") else "RGB")
+
+            pyramid = ImagePyramid(key, img.width, img.height, self.tile_size)
+            level = 0
+            while True:
+                pyramid.levels.append(self._write_level(img, level, work_dir))
+                if img.width <= self.tile_size and img.height <= self.tile_size:
+                    break
+                # Each level is resized from the previous one, which is much
+                # cheaper than resizing the full scan every time
+                img = img.resize(
+                    (max(1, img.width // 2), max(1, img.height // 2)),
+                    Image.Resampling.LANCZOS,
+                )
+                level += 1
+
+            size = sum(f.stat().st_size for f in work_dir.rglob("*") if f.is_file())
+            manifest = {"version": MANIFEST_VERSION, **asdict(pyramid), "bytes": size}
+            (work_dir / MANIFEST_NAME).write_text(json.dumps(manifest))
+
+            shutil.rmtree(final_dir, ignore_errors=True)
+            work_dir.rename(final_dir)
+        except BaseException:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            raise
+
+        logger.debug(
+            f"Built {len(pyramid.levels)}-level tile pyramid for {image_path.name} "
+            f"({pyramid.width}x{pyramid.height})"
+        )
+        with self._lock:
+            if self._total_bytes is not None:
+                # A replaced copy is still counted; the next rescan corrects it
+                self._total_bytes += size
+        self.evict()
+        return pyramid
+
+    def _get_or_build(self, image_path: Path) -> ImagePyramid:
+        return self.get_pyramid(image_path) or self.build(image_path)
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            self._pending.pop(key, None)
+
+    def _write_level(self, img, level: int, work_dir: Path) -> PyramidLevel:
+        """Cut one pyramid level into tiles."""
+        level_dir = work_dir / str(level)
+        level_dir.mkdir()
+        cols = -(-img.width // self.tile_size)
+        rows = -(-img.height // self.tile_size)
+
+        for row in range(rows):
+            for col in range(cols):
+                left = col * self.tile_size
+                top = row * self.tile_size
+                tile = img.crop((
+                    left,
+                    top,
+                    min(left + self.tile_size, img.width),
+                    min(top + self.tile_size, img.height),
+                ))
+                tile.save(level_dir / f"{col}_{row}.jpg", "JPEG", quality=TILE_JPEG_QUALITY)
+
+        return PyramidLevel(level, img.width, img.height, cols, rows)
+
+    # -------------------------------------------------------------------------
+    # Eviction
+    # -------------------------------------------------------------------------
+
+    def size_bytes(self) -> int:
+        """Total size of cached tiles (tracked in memory after the first scan)."""
+        with self._lock:
+            total = self._total_bytes
+        if total is None:
+            total = sum(size for _, _, size in self._scan_entries())
+            with self._lock:
+                self._total_bytes = total
+        return total
+
+    def evict(self) -> int:
+        """
+        Remove least recently viewed pyramids until the cache fits max_bytes.
+
+        Pyramids held by a viewer are never removed, so the cache may stay
+        over the limit while they are on screen. The cache directory is only
+        scanned when the tracked size exceeds the limit.
+
+        Returns:
+            Number of pyramids removed
+        """
+        if self.size_bytes() <= self.max_bytes:
+            return 0
+
+        entries = sorted(self._scan_entries(), key=lambda e: e[1])  # oldest first
+        total = sum(size for _, _, size in entries)
+        with self._lock:
+            held = set(self._held.values())
+        removed = 0
+        for entry_dir, _, size in entries:
+            if total <= self.max_bytes:
+                break
+            if entry_dir.name in held:
+                continue
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= size
+            removed += 1
+        with self._lock:
+            self._total_bytes = total
+
+        if removed:
+            logger.info(f"Evicted {removed} image pyramids from tile cache")
+        return removed
+
+    def _scan_entries(self) -> list[tuple[Path, float, int]]:
+        """(directory, last used, bytes) for each complete pyramid."""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if not entry.is_dir() or entry.name.startswith("."):
+                continue
+            entry_dir = Path(entry.path)
+            manifest = entry_dir / MANIFEST_NAME
+            try:
+                last_used = manifest.stat().st_mtime
+            except OSError:
+                last_used = 0.0  # Incomplete pyramid: evict first
+            try:
+                size = json.loads(manifest.read_text())["bytes"]
+            except (OSError, ValueError, KeyError):
+                # Incomplete pyramid or one built before sizes were recorded
+                size = sum(f.stat().st_size for f in entry_dir.rglob("*") if f.is_file())
+            entries.append((entry_dir, last_used, size))
+        return entries
+
+    def shutdown(self) -> None:
+        """Stop background tiling (pending builds are cancelled)."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_tile_cache: ImageTileCache | None = None
+
+
+def get_image_tile_cache() -> ImageTileCache:
+    """Get the process-wide tile cache configured from settings."""
+    global _tile_cache
+    if _tile_cache is None:
+        from rmcitecraft.config import get_config
+
+        config = get_config()
+        _tile_cache = ImageTileCache(
+            Path(config.image_tile_cache_dir),
+            max_bytes=config.image_tile_cache_max_mb * 1024**2,
+        )
+    return _tile_cache
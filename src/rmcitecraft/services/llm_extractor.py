@@ -5,17 +5,18 @@ components from FamilySearch citation text, handling format variations across
 census years.
 """
 
+from __future__ import annotations
+
 import os
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from langchain_anthropic import ChatAnthropic
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
 from loguru import logger
 
 from rmcitecraft.models.census_citation import CensusExtraction
 
+if TYPE_CHECKING:
+    from langchain_core.prompts import ChatPromptTemplate
+
 # System instructions (cached for all requests)
 SYSTEM_INSTRUCTIONS = """You are a genealogical citation parser specialized in US Federal Census records from FamilySearch.
 
@@ -108,7 +109,10 @@ def create_llm_client(provider: str, model: str, api_key: str | None = None) ->
     Raises:
         ValueError: If provider is not supported
     """
+    # LangChain clients are imported here so loading this module stays cheap
     if provider == "anthropic":
+        from langchain_anthropic import ChatAnthropic
+
         return ChatAnthropic(
             model=model,
             anthropic_api_key=api_key,
@@ -116,6 +120,8 @@ def create_llm_client(provider: str, model: str, api_key: str | None = None) ->
             max_tokens=1024,
         )
     elif provider == "openai":
+        from langchain_openai import ChatOpenAI
+
         return ChatOpenAI(
             model=model,
             openai_api_key=api_key,
@@ -127,7 +133,9 @@ def create_llm_client(provider: str, model: str, api_key: str | None = None) ->
         api_key = api_key or os.getenv("OPENROUTER_API_KEY")
         if not api_key:
             raise ValueError("OPENROUTER_API_KEY not found in environment")
-            
+
+        from langchain_openai import ChatOpenAI
+
         return ChatOpenAI(
             model=model,
             openai_api_key=api_key,
@@ -159,6 +167,8 @@ class LLMCitationExtractor:
             model: Model name
             api_key: API key (optional if in environment)
         """
+        from langchain_core.output_parsers import PydanticOutputParser
+
         self.llm = create_llm_client(provider, model, api_key)
         self.parser = PydanticOutputParser(pydantic_object=CensusExtraction)
         self.prompt = self._build_prompt()
@@ -169,6 +179,8 @@ class LLMCitationExtractor:
         The system instructions and examples are cached, only the citation
         text changes per request.
         """
+        from langchain_core.prompts import ChatPromptTemplate
+
         return ChatPromptTemplate.from_messages([
             ("system", SYSTEM_INSTRUCTIONS + "\n\n" + FEW_SHOT_EXAMPLES),
             ("human", """Extract citation data from the following:
@@ -1,20 +1,22 @@
 """LLM provider abstraction for citation extraction.
 
-Supports multiple LLM providers with fallback chain.
+Supports multiple LLM providers with fallback chain. LangChain packages are
+imported when a model is first requested.
 """
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from langchain_anthropic import ChatAnthropic
-from langchain_core.language_models import BaseChatModel
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_ollama import ChatOllama
-from langchain_openai import ChatOpenAI
 from loguru import logger
 
 from rmcitecraft.config import get_config
 
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+    from langchain_core.output_parsers import PydanticOutputParser
+
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
@@ -45,6 +47,8 @@ class AnthropicProvider(LLMProvider):
 
     def get_model(self) -> BaseChatModel:
         """Get Claude model instance."""
+        from langchain_anthropic import ChatAnthropic
+
         return ChatAnthropic(
             model=self.config.anthropic_model,
             api_key=self.config.anthropic_api_key,
@@ -71,6 +75,8 @@ class OpenAIProvider(LLMProvider):
 
     def get_model(self) -> BaseChatModel:
         """Get OpenAI model instance."""
+        from langchain_openai import ChatOpenAI
+
         return ChatOpenAI(
             model=self.config.openai_model,
             api_key=self.config.openai_api_key,
@@ -97,6 +103,8 @@ class OllamaProvider(LLMProvider):
 
     def get_model(self) -> BaseChatModel:
         """Get Ollama model instance."""
+        from langchain_ollama import ChatOllama
+
         return ChatOllama(
             model=self.config.ollama_model,
             base_url=self.config.ollama_base_url,
@@ -5,11 +5,15 @@ Detects crashed or unresponsive pages and attempts recovery to enable
 robust batch processing.
 """
 
+from __future__ import annotations
+
 import asyncio
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
-from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
 
 
 class PageHealthStatus:
@@ -57,6 +61,8 @@ class PageHealthMonitor:
         Returns:
             PageHealthStatus indicating if page is healthy
         """
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
         try:
             # Try simple JavaScript evaluation to test if page context is alive
             result = await asyncio.wait_for(
@@ -132,6 +138,8 @@ class PageHealthMonitor:
         Returns:
             True if page is ready, False if timeout
         """
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
         try:
             # Wait for DOM content to load
             await page.wait_for_load_state("domcontentloaded", timeout=timeout_ms)
@@ -2,10 +2,21 @@
 Retry strategy with exponential backoff for Find a Grave batch processing.
 
 Handles transient failures gracefully with configurable retry logic.
+
+Also provides process-wide outbound guards shared by every caller of an
+external target (FamilySearch, Find a Grave, LLM providers). Each guard
+combines a token-bucket rate limiter with a circuit breaker, so concurrent
+workers pace their requests together, all back off when the target signals
+rate limiting, and stop calling a target that keeps failing until it has had
+time to recover.
 """
 
 import asyncio
+import threading
 import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from enum import Enum
 from typing import Any, Callable
 
 from loguru import logger
@@ -50,6 +61,392 @@ class NonRetryableError(Exception):
     pass
 
 
+class CircuitOpenError(NonRetryableError):
+    """Raised instead of calling a target whose circuit breaker is open."""
+
+    def __init__(self, target: str, retry_after: float):
+        super().__init__(
+            f"{target} is temporarily paused after repeated failures; "
+            f"retry in {retry_after:.0f}s"
+        )
+        self.target = target
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Thread-safe token-bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `capacity`. Callers
+    reserve a token and then sleep until it is available, so concurrent
+    callers are spaced out instead of all waking at once.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens, going into debt if necessary.
+
+        Returns:
+            Seconds the caller must wait before using the reservation
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until tokens are available.
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """Wait (without blocking the event loop) until tokens are available.
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for the next `seconds` (target asked us to slow down)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+
+class CircuitState(Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"  # Calls flow normally
+    OPEN = "open"  # Calls rejected until the reset timeout passes
+    HALF_OPEN = "half_open"  # One trial call allowed
+
+
+class CircuitBreaker:
+    """Stops calls to a target after consecutive failures.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    calls are rejected for `reset_timeout` seconds. Then a single trial call
+    is let through: success closes the circuit, failure opens it again, and a
+    trial that ends without either (release_trial) lets the next caller try.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 120.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a trial call
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state (OPEN becomes HALF_OPEN once the timeout has passed)."""
+        with self._lock:
+            if (
+                self._state == CircuitState.OPEN
+                and self._clock() - self._opened_at >= self.reset_timeout
+            ):
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    @property
+    def consecutive_failures(self) -> int:
+        """Failures since the last success."""
+        return self._failures
+
+    def allow(self) -> float:
+        """Check whether a call may proceed.
+
+        Returns:
+            0 if the call may proceed, otherwise seconds until the next trial
+        """
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                return 0.0
+            remaining = self.reset_timeout - (self._clock() - self._opened_at)
+            if remaining > 0:
+                return remaining
+            if self._trial_in_flight:
+                return self.reset_timeout
+            self._state = CircuitState.HALF_OPEN
+            self._trial_in_flight = True
+            return 0.0
+
+    def record_success(self) -> None:
+        """Record a successful call (closes a half-open circuit)."""
+        with self._lock:
+            if self._state != CircuitState.CLOSED:
+                logger.info("Circuit closed after successful trial call")
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """End a trial call without an outcome (the circuit stays half-open)."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self, trip: bool = False) -> None:
+        """Record a failed call.
+
+        Args:
+            trip: Open the circuit immediately (failure already known to be
+                persistent, e.g. the browser connection is gone)
+        """
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if (
+                trip
+                or self._state == CircuitState.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                self._state = CircuitState.OPEN
+                self._opened_at = self._clock()
+
+
+class OutboundGuard:
+    """Rate limiter plus circuit breaker for one external target.
+
+    Example:
+        guard = get_outbound_guard("findagrave")
+        async with guard.guard_async():
+            await page.goto(url)
+    """
+
+    # Backoff applied to the whole target when it signals rate limiting
+    RATE_LIMIT_BASE_PAUSE = 5.0
+    RATE_LIMIT_MAX_PAUSE = 300.0
+
+    RATE_LIMIT_PATTERNS = ("429", "rate limit", "too many requests")
+
+    def __init__(self, name: str, limiter: TokenBucket, breaker: CircuitBreaker):
+        """Initialize guard.
+
+        Args:
+            name: Target name used in logs and errors
+            limiter: Request rate limiter
+            breaker: Failure circuit breaker
+        """
+        self.name = name
+        self.limiter = limiter
+        self.breaker = breaker
+        self._rate_limit_streak = 0
+
+    def check(self) -> None:
+        """Raise CircuitOpenError if the target is paused."""
+        retry_after = self.breaker.allow()
+        if retry_after > 0:
+            raise CircuitOpenError(self.name, retry_after)
+
+    def acquire(self) -> None:
+        """Check the circuit, then wait for a request slot."""
+        self.check()
+        try:
+            waited = self.limiter.acquire()
+        except BaseException:
+            self.settle()
+            raise
+        if waited > 1:
+            logger.debug(f"{self.name}: waited {waited:.1f}s for rate limiter")
+
+    async def acquire_async(self) -> None:
+        """Async variant of acquire()."""
+        self.check()
+        try:
+            waited = await self.limiter.acquire_async()
+        except BaseException:
+            # Cancelled while waiting for a slot: give up a trial we were granted
+            self.settle()
+            raise
+        if waited > 1:
+            logger.debug(f"{self.name}: waited {waited:.1f}s for rate limiter")
+
+    def record_success(self) -> None:
+        """Record a successful request."""
+        self._rate_limit_streak = 0
+        self.breaker.record_success()
+
+    def record_rate_limited(self) -> None:
+        """Pause all callers of this target with growing backoff."""
+        self._rate_limit_streak += 1
+        pause = min(
+            self.RATE_LIMIT_BASE_PAUSE * 2 ** (self._rate_limit_streak - 1),
+            self.RATE_LIMIT_MAX_PAUSE,
+        )
+        logger.warning(f"{self.name} is rate limiting requests; pausing all callers {pause:.0f}s")
+        self.limiter.pause(pause)
+        self.breaker.record_failure()
+
+    def record_failure(self, error: BaseException) -> None:
+        """Classify a failed request and update limiter and breaker.
+
+        Rate-limit errors pause the target; lost browser connections open the
+        circuit at once; permanent errors (404, private memorial, ...) say
+        nothing about target health, so they count as neither success nor
+        failure (a half-open trial is released); anything else counts toward
+        the consecutive-failure threshold.
+        """
+        if isinstance(error, CircuitOpenError):
+            return
+        message = str(error).lower()
+        if type(error).__name__ == "RateLimitError" or any(
+            pattern in message for pattern in self.RATE_LIMIT_PATTERNS
+        ):
+            self.record_rate_limited()
+        elif type(error).__name__ == "CDPConnectionError":
+            self.breaker.record_failure(trip=True)
+        elif isinstance(error, NonRetryableError) or any(
+            pattern in message for pattern in RetryStrategy.NON_RETRYABLE_PATTERNS
+        ):
+            self.breaker.release_trial()
+            return
+        else:
+            self.breaker.record_failure()
+
+        if self.breaker.state != CircuitState.CLOSED:
+            logger.warning(
+                f"{self.name} circuit open after {self.breaker.consecutive_failures} "
+                f"consecutive failures"
+            )
+
+    def settle(self) -> None:
+        """Release a half-open trial slot the call did not record an outcome for.
+
+        Call in a `finally` after acquire(), so a trial call that is
+        cancelled, closed or fails before reaching outcome() cannot leave the
+        circuit waiting for a result that never comes. Harmless after
+        record_success() or record_failure().
+        """
+        self.breaker.release_trial()
+
+    @contextmanager
+    def outcome(self) -> Iterator[None]:
+        """Record the block's success or failure (after acquire() was called).
+
+        Cancellation, generator close and other BaseExceptions record no
+        outcome but still release a half-open trial.
+        """
+        try:
+            yield
+        except Exception as e:
+            self.record_failure(e)
+            raise
+        else:
+            self.record_success()
+        finally:
+            self.settle()
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """Acquire a slot, then record the outcome of the block."""
+        self.acquire()
+        with self.outcome():
+            yield
+
+    @asynccontextmanager
+    async def guard_async(self) -> AsyncIterator[None]:
+        """Async variant of guard()."""
+        await self.acquire_async()
+        with self.outcome():
+            yield
+
+
+# Requests per minute and burst size per target (overridable in settings)
+DEFAULT_TARGET_LIMITS: dict[str, tuple[float, float]] = {
+    "familysearch": (20, 3),
+    "findagrave": (30, 3),
+    "llm": (60, 5),
+}
+
+_guards: dict[str, OutboundGuard] = {}
+_guards_lock = threading.Lock()
+
+
+def get_outbound_guard(target: str) -> OutboundGuard:
+    """Get the process-wide guard for a target ("familysearch", "findagrave", "llm").
+
+    Limits come from settings ({target}_requests_per_minute,
+    outbound_failure_threshold, outbound_circuit_reset_seconds), falling
+    back to DEFAULT_TARGET_LIMITS.
+    """
+    with _guards_lock:
+        guard = _guards.get(target)
+        if guard is None:
+            per_minute, burst = DEFAULT_TARGET_LIMITS.get(target, (60, 1))
+            failure_threshold, reset_seconds = 5, 120.0
+            try:
+                from rmcitecraft.config import get_config
+
+                config = get_config()
+                per_minute = getattr(config, f"{target}_requests_per_minute", per_minute)
+                failure_threshold = config.outbound_failure_threshold
+                reset_seconds = config.outbound_circuit_reset_seconds
+            except Exception as e:  # Settings unavailable: use defaults
+                logger.debug(f"Using default outbound limits for {target}: {e}")
+
+            guard = OutboundGuard(
+                target,
+                TokenBucket(per_minute / 60.0, burst),
+                CircuitBreaker(failure_threshold, reset_seconds),
+            )
+            _guards[target] = guard
+    return guard
+
+
+def reset_outbound_guards() -> None:
+    """Forget all guards (new limits from settings apply on next use)."""
+    with _guards_lock:
+        _guards.clear()
+
+
 class RetryStrategy:
     """Handle retries with exponential backoff."""
 
@@ -1,20 +1,29 @@
 """Performance Heatmap Card component for dashboard."""
 
+import json
 from typing import Callable
 
 from nicegui import ui
 
 from rmcitecraft.database.batch_state_repository import FindAGraveBatchStateRepository
+from rmcitecraft.monitoring.stage_report import (
+    ItemTiming,
+    StageStats,
+    item_timings,
+    stage_percentiles,
+    to_chrome_trace,
+)
 
 
 class PerformanceHeatmapCard:
-    """Performance heatmap card showing operation durations and bottlenecks."""
+    """Performance heatmap card showing stage timings and bottlenecks."""
 
     def __init__(
         self,
         state_repo: FindAGraveBatchStateRepository,
         session_id: str | None = None,
         on_cell_click: Callable[[dict], None] | None = None,
+        slowest_limit: int = 10,
     ):
         """Initialize performance heatmap card.
 
@@ -22,10 +31,14 @@ class PerformanceHeatmapCard:
             state_repo: Batch state repository
             session_id: Optional session identifier (None = all sessions)
             on_cell_click: Callback when user clicks a heatmap cell
+            slowest_limit: Number of slowest items listed
         """
         self._state_repo = state_repo
         self.session_id = session_id
         self._on_cell_click = on_cell_click
+        self.slowest_limit = slowest_limit
+        self.group_by = 'hour'  # 'hour' or 'session'
+        self.statistic = 'p95'  # 'p50' or 'p95'
         self.container = None
         self.chart = None
 
@@ -45,150 +58,132 @@ class PerformanceHeatmapCard:
                     icon='info',
                     on_click=self._show_info
                 ).props('flat dense round size=sm').tooltip('Understanding performance metrics')
-            ui.button(
-                '',
-                icon='refresh',
-                on_click=self.update
-            ).props('flat dense round').tooltip('Refresh metrics')
-
-        # Get performance metrics
-        if self.session_id:
-            metrics = self._state_repo.get_session_metrics(self.session_id)
-        else:
-            # Aggregate across all sessions
-            sessions = self._state_repo.get_all_sessions()
-            metrics = {}
-            for session in sessions:
-                session_metrics = self._state_repo.get_session_metrics(session['session_id'])
-                for op_type, op_metrics in session_metrics.items():
-                    if op_type not in metrics:
-                        metrics[op_type] = {
-                            'count': 0,
-                            'avg_duration_ms': [],
-                            'min_duration_ms': float('inf'),
-                            'max_duration_ms': 0,
-                            'success_count': 0,
-                            'success_rate': 0,
-                        }
-                    metrics[op_type]['count'] += op_metrics['count']
-                    metrics[op_type]['avg_duration_ms'].append(op_metrics['avg_duration_ms'])
-                    metrics[op_type]['min_duration_ms'] = min(
-                        metrics[op_type]['min_duration_ms'],
-                        op_metrics['min_duration_ms']
-                    )
-                    metrics[op_type]['max_duration_ms'] = max(
-                        metrics[op_type]['max_duration_ms'],
-                        op_metrics['max_duration_ms']
-                    )
-                    metrics[op_type]['success_count'] += op_metrics['success_count']
-
-            # Average the averages (weighted by count)
-            for op_type in metrics:
-                if metrics[op_type]['count'] > 0:
-                    metrics[op_type]['success_rate'] = (
-                        metrics[op_type]['success_count'] / metrics[op_type]['count']
-                    )
-                    avg_list = metrics[op_type]['avg_duration_ms']
-                    metrics[op_type]['avg_duration_ms'] = sum(avg_list) / len(avg_list)
-
-        if metrics:
+            with ui.row().classes('items-center gap-2'):
+                ui.toggle(
+                    {'hour': 'By hour', 'session': 'By session'},
+                    value=self.group_by,
+                    on_change=lambda e: self._set_option('group_by', e.value),
+                ).props('dense')
+                ui.toggle(
+                    {'p50': 'p50', 'p95': 'p95'},
+                    value=self.statistic,
+                    on_change=lambda e: self._set_option('statistic', e.value),
+                ).props('dense')
+                ui.button(
+                    '',
+                    icon='download',
+                    on_click=self._export_trace
+                ).props('flat dense round').tooltip('Export session trace (speedscope / Chrome trace)')
+                ui.button(
+                    '',
+                    icon='refresh',
+                    on_click=self.update
+                ).props('flat dense round').tooltip('Refresh metrics')
+
+        spans = self._state_repo.get_stage_spans(session_id=self.session_id)
+
+        if spans:
+            overall = stage_percentiles(spans, by='all')
+            items = item_timings(spans)
+
             # Summary statistics
-            self._render_summary(metrics)
+            self._render_summary(overall, items)
 
             # Heatmap visualization
-            self._render_heatmap(metrics)
+            self._render_heatmap(stage_percentiles(spans, by=self.group_by))
 
             # Performance table
-            self._render_performance_table(metrics)
+            self._render_performance_table(overall)
+
+            # Slowest items (click for stage breakdown)
+            self._render_slowest_items(items[:self.slowest_limit])
         else:
             # Empty state
             with ui.column().classes('items-center p-8'):
                 ui.icon('speed').classes('text-6xl text-grey-5')
-                ui.label('No performance data available').classes('text-grey-7')
+                ui.label('No stage timings recorded').classes('text-grey-7')
                 if self.session_id:
                     ui.label('Process a batch to see performance metrics').classes('text-sm text-grey-6')
 
-    def _render_summary(self, metrics: dict[str, dict]) -> None:
+    def _render_summary(self, overall: list[StageStats], items: list[ItemTiming]) -> None:
         """Render performance summary cards.
 
         Args:
-            metrics: Performance metrics dict
+            overall: Stage statistics across the whole selection
+            items: Item timings, slowest first
         """
-        # Calculate overall statistics
-        total_ops = sum(m['count'] for m in metrics.values())
-        avg_success_rate = (
-            sum(m['success_rate'] for m in metrics.values()) / len(metrics)
-            if metrics else 0
-        )
-        slowest_op = max(metrics.items(), key=lambda x: x[1]['avg_duration_ms']) if metrics else None
+        failed_items = sum(1 for item in items if item.failures)
+        slowest_stage = max(overall, key=lambda s: s.p95_ms or 0) if overall else None
 
         with ui.row().classes('w-full gap-4 mb-4'):
             with ui.card().classes('bg-blue-1 flex-1'):
                 with ui.column().classes('items-center p-4 gap-1'):
-                    ui.label(f'{total_ops:,}').classes('text-h4 text-blue font-bold')
-                    ui.label('Total Operations').classes('text-caption text-grey-7')
+                    ui.label(f'{len(items):,}').classes('text-h4 text-blue font-bold')
+                    ui.label('Items Timed').classes('text-caption text-grey-7')
 
             with ui.card().classes('bg-green-1 flex-1'):
                 with ui.column().classes('items-center p-4 gap-1'):
-                    ui.label(f'{avg_success_rate * 100:.1f}%').classes('text-h4 text-green font-bold')
-                    ui.label('Avg Success Rate').classes('text-caption text-grey-7')
+                    clean_rate = 1 - failed_items / len(items) if items else 0
+                    ui.label(f'{clean_rate * 100:.1f}%').classes('text-h4 text-green font-bold')
+                    ui.label('Items Without Stage Failures').classes('text-caption text-grey-7')
 
-            if slowest_op:
+            if slowest_stage:
                 with ui.card().classes('bg-orange-1 flex-1'):
                     with ui.column().classes('items-center p-4 gap-1'):
-                        ui.label(slowest_op[0]).classes('text-h4 text-orange font-bold')
+                        ui.label(slowest_stage.stage).classes('text-h4 text-orange font-bold')
                         ui.label(
-                            f'{slowest_op[1]["avg_duration_ms"]:.0f}ms avg'
+                            f'{slowest_stage.p95_ms:.0f}ms p95'
                         ).classes('text-caption text-grey-7')
 
-    def _render_heatmap(self, metrics: dict[str, dict]) -> None:
-        """Render performance heatmap.
+    def _render_heatmap(self, stats: list[StageStats]) -> None:
+        """Render stage × hour (or session) heatmap of p50/p95 item time.
 
         Args:
-            metrics: Performance metrics dict
+            stats: Stage statistics bucketed by hour or session
         """
-        # Prepare data for heatmap
-        # X-axis: metric types (avg, min, max, success rate)
-        # Y-axis: operation types
-        operations = sorted(metrics.keys())
-        metric_types = ['Avg Duration', 'Min Duration', 'Max Duration', 'Success Rate']
+        buckets = sorted({s.bucket for s in stats})
+        stages = []
+        for s in stats:
+            if s.stage not in stages:
+                stages.append(s.stage)
 
+        # Format: [x_index, y_index, value]
         heatmap_data = []
-        for i, op in enumerate(operations):
-            op_metrics = metrics[op]
-            # Round to 0.01 ms precision for display
-            # Format: [x_index, y_index, value]
-            heatmap_data.append([0, i, round(op_metrics['avg_duration_ms'], 2)])
-            heatmap_data.append([1, i, round(op_metrics['min_duration_ms'], 2)])
-            heatmap_data.append([2, i, round(op_metrics['max_duration_ms'], 2)])
-            heatmap_data.append([3, i, round(op_metrics['success_rate'] * 100, 2)])  # Convert to percentage
+        for s in stats:
+            value = s.p95_ms if self.statistic == 'p95' else s.p50_ms
+            if value is None:
+                continue
+            heatmap_data.append({
+                'value': [buckets.index(s.bucket), stages.index(s.stage), round(value, 1)],
+                'items': s.items,
+                'failures': s.failures,
+            })
 
         # ECharts heatmap configuration
         echart_options = {
             'tooltip': {
                 'position': 'top',
-                # Build tooltip content with operation and metric labels
-                'formatter': '{b}<br/>{c}' + (' ms' if metric_types else '')
+                'formatter': f'{{c}} ms {self.statistic}',
             },
             'grid': {
                 'height': '70%',
                 'top': '10%',
-                'left': '20%'
+                'left': '15%'
             },
             'xAxis': {
                 'type': 'category',
-                'data': metric_types,
+                'data': buckets,
                 'splitArea': {
                     'show': True
                 },
                 'axisLabel': {
-                    'interval': 0,
-                    'rotate': 0
+                    'rotate': 30,
+                    'fontSize': 10
                 }
             },
             'yAxis': {
                 'type': 'category',
-                'data': operations,
+                'data': stages,
                 'splitArea': {
                     'show': True
                 },
@@ -198,23 +193,23 @@ class PerformanceHeatmapCard:
             },
             'visualMap': {
                 'min': 0,
-                'max': max([d[2] for d in heatmap_data]) if heatmap_data else 100,
+                'max': max((d['value'][2] for d in heatmap_data), default=100),
                 'calculable': True,
                 'orient': 'horizontal',
                 'left': 'center',
-                'bottom': '5%',
+                'bottom': '0%',
                 'inRange': {
                     'color': ['#50a3ba', '#eac736', '#d94e5d']  # Blue -> Yellow -> Red
                 }
             },
             'series': [
                 {
-                    'name': 'Performance',
+                    'name': 'Stage time',
                     'type': 'heatmap',
                     'data': heatmap_data,
                     'label': {
-                        'show': True,
-                        'fontSize': 11,
+                        'show': len(buckets) <= 12,
+                        'fontSize': 10,
                         'color': '#000'
                     },
                     'emphasis': {
@@ -228,41 +223,50 @@ class PerformanceHeatmapCard:
         }
 
         with ui.card().classes('w-full'):
-            ui.label('Performance Heatmap').classes('text-subtitle1 mb-2')
-            ui.label('Darker colors indicate slower operations or lower success rates').classes('text-caption text-grey-6 mb-2')
+            by_label = 'hour' if self.group_by == 'hour' else 'session'
+            ui.label(f'Stage Time by {by_label.title()} ({self.statistic})').classes('text-subtitle1 mb-2')
+            ui.label(
+                'Per-item time spent in each stage; darker cells are slower'
+            ).classes('text-caption text-grey-6 mb-2')
             self.chart = ui.echart(echart_options).classes('w-full h-96')
+            if self._on_cell_click:
+                self.chart.on('click', lambda e: self._on_cell_click({
+                    'bucket': buckets[e.args['value'][0]],
+                    'stage': stages[e.args['value'][1]],
+                    'group_by': self.group_by,
+                }))
 
-    def _render_performance_table(self, metrics: dict[str, dict]) -> None:
-        """Render performance details table.
+    def _render_performance_table(self, overall: list[StageStats]) -> None:
+        """Render per-stage performance table.
 
         Args:
-            metrics: Performance metrics dict
+            overall: Stage statistics across the whole selection
         """
         with ui.card().classes('w-full mt-4'):
-            ui.label('Performance Details').classes('text-subtitle1 mb-2')
+            ui.label('Stage Details').classes('text-subtitle1 mb-2')
 
             # Create table data
             columns = [
-                {'name': 'operation', 'label': 'Operation', 'field': 'operation', 'sortable': True, 'align': 'left'},
-                {'name': 'count', 'label': 'Count', 'field': 'count', 'sortable': True, 'align': 'right'},
-                {'name': 'avg_ms', 'label': 'Avg (ms)', 'field': 'avg_ms', 'sortable': True, 'align': 'right'},
-                {'name': 'min_ms', 'label': 'Min (ms)', 'field': 'min_ms', 'sortable': True, 'align': 'right'},
-                {'name': 'max_ms', 'label': 'Max (ms)', 'field': 'max_ms', 'sortable': True, 'align': 'right'},
-                {'name': 'success_rate', 'label': 'Success Rate', 'field': 'success_rate', 'sortable': True, 'align': 'right'},
+                {'name': 'stage', 'label': 'Stage', 'field': 'stage', 'sortable': True, 'align': 'left'},
+                {'name': 'items', 'label': 'Items', 'field': 'items', 'sortable': True, 'align': 'right'},
+                {'name': 'p50_ms', 'label': 'p50 (ms)', 'field': 'p50_ms', 'sortable': True, 'align': 'right'},
+                {'name': 'p95_ms', 'label': 'p95 (ms)', 'field': 'p95_ms', 'sortable': True, 'align': 'right'},
+                {'name': 'total_s', 'label': 'Total (s)', 'field': 'total_s', 'sortable': True, 'align': 'right'},
+                {'name': 'failures', 'label': 'Failures', 'field': 'failures', 'sortable': True, 'align': 'right'},
                 {'name': 'status', 'label': 'Status', 'field': 'status', 'sortable': True, 'align': 'center'},
             ]
 
             rows = []
-            for op_type, op_metrics in sorted(metrics.items(), key=lambda x: x[1]['avg_duration_ms'], reverse=True):
-                status = self._get_performance_status(op_metrics)
+            for stats in sorted(overall, key=lambda s: s.p95_ms or 0, reverse=True):
+                status = self._get_performance_status(stats)
 
                 rows.append({
-                    'operation': op_type,
-                    'count': op_metrics['count'],
-                    'avg_ms': f"{op_metrics['avg_duration_ms']:.1f}",
-                    'min_ms': f"{op_metrics['min_duration_ms']:.1f}",
-                    'max_ms': f"{op_metrics['max_duration_ms']:.1f}",
-                    'success_rate': f"{op_metrics['success_rate'] * 100:.1f}%",
+                    'stage': stats.stage,
+                    'items': stats.items,
+                    'p50_ms': f"{stats.p50_ms:.1f}",
+                    'p95_ms': f"{stats.p95_ms:.1f}",
+                    'total_s': f"{stats.total_ms / 1000:.1f}",
+                    'failures': stats.failures,
                     'status': status,
                     'status_color': self._get_status_color(status)
                 })
@@ -270,7 +274,7 @@ class PerformanceHeatmapCard:
             table = ui.table(
                 columns=columns,
                 rows=rows,
-                row_key='operation'
+                row_key='stage'
             ).classes('w-full')
 
             # Add custom styling for status column
@@ -280,23 +284,111 @@ class PerformanceHeatmapCard:
                 </q-td>
             ''')
 
-    def _get_performance_status(self, metrics: dict) -> str:
+    def _render_slowest_items(self, items: list[ItemTiming]) -> None:
+        """Render the slowest items; clicking a row shows its stage breakdown.
+
+        Args:
+            items: Slowest item timings
+        """
+        with ui.card().classes('w-full mt-4'):
+            ui.label('Slowest Items').classes('text-subtitle1 mb-2')
+
+            columns = [
+                {'name': 'name', 'label': 'Item', 'field': 'name', 'align': 'left'},
+                {'name': 'session_id', 'label': 'Session', 'field': 'session_id', 'align': 'left'},
+                {'name': 'total_s', 'label': 'Total (s)', 'field': 'total_s', 'align': 'right'},
+                {'name': 'slowest_stage', 'label': 'Slowest Stage', 'field': 'slowest_stage', 'align': 'left'},
+                {'name': 'failures', 'label': 'Failed Spans', 'field': 'failures', 'align': 'right'},
+            ]
+            rows = [
+                {
+                    'key': index,
+                    'name': item.item_name or f'Item {item.item_id}',
+                    'session_id': item.session_id or '-',
+                    'total_s': f'{item.total_ms / 1000:.1f}',
+                    'slowest_stage': item.slowest_stage or '-',
+                    'failures': item.failures,
+                }
+                for index, item in enumerate(items)
+            ]
+
+            table = ui.table(columns=columns, rows=rows, row_key='key').classes('w-full')
+            table.on('rowClick', lambda e: self._show_item_breakdown(items[e.args[1]['key']]))
+
+    def _show_item_breakdown(self, item: ItemTiming) -> None:
+        """Show the stage breakdown of one item.
+
+        Args:
+            item: Item timing to show
+        """
+        stages = sorted(item.stages.items(), key=lambda s: s[1], reverse=True)
+
+        with ui.dialog() as dialog, ui.card().classes('p-6 w-[32rem]'):
+            ui.label(item.item_name or f'Item {item.item_id}').classes('text-h6 text-primary')
+            ui.label(
+                f'Session {item.session_id} · started {item.started_at[:19]} · '
+                f'{item.total_ms / 1000:.1f}s total'
+            ).classes('text-caption text-grey-7 mb-2')
+
+            ui.echart({
+                'tooltip': {'trigger': 'axis', 'axisPointer': {'type': 'shadow'}},
+                'grid': {'left': '25%', 'right': '5%', 'top': '5%', 'bottom': '5%'},
+                'xAxis': {'type': 'value', 'name': 'ms'},
+                'yAxis': {'type': 'category', 'data': [stage for stage, _ in reversed(stages)]},
+                'series': [{
+                    'type': 'bar',
+                    'data': [round(ms, 1) for _, ms in reversed(stages)],
+                    'itemStyle': {'color': '#d94e5d'},
+                }],
+            }).classes('w-full h-64')
+
+            with ui.row().classes('w-full justify-end'):
+                ui.button('Close', on_click=dialog.close).props('color=primary')
+
+        dialog.open()
+
+    def _export_trace(self) -> None:
+        """Download the selected session's spans as a Chrome trace (opens in speedscope)."""
+        if not self.session_id:
+            ui.notify('Select a session to export its trace', type='warning')
+            return
+
+        spans = self._state_repo.get_stage_spans(session_id=self.session_id)
+        if not spans:
+            ui.notify('No stage timings recorded for this session', type='warning')
+            return
+
+        trace = to_chrome_trace(spans, name=self.session_id)
+        ui.download(json.dumps(trace).encode('utf-8'), f'{self.session_id}_trace.json')
+        ui.notify(f'Exported {len(spans)} spans', type='positive')
+
+    def _set_option(self, name: str, value: str) -> None:
+        """Change grouping or statistic and re-render.
+
+        Args:
+            name: Attribute to set ('group_by' or 'statistic')
+            value: New value
+        """
+        setattr(self, name, value)
+        self.update()
+
+    def _get_performance_status(self, stats: StageStats) -> str:
         """Determine performance status.
 
         Args:
-            metrics: Operation metrics dict
+            stats: Stage statistics
 
         Returns:
             Status string (Excellent, Good, Slow, Critical)
         """
-        avg_ms = metrics['avg_duration_ms']
-        success_rate = metrics['success_rate']
+        p95_ms = stats.p95_ms or 0
+        failure_rate = stats.failures / stats.items if stats.items else 0
 
-        if success_rate < 0.5:
+        if failure_rate > 0.5:
             return 'Critical'
-        elif avg_ms > 5000:  # > 5 seconds
+        elif p95_ms > 5000:  # > 5 seconds
             return 'Slow'
-        elif avg_ms > 2000:  # > 2 seconds
+        elif p95_ms > 2000:  # > 2 seconds
             return 'Good'
         else:
             return 'Excellent'
@@ -326,44 +418,39 @@ class PerformanceHeatmapCard:
                 ui.markdown('''
                 **What are Performance Metrics?**
 
-                Performance metrics track the duration and success rate of batch processing
-                operations, helping identify bottlenecks and optimize workflow efficiency.
+                Every batch item records how long each processing stage took. The
+                heatmap shows the per-item time in each stage by hour or by session,
+                so a slow overnight run shows which stage slowed down and when.
 
-                **Operation Types:**
+                **Stages:**
 
-                - **page_load**: Time to fetch Find a Grave memorial page
-                - **extraction**: Time to parse memorial data and images
-                - **citation_creation**: Time to create RootsMagic source and citation
-                - **image_download**: Time to download memorial photos
-                - **database_write**: Time to write data to RootsMagic database
+                - **navigate**: Loading the FamilySearch or Find a Grave page
+                - **wait**: Waiting for page content to render
+                - **extract**: Reading data from the page
+                - **parse**: Turning extracted data into records and citations
+                - **match**: Looking up RootsMagic persons for the source
+                - **db_write**: Writing to census.db, RootsMagic or the state database
+                - **image_download**: Downloading memorial photos
+                - **llm_call**: Waiting for an LLM provider
 
-                **Metrics:**
+                **Statistics:**
 
-                - **Avg Duration**: Mean operation time (lower is better)
-                - **Min Duration**: Fastest operation time (best case)
-                - **Max Duration**: Slowest operation time (worst case, outlier detection)
-                - **Success Rate**: Percentage of successful operations (higher is better)
+                - **p50**: Median time per item (typical case)
+                - **p95**: Time that 95% of items beat (slow tail, outliers)
+                - **Failures**: Items where the stage raised an error
 
-                **Performance Status:**
+                **Performance Status (by p95):**
 
-                - **Excellent**: < 2 seconds, > 50% success rate
-                - **Good**: 2-5 seconds, > 50% success rate
+                - **Excellent**: < 2 seconds
+                - **Good**: 2-5 seconds
                 - **Slow**: > 5 seconds (bottleneck warning)
-                - **Critical**: < 50% success rate (needs immediate attention)
-
-                **Business Value:**
-
-                - **Identify bottlenecks**: Which operation is slowest?
-                - **Optimize workflow**: Focus on high-duration operations
-                - **Detect issues**: Low success rates indicate systemic problems
-                - **Estimate completion**: Use avg duration to project batch completion time
+                - **Critical**: more than half of the items failed in this stage
 
-                **Recommended Actions:**
+                **Drilling Down:**
 
-                - **Slow page loads**: Check network speed, use parallel processing
-                - **Slow extraction**: Optimize parser, reduce complexity
-                - **Slow database writes**: Check disk I/O, optimize queries
-                - **Low success rates**: Review error logs, fix root causes
+                - Click a row in **Slowest Items** for that item's stage breakdown
+                - Use the download button to export the selected session as a trace
+                  file; open it in https://www.speedscope.app or chrome://tracing
                 ''')
 
                 with ui.row().classes('w-full justify-end'):
@@ -6,10 +6,16 @@ from typing import Callable
 from nicegui import ui
 
 from rmcitecraft.database.batch_state_repository import FindAGraveBatchStateRepository
+from rmcitecraft.monitoring.spans import STAGES
+from rmcitecraft.monitoring.stage_report import ItemTiming, item_timings
 
 
 class ProcessingTimelineChart:
-    """Processing timeline line chart showing batch item processing over time."""
+    """Processing timeline showing per-stage item durations over time.
+
+    Sessions recorded before stage timing existed fall back to a status
+    scatter built from item update times.
+    """
 
     def __init__(
         self,
@@ -57,6 +63,13 @@ class ProcessingTimelineChart:
                     "flat dense round"
                 ).tooltip("Refresh timeline")
 
+        # Prefer stage timings; older sessions only have item update times
+        spans = self._state_repo.get_stage_spans(session_id=self.session_id)
+        if spans:
+            items = sorted(item_timings(spans), key=lambda t: t.started_at)
+            self._render_stage_timeline(items[-self.limit:])
+            return
+
         # Get timeline data
         timeline_data = self._state_repo.get_processing_timeline(
             session_id=self.session_id, limit=self.limit
@@ -213,7 +226,76 @@ class ProcessingTimelineChart:
             self._render_stat_badge("Pending", pending_count, "#FFC107")
             self._render_stat_badge("Total Shown", len(timeline_data), "#2196F3")
 
-    def _render_stat_badge(self, label: str, value: int, color: str) -> None:
+    def _render_stage_timeline(self, items: list[ItemTiming]) -> None:
+        """Render stacked stage durations for each item, oldest first.
+
+        Args:
+            items: Item timings ordered by start time
+        """
+        labels = []
+        for item in items:
+            try:
+                started = datetime.fromisoformat(item.started_at).astimezone()
+                labels.append(started.strftime("%m/%d %H:%M:%S"))
+            except ValueError:
+                labels.append("N/A")
+        names = [item.item_name or f"Item {item.item_id}" for item in items]
+
+        stages = [stage for stage in STAGES if any(stage in item.stages for item in items)]
+        series = [
+            {
+                "name": stage,
+                "type": "bar",
+                "stack": "stages",
+                "data": [round(item.stages.get(stage, 0) / 1000, 2) for item in items],
+                "emphasis": {"focus": "series"},
+            }
+            for stage in stages
+        ]
+
+        chart_options = {
+            "tooltip": {"trigger": "axis", "axisPointer": {"type": "shadow"}},
+            "legend": {"data": stages, "top": 0},
+            "grid": {
+                "left": "3%",
+                "right": "4%",
+                "bottom": "15%",
+                "top": "12%",
+                "containLabel": True,
+            },
+            "xAxis": {
+                "type": "category",
+                "data": [f"{label}\n{name}" for label, name in zip(labels, names, strict=True)],
+                "axisLabel": {"rotate": 45, "fontSize": 10},
+            },
+            "yAxis": {"type": "value", "name": "Seconds"},
+            "series": series,
+            "dataZoom": [
+                {
+                    "type": "slider",
+                    "show": True,
+                    "start": 0,
+                    "end": 100,
+                    "height": 20,
+                    "bottom": 10,
+                },
+                {"type": "inside", "start": 0, "end": 100},
+            ],
+        }
+
+        self.chart = ui.echart(chart_options).classes("w-full h-80")
+
+        # Summary stats
+        totals = sorted(item.total_ms for item in items)
+        median_s = totals[len(totals) // 2] / 1000 if totals else 0
+        failed_count = sum(1 for item in items if item.failures)
+
+        with ui.row().classes("w-full gap-4 mt-4 justify-center"):
+            self._render_stat_badge("Items Shown", len(items), "#2196F3")
+            self._render_stat_badge("Median (s)", round(median_s, 1), "#4CAF50")
+            self._render_stat_badge("With Failures", failed_count, "#F44336")
+
+    def _render_stat_badge(self, label: str, value: int | float, color: str) -> None:
         """Render a statistics badge.
 
         Args:
@@ -2,14 +2,27 @@
 
 Provides an embedded image viewer for displaying census images
 alongside citation editing forms.
+
+When Pillow is available the viewer displays tiles from the image pyramid
+cache (services/image_tiles.py) instead of the full-resolution scan: it picks
+the pyramid level matching the on-screen width and the browser lazily loads
+only the tiles scrolled into view. Until an image's pyramid is built, the
+original file is shown.
 """
 
 import random
+from concurrent.futures import Future
 from pathlib import Path
 
 from loguru import logger
 from nicegui import ui
 
+from rmcitecraft.services import image_tiles
+from rmcitecraft.services.image_tiles import ImagePyramid, PyramidLevel, get_image_tile_cache
+
+# Assumed viewport width (device pixels) until the browser reports it
+DEFAULT_VIEWPORT_WIDTH = 1200
+
 
 class CensusImageViewer:
     """Interactive image viewer with zoom and pan controls."""
@@ -34,8 +47,17 @@ class CensusImageViewer:
         self.max_zoom = max_zoom
         self.min_zoom = min_zoom
 
+        # Tile pyramid state
+        self.use_tiles = image_tiles.is_available()
+        self.pyramid: ImagePyramid | None = None
+        self.pyramid_level: PyramidLevel | None = None
+        self.viewport_width = DEFAULT_VIEWPORT_WIDTH
+        self._pending_pyramid: Future | None = None
+        self._pyramid_timer: ui.timer | None = None
+
         # UI elements (set during render)
-        self.image_element: ui.image | None = None
+        self.image_element: ui.element | None = None
+        self.image_holder: ui.element | None = None
         self.container: ui.element | None = None
         self.scroll_container: ui.element | None = None
         self.scroll_area_id: str | None = None
@@ -108,20 +130,8 @@ class CensusImageViewer:
                 .style("height: 24rem; overflow: auto;")
             )
             with self.scroll_container:
-                if self.image_path and self.image_path.exists():
-                    zoom_pct = int(self.zoom_level * 100)
-                    self.image_element = (
-                        ui.image(str(self.image_path))
-                        .classes("cursor-move")
-                        .style(
-                            f"width: {zoom_pct}%; height: auto; "
-                            "display: block; max-width: none; max-height: none;"
-                        )
-                    )
-                else:
-                    with ui.column().classes("w-full h-full items-center justify-center"):
-                        ui.icon("image_not_supported", size="4rem").classes("text-gray-400")
-                        ui.label("No image available").classes("text-gray-500")
+                self.image_holder = ui.element("div").classes("w-full")
+            self._render_image()
 
             # Add timer to poll scroll position
             if self.image_path and self.image_path.exists():
@@ -156,6 +166,106 @@ class CensusImageViewer:
                     on_click=lambda: self._pan(0, 10),
                 ).props("flat dense").tooltip("Pan Down")
 
+    def _render_image(self) -> None:
+        """Render the current image into the scroll container.
+
+        Uses the tile pyramid if it is cached; otherwise shows the original
+        file and builds the pyramid in the background.
+        """
+        if not self.image_holder:
+            return
+        self.image_holder.clear()
+        self.image_element = None
+        self.pyramid = None
+        self.pyramid_level = None
+
+        with self.image_holder:
+            if not (self.image_path and self.image_path.exists()):
+                if self.use_tiles:
+                    get_image_tile_cache().hold(self, None)
+                with ui.column().classes("w-full h-full items-center justify-center"):
+                    ui.icon("image_not_supported", size="4rem").classes("text-gray-400")
+                    ui.label("No image available").classes("text-gray-500")
+                return
+
+            if self.use_tiles:
+                tile_cache = get_image_tile_cache()
+                self.pyramid = tile_cache.get_pyramid(self.image_path)
+                tile_cache.hold(self, self.pyramid)
+
+            if self.pyramid:
+                self._render_tiles()
+            else:
+                zoom_pct = int(self.zoom_level * 100)
+                self.image_element = (
+                    ui.image(str(self.image_path))
+                    .classes("cursor-move")
+                    .style(
+                        f"width: {zoom_pct}%; height: auto; "
+                        "display: block; max-width: none; max-height: none;"
+                    )
+                )
+                if self.use_tiles:
+                    self._request_pyramid()
+
+    def _render_tiles(self) -> None:
+        """Render the pyramid level matching the current zoom as a tile grid.
+
+        Tiles are <img loading="lazy"> elements with intrinsic sizes, so the
+        grid has its full layout immediately but the browser only fetches
+        tiles near the visible part of the scroll container.
+        """
+        pyramid = self.pyramid
+        level = pyramid.level_for_width(self.zoom_level * self.viewport_width)
+        self.pyramid_level = level
+        tile_size = pyramid.tile_size
+        zoom_pct = int(self.zoom_level * 100)
+
+        tile_widths = [min(tile_size, level.width - col * tile_size) for col in range(level.cols)]
+        grid_columns = " ".join(f"{w / level.width * 100:.4f}%" for w in tile_widths)
+
+        self.image_element = (
+            ui.element("div")
+            .classes("cursor-move")
+            .style(
+                f"width: {zoom_pct}%; display: grid; grid-template-columns: {grid_columns}; "
+                "line-height: 0; max-width: none;"
+            )
+        )
+        with self.image_element:
+            for row in range(level.rows):
+                tile_height = min(tile_size, level.height - row * tile_size)
+                for col, tile_width in enumerate(tile_widths):
+                    url = pyramid.tile_url(level.level, col, row)
+                    ui.element("img").props(
+                        f'src="{url}" loading=lazy draggable=false '
+                        f"width={tile_width} height={tile_height}"
+                    ).style("width: 100%; height: auto; display: block;")
+
+    def _request_pyramid(self) -> None:
+        """Build the current image's pyramid in the background and swap it in when ready."""
+        try:
+            self._pending_pyramid = get_image_tile_cache().request(self.image_path)
+        except OSError as e:
+            logger.warning(f"Cannot build tile pyramid for {self.image_path}: {e}")
+            return
+
+        if self._pyramid_timer is None and self.container:
+            with self.container:
+                self._pyramid_timer = ui.timer(0.25, self._check_pending_pyramid)
+
+    def _check_pending_pyramid(self) -> None:
+        """Timer callback: show tiles once the background build finishes."""
+        future = self._pending_pyramid
+        if future is None or not future.done():
+            return
+        self._pending_pyramid = None
+
+        if future.exception():
+            logger.warning(f"Tile pyramid build failed for {self.image_path}: {future.exception()}")
+            return
+        self._render_image()
+
     def set_image(self, image_path: Path) -> None:
         """Change the displayed image.
 
@@ -164,10 +274,10 @@ class CensusImageViewer:
         """
         self.image_path = image_path
         self.zoom_level = 1.0
+        self._pending_pyramid = None
 
-        if self.image_element:
-            self.image_element.set_source(str(image_path))
-            self._set_zoom(1.0)
+        self._render_image()
+        self._set_zoom(1.0)
 
     def _zoom_in(self) -> None:
         """Increase zoom level by 25%."""
@@ -191,7 +301,16 @@ class CensusImageViewer:
         zoom_pct = int(self.zoom_level * 100)
 
         # Update image size - uses actual dimensions not CSS transform for proper scrolling
-        if self.image_element:
+        if self.pyramid:
+            # Switch pyramid level if the new size needs more (or less) detail
+            level = self.pyramid.level_for_width(self.zoom_level * self.viewport_width)
+            if level != self.pyramid_level:
+                self.image_holder.clear()
+                with self.image_holder:
+                    self._render_tiles()
+            elif self.image_element:
+                self.image_element.style(f"width: {zoom_pct}%;")
+        elif self.image_element:
             self.image_element.style(
                 f"width: {zoom_pct}%; height: auto; "
                 "display: block; max-width: none; max-height: none;"
@@ -232,7 +351,10 @@ class CensusImageViewer:
                         return {{
                             found: true,
                             scrollLeft: Math.round(scrollContainer.scrollLeft),
-                            scrollTop: Math.round(scrollContainer.scrollTop)
+                            scrollTop: Math.round(scrollContainer.scrollTop),
+                            viewportWidth: Math.round(
+                                scrollContainer.clientWidth * (window.devicePixelRatio || 1)
+                            )
                         }};
                     }}
                     return {{found: false, scrollLeft: 0, scrollTop: 0}};
@@ -246,6 +368,11 @@ class CensusImageViewer:
                 scroll_y = result.get("scrollTop", 0)
                 zoom_pct = int(self.zoom_level * 100)
                 self.position_label.set_text(f"Zoom: {zoom_pct}% | X={scroll_x}px, Y={scroll_y}px")
+
+                viewport_width = result.get("viewportWidth")
+                if viewport_width and viewport_width != self.viewport_width:
+                    self.viewport_width = viewport_width
+                    self._set_zoom(self.zoom_level)  # Re-pick the pyramid level
             else:
                 self.position_label.set_text(f"Zoom: {int(self.zoom_level * 100)}%")
 
@@ -42,7 +42,7 @@ from rmcitecraft.services.page_health_monitor import (
     PageHealthMonitor,
     PageRecoveryManager,
 )
-from rmcitecraft.services.retry_strategy import RetryConfig, RetryStrategy
+from rmcitecraft.services.retry_strategy import CircuitOpenError, RetryConfig, RetryStrategy
 from rmcitecraft.ui.components.citation_queue import CitationQueueComponent
 from rmcitecraft.ui.components.data_entry_form import DataEntryFormComponent
 from rmcitecraft.ui.components.image_viewer import create_census_image_viewer
@@ -903,6 +903,17 @@ class BatchProcessingTab:
                         timeout=10000,
                     )
                     break  # Exit the processing loop
+                elif result == "circuit_open":
+                    # FamilySearch keeps failing - stop instead of hammering it
+                    errors += 1
+                    logger.error("Stopping batch: FamilySearch circuit breaker open")
+                    ui.notify(
+                        "Batch stopped: FamilySearch requests keep failing. "
+                        "Wait a few minutes before resuming.",
+                        type="negative",
+                        timeout=10000,
+                    )
+                    break
 
                 # Refresh queue component only (don't destroy/recreate UI)
                 if self.queue_component:
@@ -1189,6 +1200,15 @@ class BatchProcessingTab:
                 # Return special status to signal caller to stop batch
                 return "connection_error"
 
+            except CircuitOpenError as e:
+                logger.error(f"Extraction paused: {e}")
+                self.controller.mark_citation_error(citation, str(e))
+                if self.state_repository and self.current_state_item_id:
+                    self.state_repository.update_item_status(
+                        self.current_state_item_id, "error", str(e)
+                    )
+                return "circuit_open"
+
             except Exception as e:
                 retry_count += 1
                 logger.warning(f"Extraction attempt {retry_count} failed: {e}")
@@ -138,6 +138,7 @@ class CensusExtractionViewerTab:
         self.rin_input: ui.input | None = None
         self.year_select: ui.select | None = None
         self.unlinked_filter: ui.checkbox | None = None
+        self.phonetic_filter: ui.checkbox | None = None
         self.status_label: ui.label | None = None
 
         # View mode: "persons" or "pages"
@@ -340,6 +341,12 @@ class CensusExtractionViewerTab:
                 on_change=lambda e: self._do_search(),
             ).classes("w-28").tooltip("Search by RootsMagic Person ID")
 
+            self.phonetic_filter = ui.checkbox(
+                "Sounds Like",
+                value=False,
+                on_change=lambda e: self._do_search(),
+            ).tooltip("Match names by Soundex code (e.g. Iams finds Imes)")
+
             self.year_select = ui.select(
                 options={
                     None: "All Years",
@@ -423,6 +430,7 @@ class CensusExtractionViewerTab:
         rin_str = self.rin_input.value if self.rin_input else None
         year = self.year_select.value if self.year_select else None
         unlinked_only = self.unlinked_filter.value if self.unlinked_filter else False
+        phonetic = self.phonetic_filter.value if self.phonetic_filter else False
 
         # Parse RIN if provided
         rin = None
@@ -437,6 +445,7 @@ class CensusExtractionViewerTab:
             given_name=given_name if given_name else None,
             census_year=year,
             rmtree_person_id=rin,
+            phonetic=phonetic,
         )
 
         # Filter to unlinked persons if requested (exclude linked AND user-rejected)
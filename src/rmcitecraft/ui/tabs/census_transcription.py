@@ -12,14 +12,19 @@ import webbrowser
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from loguru import logger
 from nicegui import ui
 
 from rmcitecraft.config import get_config
 from rmcitecraft.repositories import DatabaseConnection
+from rmcitecraft.services import image_tiles
 from rmcitecraft.services.census_transcriber import CensusTranscriber
 
+if TYPE_CHECKING:
+    from rmcitecraft.services.census_rmtree_matcher import CensusRMTreeMatcher
+
 
 def parse_footnote_context(footnote: str) -> dict:
     """Extract line number, sheet, and ED from citation footnote.
@@ -77,6 +82,11 @@ class CensusTranscriptionTab:
         self.config = get_config()
         self.transcriber: CensusTranscriber | None = None
         self.is_transcribing: bool = False
+        # Person records received so far from the streaming LLM response
+        self.streamed_persons: list[dict] = []
+        # RootsMagic matcher with the tree's household graph, loaded on the
+        # first import and reused for the life of the tab
+        self.matcher: CensusRMTreeMatcher | None = None
 
         # Data
         self.census_images: list[CensusImageRecord] = []
@@ -174,10 +184,10 @@ class CensusTranscriptionTab:
                 elapsed = int(time.time() - self.start_time)
                 minutes = elapsed // 60
                 seconds = elapsed % 60
-                if minutes > 0:
-                    self.elapsed_label.set_text(f"{minutes}m {seconds}s")
-                else:
-                    self.elapsed_label.set_text(f"{seconds}s")
+                elapsed_text = f"{minutes}m {seconds}s" if minutes > 0 else f"{seconds}s"
+                if self.streamed_persons:
+                    elapsed_text += f" - {len(self.streamed_persons)} persons read"
+                self.elapsed_label.set_text(elapsed_text)
 
         self.elapsed_timer = ui.timer(1.0, update_elapsed)
 
@@ -515,6 +525,25 @@ class CensusTranscriptionTab:
         """Select an image."""
         self.selected_image = img
         self._refresh_preview()
+        self._prefetch_following_images(img)
+
+    def _prefetch_following_images(self, img: CensusImageRecord, count: int = 3) -> None:
+        """Build tile pyramids for the next images in the list in the background."""
+        if not image_tiles.is_available() or img not in self.census_images:
+            return
+        start = self.census_images.index(img) + 1
+        following = [Path(i.media_path) for i in self.census_images[start:start + count]]
+        image_tiles.get_image_tile_cache().prefetch([p for p in following if p.exists()])
+
+    def _preview_source(self, img: CensusImageRecord) -> str:
+        """Preview image source: cached pyramid thumbnail, else the original file."""
+        if image_tiles.is_available():
+            tile_cache = image_tiles.get_image_tile_cache()
+            pyramid = tile_cache.get_pyramid(Path(img.media_path))
+            tile_cache.hold(self, pyramid)
+            if pyramid:
+                return pyramid.thumbnail_url()
+        return img.media_path
 
     def _refresh_preview(self) -> None:
         """Refresh the preview panel."""
@@ -558,7 +587,7 @@ class CensusTranscriptionTab:
 
             # Preview or error
             if exists:
-                ui.image(img.media_path).classes("w-full max-h-48 object-contain mt-2")
+                ui.image(self._preview_source(img)).classes("w-full max-h-48 object-contain mt-2")
                 with ui.row().classes("w-full gap-2 mt-2"):
                     # NiceGUI handles async functions directly when passed to on_click
                     ui.button(
@@ -635,6 +664,7 @@ class CensusTranscriptionTab:
                 print(">>> Creating CensusTranscriber...", flush=True)
 
                 try:
+                    # census_cascade_models, when set, takes precedence over this model
                     self.transcriber = CensusTranscriber(model='gemini-3-pro-preview')
                     logger.info(f"CensusTranscriber created with provider: {self.transcriber.provider.name}")
                     print(f">>> CensusTranscriber created: {self.transcriber.provider.name}", flush=True)
@@ -649,6 +679,7 @@ class CensusTranscriptionTab:
             logger.info(f"Calling transcribe_census for {img.media_path}")
             print(f">>> Calling LLM for {year} census...", flush=True)
 
+            self.streamed_persons = []
             loop = asyncio.get_event_loop()
             result = await loop.run_in_executor(
                 None,
@@ -686,6 +717,7 @@ class CensusTranscriptionTab:
                 img.media_path,
                 year,
                 target_names=img.person_names if img.person_names else None,
+                on_person=self._on_streamed_person,
                 **footnote_context
             )
             logger.info(f"transcribe_census returned: confidence={result.confidence}")
@@ -695,6 +727,12 @@ class CensusTranscriptionTab:
             print(f">>> transcribe_census FAILED: {e}", flush=True)
             raise
 
+    def _on_streamed_person(self, person: dict, warnings: list[str]) -> None:
+        """Collect a person record as the LLM streams it (runs in the executor thread)."""
+        self.streamed_persons.append(person)
+        if warnings:
+            logger.debug(f"Streamed person {person.get('name')}: {warnings}")
+
     def _open_image_in_browser(self) -> None:
         """Open the census image in a browser tab for full-screen viewing."""
         if not self.selected_image:
@@ -1019,6 +1057,9 @@ class CensusTranscriptionTab:
                 ("bg-green-100 text-green-700" if result.confidence >= 0.8 else "bg-yellow-100 text-yellow-700")
             )
             ui.label(f"{len(records)} records extracted").classes("text-sm")
+            model = (result.metadata or {}).get('model')
+            if model:
+                ui.label(f"Model: {model}").classes("text-xs text-gray-500")
 
             # Browser view buttons
             with ui.row().classes("gap-2 mt-2"):
@@ -1080,6 +1121,14 @@ class CensusTranscriptionTab:
 
         return None
 
+    async def _get_matcher(self) -> "CensusRMTreeMatcher":
+        """The tab's matcher, created with the household graph on first use."""
+        from rmcitecraft.services.census_rmtree_matcher import create_matcher
+
+        if self.matcher is None:
+            self.matcher = await asyncio.to_thread(create_matcher, household_graph=True)
+        return self.matcher
+
     async def _import_from_familysearch(self, ark_url: str) -> None:
         """Import census data from FamilySearch and run fuzzy matching.
 
@@ -1089,8 +1138,6 @@ class CensusTranscriptionTab:
         from rmcitecraft.services.familysearch_census_extractor import (
             extract_census_from_citation,
         )
-        from rmcitecraft.services.census_rmtree_matcher import create_matcher
-
         if not self.selected_image:
             ui.notify("No image selected", type="warning")
             return
@@ -1129,11 +1176,10 @@ class CensusTranscriptionTab:
             # Step 3: Run fuzzy matching against RootsMagic
             # Get the footnote to find the citation ID
             footnote = img.footnote or ""
-            matcher = None
             match_result = None
 
             try:
-                matcher = create_matcher()
+                matcher = await self._get_matcher()
 
                 # Try to find matching RootsMagic citation by ARK URL in the footnote
                 # The footnote contains the FamilySearch URL which links to the citation
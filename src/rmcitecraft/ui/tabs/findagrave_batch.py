@@ -1,6 +1,5 @@
 """Find a Grave Batch Processing Tab UI."""
 
-import asyncio
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -19,6 +18,7 @@ from rmcitecraft.database.findagrave_queries import (
     link_citation_to_families,
 )
 from rmcitecraft.database.image_repository import ImageRepository
+from rmcitecraft.monitoring.spans import SpanRecorder, span, span_context
 from rmcitecraft.services.adaptive_timeout import AdaptiveTimeoutManager, TimingContext
 from rmcitecraft.services.error_log import get_error_log_service
 from rmcitecraft.services.findagrave_automation import get_findagrave_automation
@@ -32,10 +32,8 @@ from rmcitecraft.services.findagrave_formatter import (
     generate_image_filename,
     generate_source_name,
 )
-from rmcitecraft.services.page_health_monitor import (
-    PageHealthMonitor,
-    PageRecoveryManager,
-)
+from rmcitecraft.services.findagrave_pipeline import ExtractionResult, MemorialExtractionPipeline
+from rmcitecraft.services.page_health_monitor import PageHealthMonitor
 from rmcitecraft.services.retry_strategy import RetryConfig, RetryStrategy
 
 
@@ -54,7 +52,6 @@ class FindAGraveBatchTab:
             db_path=self.config.findagrave_state_db_path
         )
         self.health_monitor = PageHealthMonitor(health_check_timeout_ms=2000)
-        self.recovery_manager = PageRecoveryManager(self.health_monitor)
         self.timeout_manager = AdaptiveTimeoutManager(
             base_timeout_seconds=self.config.findagrave_base_timeout_seconds,
             window_size=self.config.findagrave_timeout_window_size,
@@ -68,7 +65,6 @@ class FindAGraveBatchTab:
 
         # State tracking
         self.current_session_id: str | None = None
-        self.current_state_item_id: int | None = None
         self.checkpoint_counter = 0
 
         # UI component references
@@ -915,7 +911,7 @@ class FindAGraveBatchTab:
 
                         # Store media ID with the downloaded image info
                         item.downloaded_images[-1] = {
-                            'path': str(download_path),
+                            'path': media_info['image_path'],
                             'media_id': media_info['media_id'],
                             'photo_type': photo_type,
                         }
@@ -1051,7 +1047,7 @@ class FindAGraveBatchTab:
 
                     # Store in item's downloaded images list
                     item.downloaded_images.append({
-                        'path': str(download_path),
+                        'path': media_info['image_path'],
                         'media_id': media_info['media_id'],
                         'photo_type': photo_type,
                     })
@@ -1557,56 +1553,38 @@ class FindAGraveBatchTab:
         # Collect citation matching data for end-of-batch report
         citation_report_data = []
 
-        # Reset recovery counter at start of batch
-        if self.config.findagrave_enable_crash_recovery:
-            self.recovery_manager.reset_recovery_counter()
-
-        for i, item in enumerate(items_to_process, 1):
-            # Update progress
-            progress_label.text = f"Processing {i} of {total}: {item.full_name}"
-            progress_bar.value = i / total
-            status_label.text = f"{processed} completed"
-
-            # Get state item ID for tracking
-            try:
-                state_items = self.state_repository.get_session_items(session_id)
-                state_item = next(
-                    (si for si in state_items if si['person_id'] == item.person_id),
-                    None
-                )
-                self.current_state_item_id = state_item['id'] if state_item else None
-            except Exception:
-                self.current_state_item_id = None
-
-            try:
-                # ===== PHASE 1: PAGE HEALTH CHECK =====
-                if self.config.findagrave_enable_crash_recovery:
-                    health_label.text = "Checking page health..."
-
-                    page = await self.automation.get_or_create_page()
-                    health = await self.health_monitor.check_page_health(page)
-
-                    if not health.is_healthy:
-                        logger.warning(f"Page unhealthy: {health.error}")
-                        health_label.text = f"⚠️ Page issue: {health.error}"
-
-                        # Attempt recovery
-                        status_label.text = "Recovering from page crash..."
-                        recovered_page = await self.recovery_manager.attempt_recovery(
-                            page, self.automation
-                        )
-
-                        if not recovered_page:
-                            raise Exception(f"Failed to recover page: {health.error}")
-
-                        logger.info("Page recovery successful")
-                        health_label.text = "✓ Page recovered"
-                    else:
-                        health_label.text = "✓ Page healthy"
-
-                # ===== PHASE 2: DUPLICATE CHECK =====
-                status_label.text = "Checking for duplicates..."
+        recorder = SpanRecorder(
+            self.state_repository.record_spans,
+            batch_type="findagrave",
+            enabled=self.config.stage_spans_enabled,
+        )
 
+        # State item IDs for tracking, looked up once for the whole batch
+        try:
+            state_item_ids = {
+                state_item['person_id']: state_item['id']
+                for state_item in self.state_repository.get_session_items(session_id)
+            }
+        except Exception:
+            state_item_ids = {}
+
+        started = 0
+        finished = 0
+
+        async def extract_item(item: FindAGraveBatchItem, page) -> dict | None:
+            """Check for duplicates and extract one memorial (runs in an extraction tab).
+
+            Returns:
+                Memorial data, or None if the person already has the citation
+            """
+            nonlocal started
+            started += 1
+            progress_label.text = f"Processing {started} of {total}: {item.full_name}"
+            state_item_id = state_item_ids.get(item.person_id)
+
+            # Stage spans for this item carry its state item ID
+            with span_context(item_id=state_item_id):
+                # ===== PHASE 1: DUPLICATE CHECK =====
                 duplicate_check = check_citation_exists_detailed(
                     db_path=self.config.rm_database_path,
                     person_id=item.person_id,
@@ -1623,20 +1601,20 @@ class FindAGraveBatchTab:
                         f"Duplicate: {duplicate_check['details']}"
                     )
 
-                    if self.current_state_item_id:
+                    if state_item_id:
                         self.state_repository.update_item_status(
-                            self.current_state_item_id,
+                            state_item_id,
                             'error',
                             error_message=duplicate_check['details']
                         )
 
-                    continue
+                    return None
 
-                # ===== PHASE 3: EXTRACTION WITH RETRY & ADAPTIVE TIMEOUT =====
+                # ===== PHASE 2: EXTRACTION WITH RETRY & ADAPTIVE TIMEOUT =====
                 item.status = FindAGraveStatus.EXTRACTING
-                if self.current_state_item_id:
+                if state_item_id:
                     self.state_repository.update_item_status(
-                        self.current_state_item_id,
+                        state_item_id,
                         'extracting'
                     )
 
@@ -1656,7 +1634,8 @@ class FindAGraveBatchTab:
                         """Extraction with adaptive timeout."""
                         return await self.automation.extract_memorial_data(
                             item.url,
-                            timeout=current_timeout
+                            timeout=current_timeout,
+                            page=page,
                         )
 
                     memorial_data = await self.retry_strategy.retry_async(
@@ -1667,7 +1646,7 @@ class FindAGraveBatchTab:
                     extraction_duration = time.time() - extraction_start
                     self.timeout_manager.record_response_time(extraction_duration, success=True)
 
-                    if self.current_state_item_id:
+                    if state_item_id:
                         self.state_repository.record_metric(
                             operation='extraction',
                             duration_ms=int(extraction_duration * 1000),
@@ -1680,7 +1659,7 @@ class FindAGraveBatchTab:
                     extraction_duration = time.time() - extraction_start
                     self.timeout_manager.record_response_time(extraction_duration, success=False)
 
-                    if self.current_state_item_id:
+                    if state_item_id:
                         self.state_repository.record_metric(
                             operation='extraction',
                             duration_ms=int(extraction_duration * 1000),
@@ -1690,7 +1669,7 @@ class FindAGraveBatchTab:
 
                         # Increment retry count in state DB
                         retry_count = self.state_repository.increment_retry_count(
-                            self.current_state_item_id
+                            state_item_id
                         )
 
                         logger.error(
@@ -1699,288 +1678,331 @@ class FindAGraveBatchTab:
                             f"{extraction_error}"
                         )
 
-                    raise  # Re-raise to be caught by outer exception handler
+                    raise  # Re-raise; the writer records the error
 
                 if not memorial_data:
                     raise Exception("Failed to extract memorial data")
 
-                # Update item with extracted data
-                self.controller.update_item_extracted_data(item, memorial_data)
+                return memorial_data
 
-                # Store extraction in state DB
-                if self.current_state_item_id:
-                    self.state_repository.update_item_extraction(
-                        self.current_state_item_id,
-                        extracted_data=memorial_data
-                    )
-
-                # ===== PHASE 4: CITATION FORMATTING =====
-                status_label.text = "Formatting citation..."
-
-                # Format citation using Find a Grave name (not database name)
-                # Source name uses database name, but citations use Find a Grave name
-                citation = format_findagrave_citation(
-                    memorial_data=memorial_data,
-                    person_name=memorial_data.get('personName', item.full_name),
-                    birth_year=item.birth_year,
-                    death_year=item.death_year,
-                    maiden_name=memorial_data.get('maidenName'),
-                )
+        async def write_item(extraction: ExtractionResult[FindAGraveBatchItem]) -> None:
+            """Format, write and checkpoint one extracted item (never runs concurrently)."""
+            nonlocal processed, finished
+            item = extraction.item
+            state_item_id = state_item_ids.get(item.person_id)
+            finished += 1
+            progress_bar.value = finished / total
 
-                # Store formatted citations
-                item.footnote = citation['footnote']
-                item.short_footnote = citation['short_footnote']
-                item.bibliography = citation['bibliography']
-
-                # Generate source name
-                source_name = generate_source_name(
-                    surname=item.surname,
-                    given_name=item.given_name,
-                    maiden_name=memorial_data.get('maidenName'),
-                    birth_year=item.birth_year,
-                    death_year=item.death_year,
-                    person_id=item.person_id,
-                )
+            with span_context(item_id=state_item_id):
+                try:
+                    if extraction.error:
+                        raise extraction.error
 
-                # ===== PHASE 5: DATABASE WRITES =====
-                status_label.text = "Writing to database..."
+                    memorial_data = extraction.data
+                    if memorial_data is None:
+                        return  # Duplicate, already marked
 
-                if self.current_state_item_id:
-                    self.state_repository.update_item_status(
-                        self.current_state_item_id,
-                        'creating_citation'
-                    )
+                    # Update item with extracted data
+                    self.controller.update_item_extracted_data(item, memorial_data)
 
-                # Check if memorial has Grave/Headstone photos for citation quality assessment
-                has_grave_photo = False
-                photos = memorial_data.get('photos', [])
-                for photo in photos:
-                    photo_type = photo.get('photoType', '').lower()
-                    if photo_type in ['grave', 'headstone']:
-                        has_grave_photo = True
-                        break
-
-                citation_start = time.time()
+                    # Store extraction in state DB
+                    if state_item_id:
+                        self.state_repository.update_item_extraction(
+                            state_item_id,
+                            extracted_data=memorial_data
+                        )
 
-                try:
-                    result = create_findagrave_source_and_citation(
-                        db_path=self.config.rm_database_path,
-                        person_id=item.person_id,
-                        source_name=source_name,
-                        memorial_url=item.url,
-                        footnote=citation['footnote'],
-                        short_footnote=citation['short_footnote'],
-                        bibliography=citation['bibliography'],
-                        memorial_text=memorial_data.get('memorialText', ''),
-                        source_comment=memorial_data.get('sourceComment', ''),
-                    )
+                    # ===== PHASE 3: CITATION FORMATTING =====
+                    status_label.text = "Formatting citation..."
+
+                    with span("parse"):
+                        # Format citation using Find a Grave name (not database name)
+                        # Source name uses database name, but citations use Find a Grave name
+                        citation = format_findagrave_citation(
+                            memorial_data=memorial_data,
+                            person_name=memorial_data.get('personName', item.full_name),
+                            birth_year=item.birth_year,
+                            death_year=item.death_year,
+                            maiden_name=memorial_data.get('maidenName'),
+                        )
 
-                    # Link citation directly to Person (ALWAYS)
-                    try:
-                        from rmcitecraft.database.findagrave_queries import link_citation_to_person
-                        link_citation_to_person(
-                            db_path=self.config.rm_database_path,
+                        # Store formatted citations
+                        item.footnote = citation['footnote']
+                        item.short_footnote = citation['short_footnote']
+                        item.bibliography = citation['bibliography']
+
+                        # Generate source name
+                        source_name = generate_source_name(
+                            surname=item.surname,
+                            given_name=item.given_name,
+                            maiden_name=memorial_data.get('maidenName'),
+                            birth_year=item.birth_year,
+                            death_year=item.death_year,
                             person_id=item.person_id,
-                            citation_id=result['citation_id'],
-                            has_grave_photo=has_grave_photo,
                         )
-                    except Exception as person_link_error:
-                        logger.error(f"Failed to link citation to person: {person_link_error}")
-                        # Don't fail the entire item, just log the error
 
-                    # Link citation to families (conditional on family members mentioned)
-                    try:
-                        family_ids = link_citation_to_families(
-                            db_path=self.config.rm_database_path,
-                            person_id=item.person_id,
-                            citation_id=result['citation_id'],
-                            family_data=memorial_data.get('family'),
+                    # ===== PHASE 4: DATABASE WRITES =====
+                    status_label.text = "Writing to database..."
+
+                    if state_item_id:
+                        self.state_repository.update_item_status(
+                            state_item_id,
+                            'creating_citation'
                         )
-                        if family_ids:
-                            logger.info(f"Linked citation to {len(family_ids)} parent families for {item.full_name} (PersonID {item.person_id})")
-                    except Exception as family_link_error:
-                        logger.warning(f"Failed to link citation to parent families: {family_link_error}")
-                        # Don't fail the entire item, just log the warning
-
-                    burial_event_id = None
-
-                    # Create burial event BEFORE downloading images
-                    # (so Grave/Cemetery photos can link to the burial event)
-                    cemetery_name = memorial_data.get('cemeteryName', '')
-                    cemetery_city = memorial_data.get('cemeteryCity', '')
-                    cemetery_county = memorial_data.get('cemeteryCounty', '')
-                    cemetery_state = memorial_data.get('cemeteryState', '')
-                    cemetery_country = memorial_data.get('cemeteryCountry', '')
 
-                    logger.info(
-                        f"Burial event check for {item.full_name}:\n"
-                        f"  Cemetery: {cemetery_name or 'NOT FOUND'}\n"
-                        f"  City: {cemetery_city or 'NOT FOUND'}\n"
-                        f"  County: {cemetery_county or 'NOT FOUND'}\n"
-                        f"  State: {cemetery_state or 'NOT FOUND'}\n"
-                        f"  Country: {cemetery_country or 'NOT FOUND'}"
-                    )
+                    # Check if memorial has Grave/Headstone photos for citation quality assessment
+                    has_grave_photo = False
+                    photos = memorial_data.get('photos', [])
+                    for photo in photos:
+                        photo_type = photo.get('photoType', '').lower()
+                        if photo_type in ['grave', 'headstone']:
+                            has_grave_photo = True
+                            break
+
+                    citation_start = time.time()
 
-                    if cemetery_name:
-                        logger.info(f"Creating burial event for {item.full_name}...")
+                    try:
+                        with span("db_write"):
+                            result = create_findagrave_source_and_citation(
+                                db_path=self.config.rm_database_path,
+                                person_id=item.person_id,
+                                source_name=source_name,
+                                memorial_url=item.url,
+                                footnote=citation['footnote'],
+                                short_footnote=citation['short_footnote'],
+                                bibliography=citation['bibliography'],
+                                memorial_text=memorial_data.get('memorialText', ''),
+                                source_comment=memorial_data.get('sourceComment', ''),
+                            )
 
+                        # Link citation directly to Person (ALWAYS)
                         try:
-                            burial_result = create_burial_event_and_link_citation(
+                            from rmcitecraft.database.findagrave_queries import link_citation_to_person
+                            link_citation_to_person(
                                 db_path=self.config.rm_database_path,
                                 person_id=item.person_id,
                                 citation_id=result['citation_id'],
-                                cemetery_name=cemetery_name,
-                                cemetery_city=cemetery_city or '',
-                                cemetery_county=cemetery_county or '',
-                                cemetery_state=cemetery_state or '',
-                                cemetery_country=cemetery_country or '',
                                 has_grave_photo=has_grave_photo,
                             )
+                        except Exception as person_link_error:
+                            logger.error(f"Failed to link citation to person: {person_link_error}")
+                            # Don't fail the entire item, just log the error
 
-                            # Successfully created burial event
-                            burial_event_id = burial_result['burial_event_id']
-                            logger.info(
-                                f"Created burial event {burial_event_id} for {item.full_name}"
-                            )
-
-                        except Exception as burial_error:
-                            logger.error(f"Failed to create burial event: {burial_error}", exc_info=True)
-                            self.error_log.add_error(
-                                f"Failed to create burial event for {item.full_name}: {burial_error}",
-                                context="Find a Grave Batch"
+                        # Link citation to families (conditional on family members mentioned)
+                        try:
+                            family_ids = link_citation_to_families(
+                                db_path=self.config.rm_database_path,
+                                person_id=item.person_id,
+                                citation_id=result['citation_id'],
+                                family_data=memorial_data.get('family'),
                             )
-                            # Don't fail the entire item, just log the error
-                    else:
-                        logger.warning(
-                            f"No cemetery name found for {item.full_name} (PersonID {item.person_id}), skipping burial event creation"
-                        )
-                        self.error_log.add_warning(
-                            f"No cemetery name found for {item.full_name} (PersonID {item.person_id}), skipping burial event",
-                            context="Find a Grave Batch"
+                            if family_ids:
+                                logger.info(f"Linked citation to {len(family_ids)} parent families for {item.full_name} (PersonID {item.person_id})")
+                        except Exception as family_link_error:
+                            logger.warning(f"Failed to link citation to parent families: {family_link_error}")
+                            # Don't fail the entire item, just log the warning
+
+                        burial_event_id = None
+
+                        # Create burial event BEFORE downloading images
+                        # (so Grave/Cemetery photos can link to the burial event)
+                        cemetery_name = memorial_data.get('cemeteryName', '')
+                        cemetery_city = memorial_data.get('cemeteryCity', '')
+                        cemetery_county = memorial_data.get('cemeteryCounty', '')
+                        cemetery_state = memorial_data.get('cemeteryState', '')
+                        cemetery_country = memorial_data.get('cemeteryCountry', '')
+
+                        logger.info(
+                            f"Burial event check for {item.full_name}:\n"
+                            f"  Cemetery: {cemetery_name or 'NOT FOUND'}\n"
+                            f"  City: {cemetery_city or 'NOT FOUND'}\n"
+                            f"  County: {cemetery_county or 'NOT FOUND'}\n"
+                            f"  State: {cemetery_state or 'NOT FOUND'}\n"
+                            f"  Country: {cemetery_country or 'NOT FOUND'}"
                         )
 
-                    # Auto-download images AFTER burial event is created
-                    # (so Grave/Cemetery photos can link to the burial event)
-                    if self.auto_download_images and item.photos:
-                        logger.info(f"Auto-downloading {len(item.photos)} photo(s) for {item.full_name}...")
-                        status_label.text = f"Downloading {len(item.photos)} image(s)..."
+                        if cemetery_name:
+                            logger.info(f"Creating burial event for {item.full_name}...")
 
-                        for photo in item.photos:
                             try:
-                                # Download photo using the same logic as manual download
-                                await self._download_photo_for_batch(item, photo, result['citation_id'])
-                            except Exception as photo_error:
-                                logger.error(f"Failed to download photo: {photo_error}", exc_info=True)
-                                self.error_log.add_warning(
-                                    f"Failed to download photo for {item.full_name}: {photo_error}",
+                                with span("db_write"):
+                                    burial_result = create_burial_event_and_link_citation(
+                                        db_path=self.config.rm_database_path,
+                                        person_id=item.person_id,
+                                        citation_id=result['citation_id'],
+                                        cemetery_name=cemetery_name,
+                                        cemetery_city=cemetery_city or '',
+                                        cemetery_county=cemetery_county or '',
+                                        cemetery_state=cemetery_state or '',
+                                        cemetery_country=cemetery_country or '',
+                                        has_grave_photo=has_grave_photo,
+                                    )
+
+                                # Successfully created burial event
+                                burial_event_id = burial_result['burial_event_id']
+                                logger.info(
+                                    f"Created burial event {burial_event_id} for {item.full_name}"
+                                )
+
+                            except Exception as burial_error:
+                                logger.error(f"Failed to create burial event: {burial_error}", exc_info=True)
+                                self.error_log.add_error(
+                                    f"Failed to create burial event for {item.full_name}: {burial_error}",
                                     context="Find a Grave Batch"
                                 )
-                                # Continue with other photos/processing
+                                # Don't fail the entire item, just log the error
+                        else:
+                            logger.warning(
+                                f"No cemetery name found for {item.full_name} (PersonID {item.person_id}), skipping burial event creation"
+                            )
+                            self.error_log.add_warning(
+                                f"No cemetery name found for {item.full_name} (PersonID {item.person_id}), skipping burial event",
+                                context="Find a Grave Batch"
+                            )
 
-                    # Record citation creation timing
-                    citation_duration = time.time() - citation_start
-                    if self.current_state_item_id:
-                        self.state_repository.record_metric(
-                            operation='citation_creation',
-                            duration_ms=int(citation_duration * 1000),
-                            success=True,
-                            session_id=session_id
-                        )
+                        # Auto-download images AFTER burial event is created
+                        # (so Grave/Cemetery photos can link to the burial event)
+                        if self.auto_download_images and item.photos:
+                            logger.info(f"Auto-downloading {len(item.photos)} photo(s) for {item.full_name}...")
+                            status_label.text = f"Downloading {len(item.photos)} image(s)..."
+
+                            for photo in item.photos:
+                                try:
+                                    # Download photo using the same logic as manual download
+                                    await self._download_photo_for_batch(item, photo, result['citation_id'])
+                                except Exception as photo_error:
+                                    logger.error(f"Failed to download photo: {photo_error}", exc_info=True)
+                                    self.error_log.add_warning(
+                                        f"Failed to download photo for {item.full_name}: {photo_error}",
+                                        context="Find a Grave Batch"
+                                    )
+                                    # Continue with other photos/processing
+
+                        # Record citation creation timing
+                        citation_duration = time.time() - citation_start
+                        if state_item_id:
+                            self.state_repository.record_metric(
+                                operation='citation_creation',
+                                duration_ms=int(citation_duration * 1000),
+                                success=True,
+                                session_id=session_id
+                            )
 
-                        # Update state DB with created citation IDs
-                        self.state_repository.update_item_citation(
-                            self.current_state_item_id,
-                            citation_id=result['citation_id'],
+                            # Update state DB with created citation IDs
+                            self.state_repository.update_item_citation(
+                                state_item_id,
+                                citation_id=result['citation_id'],
+                                source_id=result['source_id'],
+                                burial_event_id=burial_event_id
+                            )
+
+                        # Mark as complete
+                        self.controller.mark_item_complete(
+                            item,
                             source_id=result['source_id'],
-                            burial_event_id=burial_event_id
+                            citation_id=result['citation_id'],
+                            burial_event_id=burial_event_id,
                         )
 
-                    # Mark as complete
-                    self.controller.mark_item_complete(
-                        item,
-                        source_id=result['source_id'],
-                        citation_id=result['citation_id'],
-                        burial_event_id=burial_event_id,
-                    )
+                        status_label.text = f"{processed + 1} saved to database"
 
-                    status_label.text = f"{processed + 1} saved to database"
+                    except Exception as db_error:
+                        logger.error(f"Database write failed: {db_error}")
+                        self.error_log.add_error(
+                            f"Database write failed for {item.full_name}: {db_error}",
+                            context="Find a Grave Batch"
+                        )
+                        self.controller.mark_item_error(item, f"Database write failed: {db_error}")
+
+                        # Record failure in state DB
+                        if state_item_id:
+                            self.state_repository.update_item_status(
+                                state_item_id,
+                                'error',
+                                error_message=f"Database write failed: {db_error}"
+                            )
+                            self.state_repository.record_metric(
+                                operation='citation_creation',
+                                duration_ms=int((time.time() - citation_start) * 1000),
+                                success=False,
+                                session_id=session_id
+                            )
 
-                except Exception as db_error:
-                    logger.error(f"Database write failed: {db_error}")
-                    self.error_log.add_error(
-                        f"Database write failed for {item.full_name}: {db_error}",
-                        context="Find a Grave Batch"
-                    )
-                    self.controller.mark_item_error(item, f"Database write failed: {db_error}")
+                        return
 
-                    # Record failure in state DB
-                    if self.current_state_item_id:
+                    processed += 1
+
+                    # ===== PHASE 5: CHECKPOINT =====
+                    # Mark complete in state DB
+                    if state_item_id:
                         self.state_repository.update_item_status(
-                            self.current_state_item_id,
-                            'error',
-                            error_message=f"Database write failed: {db_error}"
-                        )
-                        self.state_repository.record_metric(
-                            operation='citation_creation',
-                            duration_ms=int((time.time() - citation_start) * 1000),
-                            success=False,
-                            session_id=session_id
+                            state_item_id,
+                            'complete'
                         )
 
-                    continue
-
-                processed += 1
-
-                # ===== PHASE 6: CHECKPOINT =====
-                # Mark complete in state DB
-                if self.current_state_item_id:
-                    self.state_repository.update_item_status(
-                        self.current_state_item_id,
-                        'complete'
-                    )
+                    # Create checkpoint after configured interval
+                    self.checkpoint_counter += 1
+                    if self.checkpoint_counter >= self.config.findagrave_checkpoint_frequency:
+                        try:
+                            self.state_repository.create_checkpoint(
+                                session_id=session_id,
+                                last_processed_item_id=state_item_id or 0,
+                                last_processed_person_id=item.person_id
+                            )
+                            self.checkpoint_counter = 0
+                            logger.debug(f"Checkpoint created at item {finished}/{total}")
+                        except Exception as checkpoint_error:
+                            logger.warning(f"Failed to create checkpoint: {checkpoint_error}")
 
-                # Create checkpoint after configured interval
-                self.checkpoint_counter += 1
-                if self.checkpoint_counter >= self.config.findagrave_checkpoint_frequency:
+                    # Update session progress
                     try:
-                        self.state_repository.create_checkpoint(
+                        self.state_repository.update_session_counts(
                             session_id=session_id,
-                            last_processed_item_id=self.current_state_item_id or 0,
-                            last_processed_person_id=item.person_id
+                            completed_count=processed,
                         )
-                        self.checkpoint_counter = 0
-                        logger.debug(f"Checkpoint created at item {i}/{total}")
-                    except Exception as checkpoint_error:
-                        logger.warning(f"Failed to create checkpoint: {checkpoint_error}")
+                    except Exception:
+                        pass  # Non-critical
 
-                # Update session progress
-                try:
-                    self.state_repository.update_session_counts(
-                        session_id=session_id,
-                        completed_count=processed,
-                    )
-                except Exception:
-                    pass  # Non-critical
+                    # Refresh queue
+                    self.queue_container.clear()
+                    with self.queue_container:
+                        self._render_queue_items()
 
-                # Refresh queue
-                self.queue_container.clear()
-                with self.queue_container:
-                    self._render_queue_items()
+                except Exception as e:
+                    logger.error(f"Error processing item {item.full_name} (PersonID {item.person_id}): {e}")
+                    self.controller.mark_item_error(item, str(e))
 
-            except Exception as e:
-                logger.error(f"Error processing item {item.full_name} (PersonID {item.person_id}): {e}")
-                self.controller.mark_item_error(item, str(e))
+                    # Record error in state DB
+                    if state_item_id:
+                        self.state_repository.update_item_status(
+                            state_item_id,
+                            'error',
+                            error_message=str(e)
+                        )
 
-                # Record error in state DB
-                if self.current_state_item_id:
-                    self.state_repository.update_item_status(
-                        self.current_state_item_id,
-                        'error',
-                        error_message=str(e)
-                    )
+                finally:
+                    status_label.text = f"{processed} completed"
+
+        # Memorials load in several browser tabs at once (paced by the shared
+        # Find a Grave rate limit); results are written here one at a time
+        pipeline = MemorialExtractionPipeline(
+            self.automation,
+            tabs=self.config.findagrave_extraction_tabs,
+            health_monitor=(
+                self.health_monitor if self.config.findagrave_enable_crash_recovery else None
+            ),
+        )
+        try:
+            with span_context(recorder, session_id=session_id):
+                pipeline_stats = await pipeline.run(items_to_process, extract_item, write_item)
+        finally:
+            recorder.flush()
 
-            # Small delay to allow UI update
-            await asyncio.sleep(0.1)
+        if pipeline_stats.stop_reason:
+            self.error_log.add_error(
+                f"Batch stopped early: {pipeline_stats.stop_reason}",
+                context="Find a Grave Batch"
+            )
 
         # Close progress dialog
         progress_dialog.close()
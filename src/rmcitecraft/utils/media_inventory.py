@@ -0,0 +1,222 @@
+"""Cached filesystem inventory for media existence checks.
+
+Checking media records one at a time costs one stat() per file, which is
+slow when the media root is on a network mount. MediaInventory instead lists
+each directory once with os.scandir and answers existence, size and mtime
+queries from an in-memory, case-insensitive index.
+
+Directories are indexed lazily on first use. Afterwards a directory is
+re-listed only when its own mtime changes (files added, removed or renamed),
+and its mtime is re-checked at most once per recheck_interval seconds, or
+straight away when a lookup misses so newly written files are found. Code
+that writes media calls invalidate() on the target directory. Editing a file
+in place does not change the directory mtime, so sizes and mtimes of such
+files can be stale until refresh(force=True).
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class MediaFileEntry:
+    """A file found on disk."""
+
+    path: Path  # Actual on-disk path (with on-disk case)
+    size: int
+    mtime: float
+
+
+@dataclass
+class _DirectoryListing:
+    """Cached listing of one directory."""
+
+    path: Path
+    mtime_ns: int
+    checked_at: float
+    files: dict[str, MediaFileEntry] = field(default_factory=dict)  # lowercase name -> entry
+    subdirs: dict[str, str] = field(default_factory=dict)  # lowercase name -> on-disk name
+
+
+class MediaInventory:
+    """Case-insensitive index of media files, refreshed by directory mtime."""
+
+    def __init__(self, recheck_interval: float = 5.0):
+        """Initialize inventory.
+
+        Args:
+            recheck_interval: Seconds before a cached directory's mtime is
+                checked again (0 checks on every lookup)
+        """
+        self.recheck_interval = recheck_interval
+        self._listings: dict[str, _DirectoryListing] = {}  # lowercase dir path -> listing
+        self._lock = threading.RLock()
+        self.scans = 0  # Number of directory listings performed
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def lookup(self, path: str | Path) -> MediaFileEntry | None:
+        """Find a file, ignoring case in both directory and file names.
+
+        Args:
+            path: Absolute file path
+
+        Returns:
+            The on-disk entry, or None if the file does not exist
+        """
+        path = Path(path)
+        listing = self._get_listing(path.parent)
+        if listing is None:
+            return None
+        entry = listing.files.get(path.name.lower())
+        if entry is None:
+            # The file may have been written since the last mtime check
+            listing = self._get_listing(path.parent, recheck=True)
+            entry = listing.files.get(path.name.lower()) if listing else None
+        return entry
+
+    def exists(self, path: str | Path) -> bool:
+        """Whether a file exists (case-insensitive)."""
+        return self.lookup(path) is not None
+
+    def list_files(self, directory: str | Path, include_hidden: bool = False) -> list[MediaFileEntry]:
+        """List the files directly in a directory.
+
+        Args:
+            directory: Directory path (matched case-insensitively)
+            include_hidden: Include dot-files such as .DS_Store
+
+        Returns:
+            Entries sorted by file name; empty if the directory does not exist
+        """
+        listing = self._get_listing(Path(directory))
+        if listing is None:
+            return []
+        entries = sorted(listing.files.values(), key=lambda e: e.path.name)
+        if include_hidden:
+            return entries
+        return [e for e in entries if not e.path.name.startswith(".")]
+
+    def refresh(self, force: bool = False) -> None:
+        """Re-check every indexed directory.
+
+        Args:
+            force: Re-list every directory even if its mtime is unchanged
+                (picks up in-place edits to file sizes/mtimes)
+        """
+        with self._lock:
+            for key, listing in list(self._listings.items()):
+                if force:
+                    self._scan(key, listing.path)
+                else:
+                    self._revalidate(key, listing, time.monotonic())
+
+    def invalidate(self, directory: str | Path) -> None:
+        """Drop a directory's listing so the next lookup re-lists it.
+
+        Args:
+            directory: Directory whose files were added, moved or rewritten
+        """
+        with self._lock:
+            self._listings.pop(str(directory).lower(), None)
+
+    def clear(self) -> None:
+        """Drop all cached listings."""
+        with self._lock:
+            self._listings.clear()
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _get_listing(
+        self, directory: Path, recheck: bool = False
+    ) -> _DirectoryListing | None:
+        """Get the (fresh enough) listing for a directory, scanning if needed.
+
+        Args:
+            directory: Directory path (matched case-insensitively)
+            recheck: Check the directory mtime even within recheck_interval
+        """
+        key = str(directory).lower()
+        now = time.monotonic()
+        with self._lock:
+            listing = self._listings.get(key)
+            if listing is not None:
+                if recheck or now - listing.checked_at >= self.recheck_interval:
+                    listing = self._revalidate(key, listing, now)
+                return listing
+
+            actual = self._find_directory(directory)
+            if actual is None:
+                return None
+            return self._scan(key, actual)
+
+    def _revalidate(
+        self, key: str, listing: _DirectoryListing, now: float
+    ) -> _DirectoryListing | None:
+        """Re-list a directory if its mtime changed since it was scanned."""
+        try:
+            mtime_ns = os.stat(listing.path).st_mtime_ns
+        except OSError:
+            del self._listings[key]
+            return None
+        if mtime_ns != listing.mtime_ns:
+            return self._scan(key, listing.path)
+        listing.checked_at = now
+        return listing
+
+    def _find_directory(self, directory: Path) -> Path | None:
+        """Resolve a directory path to its on-disk case, or None if missing."""
+        if directory.is_dir():
+            return directory
+        parent = directory.parent
+        if parent == directory:
+            return None
+        parent_listing = self._get_listing(parent)
+        if parent_listing is None:
+            return None
+        name = parent_listing.subdirs.get(directory.name.lower())
+        return parent_listing.path / name if name else None
+
+    def _scan(self, key: str, directory: Path) -> _DirectoryListing | None:
+        """List a directory with a single os.scandir pass."""
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+            listing = _DirectoryListing(directory, mtime_ns, time.monotonic())
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        listing.subdirs[entry.name.lower()] = entry.name
+                    elif entry.is_file():
+                        stat = entry.stat()
+                        listing.files[entry.name.lower()] = MediaFileEntry(
+                            Path(entry.path), stat.st_size, stat.st_mtime
+                        )
+        except OSError as e:
+            logger.debug(f"Cannot list media directory {directory}: {e}")
+            self._listings.pop(key, None)
+            return None
+
+        self.scans += 1
+        self._listings[key] = listing
+        logger.debug(f"Indexed {len(listing.files)} files in {directory}")
+        return listing
+
+
+_shared_inventory: MediaInventory | None = None
+
+
+def get_media_inventory() -> MediaInventory:
+    """Get the process-wide media inventory."""
+    global _shared_inventory
+    if _shared_inventory is None:
+        _shared_inventory = MediaInventory()
+    return _shared_inventory
@@ -4,6 +4,9 @@ RootsMagic uses symbolic placeholders in MediaPath:
 - ? = Media root directory (typically ~/Genealogy/RootsMagic/Files)
 - ~ = User's home directory
 - * = Database directory
+
+Existence checks are answered from a shared MediaInventory, which lists each
+media directory once instead of stat-ing every file.
 """
 
 import os
@@ -11,6 +14,8 @@ from pathlib import Path
 
 from loguru import logger
 
+from rmcitecraft.utils.media_inventory import MediaInventory, get_media_inventory
+
 
 class MediaPathResolver:
     """Resolve RootsMagic media paths to absolute file system paths."""
@@ -19,6 +24,7 @@ class MediaPathResolver:
         self,
         media_root: str | None = None,
         database_path: str | None = None,
+        inventory: MediaInventory | None = None,
     ):
         """Initialize resolver with root directories.
 
@@ -27,7 +33,11 @@ class MediaPathResolver:
                        Defaults to ~/Genealogy/RootsMagic/Files
             database_path: Path to .rmtree file (for * symbol).
                           If None, * symbol won't be resolved.
+            inventory: Filesystem inventory used for existence checks.
+                      Defaults to the process-wide shared inventory.
         """
+        self.inventory = inventory or get_media_inventory()
+
         if media_root:
             self.media_root = Path(media_root).expanduser().resolve()
         else:
@@ -55,7 +65,9 @@ class MediaPathResolver:
             media_file: Filename from MultimediaTable.MediaFile
 
         Returns:
-            Absolute Path object if resolved, None if path invalid
+            Absolute Path object if resolved, None if path invalid or the file
+            does not exist. File and directory names are matched without
+            regard to case; the returned path uses the on-disk case.
 
         Examples:
             >>> resolver = MediaPathResolver()
@@ -91,12 +103,21 @@ class MediaPathResolver:
         full_path = Path(resolved_path) / media_file
 
         # Verify file exists
-        if not full_path.exists():
+        entry = self.inventory.lookup(full_path)
+        if entry is None:
             logger.warning(f"Media file not found: {full_path}")
             return None
 
-        logger.debug(f"Resolved: {media_path} + {media_file} -> {full_path}")
-        return full_path
+        logger.debug(f"Resolved: {media_path} + {media_file} -> {entry.path}")
+        return entry.path
+
+    def invalidate(self, directory: str | Path) -> None:
+        """Forget the cached listing of a directory media was just written to.
+
+        Args:
+            directory: Absolute directory path
+        """
+        self.inventory.invalidate(directory)
 
     def get_census_image_for_event(
         self,
@@ -0,0 +1,74 @@
+"""
+Pytest fixtures for performance benchmarks.
+
+Benchmarks use pytest-benchmark and run against synthetic RootsMagic trees
+(see rmcitecraft.database.synthetic_tree) at several sizes. Sizes default to
+1,000 and 10,000 persons; override with a comma-separated list:
+
+    RMCITECRAFT_BENCH_SIZES=1000,100000 pytest tests/benchmarks
+
+Store a baseline and check for regressions with scripts/benchmark_compare.py.
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+from loguru import logger
+
+from rmcitecraft.database.synthetic_tree import SyntheticTreeConfig, generate_synthetic_tree
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    # The benchmark fixture comes from pytest-benchmark (dev dependency)
+    collect_ignore_glob = ["test_*.py"]
+
+BENCH_SIZES = [
+    int(size)
+    for size in os.environ.get("RMCITECRAFT_BENCH_SIZES", "1000,10000").split(",")
+    if size.strip()
+]
+
+
+@dataclass
+class SyntheticTree:
+    """A generated tree and its matching census.db."""
+
+    persons: int
+    rmtree_path: Path
+    census_db_path: Path
+
+
+@pytest.fixture(scope="session", autouse=True)
+def quiet_logging():
+    """Keep log formatting and I/O out of the timings."""
+    logger.disable("rmcitecraft")
+    yield
+    logger.enable("rmcitecraft")
+
+
+@pytest.fixture(scope="session", params=BENCH_SIZES, ids=lambda size: f"{size}p")
+def synthetic_tree(request, tmp_path_factory) -> SyntheticTree:
+    """Synthetic tree generated once per size for the whole session."""
+    size = request.param
+    directory = tmp_path_factory.mktemp(f"tree_{size}")
+    tree = SyntheticTree(size, directory / "tree.rmtree", directory / "census.db")
+    generate_synthetic_tree(
+        tree.rmtree_path, SyntheticTreeConfig(persons=size, seed=42), tree.census_db_path
+    )
+    return tree
+
+
+@pytest.fixture
+def rmtree_env(synthetic_tree, monkeypatch) -> SyntheticTree:
+    """Point census.db access at the synthetic tree.
+
+    connect_rmtree() needs no patching: without the ICU extension it
+    registers the pure-Python RMNOCASE collation.
+    """
+    monkeypatch.setattr(
+        "rmcitecraft.database.census_extraction_db.CENSUS_DB_PATH", synthetic_tree.census_db_path
+    )
+    return synthetic_tree
@@ -0,0 +1,67 @@
+"""Benchmarks for census citation parsing and formatting."""
+
+import re
+
+import pytest
+
+from rmcitecraft.database.connection import connect_rmtree
+from rmcitecraft.parsers.citation_formatter import CitationFormatter
+from rmcitecraft.parsers.familysearch_parser import FamilySearchParser
+
+CITATIONS = 500
+
+
+@pytest.fixture
+def citation_inputs(synthetic_tree):
+    """(source name, FamilySearch entry) pairs built from the tree's census sources."""
+    conn = connect_rmtree(synthetic_tree.rmtree_path)
+    rows = conn.execute(
+        "SELECT Name, Fields FROM SourceTable WHERE Name LIKE 'Fed Census:%' "
+        "ORDER BY SourceID LIMIT ?",
+        (CITATIONS,),
+    ).fetchall()
+    inputs = []
+    for name, fields in rows:
+        year, state, county, sheet, family, surname, given = re.match(
+            r"Fed Census: (\d{4}), ([^,]+), (\S+) \[citing sheet (\w+), family (\d+)\] "
+            r"([^,]+), (.+)",
+            name,
+        ).groups()
+        ark = re.search(rb"(https://www\.familysearch\.org/ark:/61903/1:1:[A-Z0-9-]+)", fields)
+        entry = (
+            f'"United States Census, {year}," database with images, *FamilySearch* '
+            f"({ark.group(1).decode()} : accessed 2 January 2025), {given} {surname}, "
+            f"{county}, {state}, United States; citing sheet {sheet}, family {family}, "
+            "NARA microfilm publication T623 (Washington, D.C.: National Archives and "
+            "Records Administration, n.d.); FHL microfilm 1,241,311."
+        )
+        inputs.append((name, entry))
+    return inputs
+
+
+def test_familysearch_parser(benchmark, citation_inputs):
+    parser = FamilySearchParser()
+
+    def parse_all():
+        return [
+            parser.parse(name, entry, citation_id)
+            for citation_id, (name, entry) in enumerate(citation_inputs, start=1)
+        ]
+
+    citations = benchmark(parse_all)
+    assert all(c.census_year for c in citations)
+
+
+def test_citation_formatter(benchmark, citation_inputs):
+    parser = FamilySearchParser()
+    citations = [
+        parser.parse(name, entry, citation_id)
+        for citation_id, (name, entry) in enumerate(citation_inputs, start=1)
+    ]
+    formatter = CitationFormatter()
+
+    def format_all():
+        return [formatter.format(citation) for citation in citations]
+
+    formatted = benchmark(format_all)
+    assert all(footnote for footnote, _, _ in formatted)
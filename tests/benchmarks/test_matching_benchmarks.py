@@ -0,0 +1,128 @@
+"""Benchmarks for census name scoring and household matching."""
+
+import sqlite3
+
+from rmcitecraft.database.census_extraction_db import CensusExtractionRepository
+from rmcitecraft.database.connection import connect_rmtree
+from rmcitecraft.services.census_rmtree_matcher import (
+    CensusPersonData,
+    CensusRMTreeMatcher,
+    RMPersonData,
+)
+from rmcitecraft.services.familysearch_census_extractor import names_match_score
+
+# Pairs covering every scoring path: exact, nickname, initial, phonetic
+# surname, middle name as first name and no match
+NAME_PAIRS = [
+    ("John Smith", "John Smith"),
+    ("Wm Ijams", "William Ijams"),
+    ("Bill Iams", "William Ijams"),
+    ("L. Smith", "Larry Smith"),
+    ("Katherine Mueller", "Catherine Muller"),
+    ("Harvey Iams", "Guy Harvey Iams"),
+    ("Lizzie O'Brien", "Elizabeth OBrien"),
+    ("Mary Jones", "Robert Anderson"),
+]
+
+HOUSEHOLDS = 200
+
+
+def load_households(rmtree_path, census_db_path, limit):
+    """RM and census persons for extracted households, as the matcher sees them."""
+    rm_conn = connect_rmtree(rmtree_path)
+    census = sqlite3.connect(census_db_path)
+    households = []
+    links = census.execute(
+        """
+        SELECT rl.rmtree_event_id, cp.person_id, cp.full_name, cp.given_name, cp.surname,
+               cp.sex, cp.age, cp.relationship_to_head, cp.familysearch_ark, cp.line_number,
+               cp.page_id
+        FROM rmtree_link rl
+        JOIN census_person cp ON cp.person_id = rl.census_person_id
+        ORDER BY cp.page_id, cp.line_number
+        """
+    ).fetchall()
+    by_event: dict[int, list] = {}
+    for row in links:
+        by_event.setdefault(row[0], []).append(row)
+
+    for event_id, rows in list(by_event.items())[:limit]:
+        members = rm_conn.execute(
+            """
+            SELECT p.PersonID, n.Given, n.Surname, p.Sex, n.BirthYear, 'Head', -1
+            FROM EventTable e
+            JOIN PersonTable p ON p.PersonID = e.OwnerID
+            JOIN NameTable n ON n.OwnerID = p.PersonID AND n.IsPrimary = 1
+            WHERE e.EventID = ?
+            UNION ALL
+            SELECT p.PersonID, n.Given, n.Surname, p.Sex, n.BirthYear, r.RoleName,
+                   w.WitnessOrder
+            FROM WitnessTable w
+            JOIN RoleTable r ON r.RoleID = w.Role
+            JOIN PersonTable p ON p.PersonID = w.PersonID
+            JOIN NameTable n ON n.OwnerID = p.PersonID AND n.IsPrimary = 1
+            WHERE w.EventID = ?
+            ORDER BY 7
+            """,
+            (event_id, event_id),
+        ).fetchall()
+        rm_persons = [
+            RMPersonData(
+                person_id=person_id,
+                given_name=given,
+                surname=surname,
+                full_name=f"{given} {surname}",
+                sex="M" if sex == 0 else "F",
+                birth_year=birth_year,
+                relationship=role.lower(),
+                event_id=event_id,
+            )
+            for person_id, given, surname, sex, birth_year, role, _ in members
+        ]
+        census_persons = [
+            CensusPersonData(
+                person_id=row[1],
+                full_name=row[2],
+                given_name=row[3],
+                surname=row[4],
+                sex=row[5],
+                age=row[6],
+                relationship=row[7].lower(),
+                familysearch_ark=row[8],
+                line_number=row[9],
+            )
+            for row in rows
+        ]
+        year = census.execute(
+            "SELECT census_year FROM census_page WHERE page_id = ?", (rows[0][10],)
+        ).fetchone()[0]
+        households.append((rm_persons, census_persons, year))
+    return households
+
+
+def test_names_match_score(benchmark):
+    def score_all():
+        return [names_match_score(a, b) for a, b in NAME_PAIRS]
+
+    scores = benchmark(score_all)
+    assert scores[0] == (1.0, "exact")
+
+
+def test_find_optimal_matches(benchmark, rmtree_env):
+    households = load_households(rmtree_env.rmtree_path, rmtree_env.census_db_path, HOUSEHOLDS)
+    matcher = CensusRMTreeMatcher(
+        rmtree_env.rmtree_path,
+        rmtree_env.rmtree_path,
+        census_repo=CensusExtractionRepository(rmtree_env.census_db_path),
+    )
+
+    def match_all():
+        return [
+            matcher.find_optimal_matches(rm_persons, census_persons, year)
+            for rm_persons, census_persons, year in households
+        ]
+
+    results = benchmark(match_all)
+    matched = sum(len(matches) for matches, _, _ in results)
+    assert matched >= sum(len(census) for _, census, _ in households) * 0.9
+
@@ -0,0 +1,95 @@
+"""Benchmarks for RootsMagic queue builders and dashboard queries."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from rmcitecraft.database.batch_state_repository import FindAGraveBatchStateRepository
+from rmcitecraft.database.connection import connect_rmtree
+from rmcitecraft.database.findagrave_queries import find_findagrave_people
+from rmcitecraft.services.census_transcription_batch import CensusTranscriptionBatchService
+
+SESSION_ID = "bench_session"
+ERRORS = ["Network timeout", "Extraction failed: no memorial", "Validation error", "Crash"]
+
+
+@pytest.fixture
+def dashboard_repo(synthetic_tree, tmp_path):
+    """Batch state database with one item per Find a Grave link in the tree."""
+    rows = connect_rmtree(synthetic_tree.rmtree_path).execute(
+        """
+        SELECT u.OwnerID, u.URL, n.Given || ' ' || n.Surname,
+               (SELECT MIN(cl.CitationID) FROM CitationLinkTable cl
+                WHERE cl.OwnerType = 0 AND cl.OwnerID = u.OwnerID)
+        FROM URLTable u
+        JOIN NameTable n ON n.OwnerID = u.OwnerID AND n.IsPrimary = 1
+        WHERE u.Name = 'Find a Grave'
+        """
+    ).fetchall()
+    repo = FindAGraveBatchStateRepository(str(tmp_path / "batch_state.db"))
+    repo.create_session(SESSION_ID, len(rows))
+    now = repo._now_iso()
+    items = []
+    for i, (person_id, url, name, citation_id) in enumerate(rows):
+        if citation_id:
+            status, error = "complete", None
+        elif i % 7 == 0:
+            status, error = "error", ERRORS[i % len(ERRORS)]
+        else:
+            status, error = "queued", None
+        memorial_id = url.split("/")[4]
+        items.append(
+            (SESSION_ID, person_id, memorial_id, url, name, status, error, citation_id, now, now)
+        )
+    with repo._get_connection() as conn:
+        conn.executemany(
+            """
+            INSERT INTO batch_items (
+                session_id, person_id, memorial_id, memorial_url, person_name, status,
+                error_message, created_citation_id, created_at, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            items,
+        )
+        conn.commit()
+    return repo
+
+
+def test_build_transcription_queue(benchmark, rmtree_env):
+    settings = SimpleNamespace(
+        rm_database_path=rmtree_env.rmtree_path, sqlite_icu_extension=rmtree_env.rmtree_path
+    )
+    service = CensusTranscriptionBatchService(
+        settings=settings, state_repo=MagicMock(), extractor=MagicMock()
+    )
+
+    def build():
+        return asyncio.run(service.build_transcription_queue())
+
+    queue, stats = benchmark(build)
+    assert stats.already_processed > 0
+    assert len(queue) == stats.remaining
+
+
+def test_find_findagrave_people(benchmark, rmtree_env):
+    result = benchmark(find_findagrave_people, str(rmtree_env.rmtree_path))
+
+    assert result["examined"] > 0
+    assert result["excluded"] > 0
+
+
+def test_dashboard_queries(benchmark, dashboard_repo, synthetic_tree):
+    def load_dashboard():
+        return (
+            dashboard_repo.get_master_progress(),
+            dashboard_repo.get_status_distribution(SESSION_ID),
+            dashboard_repo.get_processing_timeline(SESSION_ID),
+            dashboard_repo.get_error_distribution(),
+            dashboard_repo.get_session_items(SESSION_ID),
+            dashboard_repo.get_citation_statistics(str(synthetic_tree.rmtree_path), SESSION_ID),
+        )
+
+    progress, statuses, *_ = benchmark(load_dashboard)
+    assert progress["total_items"] == sum(statuses.values())
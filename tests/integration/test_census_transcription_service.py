@@ -30,6 +30,22 @@ class MockLLMProvider:
         return mock_response
 
 
+class MockStreamingProvider(MockLLMProvider):
+    """Mock provider that streams the response in small chunks."""
+
+    def __init__(self, response_text: str, chunk_size: int = 16):
+        super().__init__(response_text)
+        self.chunk_size = chunk_size
+        self.chunks_sent = 0
+
+    def stream_complete_with_image_prefix(self, prefix, prompt, image_path, **kwargs):
+        """Mock stream_complete_with_image_prefix."""
+        self.call_count += 1
+        for i in range(0, len(self.response_text), self.chunk_size):
+            self.chunks_sent += 1
+            yield self.response_text[i : i + self.chunk_size]
+
+
 class TestCensusTranscriptionService:
     """Integration tests for the transcription service."""
 
@@ -251,3 +267,97 @@ class TestTranscriptionResultFormats:
 
         assert result.success is False
         assert result.error is not None
+
+
+class TestStreamingTranscription:
+    """Tests for transcribe_streaming."""
+
+    RESPONSE = """{
+        "metadata": {"census_year": 1940, "enumeration_district": "93-76", "sheet": "9A"},
+        "persons": [
+            {"line_number": 24, "name": "Smith, John", "relationship": "Head",
+             "sex": "M", "race": "W", "age": 35, "birthplace": "Ohio"},
+            {"line_number": 25, "name": "Smith, Mary", "relationship": "Wife",
+             "sex": "F", "race": "W", "age": 32, "birthplace": "Indiana"}
+        ]
+    }"""
+
+    @pytest.fixture
+    def image_file(self, tmp_path):
+        image_file = tmp_path / "census.jpg"
+        image_file.write_bytes(b"fake image data")
+        return image_file
+
+    def test_persons_delivered_during_stream(self, image_file):
+        provider = MockStreamingProvider(self.RESPONSE)
+        service = CensusTranscriptionService(provider=provider)
+        seen = []
+
+        result = service.transcribe_streaming(
+            image_file,
+            1940,
+            on_person=lambda person, warnings: seen.append(
+                (person["name"], provider.chunks_sent)
+            ),
+        )
+
+        assert result.success is True
+        assert [name for name, _ in seen] == ["Smith, John", "Smith, Mary"]
+        # The first person arrived before the stream finished
+        assert seen[0][1] < provider.chunks_sent
+        assert result.persons == result.data["persons"]
+        assert result.raw_response == self.RESPONSE
+
+    def test_matches_blocking_result(self, image_file):
+        streamed = CensusTranscriptionService(
+            provider=MockStreamingProvider(self.RESPONSE)
+        ).transcribe_streaming(image_file, 1940)
+        blocking = CensusTranscriptionService(
+            provider=MockLLMProvider(self.RESPONSE)
+        ).transcribe(image_file, 1940)
+
+        assert streamed.persons == blocking.persons
+        assert streamed.metadata == blocking.metadata
+        assert streamed.warnings == blocking.warnings
+
+    def test_non_streaming_provider_falls_back(self, image_file):
+        provider = MockLLMProvider(self.RESPONSE)
+        seen = []
+
+        result = CensusTranscriptionService(provider=provider).transcribe_streaming(
+            image_file, 1940, on_person=lambda person, warnings: seen.append(person)
+        )
+
+        assert result.success is True
+        assert len(seen) == 2
+        assert provider.call_count == 1
+
+    def test_census_transcriber_streams_persons(self, image_file):
+        from rmcitecraft.services.census_transcriber import CensusTranscriber
+
+        provider = MockStreamingProvider(self.RESPONSE)
+        provider.name = "mock"
+        seen = []
+
+        response = CensusTranscriber(provider=provider).transcribe_census(
+            image_file, 1940, on_person=lambda person, warnings: seen.append(person["name"])
+        )
+
+        assert seen == ["Smith, John", "Smith, Mary"]
+        assert len(response.data["records"]) == 2
+        assert response.data["page_info"]["sheet"] == "9A"
+
+    def test_empty_page_warns_no_persons(self, image_file):
+        result = CensusTranscriptionService(
+            provider=MockStreamingProvider('{"metadata": {"census_year": 1940}, "persons": []}')
+        ).transcribe_streaming(image_file, 1940)
+
+        assert result.success is True
+        assert "No persons found in transcription" in result.warnings
+
+    def test_invalid_json_fails(self, image_file):
+        result = CensusTranscriptionService(
+            provider=MockStreamingProvider("not json at all")
+        ).transcribe_streaming(image_file, 1940)
+
+        assert result.success is False
@@ -0,0 +1,176 @@
+"""Unit tests for bulk citation formatting with single-transaction write-back."""
+
+import sqlite3
+
+import pytest
+
+from rmcitecraft.repositories.citation_repository import CitationRepository
+from rmcitecraft.services.bulk_citation_formatter import (
+    BulkCitationFormatter,
+    build_source_fields_blob,
+    fill_source_name_brackets,
+)
+
+FRANK_ENTRY = (
+    '"United States Census, 1940," database with images, *FamilySearch* '
+    "(https://familysearch.org/ark:/61903/1:1:VYSJ-NRR : accessed 2 July 2017), "
+    "Frank W Iiams, Justice Precinct 4, Milam, Texas, United States; citing enumeration "
+    "district (ED) 166-24, sheet 3A, family 50, Sixteenth Census of the United States, "
+    "1940, NARA digital publication T627 (Washington, D.C.: National Archives and "
+    "Records Administration, 2012), roll 4141."
+)
+
+
+def page_fields(page: str) -> bytes:
+    return f"<Root><Fields><Field><Name>Page</Name><Value>{page}</Value></Field></Fields></Root>".encode()
+
+
+@pytest.fixture
+def conn():
+    """In-memory database with the SourceTable/CitationTable columns used."""
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.executescript(
+        """
+        CREATE TABLE SourceTable (
+            SourceID INTEGER PRIMARY KEY, Name TEXT, TemplateID INTEGER,
+            Fields BLOB, UTCModDate FLOAT
+        );
+        CREATE TABLE CitationTable (
+            CitationID INTEGER PRIMARY KEY, SourceID INTEGER, CitationName TEXT,
+            ActualText TEXT, RefNumber TEXT, Footnote TEXT, ShortFootnote TEXT,
+            Bibliography TEXT, Fields BLOB, UTCModDate FLOAT
+        );
+        """
+    )
+    # Free-form source with empty brackets and an unrelated field to preserve
+    conn.execute(
+        "INSERT INTO SourceTable VALUES (1, ?, 0, ?, 0)",
+        (
+            "Fed Census: 1940, Texas, Milam [] Iiams, Frank W.",
+            b"<Root><Fields><Field><Name>Extra</Name><Value>keep</Value></Field></Fields></Root>",
+        ),
+    )
+    conn.execute(
+        "INSERT INTO CitationTable (CitationID, SourceID, Fields) VALUES (10, 1, ?)",
+        (page_fields(FRANK_ENTRY),),
+    )
+    # Template-based source: formatted text lives in CitationTable
+    conn.execute(
+        "INSERT INTO SourceTable VALUES (2, 'Fed Census: 1940, Texas, Milam [] Iiams, Frank W.', 5, NULL, 0)"
+    )
+    conn.execute(
+        "INSERT INTO CitationTable (CitationID, SourceID, ActualText, Footnote, ShortFootnote) "
+        "VALUES (20, 2, ?, 'same', 'same')",
+        (FRANK_ENTRY,),
+    )
+    # Unparseable entry
+    conn.execute("INSERT INTO SourceTable VALUES (3, 'Fed Census: 1940, Texas, Milam [] Doe, J', 0, NULL, 0)")
+    conn.execute(
+        "INSERT INTO CitationTable (CitationID, SourceID, Fields) VALUES (30, 3, ?)",
+        (page_fields("junk"),),
+    )
+    # Other year
+    conn.execute("INSERT INTO SourceTable VALUES (4, 'Fed Census: 1950, Ohio, Noble [] Doe, J', 0, NULL, 0)")
+    conn.execute("INSERT INTO CitationTable (CitationID, SourceID) VALUES (40, 4)")
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+class TestPlan:
+    """Tests for the dry-run report."""
+
+    def test_changes_and_skips(self, conn):
+        report = BulkCitationFormatter(conn).plan(1940)
+
+        assert [c.citation_id for c in report.changes] == [10, 20]
+        assert 30 in report.skipped
+        assert report.summary().startswith("1940: 2 to update")
+
+    def test_plan_writes_nothing(self, conn):
+        BulkCitationFormatter(conn).plan(1940)
+        row = conn.execute("SELECT Footnote FROM CitationTable WHERE CitationID = 20").fetchone()
+        assert row["Footnote"] == "same"
+
+    def test_source_name_brackets_filled(self, conn):
+        change = BulkCitationFormatter(conn).plan(1940).changes[0]
+        assert change.new_source_name.startswith("Fed Census: 1940, Texas, Milam [citing")
+        assert "] Iiams, Frank W." in change.new_source_name
+
+    def test_diff_report(self, conn):
+        text = BulkCitationFormatter(conn).plan(1940).to_text()
+        assert "Citation 20 (Source 2)" in text
+        assert "-same" in text
+        assert "+1940 U.S. census, Milam County, Texas" in text
+
+    def test_processed_citations_excluded_unless_requested(self, conn):
+        bulk = BulkCitationFormatter(conn)
+        bulk.apply(bulk.plan(1940))
+
+        report = bulk.plan(1940)
+        assert report.changes == []
+        assert sorted(report.already_processed) == [10, 20]
+
+        report = bulk.plan(1940, include_processed=True)
+        assert report.already_processed == []
+        assert len(report.changes) + len(report.unchanged) == 2
+
+
+class TestApply:
+    """Tests for single-transaction write-back."""
+
+    def test_apply_writes_all_changes(self, conn):
+        bulk = BulkCitationFormatter(conn)
+        report = bulk.plan(1940)
+
+        assert bulk.apply(report) == 2
+        assert report.applied
+
+        source = conn.execute("SELECT Name, Fields FROM SourceTable WHERE SourceID = 1").fetchone()
+        footnote = CitationRepository.extract_field_from_blob(source["Fields"], "Footnote")
+        assert footnote == report.changes[0].footnote
+        assert CitationRepository.extract_field_from_blob(source["Fields"], "Extra") == "keep"
+        assert "[]" not in source["Name"]
+
+        citation = conn.execute("SELECT * FROM CitationTable WHERE CitationID = 20").fetchone()
+        assert citation["ShortFootnote"] == report.changes[1].short_footnote
+        assert citation["UTCModDate"].is_integer()  # whole seconds, as other writers stamp
+
+        # Template-based source names are left alone
+        name = conn.execute("SELECT Name FROM SourceTable WHERE SourceID = 2").fetchone()[0]
+        assert "[]" in name
+
+    def test_failure_rolls_back_everything(self, conn):
+        bulk = BulkCitationFormatter(conn)
+        report = bulk.plan(1940)
+        conn.execute("DROP TABLE CitationTable")
+
+        with pytest.raises(sqlite3.Error):
+            bulk.apply(report)
+
+        fields = conn.execute("SELECT Fields FROM SourceTable WHERE SourceID = 1").fetchone()[0]
+        assert CitationRepository.extract_field_from_blob(fields, "Footnote") is None
+
+
+class TestHelpers:
+    """Tests for BLOB and source name helpers."""
+
+    def test_blob_values_are_escaped(self):
+        blob = build_source_fields_blob(None, "<i>A</i> & B", "short", "bib")
+        assert CitationRepository.extract_field_from_blob(blob, "Footnote") == "<i>A</i> & B"
+
+    def test_blob_replaces_existing_values(self):
+        blob = build_source_fields_blob(build_source_fields_blob(None, "a", "b", "c"), "x", "y", "z")
+        assert blob.count(b"<Name>Footnote</Name>") == 1
+        assert CitationRepository.extract_field_from_blob(blob, "Bibliography") == "z"
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("Fed Census: 1950, Ohio, Noble [], Doe, J", "Fed Census: 1950, Ohio, Noble [citing x] Doe, J"),
+            ("Fed Census: 1950, Ohio, Noble [] Doe, J", "Fed Census: 1950, Ohio, Noble [citing x] Doe, J"),
+        ],
+    )
+    def test_fill_brackets(self, name, expected):
+        assert fill_source_name_brackets(name, "[citing x]") == expected
@@ -0,0 +1,129 @@
+"""Unit tests for streaming census.db export."""
+
+import csv
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from rmcitecraft.cli import cli_main
+from rmcitecraft.database.census_extraction_db import (
+    CensusExtractionRepository,
+    CensusPage,
+    CensusPerson,
+    RMTreeLink,
+)
+from rmcitecraft.services.census_export import CensusExporter, CensusExportFilter
+
+
+@pytest.fixture
+def tmp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def census_db(tmp_dir):
+    """census.db with persons in two years and states."""
+    repo = CensusExtractionRepository(tmp_dir / "census.db")
+    batch_id = repo.create_batch()
+
+    ohio = repo.insert_page(
+        CensusPage(batch_id=batch_id, census_year=1950, state="Ohio", county="Noble")
+    )
+    head = repo.insert_person(CensusPerson(page_id=ohio, full_name="John Iams", age=40))
+    repo.insert_person(CensusPerson(page_id=ohio, full_name="Mary Iams", age=38))
+    repo.insert_person_fields_bulk(head, {"street_name": "Main", "hours_worked": 40})
+    repo.insert_rmtree_link(
+        RMTreeLink(census_person_id=head, rmtree_citation_id=7, match_confidence=0.5)
+    )
+    repo.insert_rmtree_link(
+        RMTreeLink(
+            census_person_id=head, rmtree_person_id=101, rmtree_citation_id=7,
+            match_confidence=0.9, match_method="name_match",
+        )
+    )
+
+    penn = repo.insert_page(CensusPage(census_year=1940, state="Pennsylvania", county="Greene"))
+    for i in range(5):
+        repo.insert_person(CensusPerson(page_id=penn, full_name=f"Person {i}"))
+
+    return repo.db_path
+
+
+class TestCensusExporter:
+    """Tests for CensusExporter."""
+
+    def test_csv_export(self, census_db, tmp_dir):
+        out = tmp_dir / "out.csv"
+        count = CensusExporter(census_db, chunk_size=2).export(out)
+
+        assert count == 7
+        with open(out, newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 7
+        head = rows[0]
+        assert head["full_name"] == "John Iams"
+        assert head["census_year"] == "1950"
+        assert head["field_street_name"] == "Main"
+        assert head["field_hours_worked"] == "40"
+        # Missing EAV values are empty, not absent
+        assert rows[1]["field_street_name"] == ""
+
+    def test_best_link_is_exported(self, census_db, tmp_dir):
+        out = tmp_dir / "out.jsonl"
+        CensusExporter(census_db).export(out)
+
+        head = json.loads(out.read_text().splitlines()[0])
+        assert head["rmtree_person_id"] == 101
+        assert head["match_method"] == "name_match"
+
+    def test_jsonl_filters(self, census_db, tmp_dir):
+        out = tmp_dir / "out.jsonl"
+        count = CensusExporter(census_db).export(
+            out, filters=CensusExportFilter(census_year=1940, state="Pennsylvania")
+        )
+
+        lines = out.read_text().splitlines()
+        assert count == len(lines) == 5
+        assert all(json.loads(line)["county"] == "Greene" for line in lines)
+
+    def test_batch_filter(self, census_db, tmp_dir):
+        out = tmp_dir / "out.csv"
+        assert CensusExporter(census_db).export(out, filters=CensusExportFilter(batch_id=1)) == 2
+
+    def test_format_override(self, census_db, tmp_dir):
+        out = tmp_dir / "out.txt"
+        CensusExporter(census_db).export(out, fmt="jsonl")
+        assert json.loads(out.read_text().splitlines()[0])["full_name"] == "John Iams"
+
+    def test_unknown_format(self, census_db, tmp_dir):
+        with pytest.raises(ValueError, match="Unsupported export format"):
+            CensusExporter(census_db).export(tmp_dir / "out.xlsx")
+
+    def test_parquet_export(self, census_db, tmp_dir):
+        pq = pytest.importorskip("pyarrow.parquet")
+        out = tmp_dir / "out.parquet"
+
+        assert CensusExporter(census_db, chunk_size=3).export(out) == 7
+        table = pq.read_table(out)
+        assert table.num_rows == 7
+        assert table.column("age").to_pylist()[:2] == [40, 38]
+
+
+class TestExportCommand:
+    """Tests for the `rmcitecraft export` command."""
+
+    def test_export_command(self, census_db, tmp_dir, capsys):
+        out = tmp_dir / "cli.csv"
+        exit_code = cli_main(["export", str(out), "--db", str(census_db), "--year", "1950"])
+
+        assert exit_code == 0
+        assert "Exported 2 persons" in capsys.readouterr().out
+
+    def test_missing_database(self, tmp_dir, capsys):
+        exit_code = cli_main(["export", str(tmp_dir / "x.csv"), "--db", str(tmp_dir / "none.db")])
+
+        assert exit_code == 1
+        assert "not found" in capsys.readouterr().out
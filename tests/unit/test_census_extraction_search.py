@@ -0,0 +1,188 @@
+"""Unit tests for the census.db full-text search index."""
+
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from rmcitecraft.database.census_extraction_db import (
+    CensusExtractionRepository,
+    CensusPage,
+    CensusPerson,
+    census_phonetic,
+    soundex,
+)
+
+
+@pytest.fixture
+def repo():
+    """Create a repository backed by a temporary census.db."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield CensusExtractionRepository(Path(tmpdir) / "census.db")
+
+
+@pytest.fixture
+def populated_repo(repo):
+    """Repository with a 1950 and a 1940 page and a few persons."""
+    page_1950 = repo.insert_page(CensusPage(census_year=1950, state="Ohio", county="Noble"))
+    page_1940 = repo.insert_page(
+        CensusPage(census_year=1940, state="Pennsylvania", county="Greene")
+    )
+    repo.insert_person(
+        CensusPerson(
+            page_id=page_1950,
+            full_name="John W Iams",
+            given_name="John W",
+            surname="Iams",
+            birthplace="Ohio",
+            occupation="Farmer",
+        )
+    )
+    repo.insert_person(
+        CensusPerson(
+            page_id=page_1950,
+            full_name="Mary Imes",
+            given_name="Mary",
+            surname="Imes",
+            birthplace="Pennsylvania",
+            occupation="Teacher",
+        )
+    )
+    repo.insert_person(
+        CensusPerson(
+            page_id=page_1940,
+            full_name="Johanna Smith",
+            given_name="Johanna",
+            surname="Smith",
+            birthplace="West Virginia",
+        )
+    )
+    return repo
+
+
+class TestSoundex:
+    """Tests for the Soundex helper used by phonetic search."""
+
+    @pytest.mark.parametrize(
+        ("word", "expected"),
+        [
+            ("Robert", "R163"),
+            ("Rupert", "R163"),
+            ("Ashcraft", "A261"),
+            ("Tymczak", "T522"),
+            ("Pfister", "P236"),
+            ("Iams", "I520"),
+            ("Imes", "I520"),
+            ("Lee", "L000"),
+        ],
+    )
+    def test_codes(self, word, expected):
+        assert soundex(word) == expected
+
+    def test_no_letters(self):
+        assert soundex("123") == ""
+
+    def test_phonetic_keys_tag_name_part(self):
+        assert census_phonetic("John W", "Iams") == "sI520 gJ500 gW000"
+
+
+class TestSearchPersons:
+    """Tests for name search through the FTS index."""
+
+    def test_prefix_match_on_surname(self, populated_repo):
+        results = populated_repo.search_persons(surname="Ia")
+        assert [p.full_name for p in results] == ["John W Iams"]
+
+    def test_given_name_is_column_restricted(self, populated_repo):
+        # "Iams" only appears in surname/full_name, never in given_name
+        assert populated_repo.search_persons(given_name="Iams") == []
+
+    def test_phonetic_match(self, populated_repo):
+        results = populated_repo.search_persons(surname="Iams", phonetic=True)
+        assert {p.full_name for p in results} == {"John W Iams", "Mary Imes"}
+
+    def test_year_filter_combined_with_name(self, populated_repo):
+        assert populated_repo.search_persons(given_name="Jo", census_year=1940)[0].surname == "Smith"
+
+    def test_unsearchable_input_returns_nothing(self, populated_repo):
+        assert populated_repo.search_persons(surname="!!") == []
+
+    def test_update_trigger_reindexes(self, populated_repo):
+        with populated_repo._connect() as conn:
+            conn.execute("UPDATE census_person SET surname = 'Jones' WHERE surname = 'Smith'")
+        assert populated_repo.search_persons(surname="Smith") == []
+        assert len(populated_repo.search_persons(surname="Jones")) == 1
+
+    def test_delete_trigger_removes_entry(self, populated_repo):
+        with populated_repo._connect() as conn:
+            conn.execute("DELETE FROM census_person WHERE surname = 'Imes'")
+            remaining = conn.execute("SELECT COUNT(*) FROM census_person_fts").fetchone()[0]
+        assert remaining == 2
+
+
+class TestSearchPersonsRanked:
+    """Tests for free-text ranked search."""
+
+    def test_matches_birthplace_and_occupation(self, populated_repo):
+        results = populated_repo.search_persons_ranked("ohio farm")
+        assert [p.full_name for p, _ in results] == ["John W Iams"]
+
+    def test_indexed_extended_fields(self, populated_repo):
+        person = populated_repo.search_persons(surname="Imes")[0]
+        populated_repo.insert_person_fields_bulk(
+            person.person_id, {"street_name": "Maple Avenue", "income_wages_1949": "900"}
+        )
+        results = populated_repo.search_persons_ranked("maple")
+        assert [p.full_name for p, _ in results] == ["Mary Imes"]
+        # Non-indexed EAV fields are not searchable
+        assert populated_repo.search_persons_ranked("900") == []
+
+    def test_state_filter(self, populated_repo):
+        results = populated_repo.search_persons_ranked("jo", state="Ohio")
+        assert [p.full_name for p, _ in results] == ["John W Iams"]
+
+    def test_results_ordered_by_relevance(self, populated_repo):
+        results = populated_repo.search_persons_ranked("pennsylvania")
+        scores = [score for _, score in results]
+        assert scores == sorted(scores)
+
+    def test_empty_query(self, populated_repo):
+        assert populated_repo.search_persons_ranked("   ") == []
+
+
+class TestSearchIndexMaintenance:
+    """Tests for building the index on existing databases."""
+
+    def test_backfills_database_without_index(self, populated_repo):
+        db_path = populated_repo.db_path
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("DROP TABLE census_person_fts")
+            for trigger in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+            ).fetchall():
+                conn.execute(f"DROP TRIGGER {trigger[0]}")
+
+        reopened = CensusExtractionRepository(db_path)
+        assert len(reopened.search_persons(surname="Iams")) == 1
+
+    def test_rebuild_returns_count(self, populated_repo):
+        assert populated_repo.rebuild_search_index() == 3
+        assert len(populated_repo.search_persons(surname="Smith")) == 1
+
+    def test_plain_connection_can_write_persons(self, populated_repo):
+        """Triggers need no app-registered functions; keys catch up on search."""
+        with sqlite3.connect(populated_repo.db_path) as conn:
+            page_id = conn.execute("SELECT MIN(page_id) FROM census_page").fetchone()[0]
+            conn.execute(
+                "INSERT INTO census_person (page_id, full_name, given_name, surname) "
+                "VALUES (?, 'Ann Iyms', 'Ann', 'Iyms')",
+                (page_id,),
+            )
+            conn.execute("UPDATE census_person SET surname = 'Smyth' WHERE surname = 'Smith'")
+
+        iams = populated_repo.search_persons(surname="Iams", phonetic=True)
+        smith = populated_repo.search_persons(surname="Smith", phonetic=True)
+
+        assert {p.surname for p in iams} == {"Iams", "Imes", "Iyms"}
+        assert [p.surname for p in smith] == ["Smyth"]
@@ -0,0 +1,217 @@
+"""Unit tests for typed per-year projections of census_person_field."""
+
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from rmcitecraft.database.census_extraction_db import (
+    CensusExtractionRepository,
+    CensusPage,
+    CensusPerson,
+)
+from rmcitecraft.database.census_field_projection import (
+    get_projection_columns,
+    projection_table_name,
+)
+
+
+@pytest.fixture
+def repo():
+    """Create a repository backed by a temporary census.db."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield CensusExtractionRepository(Path(tmpdir) / "census.db")
+
+
+@pytest.fixture
+def page_1950(repo):
+    """A 1950 page with two persons."""
+    page_id = repo.insert_page(CensusPage(census_year=1950, state="Ohio", county="Noble"))
+    head = repo.insert_person(CensusPerson(page_id=page_id, full_name="John Iams", line_number=1))
+    wife = repo.insert_person(CensusPerson(page_id=page_id, full_name="Mary Iams", line_number=2))
+    return page_id, head, wife
+
+
+def projected_row(repo, year, person_id):
+    with repo._connect() as conn:
+        return conn.execute(
+            f"SELECT * FROM {projection_table_name(year)} WHERE person_id = ?", (person_id,)
+        ).fetchone()
+
+
+class TestProjectionColumns:
+    """Tests for deriving projection columns from YAML schemas."""
+
+    def test_excludes_core_and_metadata_columns(self):
+        names = {col.name for col in get_projection_columns(1950)}
+        assert "income_wages_1949" in names
+        assert "name" not in names
+        assert "age" not in names
+        assert "page_number" not in names
+
+    def test_includes_extra_fields(self):
+        names = {col.name for col in get_projection_columns(1950)}
+        assert {"veteran_ww1", "veteran_ww2"} <= names
+
+    def test_schema_types_are_kept(self):
+        types = {col.name: col.sql_type for col in get_projection_columns(1950)}
+        assert types["income_wages_1949"] == "INTEGER"
+        assert types["street_name"] == "TEXT"
+
+    def test_invalid_year(self):
+        with pytest.raises(ValueError):
+            get_projection_columns(1890)
+
+
+class TestProjectionMaintenance:
+    """Tests for trigger-maintained projection rows."""
+
+    def test_row_created_for_each_person(self, repo, page_1950):
+        _, head, wife = page_1950
+        assert projected_row(repo, 1950, head) is not None
+        assert projected_row(repo, 1950, wife) is not None
+
+    def test_values_are_typed(self, repo, page_1950):
+        _, head, _ = page_1950
+        repo.insert_person_fields_bulk(
+            head, {"income_wages_1949": "$1,200", "hours_worked": 40, "street_name": "Main"}
+        )
+        row = projected_row(repo, 1950, head)
+        assert row["income_wages_1949"] == 1200
+        assert row["hours_worked"] == 40
+        assert row["street_name"] == "Main"
+
+    def test_unconvertible_integer_is_null(self, repo, page_1950):
+        _, head, _ = page_1950
+        repo.insert_person_fields_bulk(head, {"weeks_worked_1949": "unknown"})
+        assert projected_row(repo, 1950, head)["weeks_worked_1949"] is None
+
+    def test_latest_eav_value_wins(self, repo, page_1950):
+        _, head, _ = page_1950
+        repo.insert_person_field(head, "street_name", "Main")
+        repo.insert_person_field(head, "street_name", "Elm")
+        assert projected_row(repo, 1950, head)["street_name"] == "Elm"
+
+    def test_field_inserts_match_rebuild(self, repo, page_1950):
+        _, head, wife = page_1950
+        repo.insert_person_fields_bulk(
+            head, {"income_wages_1949": "10,000+", "hours_worked": "40", "street_name": "Main"}
+        )
+        repo.insert_person_field(head, "hours_worked", "")
+        repo.insert_person_field(wife, "veteran_ww2", "Yes")
+        before = [dict(projected_row(repo, 1950, pid)) for pid in (head, wife)]
+
+        repo.rebuild_projection(1950)
+
+        assert [dict(projected_row(repo, 1950, pid)) for pid in (head, wife)] == before
+        assert before[0]["hours_worked"] is None and before[0]["street_name"] == "Main"
+
+    def test_delete_field_clears_column(self, repo, page_1950):
+        _, head, _ = page_1950
+        field_id = repo.insert_person_field(head, "street_name", "Main")
+        with repo._connect() as conn:
+            conn.execute("DELETE FROM census_person_field WHERE field_id = ?", (field_id,))
+        assert projected_row(repo, 1950, head)["street_name"] is None
+
+    def test_move_field_updates_both_persons(self, repo, page_1950):
+        _, head, wife = page_1950
+        field_id = repo.insert_person_field(head, "veteran_status", "Yes")
+        repo.move_person_field(field_id, wife)
+        assert projected_row(repo, 1950, head)["veteran_status"] is None
+        assert projected_row(repo, 1950, wife)["veteran_status"] == "Yes"
+
+    def test_delete_person_removes_row(self, repo, page_1950):
+        _, head, _ = page_1950
+        with repo._connect() as conn:
+            conn.execute("DELETE FROM census_person WHERE person_id = ?", (head,))
+        assert projected_row(repo, 1950, head) is None
+
+    def test_other_years_unaffected(self, repo, page_1950):
+        page_1940 = repo.insert_page(CensusPage(census_year=1940, state="Ohio", county="Noble"))
+        person = repo.insert_person(CensusPerson(page_id=page_1940, full_name="Ann Iams"))
+        assert projected_row(repo, 1950, person) is None
+        assert projected_row(repo, 1940, person) is not None
+
+    def test_backfills_existing_database(self, repo, page_1950):
+        _, head, _ = page_1950
+        repo.insert_person_fields_bulk(head, {"street_name": "Main"})
+        with sqlite3.connect(repo.db_path) as conn:
+            conn.execute(f"DROP TABLE {projection_table_name(1950)}")
+            for (name,) in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'census_fields_%'"
+            ).fetchall():
+                conn.execute(f"DROP TRIGGER {name}")
+
+        reopened = CensusExtractionRepository(repo.db_path)
+        assert projected_row(reopened, 1950, head)["street_name"] == "Main"
+
+    def test_move_person_to_other_year(self, repo, page_1950):
+        _, head, _ = page_1950
+        repo.insert_person_fields_bulk(head, {"street_name": "Main"})
+        page_1940 = repo.insert_page(CensusPage(census_year=1940, state="Ohio", county="Noble"))
+        with repo._connect() as conn:
+            conn.execute("UPDATE census_person SET page_id = ? WHERE person_id = ?", (page_1940, head))
+        assert projected_row(repo, 1950, head) is None
+        assert projected_row(repo, 1940, head) is not None
+
+    def test_rebuilds_outdated_projection(self, repo, page_1950):
+        _, head, _ = page_1950
+        repo.insert_person_fields_bulk(head, {"income_wages_1949": "10,000+"})
+        with sqlite3.connect(repo.db_path) as conn:
+            conn.execute(f"DROP TRIGGER {projection_table_name(1950)}_person_au")
+            conn.execute(f"DROP TRIGGER {projection_table_name(1950)}_field_ai")
+            conn.execute(f"ALTER TABLE {projection_table_name(1950)} DROP COLUMN income_wages_1949_text")
+
+        reopened = CensusExtractionRepository(repo.db_path)
+        assert projected_row(reopened, 1950, head)["income_wages_1949_text"] == "10,000+"
+
+    def test_replaces_per_person_field_trigger(self, repo, page_1950):
+        table = projection_table_name(1950)
+        with sqlite3.connect(repo.db_path) as conn:
+            conn.execute(f"DROP TRIGGER {table}_field_ai")
+            conn.execute(
+                f"CREATE TRIGGER {table}_field_ai AFTER INSERT ON census_person_field "
+                f"BEGIN INSERT OR REPLACE INTO {table} (person_id) VALUES (new.person_id); END"
+            )
+
+        reopened = CensusExtractionRepository(repo.db_path)
+        _, head, _ = page_1950
+        reopened.insert_person_field(head, "street_name", "Main")
+        assert projected_row(reopened, 1950, head)["street_name"] == "Main"
+
+    def test_rebuild_projection(self, repo, page_1950):
+        assert repo.rebuild_projection(1950) == 2
+
+
+class TestProjectionReads:
+    """Tests for repository reads served from the projection."""
+
+    def test_sample_line_count(self, repo, page_1950):
+        _, head, wife = page_1950
+        repo.insert_person_fields_bulk(head, {"income_wages_1949": "900"})
+        repo.insert_person_fields_bulk(wife, {"street_name": "Main"})
+        assert repo.get_extraction_stats()["sample_line_persons"] == 1
+
+    def test_sample_line_count_includes_unconvertible_values(self, repo, page_1950):
+        _, head, wife = page_1950
+        repo.insert_person_fields_bulk(head, {"income_wages_1949": "10,000+"})
+        repo.insert_person_fields_bulk(wife, {"veteran_status": "None"})
+        assert repo.get_extraction_stats()["sample_line_persons"] == 2
+
+    def test_page_fields_merge_projection_and_eav(self, repo, page_1950):
+        page_id, head, wife = page_1950
+        repo.insert_person_fields_bulk(
+            head,
+            {"income_wages_1949": "1,200", "enumerator_name": "Bob", "weeks_worked_1949": "n/a"},
+        )
+        fields = repo.get_person_fields_for_page(page_id, 1950)
+        assert fields[head]["income_wages_1949"] == 1200  # typed from projection
+        assert fields[head]["enumerator_name"] == "Bob"  # EAV-only field
+        assert fields[head]["weeks_worked_1949"] == "n/a"  # unconvertible keeps EAV text
+        assert wife not in fields or fields[wife] == {}
+
+    def test_page_fields_without_year_match_eav(self, repo, page_1950):
+        page_id, head, _ = page_1950
+        repo.insert_person_fields_bulk(head, {"income_wages_1949": "1,200", "hours_worked": 40})
+        assert repo.get_person_fields_for_page(page_id)[head] == repo.get_person_fields(head)
@@ -0,0 +1,169 @@
+"""Unit tests for census image preprocessing."""
+
+import os
+
+import pytest
+
+pytest.importorskip("PIL")
+from PIL import Image, ImageDraw  # noqa: E402
+
+from rmcitecraft.services.census.image_preprocessor import (  # noqa: E402
+    CensusImagePreprocessor,
+    PreprocessSettings,
+)
+from rmcitecraft.services.census.schema_registry import CensusSchemaRegistry  # noqa: E402
+
+
+@pytest.fixture
+def scan(tmp_path):
+    """3000x2000 colour 'page' with a 100px black microfilm border."""
+    path = tmp_path / "census.jpg"
+    img = Image.new("RGB", (3000, 2000), "black")
+    draw = ImageDraw.Draw(img)
+    draw.rectangle((100, 100, 2899, 1899), fill=(240, 235, 220))
+    draw.line((200, 500, 2800, 500), fill="black", width=5)
+    img.save(path, quality=95)
+    return path
+
+
+@pytest.fixture
+def preprocessor(tmp_path):
+    return CensusImagePreprocessor(
+        PreprocessSettings(max_long_edge=1000), cache_dir=tmp_path / "cache"
+    )
+
+
+class TestPreprocess:
+    """Tests for the preprocessing pipeline."""
+
+    def test_crops_grayscales_and_downscales(self, preprocessor, scan):
+        result = preprocessor.preprocess(scan)
+
+        with Image.open(result) as img:
+            assert img.mode == "L"
+            assert img.size == (1000, 643)  # 2800x1800 page after margin crop
+        assert result.stat().st_size < scan.stat().st_size
+
+    def test_result_is_cached(self, preprocessor, scan):
+        first = preprocessor.preprocess(scan)
+        inode = first.stat().st_ino
+        assert preprocessor.preprocess(scan) == first
+        assert first.stat().st_ino == inode  # Not rewritten
+
+    def test_settings_change_cache_key(self, preprocessor, scan, tmp_path):
+        other = CensusImagePreprocessor(
+            PreprocessSettings(max_long_edge=500), cache_dir=tmp_path / "cache"
+        )
+        assert other.preprocess(scan) != preprocessor.preprocess(scan)
+
+    def test_modified_image_gets_new_variant(self, preprocessor, scan):
+        first = preprocessor.preprocess(scan)
+        Image.new("RGB", (3000, 2000), "white").save(scan)
+        assert preprocessor.preprocess(scan) != first
+
+    def test_unreadable_file_returns_original(self, preprocessor, tmp_path):
+        path = tmp_path / "fake.jpg"
+        path.write_bytes(b"fake image data")
+        assert preprocessor.preprocess(path) == path
+
+    def test_border_colour_ignores_one_odd_corner(self, preprocessor, tmp_path):
+        path = tmp_path / "labelled.png"
+        img = Image.new("RGB", (3000, 2000), "black")
+        draw = ImageDraw.Draw(img)
+        draw.rectangle((100, 100, 2899, 1899), fill=(240, 235, 220))
+        draw.rectangle((0, 0, 50, 50), fill="white")  # Film label over one corner
+        img.save(path)
+
+        with Image.open(preprocessor.preprocess(path)) as result:
+            # Black margins trimmed up to the label (2900x1900), not kept (3000x2000)
+            assert result.size == (1000, 655)
+
+    def test_leaves_no_temp_files(self, preprocessor, scan, tmp_path):
+        preprocessor.preprocess(scan)
+        assert [p.suffix for p in (tmp_path / "cache").iterdir()] == [".jpg"]
+
+
+class TestCacheEviction:
+    """Tests for the preprocessed image cache size bound."""
+
+    @pytest.fixture
+    def scans(self, tmp_path):
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"census_{i}.jpg"
+            Image.new("RGB", (800, 600), (i * 60, 100, 200)).save(path)
+            paths.append(path)
+        return paths
+
+    def test_evicts_least_recently_used(self, tmp_path, scans):
+        preprocessor = CensusImagePreprocessor(cache_dir=tmp_path / "cache")
+        first = preprocessor.preprocess(scans[0])
+        second = preprocessor.preprocess(scans[1])
+        os.utime(first, (1, 1))
+        os.utime(second, (2, 2))
+        preprocessor.max_bytes = first.stat().st_size + second.stat().st_size
+
+        third = preprocessor.preprocess(scans[2])
+
+        assert not first.exists()
+        assert second.exists() and third.exists()
+
+    def test_cache_hit_marks_recently_used(self, tmp_path, scans):
+        preprocessor = CensusImagePreprocessor(cache_dir=tmp_path / "cache")
+        first = preprocessor.preprocess(scans[0])
+        second = preprocessor.preprocess(scans[1])
+        os.utime(first, (1, 1))
+        os.utime(second, (2, 2))
+        preprocessor.max_bytes = first.stat().st_size + second.stat().st_size
+
+        assert preprocessor.preprocess(scans[0]) == first
+        preprocessor.preprocess(scans[2])
+
+        assert first.exists()
+        assert not second.exists()
+
+    def test_directory_scanned_only_when_over_limit(self, tmp_path, scans, monkeypatch):
+        preprocessor = CensusImagePreprocessor(cache_dir=tmp_path / "cache")
+        preprocessor.preprocess(scans[0])
+        scans_made = []
+        original = preprocessor._scan_entries
+        monkeypatch.setattr(
+            preprocessor, "_scan_entries", lambda: scans_made.append(1) or original()
+        )
+
+        preprocessor.preprocess(scans[1])
+
+        assert scans_made == []
+
+
+class TestLineCrop:
+    """Tests for cropping to the target line region."""
+
+    @pytest.fixture
+    def preprocessor(self, tmp_path):
+        return CensusImagePreprocessor(
+            PreprocessSettings(max_long_edge=1000, crop_to_line=True),
+            cache_dir=tmp_path / "cache",
+        )
+
+    def test_off_by_default(self, tmp_path):
+        schema = CensusSchemaRegistry.get_schema(1940)
+        preprocessor = CensusImagePreprocessor(cache_dir=tmp_path / "cache")
+        assert preprocessor._line_band(schema, 20) is None
+
+    def test_line_band_keeps_header_and_nearby_lines(self, preprocessor, scan):
+        schema = CensusSchemaRegistry.get_schema(1940)
+        full = preprocessor.preprocess(scan)
+        cropped = preprocessor.preprocess(scan, schema, target_line=20)
+
+        with Image.open(full) as full_img, Image.open(cropped) as cropped_img:
+            assert cropped_img.width == full_img.width
+            assert cropped_img.height < full_img.height / 2
+
+    def test_side_b_lines_map_to_same_rows(self, preprocessor):
+        schema = CensusSchemaRegistry.get_schema(1940)
+        assert preprocessor._line_band(schema, 5) == preprocessor._line_band(schema, 45)
+
+    def test_no_band_without_line(self, preprocessor):
+        schema = CensusSchemaRegistry.get_schema(1940)
+        assert preprocessor._line_band(schema, None) is None
@@ -0,0 +1,210 @@
+"""Unit tests for the census transcription model cascade."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from rmcitecraft.llm.telemetry import LLMTelemetryStore
+from rmcitecraft.services.census.model_cascade import CascadeTier, CensusModelCascade
+
+CLEAN_1940 = """{
+    "metadata": {"enumeration_district": "93-76", "sheet": "9A"},
+    "persons": [
+        {"line_number": 24, "name": "Smith, John", "relationship": "Head",
+         "sex": "M", "race": "W", "age": 35, "marital_status": "M",
+         "birthplace": "Ohio"}
+    ]
+}"""
+
+MISSING_SHEET_1940 = """{
+    "metadata": {"enumeration_district": "93-76"},
+    "persons": [
+        {"line_number": 24, "name": "Smith, John", "relationship": "Head",
+         "sex": "M", "race": "W", "age": 35, "marital_status": "M",
+         "birthplace": "Ohio"}
+    ]
+}"""
+
+
+# Lines 24-27: a daughter continuing the previous page's household, then a
+# new household
+PAGE_1940 = """{
+    "metadata": {"enumeration_district": "93-76", "sheet": "9A"},
+    "persons": [
+        {"line_number": 24, "name": "Jones, Ann", "relationship": "Daughter",
+         "sex": "F", "race": "W", "age": 12, "marital_status": "S", "birthplace": "Ohio"},
+        {"line_number": 25, "name": "Smith, John", "relationship": "Head",
+         "sex": "M", "race": "W", "age": 35, "marital_status": "M", "birthplace": "Ohio"},
+        {"line_number": 26, "name": "Smith, Mary", "relationship": "Wife",
+         "sex": "F", "race": "W", "age": 33, "marital_status": "M", "birthplace": "Ohio"},
+        {"line_number": 27, "name": "Smith, Paul", "relationship": "Son",
+         "sex": "M", "race": "W", "age": 8, "marital_status": "S", "birthplace": "Ohio"}
+    ]
+}"""
+
+
+class ModelProvider:
+    """Mock provider returning a fixed response per model."""
+
+    def __init__(self, responses: dict[str, str]):
+        self.responses = responses
+        self.calls: list[str] = []
+
+    def complete_with_image(self, prompt, image_path, model=None, **kwargs):
+        self.calls.append(model)
+        response = MagicMock()
+        response.text = self.responses[model]
+        return response
+
+
+@pytest.fixture
+def image_file(tmp_path):
+    path = tmp_path / "census.jpg"
+    path.write_bytes(b"fake image data")
+    return path
+
+
+@pytest.fixture
+def telemetry(tmp_path):
+    return LLMTelemetryStore(tmp_path / "telemetry.db")
+
+
+def make_cascade(provider, telemetry, max_warnings=0):
+    return CensusModelCascade(
+        provider,
+        [CascadeTier("cheap", max_warnings), CascadeTier("strong")],
+        telemetry=telemetry,
+    )
+
+
+class TestRouting:
+    """Tests for escalation decisions."""
+
+    def test_clean_result_stays_on_cheap_model(self, image_file, telemetry):
+        provider = ModelProvider({"cheap": CLEAN_1940, "strong": CLEAN_1940})
+
+        result = make_cascade(provider, telemetry).transcribe(image_file, 1940)
+
+        assert result.success is True
+        assert result.model == "cheap"
+        assert provider.calls == ["cheap"]
+
+    def test_validation_warnings_escalate(self, image_file, telemetry):
+        provider = ModelProvider({"cheap": MISSING_SHEET_1940, "strong": CLEAN_1940})
+
+        result = make_cascade(provider, telemetry).transcribe(image_file, 1940)
+
+        assert result.model == "strong"
+        assert result.warnings == []
+        assert provider.calls == ["cheap", "strong"]
+
+    def test_warning_threshold(self, image_file, telemetry):
+        provider = ModelProvider({"cheap": MISSING_SHEET_1940, "strong": CLEAN_1940})
+
+        result = make_cascade(provider, telemetry, max_warnings=1).transcribe(image_file, 1940)
+
+        assert result.model == "cheap"
+        assert len(result.warnings) == 1
+
+    def test_parse_failure_escalates(self, image_file, telemetry):
+        provider = ModelProvider({"cheap": "I cannot read this image", "strong": CLEAN_1940})
+
+        result = make_cascade(provider, telemetry).transcribe(image_file, 1940)
+
+        assert result.success is True
+        assert result.model == "strong"
+
+    def test_last_model_result_returned_even_with_warnings(self, image_file, telemetry):
+        provider = ModelProvider({"cheap": "garbage", "strong": MISSING_SHEET_1940})
+
+        result = make_cascade(provider, telemetry).transcribe(image_file, 1940)
+
+        assert result.success is True
+        assert result.model == "strong"
+        assert result.warnings
+
+    def test_household_warnings_escalate_family_extraction(self, image_file, telemetry):
+        wife_first = CLEAN_1940.replace('"Head"', '"Wife"')
+        provider = ModelProvider({"cheap": wife_first, "strong": CLEAN_1940})
+
+        result = make_cascade(provider, telemetry).extract_family(
+            image_file, 1940, ["John Smith"]
+        )
+
+        assert result.model == "strong"
+
+    def test_household_warnings_escalate_page_transcription(self, image_file, telemetry):
+        provider = ModelProvider({"cheap": PAGE_1940.replace("26", "25"), "strong": PAGE_1940})
+
+        result = make_cascade(provider, telemetry).transcribe(image_file, 1940)
+
+        assert result.model == "strong"
+        assert result.warnings == []
+
+    def test_page_may_start_mid_household(self, image_file, telemetry):
+        provider = ModelProvider({"cheap": PAGE_1940, "strong": PAGE_1940})
+
+        result = make_cascade(provider, telemetry).transcribe(image_file, 1940)
+
+        assert result.model == "cheap"
+
+    def test_invalid_year_makes_no_calls(self, image_file, telemetry):
+        provider = ModelProvider({})
+
+        result = make_cascade(provider, telemetry).transcribe(image_file, 1890)
+
+        assert result.success is False
+        assert provider.calls == []
+
+    def test_requires_a_model(self):
+        with pytest.raises(ValueError):
+            CensusModelCascade(ModelProvider({}), [])
+
+
+class TestRoutingTelemetry:
+    """Tests for recorded routing decisions."""
+
+    def test_decisions_recorded(self, image_file, telemetry):
+        cascade = make_cascade(
+            ModelProvider({"cheap": MISSING_SHEET_1940, "strong": CLEAN_1940}), telemetry
+        )
+        cascade.transcribe(image_file, 1940)
+        cascade.transcribe(image_file, 1950)
+
+        summary = {(s.model, s.census_year): s for s in telemetry.routing_summary()}
+
+        cheap_1940 = summary[("cheap", 1940)]
+        assert (cheap_1940.attempts, cheap_1940.escalated, cheap_1940.accepted) == (1, 1, 0)
+        assert cheap_1940.mean_warnings == 1
+        assert summary[("strong", 1940)].accepted == 1
+        assert summary[("strong", 1940)].acceptance_rate == 1.0
+        assert ("cheap", 1950) in summary
+
+
+class TestCensusTranscriberRouting:
+    """Tests for CensusTranscriber using a configured cascade."""
+
+    def test_transcribe_census_uses_cascade(self, image_file, telemetry):
+        from rmcitecraft.services.census_transcriber import CensusTranscriber
+
+        provider = ModelProvider({"cheap": MISSING_SHEET_1940, "strong": CLEAN_1940})
+        provider.name = "mock"
+        transcriber = CensusTranscriber(
+            provider=provider, cascade=make_cascade(provider, telemetry)
+        )
+        seen = []
+
+        response = transcriber.transcribe_census(
+            image_file, 1940, on_person=lambda person, warnings: seen.append(person["name"])
+        )
+
+        assert provider.calls == ["cheap", "strong"]
+        assert response.metadata["model"] == "strong"
+        assert seen == ["Smith, John"]
+
+    def test_cascade_built_from_settings(self, monkeypatch):
+        from rmcitecraft.config import get_config
+
+        monkeypatch.setattr(get_config(), "census_cascade_models", "cheap, strong")
+        cascade = CensusModelCascade.from_config(MagicMock())
+        assert [tier.model for tier in cascade.tiers] == ["cheap", "strong"]
@@ -174,3 +174,55 @@ class TestPromptBuilderEdgeCases:
         assert "24" in prompt
         assert "9A" in prompt
         assert "93-76" in prompt
+
+
+class TestCacheablePromptLayout:
+    """Tests for the stable prefix / per-request suffix split."""
+
+    @pytest.fixture
+    def builder(self):
+        return CensusPromptBuilder()
+
+    def test_prefix_identical_across_targets(self, builder):
+        schema = CensusSchemaRegistry.get_schema(1940)
+        first = builder.build_transcription_prompt_parts(schema, target_names=["John Smith"])
+        second = builder.build_transcription_prompt_parts(schema, target_line=12, sheet="3B")
+
+        assert first.prefix == second.prefix
+        assert "John Smith" in first.suffix
+        assert "John Smith" not in first.prefix
+        assert "12" in second.suffix
+
+    def test_prefix_is_memoized(self, builder):
+        schema = CensusSchemaRegistry.get_schema(1940)
+        first = builder.build_transcription_prompt_parts(schema)
+        second = builder.build_transcription_prompt_parts(schema)
+        assert first.prefix is second.prefix
+
+    def test_prefix_differs_by_year(self, builder):
+        prefix_1940 = builder.build_transcription_prompt_parts(
+            CensusSchemaRegistry.get_schema(1940)
+        ).prefix
+        prefix_1950 = builder.build_transcription_prompt_parts(
+            CensusSchemaRegistry.get_schema(1950)
+        ).prefix
+        assert prefix_1940 != prefix_1950
+
+    def test_text_joins_prefix_and_suffix(self, builder):
+        schema = CensusSchemaRegistry.get_schema(1940)
+        parts = builder.build_transcription_prompt_parts(schema, target_names=["John Smith"])
+        assert parts.text == builder.build_transcription_prompt(schema, target_names=["John Smith"])
+        assert parts.text.startswith(parts.prefix)
+        assert parts.text.endswith(parts.suffix)
+
+    def test_no_targeting_means_empty_suffix(self, builder):
+        schema = CensusSchemaRegistry.get_schema(1940)
+        assert builder.build_transcription_prompt_parts(schema).suffix == ""
+
+    def test_family_prompt_names_only_in_suffix(self, builder):
+        schema = CensusSchemaRegistry.get_schema(1940)
+        parts = builder.build_family_extraction_prompt_parts(schema, ["John Smith"])
+        other = builder.build_family_extraction_prompt_parts(schema, ["Mary Jones"])
+
+        assert parts.prefix == other.prefix
+        assert "John Smith" in parts.suffix
@@ -0,0 +1,123 @@
+"""Unit tests for parallel, cached census quality checks."""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# census_quality lives in scripts/
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "scripts"))
+
+from census_quality.cache import QualityResultCache  # noqa: E402
+from census_quality.runner import (  # noqa: E402
+    merge_results,
+    run_all_quality_checks,
+    run_quality_check,
+)
+
+
+def source_fields(footnote: str) -> bytes:
+    return (
+        "<Root><Fields>"
+        f"<Field><Name>Footnote</Name><Value>{footnote}</Value></Field>"
+        "<Field><Name>ShortFootnote</Name><Value>short</Value></Field>"
+        "<Field><Name>Bibliography</Name><Value>bib</Value></Field>"
+        "</Fields></Root>"
+    ).encode()
+
+
+@pytest.fixture
+def rm_db(tmp_path):
+    """Minimal RootsMagic database with 1940 and 1950 census sources."""
+    db_path = tmp_path / "test.rmtree"
+    conn = sqlite3.connect(db_path)
+    conn.executescript(
+        """
+        CREATE TABLE SourceTable (SourceID INTEGER PRIMARY KEY, Name TEXT, Fields BLOB, UTCModDate REAL);
+        CREATE TABLE MediaLinkTable (LinkID INTEGER PRIMARY KEY, OwnerID INTEGER, OwnerType INTEGER);
+        CREATE TABLE CitationTable (CitationID INTEGER PRIMARY KEY, SourceID INTEGER);
+        CREATE TABLE CitationLinkTable (LinkID INTEGER PRIMARY KEY, CitationID INTEGER, Quality TEXT);
+        """
+    )
+    for source_id, year in [(1, 1940), (2, 1940), (3, 1940), (4, 1950), (5, 1950)]:
+        conn.execute(
+            "INSERT INTO SourceTable VALUES (?, ?, ?, 1.0)",
+            (source_id, f"Fed Census: {year}, Ohio, Noble [] Doe, J{source_id}", source_fields("x")),
+        )
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+class TestResultCache:
+    """Tests for incremental re-checking."""
+
+    def test_second_run_reuses_results(self, rm_db, tmp_path):
+        cache_path = tmp_path / "cache.sqlite"
+        first = run_quality_check(rm_db, 1940, cache_path=cache_path)
+        second = run_quality_check(rm_db, 1940, cache_path=cache_path)
+
+        assert first["cache"] == {"hits": 0, "checked": 3}
+        assert second["cache"] == {"hits": 3, "checked": 0}
+        assert second["issues"] == first["issues"]
+
+    def test_modified_source_is_rechecked(self, rm_db, tmp_path):
+        cache_path = tmp_path / "cache.sqlite"
+        run_quality_check(rm_db, 1940, cache_path=cache_path)
+        with sqlite3.connect(rm_db) as conn:
+            conn.execute("UPDATE SourceTable SET UTCModDate = 2.0 WHERE SourceID = 2")
+
+        assert run_quality_check(rm_db, 1940, cache_path=cache_path)["cache"]["checked"] == 1
+
+    def test_content_change_without_moddate_is_rechecked(self, rm_db, tmp_path):
+        cache_path = tmp_path / "cache.sqlite"
+        run_quality_check(rm_db, 1940, cache_path=cache_path)
+        with sqlite3.connect(rm_db) as conn:
+            conn.execute("UPDATE SourceTable SET Fields = ? WHERE SourceID = 3", (source_fields("y"),))
+
+        assert run_quality_check(rm_db, 1940, cache_path=cache_path)["cache"]["checked"] == 1
+
+    def test_validator_version_change_invalidates(self, rm_db, tmp_path):
+        cache_path = tmp_path / "cache.sqlite"
+        run_quality_check(rm_db, 1940, cache_path=cache_path)
+
+        cache = QualityResultCache(cache_path, validator_version="other")
+        assert cache.load_year(1940) == {}
+        cache.close()
+
+    def test_deleted_sources_are_pruned(self, rm_db, tmp_path):
+        cache_path = tmp_path / "cache.sqlite"
+        run_quality_check(rm_db, 1940, cache_path=cache_path)
+        with sqlite3.connect(rm_db) as conn:
+            conn.execute("DELETE FROM SourceTable WHERE SourceID = 1")
+        run_quality_check(rm_db, 1940, cache_path=cache_path)
+
+        cache = QualityResultCache(cache_path)
+        assert set(cache.load_year(1940)) == {2, 3}
+        cache.close()
+
+
+class TestAllYears:
+    """Tests for multi-year runs and merged results."""
+
+    def test_parallel_run_merges_years(self, rm_db, tmp_path):
+        consolidated = run_all_quality_checks(
+            rm_db, [1940, 1950], cache_path=tmp_path / "cache.sqlite", workers=2
+        )
+
+        assert [r["year"] for r in consolidated["years"]] == [1940, 1950]
+        assert consolidated["total_sources"] == 5
+        assert consolidated["total_issues"] == sum(r["total_issues"] for r in consolidated["years"])
+        assert consolidated["cache"] == {"hits": 0, "checked": 5}
+
+    def test_parallel_matches_serial(self, rm_db):
+        parallel = run_all_quality_checks(rm_db, [1940, 1950], workers=2)
+        serial = merge_results([run_quality_check(rm_db, 1940), run_quality_check(rm_db, 1950)])
+        assert parallel == serial
+
+    def test_unknown_year_reported_separately(self, rm_db):
+        consolidated = run_all_quality_checks(rm_db, [1940, 1891], workers=1)
+        assert [r["year"] for r in consolidated["errors"]] == [1891]
+        assert consolidated["total_sources"] == 3
@@ -2,7 +2,10 @@
 
 import pytest
 
-from rmcitecraft.services.census.response_parser import CensusResponseParser
+from rmcitecraft.services.census.response_parser import (
+    CensusResponseParser,
+    IncrementalPersonParser,
+)
 
 
 class TestCensusResponseParser:
@@ -231,3 +234,66 @@ class TestExtractMetadata:
         metadata = parser.extract_metadata(data)
 
         assert metadata["census_year"] == 1940
+
+
+class TestIncrementalPersonParser:
+    """Tests for streaming person extraction."""
+
+    RESPONSE = """Here is the transcription:
+```json
+{
+  "metadata": {"census_year": 1940, "sheet": "9A", "notes": ["a {brace} in \\"text\\""]},
+  "persons": [
+    {"line_number": 24, "name": "Smith, John", "relationship": "Head"},
+    {"line_number": 25, "name": "Smith, Mary }", "relationship": "Wife"}
+  ]
+}
+```"""
+
+    def feed_in_chunks(self, text, size):
+        parser = IncrementalPersonParser()
+        persons = []
+        for i in range(0, len(text), size):
+            persons.extend(parser.feed(text[i : i + size]))
+        return parser, persons
+
+    @pytest.mark.parametrize("size", [1, 7, 1000])
+    def test_persons_yielded_regardless_of_chunking(self, size):
+        parser, persons = self.feed_in_chunks(self.RESPONSE, size)
+
+        assert [p["name"] for p in persons] == ["Smith, John", "Smith, Mary }"]
+        assert parser.text == self.RESPONSE
+
+    def test_person_available_before_response_ends(self):
+        parser = IncrementalPersonParser()
+        head, _, _ = self.RESPONSE.partition('{"line_number": 25')
+
+        persons = parser.feed(head)
+
+        assert [p["line_number"] for p in persons] == [24]
+
+    def test_household_members(self):
+        text = '{"households": [{"head": "X", "members": [{"name": "A"}, {"name": "B"}]}]}'
+
+        _, persons = self.feed_in_chunks(text, 5)
+
+        assert [p["name"] for p in persons] == ["A", "B"]
+
+    def test_top_level_array(self):
+        _, persons = self.feed_in_chunks('[{"name": "A"}, {"name": "B"}]', 3)
+
+        assert len(persons) == 2
+
+    def test_trailing_comma_repaired_and_bad_record_skipped(self):
+        text = '{"persons": [{"name": "A", "age": 3,}, {"name": "B" "age"}, {"name": "C"}]}'
+
+        _, persons = self.feed_in_chunks(text, 4)
+
+        assert [p["name"] for p in persons] == ["A", "C"]
+
+    def test_text_after_root_ignored(self):
+        text = '{"persons": [{"name": "A"}]} trailing {"persons": [{"name": "Z"}]}'
+
+        _, persons = self.feed_in_chunks(text, 10)
+
+        assert [p["name"] for p in persons] == ["A"]
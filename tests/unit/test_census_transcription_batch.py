@@ -0,0 +1,129 @@
+"""Unit tests for CensusTranscriptionBatchService.process_batch."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from rmcitecraft.database.census_transcription_repository import TranscriptionItem
+from rmcitecraft.services.census_transcription_batch import CensusTranscriptionBatchService
+from rmcitecraft.services.familysearch_automation import CDPConnectionError
+
+
+class FakeExtractor:
+    """Extractor stub that records how many extractions overlap, and in which tabs."""
+
+    def __init__(self, fail_on: str | None = None):
+        self.fail_on = fail_on
+        self.active = 0
+        self.max_active = 0
+        self.pages = set()
+        self.opened = []
+        self.automation = MagicMock()
+        self.automation.get_or_create_page = self._page
+        self.automation.new_page = self._new_page
+
+    @staticmethod
+    def _make_page():
+        return SimpleNamespace(
+            url="https://www.familysearch.org/ark:/61903/3:1:ABC-123", close=AsyncMock()
+        )
+
+    async def _page(self):
+        return self._make_page()
+
+    async def _new_page(self):
+        page = self._make_page()
+        self.opened.append(page)
+        return page
+
+    async def connect(self):
+        return True
+
+    async def disconnect(self):
+        pass
+
+    async def extract_from_ark(self, ark_url, page=None, **kwargs):
+        if self.fail_on and ark_url.endswith(self.fail_on):
+            raise CDPConnectionError("Chrome not reachable")
+        self.pages.add(id(page))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return SimpleNamespace(
+            success=True,
+            error_message=None,
+            extracted_data={"line_number": "12"},
+            person_id=1,
+            page_id=None,
+            related_persons=[],
+        )
+
+
+def make_service(extractor, count=4):
+    state_repo = MagicMock()
+    state_repo.get_pending_items.return_value = [
+        TranscriptionItem(
+            item_id=i,
+            session_id="s1",
+            rmtree_citation_id=100 + i,
+            person_name=f"Person {i}",
+            census_year=1950,
+            familysearch_ark=f"1:1:ITEM{i}",
+        )
+        for i in range(count)
+    ]
+    service = CensusTranscriptionBatchService(
+        extractor=extractor, state_repo=state_repo, settings=MagicMock()
+    )
+    matcher = MagicMock()
+    matcher.get_rm_persons_for_source.return_value = ([], None, None)
+    service._matcher = matcher
+    return service, state_repo
+
+
+class TestProcessBatch:
+    """Tests for batch processing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_items_use_their_own_tabs(self):
+        extractor = FakeExtractor()
+        service, state_repo = make_service(extractor)
+        done = []
+
+        result = await service.process_batch(
+            "s1", concurrency=3, on_item_done=lambda item, r: done.append(item.item_id)
+        )
+
+        assert result.completed == 4
+        assert sorted(done) == [0, 1, 2, 3]
+        assert extractor.max_active == 3
+        assert extractor.pages == {id(page) for page in extractor.opened}
+        assert len(extractor.opened) == 3
+        assert all(page.close.await_count == 1 for page in extractor.opened)
+        assert state_repo.create_checkpoint.call_count == 4
+        state_repo.complete_session.assert_called_once_with("s1")
+        service.matcher.load_household_graph.assert_called_once_with(reload=True)
+
+    @pytest.mark.asyncio
+    async def test_connection_error_pauses_session(self):
+        service, state_repo = make_service(FakeExtractor(fail_on="ITEM1"))
+
+        result = await service.process_batch("s1", concurrency=1)
+
+        assert result.connection_error is True
+        assert result.completed == 1
+        state_repo.pause_session.assert_called_once_with("s1")
+        state_repo.complete_session.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_single_worker_uses_users_tab(self):
+        extractor = FakeExtractor()
+        service, _ = make_service(extractor, count=2)
+
+        result = await service.process_batch("s1", concurrency=1)
+
+        assert result.completed == 2
+        assert extractor.pages == {id(None)} and not extractor.opened
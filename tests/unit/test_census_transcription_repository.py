@@ -353,6 +353,22 @@ class TestItemOperations:
         assert len(pending) == 1
         assert pending[0].item_id == id2
 
+    def test_get_pending_items_includes_interrupted(self, repo):
+        """Test items left mid-extraction by a crashed run are retried."""
+        repo.create_session("test_session", total_items=1)
+        item_id = repo.create_item(
+            session_id="test_session",
+            rmtree_citation_id=100,
+            rmtree_person_id=1,
+            person_name="Person 1",
+            census_year=1950,
+            familysearch_ark="1:1:TEST1",
+        )
+        repo.update_item_status(item_id, "extracting")
+
+        pending = repo.get_pending_items("test_session")
+        assert [item.item_id for item in pending] == [item_id]
+
     def test_get_edge_warning_items(self, repo):
         """Test getting items with edge warnings."""
         repo.create_session("test_session", total_items=2)
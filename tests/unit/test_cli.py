@@ -2,7 +2,7 @@
 
 from io import StringIO
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -268,3 +268,217 @@ class TestRestartCommand:
 
             captured = capsys.readouterr()
             assert "Stopping" in captured.out or "Starting" in captured.out
+
+
+class TestImportTimeCommand:
+    """Test import-time diagnostic command."""
+
+    def test_parse_import_times(self) -> None:
+        """Test parsing -X importtime output skips the header."""
+        from rmcitecraft.cli import _parse_import_times
+
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |     _io\n"
+            "import time:      2500 |       9000 | json\n"
+            "Traceback (most recent call last):\n"
+        )
+
+        assert _parse_import_times(output) == [("_io", 120, 120), ("json", 2500, 9000)]
+
+    def test_import_time_reports_modules(self, capsys: pytest.CaptureFixture) -> None:
+        """Test import-time on a standard library module."""
+        exit_code = cli_main(["import-time", "json", "--top", "3"])
+
+        assert exit_code == 0
+        captured = capsys.readouterr()
+        assert "Importing json:" in captured.out
+        assert len(captured.out.strip().splitlines()) <= 6
+
+    def test_import_time_unknown_module(self, capsys: pytest.CaptureFixture) -> None:
+        """Test import-time on a module that cannot be imported."""
+        exit_code = cli_main(["import-time", "no_such_module_xyz"])
+
+        assert exit_code == 1
+        captured = capsys.readouterr()
+        assert "✗ Cannot import no_such_module_xyz" in captured.out
+
+
+class TestTranscribeCommand:
+    """Test headless transcription command."""
+
+    @pytest.fixture
+    def service(self):
+        from rmcitecraft.services.census_transcription_batch import (
+            BatchResult,
+            QueueItem,
+            QueueStats,
+        )
+
+        service = MagicMock()
+        queue = [
+            QueueItem(i, i, f"Person {i}", 1950, "Ohio", "Noble", f"1:1:ITEM{i}")
+            for i in range(3)
+        ]
+        service.build_transcription_queue = AsyncMock(
+            return_value=(queue, QueueStats(total_sources=5, already_processed=2, remaining=3))
+        )
+        service.create_session_from_queue.return_value = "transcription_1950_test"
+
+        async def process_batch(session_id, concurrency=1, on_item_done=None):
+            item = MagicMock(item_id=1, person_name="Person 0", census_year=1950)
+            on_item_done(item, {"success": True, "edge_message": ""})
+            return BatchResult(total_items=2, completed=2)
+
+        service.process_batch = process_batch
+        service.extractor.disconnect = AsyncMock()
+        with patch(
+            "rmcitecraft.services.census_transcription_batch.CensusTranscriptionBatchService",
+            return_value=service,
+        ):
+            yield service
+
+    @staticmethod
+    def events(output: str) -> list[dict]:
+        import json
+
+        return [json.loads(line) for line in output.strip().splitlines()]
+
+    def test_transcribe_emits_json_lines(
+        self, service: MagicMock, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test a new session reports queue, session, items and summary."""
+        exit_code = cli_main(["transcribe", "--year", "1950", "--limit", "2"])
+
+        assert exit_code == 0
+        events = self.events(capsys.readouterr().out)
+        assert [e["event"] for e in events] == ["queue", "session", "item", "done"]
+        assert events[0]["items"] == 2
+        assert events[1]["session_id"] == "transcription_1950_test"
+        assert events[2]["status"] == "completed"
+        assert events[3]["completed"] == 2
+        queue = service.create_session_from_queue.call_args.args[0]
+        assert len(queue) == 2
+        service.extractor.disconnect.assert_awaited_once()
+
+    def test_transcribe_dry_run(self, service: MagicMock, capsys: pytest.CaptureFixture) -> None:
+        """Test dry run only reports the queue."""
+        exit_code = cli_main(["transcribe", "--dry-run"])
+
+        assert exit_code == 0
+        events = self.events(capsys.readouterr().out)
+        assert events == [
+            {"event": "queue", "items": 3, "total_sources": 5, "already_processed": 2}
+        ]
+        service.create_session_from_queue.assert_not_called()
+
+    def test_transcribe_resume_unknown_session(
+        self, service: MagicMock, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test resuming a missing session fails."""
+        service.resume_session = AsyncMock(side_effect=ValueError("Session not found: missing"))
+
+        exit_code = cli_main(["transcribe", "--resume", "missing"])
+
+        assert exit_code == 1
+        assert self.events(capsys.readouterr().out)[-1] == {
+            "event": "error", "message": "Session not found: missing"
+        }
+        service.extractor.disconnect.assert_awaited_once()
+
+    def test_transcribe_resume_checks_session_status(
+        self, service: MagicMock, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test resuming goes through resume_session, not process_batch."""
+        from rmcitecraft.services.census_transcription_batch import BatchResult
+
+        service.resume_session = AsyncMock(return_value=BatchResult(total_items=1, completed=1))
+
+        exit_code = cli_main(["transcribe", "--resume", "s1", "--concurrency", "2"])
+
+        assert exit_code == 0
+        service.resume_session.assert_awaited_once()
+        assert service.resume_session.await_args.args == ("s1",)
+        assert service.resume_session.await_args.kwargs["concurrency"] == 2
+        assert self.events(capsys.readouterr().out)[-1]["completed"] == 1
+
+
+class TestGenerateTreeCommand:
+    """Tests for the generate-tree command."""
+
+    def test_generate_tree(self, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+        """Test the tree and census database are written."""
+        output = tmp_path / "scale.rmtree"
+        census_db = tmp_path / "census.db"
+
+        exit_code = cli_main(
+            ["generate-tree", str(output), "--persons", "50", "--census-db", str(census_db)]
+        )
+
+        assert exit_code == 0
+        assert output.exists()
+        assert census_db.exists()
+        assert "50 persons" in capsys.readouterr().out
+
+    def test_generate_tree_refuses_existing_file(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test an existing output file is not overwritten."""
+        output = tmp_path / "existing.rmtree"
+        output.write_bytes(b"keep me")
+
+        exit_code = cli_main(["generate-tree", str(output), "--persons", "10"])
+
+        assert exit_code == 1
+        assert output.read_bytes() == b"keep me"
+        assert "Refusing to overwrite" in capsys.readouterr().out
+
+
+class TestStageTimingsCommand:
+    """Tests for the stage-timings command."""
+
+    @pytest.fixture
+    def state_db(self, tmp_path: Path) -> Path:
+        """Batch state database with spans for two items."""
+        from rmcitecraft.database.batch_state_repository import FindAGraveBatchStateRepository
+        from rmcitecraft.monitoring.spans import Span
+
+        db_path = tmp_path / "batch_state.db"
+        repo = FindAGraveBatchStateRepository(str(db_path))
+        repo.create_session("s1", total_items=2)
+        item_id = repo.create_item("s1", 1, "100", "https://www.findagrave.com/memorial/100", "Ann Lee")
+        repo.record_spans([
+            Span("navigate", "2025-01-02T03:00:00+00:00", 1200.0, session_id="s1", item_id=item_id),
+            Span("extract", "2025-01-02T03:00:01.200000+00:00", 300.0, session_id="s1", item_id=item_id),
+            Span("navigate", "2025-01-02T03:00:02+00:00", 9000.0, False, "s1", item_id + 1),
+        ])
+        return db_path
+
+    def test_summary(self, state_db: Path, capsys: pytest.CaptureFixture) -> None:
+        """Test stage percentiles and slowest items are printed."""
+        exit_code = cli_main(["stage-timings", "--db", str(state_db), "--by", "session"])
+
+        out = capsys.readouterr().out
+        assert exit_code == 0
+        assert "navigate" in out and "extract" in out
+        assert "Ann Lee" in out
+
+    def test_trace_export(self, state_db: Path, tmp_path: Path) -> None:
+        """Test a session trace is written as Chrome trace JSON."""
+        import json
+
+        trace_path = tmp_path / "trace.json"
+        exit_code = cli_main(
+            ["stage-timings", "--db", str(state_db), "--session", "s1", "--trace", str(trace_path)]
+        )
+
+        assert exit_code == 0
+        events = json.loads(trace_path.read_text())["traceEvents"]
+        assert sum(1 for e in events if e["ph"] == "X" and e["cat"] != "item") == 3
+
+    def test_trace_needs_session(self, state_db: Path, capsys: pytest.CaptureFixture) -> None:
+        """Test --trace without --session is rejected."""
+        exit_code = cli_main(["stage-timings", "--db", str(state_db), "--trace", "out.json"])
+
+        assert exit_code == 1
+        assert "--session" in capsys.readouterr().out
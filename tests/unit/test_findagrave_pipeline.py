@@ -0,0 +1,149 @@
+"""Unit tests for concurrent Find a Grave memorial extraction."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from rmcitecraft.services.findagrave_pipeline import MemorialExtractionPipeline
+from rmcitecraft.services.page_health_monitor import PageHealthStatus
+from rmcitecraft.services.retry_strategy import CircuitOpenError
+
+
+def make_automation():
+    automation = MagicMock()
+    automation.user_page = AsyncMock(name="user_page")
+    automation.opened = []
+
+    async def new_page():
+        page = AsyncMock(name=f"tab{len(automation.opened)}")
+        automation.opened.append(page)
+        return page
+
+    automation.get_or_create_page = AsyncMock(return_value=automation.user_page)
+    automation.new_page = AsyncMock(side_effect=new_page)
+    return automation
+
+
+class Recorder:
+    """Extract and write callbacks that track how many calls overlap."""
+
+    def __init__(self, load_seconds=0.02):
+        self.load_seconds = load_seconds
+        self.loading = 0
+        self.max_loading = 0
+        self.writing = 0
+        self.max_writing = 0
+        self.pages = set()
+        self.written = []
+
+    async def extract(self, item, page):
+        self.pages.add(page)
+        self.loading += 1
+        self.max_loading = max(self.max_loading, self.loading)
+        await asyncio.sleep(self.load_seconds)
+        self.loading -= 1
+        if item == "bad":
+            raise ValueError("no memorial")
+        return {"memorialId": item}
+
+    async def write(self, result):
+        self.writing += 1
+        self.max_writing = max(self.max_writing, self.writing)
+        await asyncio.sleep(0)
+        self.writing -= 1
+        self.written.append((result.item, result.data, result.error))
+
+
+@pytest.mark.asyncio
+async def test_tabs_extract_concurrently_and_write_one_at_a_time():
+    automation = make_automation()
+    recorder = Recorder()
+    items = [str(n) for n in range(12)]
+
+    stats = await MemorialExtractionPipeline(automation, tabs=4).run(
+        items, recorder.extract, recorder.write
+    )
+
+    assert (stats.extracted, stats.failed, stats.written, stats.not_started) == (12, 0, 12, 0)
+    assert sorted(item for item, _, _ in recorder.written) == sorted(items)
+    assert recorder.max_loading == 4
+    assert recorder.max_writing == 1
+    assert recorder.pages == set(automation.opened)
+    assert all(page.close.await_count == 1 for page in automation.opened)
+
+
+@pytest.mark.asyncio
+async def test_single_tab_uses_users_page():
+    automation = make_automation()
+    recorder = Recorder(load_seconds=0)
+
+    await MemorialExtractionPipeline(automation, tabs=1).run(
+        ["1", "2"], recorder.extract, recorder.write
+    )
+
+    assert recorder.pages == {automation.user_page}
+    automation.new_page.assert_not_called()
+    automation.user_page.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_failed_items_reach_the_writer():
+    recorder = Recorder(load_seconds=0)
+
+    stats = await MemorialExtractionPipeline(make_automation(), tabs=2).run(
+        ["1", "bad", "3"], recorder.extract, recorder.write
+    )
+
+    assert (stats.extracted, stats.failed, stats.written) == (2, 1, 3)
+    errors = {item: error for item, _, error in recorder.written}
+    assert isinstance(errors["bad"], ValueError) and errors["1"] is None
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_stops_the_batch():
+    recorder = Recorder(load_seconds=0)
+
+    async def extract(item, page):
+        if item == "2":
+            raise CircuitOpenError("findagrave", 60)
+        return await recorder.extract(item, page)
+
+    stats = await MemorialExtractionPipeline(make_automation(), tabs=1).run(
+        ["1", "2", "3", "4"], extract, recorder.write
+    )
+
+    assert stats.stop_reason.startswith("findagrave is temporarily paused")
+    assert (stats.extracted, stats.failed, stats.not_started) == (1, 1, 2)
+    assert [item for item, _, _ in recorder.written] == ["1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_crashed_tab_is_replaced():
+    automation = make_automation()
+    monitor = MagicMock()
+    monitor.check_page_health = AsyncMock(
+        side_effect=lambda page: PageHealthStatus(page is not automation.user_page, "crashed")
+    )
+    recorder = Recorder(load_seconds=0)
+
+    await MemorialExtractionPipeline(automation, tabs=1, health_monitor=monitor).run(
+        ["1", "2"], recorder.extract, recorder.write
+    )
+
+    assert recorder.pages == {automation.opened[0]}
+    automation.user_page.close.assert_not_called()
+    automation.opened[0].close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_no_browser_page():
+    automation = make_automation()
+    automation.get_or_create_page.return_value = None
+    recorder = Recorder()
+
+    stats = await MemorialExtractionPipeline(automation).run(
+        ["1", "2"], recorder.extract, recorder.write
+    )
+
+    assert stats.not_started == 2 and not recorder.written
@@ -0,0 +1,180 @@
+"""Unit tests for the in-memory household graph."""
+
+import sqlite3
+
+import pytest
+
+from rmcitecraft.database.census_extraction_db import CensusExtractionRepository
+from rmcitecraft.database.synthetic_tree import SyntheticTreeConfig, generate_synthetic_tree
+from rmcitecraft.services.census_rmtree_matcher import (
+    CensusPersonData,
+    CensusRMTreeMatcher,
+    MatchCandidate,
+    RMPersonData,
+)
+from rmcitecraft.services.household_graph import HouseholdGraph, load_household_graph
+
+JOHN, MARY, WILLIAM, SARAH, TOM, ANN, PETER, GRANDSON, ELIZA, FATHER, BROTHER = range(1, 12)
+
+
+@pytest.fixture
+def graph():
+    persons = [
+        (JOHN, 1860), (MARY, 1865), (WILLIAM, 1885), (SARAH, 1888), (TOM, 1885), (ANN, 1882),
+        (PETER, 1858), (GRANDSON, 1908), (ELIZA, 1887), (FATHER, 1830), (BROTHER, None),
+    ]
+    families = [
+        (1, JOHN, MARY),
+        (2, PETER, MARY),  # Mary's first marriage
+        (3, WILLIAM, ELIZA),
+        (4, FATHER, 0),
+    ]
+    children = [
+        (1, SARAH, 3), (1, TOM, 2), (1, WILLIAM, 1),  # William and Tom are twins
+        (2, ANN, 1),
+        (3, GRANDSON, 1),
+        (4, JOHN, 1), (4, BROTHER, 2),
+    ]
+    return HouseholdGraph(persons, families, children)
+
+
+def test_links(graph):
+    assert (len(graph), graph.family_count) == (11, 4)
+    assert graph.spouses(MARY) == [JOHN, PETER]
+    assert graph.children(JOHN) == [WILLIAM, TOM, SARAH]
+    assert graph.birth_year(ANN) == 1882
+    assert graph.birth_year(99) is None
+
+
+@pytest.mark.parametrize(
+    "person, relation",
+    [
+        (JOHN, "head"),
+        (MARY, "spouse"),
+        (TOM, "child"),
+        (ANN, "stepchild"),
+        (FATHER, "parent"),
+        (BROTHER, "sibling"),
+        (GRANDSON, "grandchild"),
+        (ELIZA, None),
+        (99, None),
+    ],
+)
+def test_relation(graph, person, relation):
+    assert graph.relation(JOHN, person) == relation
+
+
+def test_expected_order(graph):
+    household = [GRANDSON, SARAH, ANN, MARY, TOM, 99, WILLIAM, JOHN]
+
+    order = graph.expected_order(JOHN, household, relations={99: "relative"})
+
+    assert order == [JOHN, MARY, ANN, WILLIAM, TOM, SARAH, GRANDSON, 99]
+
+
+def test_check_household(graph):
+    claimed = {MARY: "spouse", WILLIAM: "child", ANN: "child", BROTHER: "sibling"}
+    assert graph.is_coherent_family(JOHN, claimed)
+
+    claimed.update({SARAH: "spouse", ELIZA: "child", 99: "child"})
+    assert graph.check_household(JOHN, claimed) == [
+        (SARAH, "spouse", "child"),
+        (ELIZA, "child", None),
+    ]
+    assert graph.check_household(99, claimed) == []
+
+
+def test_load_from_tree(tmp_path):
+    rmtree = tmp_path / "tree.rmtree"
+    stats = generate_synthetic_tree(rmtree, SyntheticTreeConfig(persons=300, seed=5))
+    conn = sqlite3.connect(rmtree)
+    family_id, father_id, mother_id = conn.execute(
+        "SELECT FamilyID, FatherID, MotherID FROM FamilyTable "
+        "WHERE FamilyID IN (SELECT FamilyID FROM ChildTable) LIMIT 1"
+    ).fetchone()
+    children = [
+        row[0] for row in conn.execute(
+            "SELECT ChildID FROM ChildTable WHERE FamilyID = ? ORDER BY ChildOrder", (family_id,)
+        )
+    ]
+    conn.close()
+
+    graph = load_household_graph(rmtree)
+
+    assert (len(graph), graph.family_count) == (stats.persons, stats.families)
+    assert graph.children(father_id) == children
+    assert graph.expected_order(father_id, [*reversed(children), mother_id, father_id]) == [
+        father_id, mother_id, *children
+    ]
+
+
+class TestMatcherWithGraph:
+    """build_position_map and validate_family_structure use the graph."""
+
+    @pytest.fixture
+    def matcher(self, tmp_path, graph):
+        matcher = CensusRMTreeMatcher(
+            tmp_path / "tree.rmtree",
+            tmp_path / "icu.dylib",
+            census_repo=CensusExtractionRepository(tmp_path / "census.db"),
+        )
+        matcher.household_graph = graph
+        return matcher
+
+    @staticmethod
+    def rm_person(person_id, given, relationship, sex="M", birth_year=None):
+        return RMPersonData(
+            person_id=person_id,
+            given_name=given,
+            surname="Ijams",
+            full_name=f"{given} Ijams",
+            sex=sex,
+            birth_year=birth_year,
+            relationship=relationship,
+            event_id=1000,
+        )
+
+    @staticmethod
+    def census_person(person_id, given, relationship, sex="M"):
+        return CensusPersonData(
+            person_id=person_id,
+            full_name=f"{given} Ijams",
+            given_name=given,
+            surname="Ijams",
+            sex=sex,
+            age=None,
+            relationship=relationship,
+            familysearch_ark=f"ark:/{person_id}",
+        )
+
+    def test_position_map(self, matcher):
+        household = [
+            self.rm_person(JOHN, "John", "head"),
+            self.rm_person(SARAH, "Sarah", "daughter", "F"),
+            self.rm_person(ANN, "Ann", "boarder", "F"),  # role missing, tree knows
+            self.rm_person(TOM, "Tom", "son"),
+            self.rm_person(MARY, "Mary", "wife", "F"),
+            self.rm_person(WILLIAM, "William", "son"),
+        ]
+
+        position_map = matcher.build_position_map(household, 1900)
+
+        assert position_map == {JOHN: 1, MARY: 2, ANN: 3, WILLIAM: 4, TOM: 5, SARAH: 6}
+
+    def test_family_link_warnings(self, matcher):
+        pairs = [
+            (self.rm_person(JOHN, "John", "head"), self.census_person(1, "John", "Head")),
+            (self.rm_person(MARY, "Mary", "wife", "F"), self.census_person(2, "Mary", "Wife", "F")),
+            (self.rm_person(ANN, "Ann", "daughter", "F"),
+             self.census_person(3, "Ann", "Stepdaughter", "F")),
+            (self.rm_person(ELIZA, "Eliza", "daughter", "F"),
+             self.census_person(4, "Eliza", "Daughter", "F")),
+        ]
+        matches = [MatchCandidate(rm_person=rm, census_person=c, score=0.9) for rm, c in pairs]
+
+        result = matcher.validate_family_structure(matches)
+
+        assert result.warnings == [
+            "Family link mismatch: census lists 'Eliza Ijams' as daughter but RootsMagic "
+            "has no family link to the head"
+        ]
@@ -0,0 +1,120 @@
+"""Unit tests for the census image tile pyramid cache."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PIL")
+from PIL import Image  # noqa: E402
+
+from rmcitecraft.services.image_tiles import ImageTileCache  # noqa: E402
+
+
+class Viewer:
+    """Stand-in for an image viewer holding a pyramid."""
+
+
+@pytest.fixture
+def scan(tmp_path):
+    """1200x900 test image."""
+    path = tmp_path / "1940, Ohio, Noble - Iams, John.jpg"
+    Image.linear_gradient("L").resize((1200, 900)).convert("RGB").save(path)
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    tile_cache = ImageTileCache(tmp_path / "tiles", tile_size=256, workers=1)
+    yield tile_cache
+    tile_cache.shutdown()
+
+
+class TestPyramidBuild:
+    """Tests for building pyramids."""
+
+    def test_levels_halve_until_single_tile(self, cache, scan):
+        pyramid = cache.build(scan)
+        assert [(lv.width, lv.height) for lv in pyramid.levels] == [
+            (1200, 900), (600, 450), (300, 225), (150, 112)
+        ]
+        assert (pyramid.levels[0].cols, pyramid.levels[0].rows) == (5, 4)
+        assert (pyramid.levels[-1].cols, pyramid.levels[-1].rows) == (1, 1)
+
+    def test_tiles_written(self, cache, scan):
+        pyramid = cache.build(scan)
+        edge_tile = cache.cache_dir / pyramid.key / "0" / "4_3.jpg"
+        with Image.open(edge_tile) as tile:
+            assert tile.size == (1200 - 4 * 256, 900 - 3 * 256)
+
+    def test_cached_pyramid_reused(self, cache, scan):
+        assert cache.get_pyramid(scan) is None
+        built = cache.request(scan).result(timeout=30)
+        assert cache.get_pyramid(scan) == built
+
+    def test_modified_image_gets_new_key(self, cache, scan):
+        pyramid = cache.build(scan)
+        os.utime(scan, (1, 1))
+        assert cache.get_pyramid(scan) is None
+        assert cache.build(scan).key != pyramid.key
+
+    def test_level_for_width(self, cache, scan):
+        pyramid = cache.build(scan)
+        assert pyramid.level_for_width(100).level == 3
+        assert pyramid.level_for_width(500).level == 1
+        assert pyramid.level_for_width(5000).level == 0
+
+
+class TestEviction:
+    """Tests for the size-bounded LRU."""
+
+    def test_least_recently_viewed_evicted(self, cache, scan, tmp_path):
+        other = tmp_path / "other.jpg"
+        Image.new("RGB", (1200, 900), "white").save(other)
+
+        first = cache.build(scan)
+        os.utime(cache.cache_dir / first.key / "manifest.json", (1, 1))
+        second = cache.build(other)
+
+        cache.max_bytes = cache.size_bytes() - 1
+        assert cache.evict() == 1
+        assert cache.get_pyramid(scan) is None
+        assert cache.get_pyramid(other) == second
+
+    def test_held_pyramid_not_evicted(self, cache, scan, tmp_path):
+        other = tmp_path / "other.jpg"
+        Image.new("RGB", (1200, 900), "white").save(other)
+
+        first = cache.build(scan)
+        os.utime(cache.cache_dir / first.key / "manifest.json", (1, 1))
+        second = cache.build(other)
+        viewer = Viewer()
+        cache.hold(viewer, first)
+
+        cache.max_bytes = cache.size_bytes() - 1
+        assert cache.evict() == 1
+        assert cache.get_pyramid(scan) == first
+        assert cache.get_pyramid(other) is None
+        assert second.key not in {p.name for p in cache.cache_dir.iterdir()}
+
+    def test_size_tracked_without_rescanning(self, cache, scan, tmp_path, monkeypatch):
+        other = tmp_path / "other.jpg"
+        Image.new("RGB", (1200, 900), "white").save(other)
+        cache.build(scan)
+        expected = cache.size_bytes()
+
+        scans = []
+        original = cache._scan_entries
+        monkeypatch.setattr(cache, "_scan_entries", lambda: scans.append(1) or original())
+        cache.build(other)
+        tracked = cache.size_bytes()
+
+        assert scans == []
+        monkeypatch.setattr(cache, "_total_bytes", None)
+        assert tracked == cache.size_bytes() > expected
+
+    def test_scan_reads_sizes_from_manifests(self, cache, scan, monkeypatch):
+        pyramid = cache.build(scan)
+        tiles = sum(f.stat().st_size for f in (cache.cache_dir / pyramid.key).rglob("*.jpg"))
+        monkeypatch.setattr(Path, "rglob", lambda *a: pytest.fail("tiles rescanned"))
+        assert cache._scan_entries()[0][2] == tiles
@@ -0,0 +1,123 @@
+"""Unit tests for the LLM telemetry store."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from rmcitecraft.llm.telemetry import LLMTelemetryStore, llm_call_context, percentile
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LLMTelemetryStore(tmp_path / "telemetry.db", blob_dir=tmp_path / "blobs")
+
+
+def record(store, model, duration, year=None, error=None, cached=None):
+    with llm_call_context(census_year=year, task="transcribe"):
+        request_id = store.start("openrouter", model, "prompt text")
+    store.finish(
+        request_id,
+        response_text="" if error else '{"persons": []}',
+        input_tokens=1000,
+        output_tokens=200,
+        cached_tokens=cached,
+        duration_seconds=duration,
+        error=error,
+    )
+    return request_id
+
+
+class TestRecording:
+    """Tests for start/finish."""
+
+    def test_call_row(self, store):
+        request_id = record(store, "gemini", 2.5, year=1940, cached=800)
+
+        call = store.get_call(request_id)
+        assert call["status"] == "ok"
+        assert call["census_year"] == 1940
+        assert call["task"] == "transcribe"
+        assert call["prompt_chars"] == len("prompt text")
+        assert call["response_chars"] == len('{"persons": []}')
+        assert (call["input_tokens"], call["output_tokens"], call["cache_hit"]) == (1000, 200, 1)
+        assert call["prompt_blob"] is None
+
+    def test_pending_until_finished(self, store):
+        request_id = store.start("llm", "gemini", "x")
+        assert store.get_call(request_id)["status"] == "pending"
+
+        store.finish(request_id, error="timeout")
+        call = store.get_call(request_id)
+        assert call["status"] == "error"
+        assert call["error"] == "timeout"
+        assert call["duration_seconds"] is not None
+
+    def test_abandoned_requests_dropped(self, store, monkeypatch):
+        clock = iter([0.0, 1000.0, 4000.0])
+        monkeypatch.setattr("rmcitecraft.llm.telemetry.time.perf_counter", lambda: next(clock))
+        store.start("llm", "gemini", "x")  # Never finished
+        recent = store.start("llm", "gemini", "x")
+        latest = store.start("llm", "gemini", "x")
+
+        assert list(store._started) == [recent, latest]
+
+    def test_explicit_context_overrides_block(self, store):
+        with llm_call_context(census_year=1940):
+            request_id = store.start("llm", "gemini", "x", context={"census_year": 1950})
+        assert store.get_call(request_id)["census_year"] == 1950
+
+    def test_bodies_stored_compressed_and_deduplicated(self, tmp_path):
+        store = LLMTelemetryStore(
+            tmp_path / "telemetry.db", blob_dir=tmp_path / "blobs", store_bodies=True
+        )
+        prompt = "schema and rules " * 500
+        first = store.start("llm", "gemini", prompt)
+        second = store.start("llm", "gemini", prompt)
+        store.finish(first, response_text="response")
+
+        call = store.get_call(first)
+        assert call["prompt_blob"] == store.get_call(second)["prompt_blob"]
+        assert store.read_blob(call["prompt_blob"]) == prompt
+        assert store.read_blob(call["response_blob"]) == "response"
+        blobs = list((tmp_path / "blobs").rglob("*.gz"))
+        assert len(blobs) == 2
+        assert sum(b.stat().st_size for b in blobs) < len(prompt) // 10
+
+
+class TestSummary:
+    """Tests for the per-model summary."""
+
+    def test_percentiles_and_totals(self, store):
+        for duration in range(1, 11):
+            record(store, "gemini", float(duration), year=1940, cached=500 if duration > 5 else 0)
+        record(store, "gemini", 99.0, year=1940, error="rate limited")
+        record(store, "gemini", 3.0, year=1950)
+        record(store, "claude", 4.0, year=1940)
+
+        summaries = {(s.model, s.census_year): s for s in store.summarize()}
+
+        gemini_1940 = summaries[("gemini", 1940)]
+        assert gemini_1940.calls == 11
+        assert gemini_1940.errors == 1
+        assert gemini_1940.p50_seconds == pytest.approx(5.5)
+        assert gemini_1940.p95_seconds == pytest.approx(9.55)
+        assert gemini_1940.input_tokens == 11000
+        assert gemini_1940.cached_tokens == 2500
+        assert gemini_1940.cache_hit_rate == pytest.approx(5 / 11)
+        assert summaries[("gemini", 1950)].calls == 1
+        assert list(summaries) == [("claude", 1940), ("gemini", 1940), ("gemini", 1950)]
+
+    def test_pending_calls_excluded(self, store):
+        store.start("llm", "gemini", "x")
+        assert store.summarize() == []
+
+    def test_since_filter(self, store):
+        record(store, "gemini", 1.0)
+        assert store.summarize(since=datetime.now() + timedelta(minutes=1)) == []
+        assert len(store.summarize(since=datetime.now() - timedelta(minutes=1))) == 1
+
+
+def test_percentile_interpolates():
+    assert percentile([], 0.5) is None
+    assert percentile([4.0], 0.95) == 4.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 0.5) == pytest.approx(2.5)
@@ -0,0 +1,160 @@
+"""Unit tests for the media content-hash index."""
+
+import os
+import sqlite3
+
+import pytest
+
+from rmcitecraft.database.image_repository import ImageRepository
+from rmcitecraft.database.media_hash_index import MediaHashIndex, compute_dhash
+
+
+@pytest.fixture
+def media_root(tmp_path):
+    """Media root with two census images."""
+    root = tmp_path / "media"
+    census_dir = root / "Records - Census" / "1940 Federal"
+    census_dir.mkdir(parents=True)
+    (census_dir / "1940, Ohio, Noble - Iams, John.jpg").write_bytes(b"john" * 100)
+    (census_dir / "1940, Ohio, Noble - Iams, Mary.jpg").write_bytes(b"mary" * 100)
+    return root
+
+
+@pytest.fixture
+def index(media_root, tmp_path):
+    return MediaHashIndex(media_root, db_path=tmp_path / "hashes.db", perceptual=False)
+
+
+@pytest.fixture
+def image_repo():
+    """ImageRepository over a minimal MultimediaTable."""
+    conn = sqlite3.connect(":memory:")
+    conn.create_collation("RMNOCASE", lambda a, b: (a.lower() > b.lower()) - (a.lower() < b.lower()))
+    conn.execute(
+        "CREATE TABLE MultimediaTable (MediaID INTEGER PRIMARY KEY, MediaPath TEXT, MediaFile TEXT)"
+    )
+    conn.execute(
+        "INSERT INTO MultimediaTable VALUES "
+        "(7, '?\\Records - Census\\1940 Federal', '1940, Ohio, Noble - Iams, John.jpg')"
+    )
+    yield ImageRepository(conn)
+    conn.close()
+
+
+class TestIndexUpdate:
+    """Tests for building the index incrementally."""
+
+    def test_initial_update_hashes_all(self, index):
+        stats = index.update()
+        assert (stats.scanned, stats.hashed, stats.removed) == (2, 2, 0)
+
+    def test_unchanged_files_not_rehashed(self, index):
+        index.update()
+        assert index.update().hashed == 0
+
+    def test_modified_and_deleted_files(self, index, media_root):
+        index.update()
+        census_dir = media_root / "Records - Census" / "1940 Federal"
+        john = census_dir / "1940, Ohio, Noble - Iams, John.jpg"
+        john.write_bytes(b"changed")
+        os.utime(john, (1, 1))
+        (census_dir / "1940, Ohio, Noble - Iams, Mary.jpg").unlink()
+
+        stats = index.update()
+        assert (stats.hashed, stats.removed) == (1, 1)
+
+
+class TestDuplicateLookup:
+    """Tests for finding existing copies of a file."""
+
+    def test_finds_identical_download(self, index, media_root, tmp_path):
+        index.update()
+        download = tmp_path / "image.jpg"
+        download.write_bytes(b"john" * 100)
+
+        assert index.find_duplicate(download) == (
+            media_root / "Records - Census" / "1940 Federal" / "1940, Ohio, Noble - Iams, John.jpg"
+        )
+
+    def test_file_is_not_its_own_duplicate(self, index, media_root):
+        index.update()
+        john = media_root / "Records - Census" / "1940 Federal" / "1940, Ohio, Noble - Iams, John.jpg"
+        assert index.find_duplicate(john) is None
+
+    def test_added_file_is_found(self, index, media_root, tmp_path):
+        index.update()
+        new_file = media_root / "Records - Census" / "1940 Federal" / "new.jpg"
+        new_file.write_bytes(b"new")
+        index.add_file(new_file)
+
+        download = tmp_path / "download.jpg"
+        download.write_bytes(b"new")
+        assert index.find_duplicate(download) == new_file
+
+    def test_find_duplicate_media_maps_to_media_id(self, index, image_repo, tmp_path):
+        index.update()
+        download = tmp_path / "image.jpg"
+        download.write_bytes(b"john" * 100)
+
+        media_id, existing = index.find_duplicate_media(download, image_repo)
+        assert media_id == 7
+        assert existing.name == "1940, Ohio, Noble - Iams, John.jpg"
+
+    def test_unlinked_duplicate_is_ignored(self, index, image_repo, tmp_path):
+        index.update()
+        download = tmp_path / "image.jpg"
+        download.write_bytes(b"mary" * 100)
+        assert index.find_duplicate_media(download, image_repo) is None
+
+
+class TestPerceptualHash:
+    """Tests for the optional perceptual hash."""
+
+    def test_reencoded_image_has_same_dhash(self, tmp_path):
+        image_module = pytest.importorskip("PIL.Image")
+        img = image_module.linear_gradient("L").resize((90, 80))
+        img.save(tmp_path / "a.png")
+        img.save(tmp_path / "b.jpg", quality=70)
+
+        assert compute_dhash(tmp_path / "a.png") == compute_dhash(tmp_path / "b.jpg")
+
+    def test_non_image_has_no_dhash(self, tmp_path):
+        path = tmp_path / "a.jpg"
+        path.write_bytes(b"not an image")
+        assert compute_dhash(path) is None
+
+    def test_lookalike_is_similar_not_duplicate(self, media_root, tmp_path):
+        image_module = pytest.importorskip("PIL.Image")
+        census_dir = media_root / "Records - Census" / "1940 Federal"
+        img = image_module.linear_gradient("L").resize((90, 80))
+        img.save(census_dir / "scan.png")
+        img.save(tmp_path / "download.jpg", quality=70)
+        index = MediaHashIndex(media_root, db_path=tmp_path / "hashes.db", perceptual=True)
+        index.update()
+
+        assert index.find_duplicate(tmp_path / "download.jpg") is None
+        assert index.find_similar(tmp_path / "download.jpg") == [census_dir / "scan.png"]
+
+
+class TestReadiness:
+    """Tests for building the index off the ingest path."""
+
+    def test_not_ready_until_background_update_finishes(self, index):
+        assert not index.ready
+        index.ready_for_lookup()
+        index._update_thread.join(timeout=10)
+        assert index.ready_for_lookup()
+
+    def test_ready_from_previous_run(self, media_root, tmp_path):
+        MediaHashIndex(media_root, db_path=tmp_path / "hashes.db", perceptual=False).update()
+        index = MediaHashIndex(media_root, db_path=tmp_path / "hashes.db", perceptual=False)
+        assert index.ready
+
+    def test_changed_file_is_not_a_duplicate(self, index, media_root, tmp_path):
+        index.update()
+        john = media_root / "Records - Census" / "1940 Federal" / "1940, Ohio, Noble - Iams, John.jpg"
+        john.write_bytes(b"edited" * 100)
+        download = tmp_path / "image.jpg"
+        download.write_bytes(b"john" * 100)
+
+        assert index.find_duplicate(download) is None
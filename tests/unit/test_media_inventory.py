@@ -0,0 +1,107 @@
+"""Unit tests for the cached media filesystem inventory."""
+
+import os
+
+import pytest
+
+from rmcitecraft.utils.media_inventory import MediaInventory
+from rmcitecraft.utils.media_resolver import MediaPathResolver
+
+
+@pytest.fixture
+def media_root(tmp_path):
+    """Media root with one census directory."""
+    census_dir = tmp_path / "Records - Census" / "1940 Federal"
+    census_dir.mkdir(parents=True)
+    (census_dir / "1940, Ohio, Noble - Iams, John.jpg").write_bytes(b"x" * 10)
+    (census_dir / ".DS_Store").write_bytes(b"")
+    return tmp_path
+
+
+def touch_dir(directory, offset):
+    """Move a directory's mtime so the change is visible on coarse-mtime filesystems."""
+    st = os.stat(directory)
+    os.utime(directory, ns=(st.st_atime_ns, st.st_mtime_ns + offset))
+
+
+class TestMediaInventory:
+    """Tests for MediaInventory."""
+
+    def test_lookup_is_case_insensitive(self, media_root):
+        inventory = MediaInventory()
+        entry = inventory.lookup(
+            media_root / "records - census" / "1940 FEDERAL" / "1940, ohio, noble - iams, john.JPG"
+        )
+        assert entry is not None
+        assert entry.path.name == "1940, Ohio, Noble - Iams, John.jpg"
+        assert entry.size == 10
+
+    def test_directory_listed_once(self, media_root):
+        inventory = MediaInventory(recheck_interval=60)
+        census_dir = media_root / "Records - Census" / "1940 Federal"
+        for _ in range(5):
+            inventory.exists(census_dir / "missing.jpg")
+        assert inventory.scans == 1
+
+    def test_changed_directory_is_rescanned(self, media_root):
+        inventory = MediaInventory(recheck_interval=0)
+        census_dir = media_root / "Records - Census" / "1940 Federal"
+        assert not inventory.exists(census_dir / "new.jpg")
+
+        (census_dir / "new.jpg").write_bytes(b"y")
+        touch_dir(census_dir, 1_000_000_000)
+
+        assert inventory.exists(census_dir / "new.jpg")
+        assert inventory.scans == 2
+
+    def test_new_file_found_within_recheck_interval(self, media_root):
+        inventory = MediaInventory(recheck_interval=60)
+        census_dir = media_root / "Records - Census" / "1940 Federal"
+        assert not inventory.exists(census_dir / "new.jpg")
+
+        (census_dir / "new.jpg").write_bytes(b"y")
+        touch_dir(census_dir, 1_000_000_000)
+
+        assert inventory.exists(census_dir / "new.jpg")
+
+    def test_invalidate_relists_directory(self, media_root):
+        inventory = MediaInventory(recheck_interval=60)
+        census_dir = media_root / "Records - Census" / "1940 Federal"
+        image = census_dir / "1940, Ohio, Noble - Iams, John.jpg"
+        assert inventory.lookup(image).size == 10
+
+        image.write_bytes(b"x" * 20)  # Rewritten in place: directory mtime unchanged
+        inventory.invalidate(str(census_dir).upper())
+
+        assert inventory.lookup(image).size == 20
+        assert inventory.scans == 2
+
+    def test_unchanged_directory_not_rescanned(self, media_root):
+        inventory = MediaInventory(recheck_interval=0)
+        census_dir = media_root / "Records - Census" / "1940 Federal"
+        inventory.exists(census_dir / "a.jpg")
+        inventory.refresh()
+        inventory.exists(census_dir / "a.jpg")
+        assert inventory.scans == 1
+
+    def test_list_files_skips_hidden(self, media_root):
+        files = MediaInventory().list_files(media_root / "Records - Census" / "1940 Federal")
+        assert [f.path.name for f in files] == ["1940, Ohio, Noble - Iams, John.jpg"]
+
+    def test_missing_directory(self, media_root):
+        inventory = MediaInventory()
+        assert inventory.lookup(media_root / "nope" / "a.jpg") is None
+        assert inventory.list_files(media_root / "nope") == []
+
+
+class TestResolverUsesInventory:
+    """Tests for MediaPathResolver existence checks."""
+
+    def test_resolves_to_on_disk_case(self, media_root):
+        resolver = MediaPathResolver(media_root=str(media_root), inventory=MediaInventory())
+        path = resolver.resolve("?\\Records - Census\\1940 Federal", "1940, OHIO, Noble - Iams, John.jpg")
+        assert path == media_root / "Records - Census" / "1940 Federal" / "1940, Ohio, Noble - Iams, John.jpg"
+
+    def test_missing_file(self, media_root):
+        resolver = MediaPathResolver(media_root=str(media_root), inventory=MediaInventory())
+        assert resolver.resolve("?\\Records - Census\\1940 Federal", "other.jpg") is None
@@ -6,10 +6,15 @@ import time
 import pytest
 
 from rmcitecraft.services.retry_strategy import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
     NonRetryableError,
+    OutboundGuard,
     RetryableError,
     RetryConfig,
     RetryStrategy,
+    TokenBucket,
 )
 
 
@@ -355,3 +360,227 @@ class TestRetryStrategy:
         assert len(call_times) == 2
         time_diff = call_times[1] - call_times[0]
         assert time_diff >= 0.1
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class RateLimitError(Exception):
+    """Stand-in for a provider's rate-limit exception."""
+
+
+class TestTokenBucket:
+    """Test shared rate limiting."""
+
+    def test_burst_then_steady_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=2, clock=clock)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.5)
+        # Reservations queue up behind each other
+        assert bucket.reserve() == pytest.approx(1.0)
+
+        clock.now += 10
+        assert bucket.reserve() == 0
+
+    def test_pause_delays_all_callers(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10.0, capacity=5, clock=clock)
+
+        bucket.pause(30)
+
+        assert bucket.reserve() == pytest.approx(30)
+        clock.now += 31
+        assert bucket.reserve() == 0
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker transitions."""
+
+    def test_opens_after_threshold(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60, clock=clock)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.allow() == pytest.approx(60)
+
+    def test_success_resets_count(self):
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_allows_single_trial(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60, clock=clock)
+        breaker.record_failure()
+
+        clock.now += 61
+        assert breaker.allow() == 0
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow() > 0
+
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow() == 0
+
+    def test_failed_trial_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60, clock=clock)
+        breaker.record_failure()
+        clock.now += 61
+        breaker.allow()
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.allow() == pytest.approx(60)
+
+
+class TestOutboundGuard:
+    """Test error classification and guarding."""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def guard(self, clock):
+        return OutboundGuard(
+            "familysearch",
+            TokenBucket(rate=100.0, capacity=10, clock=clock),
+            CircuitBreaker(failure_threshold=2, reset_timeout=60, clock=clock),
+        )
+
+    def test_open_circuit_rejects_calls(self, guard):
+        guard.record_failure(TimeoutError("timeout"))
+        guard.record_failure(TimeoutError("timeout"))
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            guard.acquire()
+
+        assert exc_info.value.target == "familysearch"
+        assert exc_info.value.retry_after == pytest.approx(60)
+        # Circuit-open errors must not be retried by RetryStrategy
+        assert RetryStrategy().should_retry(exc_info.value, 0) is False
+
+    def test_rate_limit_pauses_target(self, guard):
+        guard.record_failure(RateLimitError("slow down"))
+
+        assert guard.limiter.reserve() == pytest.approx(OutboundGuard.RATE_LIMIT_BASE_PAUSE)
+
+        guard.record_rate_limited()
+        assert guard.limiter.reserve() == pytest.approx(OutboundGuard.RATE_LIMIT_BASE_PAUSE * 2)
+
+    def test_permanent_errors_ignored(self, guard):
+        guard.record_failure(Exception("404 not found"))
+        guard.record_failure(NonRetryableError("private memorial"))
+        guard.record_failure(Exception("404 not found"))
+
+        assert guard.breaker.consecutive_failures == 0
+
+    def test_connection_loss_trips_immediately(self, guard):
+        class CDPConnectionError(Exception):
+            pass
+
+        guard.record_failure(CDPConnectionError("Chrome not reachable"))
+
+        assert guard.breaker.state == CircuitState.OPEN
+
+    def test_guard_records_outcome(self, guard):
+        with pytest.raises(TimeoutError), guard.guard():
+            raise TimeoutError("timeout")
+        assert guard.breaker.consecutive_failures == 1
+
+        with guard.guard():
+            pass
+        assert guard.breaker.consecutive_failures == 0
+
+    @pytest.mark.asyncio
+    async def test_guard_async(self, guard):
+        with pytest.raises(TimeoutError):
+            async with guard.guard_async():
+                raise TimeoutError("timeout")
+        with pytest.raises(TimeoutError):
+            async with guard.guard_async():
+                raise TimeoutError("timeout")
+
+        with pytest.raises(CircuitOpenError):
+            async with guard.guard_async():
+                pass
+
+    def _open_then_wait(self, guard, clock):
+        guard.record_failure(TimeoutError("timeout"))
+        guard.record_failure(TimeoutError("timeout"))
+        clock.now += 61
+
+    def test_permanent_error_releases_trial(self, guard, clock):
+        self._open_then_wait(guard, clock)
+
+        with pytest.raises(NonRetryableError), guard.guard():
+            raise NonRetryableError("memorial does not exist")
+
+        assert guard.breaker.state == CircuitState.HALF_OPEN
+        assert guard.breaker.allow() == 0
+
+    def test_error_before_outcome_settled(self, guard, clock):
+        self._open_then_wait(guard, clock)
+
+        guard.acquire()
+        try:
+            raise FileNotFoundError("image.jpg")
+        except FileNotFoundError:
+            pass
+        finally:
+            guard.settle()
+
+        assert guard.breaker.allow() == 0
+
+    def test_closed_generator_releases_trial(self, guard, clock):
+        self._open_then_wait(guard, clock)
+
+        def stream():
+            guard.acquire()
+            with guard.outcome():
+                yield "chunk"
+                yield "chunk"
+
+        chunks = stream()
+        next(chunks)
+        chunks.close()
+
+        assert guard.breaker.state == CircuitState.HALF_OPEN
+        assert guard.breaker.allow() == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_trial_released(self, guard, clock):
+        self._open_then_wait(guard, clock)
+
+        async def call():
+            async with guard.guard_async():
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(call())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert guard.breaker.allow() == 0
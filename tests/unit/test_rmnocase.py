@@ -0,0 +1,175 @@
+"""Unit tests for the pure-Python RMNOCASE collation."""
+
+import sqlite3
+from functools import cmp_to_key
+from pathlib import Path
+
+import pytest
+
+from rmcitecraft.database.connection import connect_rmtree, setup_rmnocase
+from rmcitecraft.database.rmnocase import (
+    register_rmnocase,
+    rmnocase_compare,
+    rmnocase_key,
+    verify_against_icu,
+)
+from rmcitecraft.database.synthetic_tree import (
+    FEMALE_GIVEN,
+    MALE_GIVEN,
+    SURNAMES,
+    SyntheticTreeConfig,
+    generate_synthetic_tree,
+)
+
+ICU_EXTENSION = Path("sqlite-extension/icu.dylib")
+
+# Order produced by ICU en_US at primary strength
+GOLDEN_ORDER = [
+    "Mac Donald",
+    "Mac-Donald",
+    "MacDonald",
+    "Mueller",
+    "Müller",
+    "O Brien",
+    "O'Brien",
+    "OBrien",
+    "Strasse",
+    "van Buren",
+    "Van Dyke",
+    "VanBuren",
+]
+
+NAME_CORPUS = [
+    *GOLDEN_ORDER,
+    "Ærø", "Aero", "Łukasz", "Lukasz", "Øster", "Oster", "Đorđe", "Dorde",
+    "Zoë", "Zoe", "José", "JOSE", "Ångström", "Angstrom", "Straße", "STRASSE",
+    "St. John", "St John", "Smith Jr.", "Smith 2nd", "Smith 1st", "D'Angelo",
+    "de la Cruz", "De La Cruz", "Dela Cruz", "Ó Súilleabháin", "ÑUÑEZ", "Nunez",
+    *SURNAMES, *MALE_GIVEN, *FEMALE_GIVEN,
+]
+
+
+def test_golden_order():
+    shuffled = sorted(GOLDEN_ORDER, key=lambda name: name[::-1])
+    assert sorted(shuffled, key=cmp_to_key(rmnocase_compare)) == GOLDEN_ORDER
+
+
+@pytest.mark.parametrize(
+    "left, right",
+    [
+        ("Müller", "MULLER"),
+        ("Straße", "STRASSE"),
+        ("José", "jose"),
+        ("Ærø", "AERO"),
+        ("Łukasz", "lukasz"),
+        ("Ｓｍｉｔｈ", "Smith"),  # fullwidth compatibility forms
+    ],
+)
+def test_primary_strength_equal(left, right):
+    assert rmnocase_compare(left, right) == 0
+
+
+def test_punctuation_digits_letters():
+    # Spaces and punctuation sort before digits, digits before letters
+    assert rmnocase_compare("Smith Jr", "Smith-Jr") < 0
+    assert rmnocase_compare("Smith-Jr", "Smith1") < 0
+    assert rmnocase_compare("Smith1", "Smith2") < 0
+    assert rmnocase_compare("Smith9", "SmithA") < 0
+    assert rmnocase_compare("Smith", "Smith Jr") < 0
+
+
+def test_keys_are_memoized():
+    rmnocase_key.cache_clear()
+    for _ in range(3):
+        rmnocase_compare("Ångström", "Angstrom")
+    info = rmnocase_key.cache_info()
+    assert (info.misses, info.hits) == (2, 4)
+
+
+def test_sqlite_order_by_and_index(tmp_path):
+    conn = sqlite3.connect(tmp_path / "names.db")
+    register_rmnocase(conn)
+    conn.execute("CREATE TABLE NameTable (Surname TEXT COLLATE RMNOCASE)")
+    conn.execute("CREATE INDEX idxSurname ON NameTable (Surname)")
+    conn.executemany("INSERT INTO NameTable VALUES (?)", [(n,) for n in reversed(GOLDEN_ORDER)])
+
+    rows = [row[0] for row in conn.execute("SELECT Surname FROM NameTable ORDER BY Surname")]
+    assert rows == GOLDEN_ORDER
+    assert conn.execute(
+        "SELECT COUNT(*) FROM NameTable WHERE Surname = 'MÜLLER'"
+    ).fetchone()[0] == 1
+    conn.close()
+
+
+class TestConnectRmtree:
+    """Tests for collation selection in connect_rmtree()."""
+
+    @pytest.fixture
+    def rmtree(self, tmp_path):
+        path = tmp_path / "tree.rmtree"
+        conn = sqlite3.connect(path)
+        register_rmnocase(conn)
+        conn.execute("CREATE TABLE NameTable (Surname TEXT COLLATE RMNOCASE)")
+        conn.executemany("INSERT INTO NameTable VALUES (?)", [("Zoë",), ("ábel",)])
+        conn.commit()
+        conn.close()
+        return path
+
+    def test_read_only_falls_back_to_python_collation(self, rmtree, tmp_path):
+        conn = connect_rmtree(rmtree, tmp_path / "missing.dylib")
+        rows = conn.execute("SELECT Surname FROM NameTable ORDER BY Surname").fetchall()
+        assert rows == [("ábel",), ("Zoë",)]
+        conn.close()
+
+    def test_writable_requires_icu(self, rmtree, tmp_path):
+        with pytest.raises(FileNotFoundError, match="ICU extension"):
+            connect_rmtree(rmtree, tmp_path / "missing.dylib", read_only=False)
+
+    def test_writable_rejects_python_collation(self, rmtree, tmp_path):
+        with pytest.raises(ValueError, match="read-only"):
+            connect_rmtree(rmtree, tmp_path / "missing.dylib", read_only=False, collation="python")
+
+    def test_icu_required(self, rmtree, tmp_path):
+        with pytest.raises(FileNotFoundError, match="ICU extension"):
+            connect_rmtree(rmtree, tmp_path / "missing.dylib", collation="icu")
+
+    def test_read_only_falls_back_when_icu_fails_to_load(self, rmtree, tmp_path):
+        broken = tmp_path / "icu.dylib"
+        broken.write_bytes(b"not a library")
+        conn = sqlite3.connect(rmtree)
+        try:
+            assert setup_rmnocase(conn, broken) == "python"
+            with pytest.raises((sqlite3.OperationalError, AttributeError)):
+                setup_rmnocase(conn, broken, read_only=False)
+        finally:
+            conn.close()
+
+
+def test_matches_icu():
+    try:
+        mismatches = verify_against_icu(NAME_CORPUS, ICU_EXTENSION)
+    except (sqlite3.OperationalError, AttributeError) as e:
+        pytest.skip(f"ICU extension not loadable here: {e}")
+    assert mismatches == []
+
+
+def test_matches_icu_on_tree_names(tmp_path):
+    rmtree = tmp_path / "tree.rmtree"
+    generate_synthetic_tree(rmtree, SyntheticTreeConfig(persons=2000, seed=5))
+    conn = sqlite3.connect(rmtree)
+    register_rmnocase(conn)
+    names = [
+        row[0]
+        for row in conn.execute(
+            "SELECT Surname FROM NameTable UNION SELECT Given FROM NameTable "
+            "UNION SELECT Name FROM PlaceTable"
+        )
+        if row[0]
+    ]
+    conn.close()
+
+    try:
+        mismatches = verify_against_icu(names, ICU_EXTENSION)
+    except (sqlite3.OperationalError, AttributeError) as e:
+        pytest.skip(f"ICU extension not loadable here: {e}")
+    assert mismatches == []
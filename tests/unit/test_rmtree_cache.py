@@ -0,0 +1,159 @@
+"""Unit tests for the local RootsMagic cache."""
+
+import sqlite3
+
+import pytest
+
+from rmcitecraft.database.connection import connect_rmtree
+from rmcitecraft.database.findagrave_queries import load_people_for_findagrave_batch
+from rmcitecraft.database.rmnocase import register_rmnocase
+from rmcitecraft.database.rmtree_cache import RootsMagicCache
+from rmcitecraft.database.shadow_index import SHADOW_SCHEMA_VERSION
+from rmcitecraft.database.synthetic_tree import SyntheticTreeConfig, generate_synthetic_tree
+
+UNIX_NOW = 1_760_000_000
+
+
+@pytest.fixture
+def rmtree(tmp_path):
+    path = tmp_path / "tree.rmtree"
+    generate_synthetic_tree(path, SyntheticTreeConfig(persons=300, seed=11))
+    return path
+
+
+def edit_tree(rmtree_path, sql, params=()):
+    conn = sqlite3.connect(rmtree_path)
+    register_rmnocase(conn)
+    with conn:
+        conn.execute(sql, params)
+    conn.close()
+
+
+def test_citations_by_year_matches_tree(rmtree):
+    conn = connect_rmtree(rmtree)
+    expected = conn.execute(
+        "SELECT c.CitationID FROM CitationTable c JOIN SourceTable s ON c.SourceID = s.SourceID "
+        "WHERE s.Name LIKE 'Fed Census: 1900%' ORDER BY s.Name COLLATE RMNOCASE"
+    ).fetchall()
+    conn.close()
+
+    rows = RootsMagicCache(rmtree).citations_by_year(1900)
+
+    assert [row["CitationID"] for row in rows] == [row[0] for row in expected]
+    assert rows and rows[0]["SourceName"].startswith("Fed Census: 1900")
+
+
+def test_census_sources_and_primary_persons(rmtree):
+    cache = RootsMagicCache(rmtree)
+
+    sources = cache.census_sources(census_year=1910)
+    persons = cache.source_primary_persons()
+
+    assert sources and {row["CensusYear"] for row in sources} == {1910}
+    assert all(row["Ark"] for row in sources)
+    name, surname, person_id = persons[sources[0]["SourceID"]]
+    assert surname in name and person_id > 0
+    state = sources[0]["State"]
+    assert {row["State"] for row in cache.census_sources(1910, state.upper())} == {state}
+
+
+def test_findagrave_batch_excludes_cited_people(rmtree):
+    people = load_people_for_findagrave_batch(str(rmtree))
+    person_ids = {person["person_id"] for person in people}
+    cited = next(person for person in people if person["memorial_id"])
+
+    assert all(person["birth_year"] or person["death_year"] for person in people)
+    assert cited["memorial_id"].isdigit()
+
+    # Citing a Find a Grave source for the person removes them from the batch
+    edit_tree(
+        rmtree,
+        "INSERT INTO SourceTable (Name, TemplateID, UTCModDate) VALUES ('Find a Grave Memorial', 0, ?)",
+        (UNIX_NOW,),
+    )
+    edit_tree(
+        rmtree,
+        "INSERT INTO CitationTable (SourceID, UTCModDate) "
+        "SELECT MAX(SourceID), ? FROM SourceTable",
+        (UNIX_NOW,),
+    )
+    edit_tree(
+        rmtree,
+        "INSERT INTO CitationLinkTable (CitationID, OwnerType, OwnerID, UTCModDate) "
+        "SELECT MAX(CitationID), 0, ?, ? FROM CitationTable",
+        (cited["person_id"], UNIX_NOW),
+    )
+
+    remaining = {person["person_id"] for person in load_people_for_findagrave_batch(str(rmtree))}
+    assert remaining == person_ids - {cited["person_id"]}
+
+
+def test_sync_pulls_only_the_delta(rmtree):
+    cache = RootsMagicCache(rmtree)
+    assert cache.sync().full
+    assert cache.sync().unchanged
+
+    citation_id = cache.citations_by_year(1920)[0]["CitationID"]
+    edit_tree(
+        rmtree,
+        "UPDATE CitationTable SET Footnote = 'Edited', UTCModDate = ? WHERE CitationID = ?",
+        (UNIX_NOW, citation_id),
+    )
+
+    stats = cache.sync()
+
+    assert not stats.full
+    assert stats.rows["citation"] == 1
+    assert stats.rows["event"] == stats.rows["name"] == 0
+    footnotes = {row["CitationID"]: row["Footnote"] for row in cache.citations_by_year(1920)}
+    assert footnotes[citation_id] == "Edited"
+
+
+def test_upgrades_older_cache(rmtree):
+    cache = RootsMagicCache(rmtree)
+    cache.sync()
+    conn = sqlite3.connect(cache.path)
+    with conn:
+        conn.execute(
+            "UPDATE shadow_meta SET value = ? WHERE key = 'schema_version'",
+            (SHADOW_SCHEMA_VERSION - 1,),
+        )
+        conn.execute("DROP VIEW census_source")
+        conn.execute("CREATE TABLE census_source (SourceID INTEGER PRIMARY KEY)")
+    conn.close()
+
+    assert cache.sync().full
+    assert cache.census_sources()
+
+
+def test_sync_picks_up_writes_in_the_same_second(rmtree):
+    cache = RootsMagicCache(rmtree)
+    first, second = (row["CitationID"] for row in cache.citations_by_year(1920)[:2])
+    edit = "UPDATE CitationTable SET Footnote = 'Edited', UTCModDate = ? WHERE CitationID = ?"
+
+    edit_tree(rmtree, edit, (UNIX_NOW, first))
+    cache.sync()
+    edit_tree(rmtree, edit, (UNIX_NOW, second))
+    cache.sync()
+
+    footnotes = {row["CitationID"]: row["Footnote"] for row in cache.citations_by_year(1920)}
+    assert footnotes[first] == footnotes[second] == "Edited"
+
+
+def test_unwritable_sidecar_falls_back_to_memory(rmtree, tmp_path):
+    cache = RootsMagicCache(rmtree, tmp_path / "missing" / "cache.db")
+
+    assert cache.sync().full
+    assert cache.sync().unchanged
+    assert not cache.path.exists()
+
+    citation_id = cache.citations_by_year(1920)[0]["CitationID"]
+    edit_tree(
+        rmtree,
+        "UPDATE CitationTable SET Footnote = 'Edited', UTCModDate = ? WHERE CitationID = ?",
+        (UNIX_NOW, citation_id),
+    )
+
+    assert cache.sync().rows["citation"] == 1
+    footnotes = {row["CitationID"]: row["Footnote"] for row in cache.citations_by_year(1920)}
+    assert footnotes[citation_id] == "Edited"
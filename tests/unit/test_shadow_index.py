@@ -0,0 +1,174 @@
+"""Unit tests for the shadow index sidecar database."""
+
+import sqlite3
+
+import pytest
+
+from rmcitecraft.database import shadow_index
+from rmcitecraft.database.connection import connect_rmtree
+from rmcitecraft.database.rmnocase import register_rmnocase
+from rmcitecraft.database.shadow_index import (
+    ShadowIndex,
+    attach_shadow_index,
+    parse_census_source,
+    shadow_index_path,
+)
+from rmcitecraft.database.synthetic_tree import SyntheticTreeConfig, generate_synthetic_tree
+
+SHADOW_TABLES = (
+    "person", "name", "fact_type", "event", "family", "child", "source", "citation",
+    "url_link", "citation_link", "witness", "citation_event",
+)
+LATER = 45700.0
+
+
+@pytest.fixture
+def rmtree(tmp_path):
+    path = tmp_path / "tree.rmtree"
+    generate_synthetic_tree(path, SyntheticTreeConfig(persons=300, seed=7))
+    return path
+
+
+def edit_tree(rmtree_path, statements):
+    conn = sqlite3.connect(rmtree_path)
+    register_rmnocase(conn)
+    with conn:
+        for sql, params in statements:
+            conn.execute(sql, params)
+    conn.close()
+
+
+def dump(path):
+    conn = sqlite3.connect(path)
+    tables = {
+        table: sorted(conn.execute(f"SELECT * FROM {table}").fetchall())
+        for table in (*SHADOW_TABLES, "census_source", "citation_person")
+    }
+    conn.close()
+    return tables
+
+
+def test_parse_census_source():
+    fields = b"<Field><Value>https://www.familysearch.org/ark:/61903/1:1:6XKG-DP65</Value></Field>"
+
+    assert parse_census_source("Fed Census: 1950, Ohio, Noble [citing ED 61-1]", fields) == {
+        "Schedule": "population",
+        "CensusYear": 1950,
+        "State": "Ohio",
+        "County": "Noble",
+        "Ark": "1:1:6XKG-DP65",
+    }
+    slave = parse_census_source("Fed Census Slave Schedule: 1850, North Carolina, Davie", None)
+    assert (slave["Schedule"], slave["State"], slave["Ark"]) == ("slave", "North Carolina", None)
+    assert parse_census_source("Fed Census notes", None)["CensusYear"] is None
+
+
+def test_full_build(rmtree):
+    stats = ShadowIndex(rmtree).refresh()
+
+    assert stats.full
+    conn = connect_rmtree(rmtree)
+    ShadowIndex(rmtree).attach(conn)
+    for rm_table, table in (
+        ("PersonTable", "person"),
+        ("EventTable", "event"),
+        ("SourceTable", "source"),
+        ("URLTable", "url_link"),
+        ("CitationLinkTable", "citation_link"),
+        ("WitnessTable", "witness"),
+    ):
+        assert conn.execute(f"SELECT COUNT(*) FROM {rm_table}").fetchone() == conn.execute(
+            f"SELECT COUNT(*) FROM shadow.{table}"
+        ).fetchone()
+    census_events = conn.execute(
+        "SELECT COUNT(*) FROM shadow.citation_event WHERE EventType = 18 AND CensusYear > 1700"
+    ).fetchone()[0]
+    census_sources = conn.execute(
+        "SELECT COUNT(*) FROM shadow.census_source WHERE Ark IS NOT NULL"
+    ).fetchone()[0]
+    assert census_events == census_sources > 0
+    conn.close()
+
+
+def test_incremental_refresh_matches_full_rebuild(rmtree, tmp_path):
+    index = ShadowIndex(rmtree)
+    index.refresh()
+    conn = sqlite3.connect(rmtree)
+    citation_id, event_id = conn.execute(
+        "SELECT CitationID, OwnerID FROM CitationLinkTable WHERE OwnerType = 2 LIMIT 1"
+    ).fetchone()
+    other_event = conn.execute(
+        "SELECT EventID FROM EventTable WHERE EventType = 18 AND EventID != ? LIMIT 1", (event_id,)
+    ).fetchone()[0]
+    census_source = conn.execute(
+        "SELECT SourceID FROM SourceTable WHERE Name LIKE 'Fed Census%' LIMIT 1"
+    ).fetchone()[0]
+    conn.close()
+
+    edit_tree(rmtree, [
+        (
+            "INSERT INTO URLTable (OwnerType, OwnerID, LinkType, Name, URL, UTCModDate) "
+            "VALUES (0, 1, 0, 'Find a Grave', 'https://www.findagrave.com/memorial/1', ?)",
+            (LATER,),
+        ),
+        ("DELETE FROM WitnessTable WHERE WitnessID = (SELECT MIN(WitnessID) FROM WitnessTable)", ()),
+        # Relink a citation to another event
+        (
+            "UPDATE CitationLinkTable SET OwnerID = ?, UTCModDate = ? "
+            "WHERE CitationID = ? AND OwnerType = 2",
+            (other_event, LATER, citation_id),
+        ),
+        # Saved without a newer UTCModDate
+        (
+            "INSERT INTO CitationLinkTable (CitationID, OwnerType, OwnerID, UTCModDate) "
+            "VALUES (?, 2, ?, NULL)",
+            (citation_id, event_id),
+        ),
+        (
+            "UPDATE SourceTable SET Name = 'Renamed source', UTCModDate = ? WHERE SourceID = ?",
+            (LATER, census_source),
+        ),
+        ("UPDATE EventTable SET Date = 'D.+19200101..+00000000..', UTCModDate = ? WHERE EventID = ?",
+         (LATER, other_event)),
+    ])
+
+    stats = index.refresh()
+    rebuilt = ShadowIndex(rmtree, tmp_path / "rebuilt.db")
+    rebuilt.refresh()
+
+    assert not stats.full
+    assert dump(index.path) == dump(rebuilt.path)
+    assert index.refresh().unchanged
+
+
+def test_older_tree_forces_full_rebuild(rmtree):
+    index = ShadowIndex(rmtree)
+    index.refresh()
+    edit_tree(rmtree, [("UPDATE URLTable SET UTCModDate = 1.0", ())])
+
+    assert index.refresh().full
+
+
+def test_attach_shadow_index(rmtree):
+    conn = connect_rmtree(rmtree)
+
+    assert attach_shadow_index(conn, rmtree)
+    assert shadow_index_path(rmtree).exists()
+    count = conn.execute(
+        "SELECT COUNT(*) FROM shadow.url_link WHERE Name = 'Find a Grave'"
+    ).fetchone()[0]
+    assert count > 0
+    with pytest.raises(sqlite3.OperationalError):
+        conn.execute("DELETE FROM shadow.url_link")
+    conn.close()
+
+
+def test_attach_falls_back_to_memory(rmtree, tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        shadow_index, "shadow_index_path", lambda path: tmp_path / "missing" / "shadow.db"
+    )
+    conn = connect_rmtree(rmtree)
+
+    assert not attach_shadow_index(conn, rmtree)
+    assert conn.execute("SELECT COUNT(*) FROM shadow.census_source").fetchone()[0] > 0
+    conn.close()
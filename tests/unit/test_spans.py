@@ -0,0 +1,204 @@
+"""Unit tests for per-stage timing spans."""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from rmcitecraft.database.batch_state_repository import FindAGraveBatchStateRepository
+from rmcitecraft.database.census_transcription_repository import CensusTranscriptionRepository
+from rmcitecraft.monitoring.spans import (
+    SpanRecorder,
+    record_span,
+    span,
+    span_context,
+    traced,
+)
+
+
+@pytest.fixture
+def sink():
+    batches = []
+    return batches
+
+
+@pytest.fixture
+def recorder(sink):
+    return SpanRecorder(sink.append, batch_type="census_transcription", flush_size=100)
+
+
+def written(sink):
+    return [s for batch in sink for s in batch]
+
+
+class TestSpan:
+    """Tests for span() and span_context()."""
+
+    def test_noop_outside_context(self):
+        first = span("navigate")
+        with first:
+            pass
+        assert span("extract") is first
+
+    def test_noop_when_disabled(self, sink):
+        recorder = SpanRecorder(sink.append, batch_type="findagrave", enabled=False)
+        with span_context(recorder, session_id="s1"), span("navigate"):
+            pass
+        recorder.flush()
+        assert sink == []
+
+    def test_records_stage_and_ids(self, recorder, sink):
+        with span_context(recorder, session_id="s1"):
+            with span_context(item_id=7), span("match"):
+                pass
+            with span("db_write"):
+                pass
+        recorder.flush()
+
+        spans = written(sink)
+        assert [(s.stage, s.session_id, s.item_id) for s in spans] == [
+            ("match", "s1", 7),
+            ("db_write", "s1", None),
+        ]
+        assert all(s.batch_type == "census_transcription" for s in spans)
+        assert all(s.duration_ms >= 0 and s.success for s in spans)
+
+    def test_failure_marks_span_and_propagates(self, recorder, sink):
+        with span_context(recorder, session_id="s1"), pytest.raises(ValueError), span("parse"):
+            raise ValueError("bad page")
+        recorder.flush()
+
+        assert [s.success for s in written(sink)] == [False]
+
+    def test_item_ids_isolated_between_tasks(self, recorder, sink):
+        async def process(item_id):
+            with span_context(item_id=item_id):
+                await asyncio.sleep(0)
+                with span("extract"):
+                    await asyncio.sleep(0)
+
+        async def run():
+            with span_context(recorder, session_id="s1"):
+                await asyncio.gather(*(process(i) for i in range(5)))
+
+        asyncio.run(run())
+        recorder.flush()
+        assert sorted(s.item_id for s in written(sink)) == [0, 1, 2, 3, 4]
+
+    def test_record_span(self, recorder, sink):
+        record_span("llm_call", 1500.0)
+        with span_context(recorder, session_id="s1", item_id=3):
+            record_span("llm_call", 2500.0, success=False)
+        recorder.flush()
+
+        [llm] = written(sink)
+        assert (llm.stage, llm.duration_ms, llm.success, llm.item_id) == ("llm_call", 2500.0, False, 3)
+
+
+class TestTraced:
+    """Tests for the traced() decorator."""
+
+    def test_sync_function(self, recorder, sink):
+        @traced("parse")
+        def parse(value):
+            return value * 2
+
+        with span_context(recorder):
+            assert parse(21) == 42
+        recorder.flush()
+        assert [s.stage for s in written(sink)] == ["parse"]
+
+    def test_async_function(self, recorder, sink):
+        @traced("navigate")
+        async def navigate(url):
+            await asyncio.sleep(0)
+            return url
+
+        async def run():
+            with span_context(recorder):
+                return await navigate("https://example.org")
+
+        assert asyncio.run(run()) == "https://example.org"
+        recorder.flush()
+        assert [s.stage for s in written(sink)] == ["navigate"]
+
+
+class TestSpanRecorder:
+    """Tests for buffering and bulk writes."""
+
+    def test_flushes_when_buffer_full(self, sink):
+        recorder = SpanRecorder(sink.append, batch_type="findagrave", flush_size=3)
+        with span_context(recorder):
+            for _ in range(7):
+                with span("extract"):
+                    pass
+
+        assert [len(batch) for batch in sink] == [3, 3]
+        assert recorder.pending == 1
+        assert recorder.flush() == 1
+        assert recorder.flush() == 0
+
+    def test_sink_errors_do_not_propagate(self):
+        def failing_sink(spans):
+            raise sqlite3.OperationalError("database is locked")
+
+        recorder = SpanRecorder(failing_sink, batch_type="findagrave")
+        with span_context(recorder), span("db_write"):
+            pass
+        assert recorder.flush() == 0
+        assert recorder.pending == 0
+
+
+class TestRecordSpans:
+    """Tests for writing spans to performance_metrics."""
+
+    def test_findagrave_spans(self, tmp_path):
+        repo = FindAGraveBatchStateRepository(str(tmp_path / "state.db"))
+        repo.create_session("s1", total_items=1)
+        repo.record_metric("extraction", 1200, True, session_id="s1")
+        recorder = SpanRecorder(repo.record_spans, batch_type="findagrave")
+        with span_context(recorder, session_id="s1", item_id=11):
+            with span("navigate"):
+                pass
+            with span("image_download"):
+                pass
+        recorder.flush()
+
+        with sqlite3.connect(tmp_path / "state.db") as conn:
+            rows = conn.execute(
+                "SELECT operation, item_id, batch_type FROM performance_metrics ORDER BY id"
+            ).fetchall()
+        assert rows == [
+            ("extraction", None, "findagrave"),
+            ("navigate", 11, "findagrave"),
+            ("image_download", 11, "findagrave"),
+        ]
+        assert set(repo.get_session_metrics("s1")) == {"extraction", "navigate", "image_download"}
+
+    def test_transcription_spans(self, tmp_path):
+        FindAGraveBatchStateRepository(str(tmp_path / "state.db"))
+        repo = CensusTranscriptionRepository(str(tmp_path / "state.db"))
+        recorder = SpanRecorder(repo.record_spans, batch_type="census_transcription")
+        with span_context(recorder, session_id="t1", item_id=4):
+            record_span("llm_call", 812.5)
+        recorder.flush()
+
+        with sqlite3.connect(tmp_path / "state.db") as conn:
+            row = conn.execute(
+                "SELECT operation, duration_ms, session_id, item_id, batch_type "
+                "FROM performance_metrics"
+            ).fetchone()
+        assert row == ("llm_call", 812.5, "t1", 4, "census_transcription")
+
+    def test_migration_keeps_existing_metrics(self, tmp_path):
+        db_path = tmp_path / "state.db"
+        repo = FindAGraveBatchStateRepository(str(db_path))
+        repo.create_session("s1", total_items=1)
+        repo.record_metric("page_load", 900, True, session_id="s1")
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("DELETE FROM schema_version WHERE version = 6")
+
+        # Re-running the migration copies rows into the rebuilt table
+        FindAGraveBatchStateRepository(str(db_path))
+
+        assert repo.get_recent_metrics("page_load") == [900]
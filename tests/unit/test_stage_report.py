@@ -0,0 +1,105 @@
+"""Unit tests for stage timing reports."""
+
+import pytest
+
+from rmcitecraft.database.batch_state_repository import FindAGraveBatchStateRepository
+from rmcitecraft.monitoring.spans import Span
+from rmcitecraft.monitoring.stage_report import item_timings, stage_percentiles, to_chrome_trace
+
+
+def row(span_id, timestamp, stage, ms, item_id, session_id="s1", success=True, name=""):
+    return {
+        "id": span_id,
+        "timestamp": timestamp,
+        "operation": stage,
+        "duration_ms": ms,
+        "success": success,
+        "session_id": session_id,
+        "item_id": item_id,
+        "batch_type": "findagrave",
+        "item_name": name,
+    }
+
+
+@pytest.fixture
+def spans():
+    return [
+        row(1, "2025-01-02T03:00:00+00:00", "navigate", 1000.0, 1, name="Ann Lee"),
+        row(2, "2025-01-02T03:00:01+00:00", "image_download", 200.0, 1, name="Ann Lee"),
+        row(3, "2025-01-02T03:00:01.200000+00:00", "image_download", 300.0, 1, name="Ann Lee"),
+        row(4, "2025-01-02T03:00:02+00:00", "navigate", 3000.0, 2, success=False),
+        row(5, "2025-01-02T04:10:00+00:00", "navigate", 2000.0, 3, session_id="s2"),
+    ]
+
+
+class TestStagePercentiles:
+    """Tests for stage_percentiles()."""
+
+    def test_by_session(self, spans):
+        stats = {(s.bucket, s.stage): s for s in stage_percentiles(spans, by="session")}
+
+        navigate = stats[("s1", "navigate")]
+        assert (navigate.items, navigate.failures) == (2, 1)
+        assert navigate.p50_ms == pytest.approx(2000.0)
+        assert navigate.p95_ms == pytest.approx(2900.0)
+
+        # Two downloads for one item count as one item total
+        downloads = stats[("s1", "image_download")]
+        assert (downloads.items, downloads.p50_ms) == (1, 500.0)
+        assert stats[("s2", "navigate")].items == 1
+
+    def test_by_hour(self, spans):
+        buckets = {s.bucket for s in stage_percentiles(spans, by="hour")}
+        assert len(buckets) == 2
+
+    def test_pipeline_order(self, spans):
+        stages = [s.stage for s in stage_percentiles(spans, by="all")]
+        assert stages == ["navigate", "image_download"]
+
+
+def test_item_timings(spans):
+    items = item_timings(spans)
+
+    assert [(i.item_id, i.total_ms) for i in items] == [(2, 3000.0), (3, 2000.0), (1, 1500.0)]
+    ann = items[-1]
+    assert ann.item_name == "Ann Lee"
+    assert ann.stages == {"navigate": 1000.0, "image_download": 500.0}
+    assert ann.slowest_stage == "navigate"
+    assert ann.started_at == "2025-01-02T03:00:00+00:00"
+
+
+def test_chrome_trace(spans):
+    trace = to_chrome_trace(spans[:4], name="s1")
+
+    events = trace["traceEvents"]
+    stage_events = [e for e in events if e["ph"] == "X" and e["cat"] != "item"]
+    item_events = {e["tid"]: e for e in events if e.get("cat") == "item"}
+    thread_names = {e["tid"]: e["args"]["name"] for e in events if e["name"] == "thread_name"}
+
+    assert len(stage_events) == 4
+    assert stage_events[0]["ts"] == 0
+    assert stage_events[0]["dur"] == 1_000_000
+    assert thread_names[stage_events[0]["tid"]] == "Ann Lee"
+    # The item event encloses its stages: 0 s to 1.5 s
+    ann = item_events[stage_events[0]["tid"]]
+    assert (ann["ts"], ann["dur"]) == (0, 1_500_000)
+    assert to_chrome_trace([])["traceEvents"] == []
+
+
+def test_get_stage_spans(tmp_path):
+    repo = FindAGraveBatchStateRepository(str(tmp_path / "state.db"))
+    repo.create_session("s1", total_items=1)
+    item_id = repo.create_item("s1", 7, "100", "https://www.findagrave.com/memorial/100", "Ann Lee")
+    repo.record_metric("extraction", 900, True, session_id="s1")
+    repo.record_spans([
+        Span("navigate", "2025-01-02T03:00:00+00:00", 812.5, session_id="s1", item_id=item_id),
+        Span("extract", "2025-01-02T03:00:01+00:00", 90.0, session_id="s2", item_id=99),
+    ])
+
+    rows = repo.get_stage_spans(session_id="s1")
+
+    # Legacy operation metrics are not spans
+    assert [(r["operation"], r["duration_ms"], r["item_name"]) for r in rows] == [
+        ("navigate", 812.5, "Ann Lee")
+    ]
+    assert len(repo.get_stage_spans(since="2025-01-02T03:00:01+00:00")) == 1
@@ -0,0 +1,145 @@
+"""Unit tests for the synthetic RootsMagic tree generator."""
+
+import re
+import sqlite3
+
+import pytest
+
+from rmcitecraft.database.findagrave_queries import _check_existing_citation
+from rmcitecraft.database.rmnocase import register_rmnocase
+from rmcitecraft.database.synthetic_tree import (
+    FACT_BIRTH,
+    FACT_CENSUS,
+    SyntheticTreeConfig,
+    generate_synthetic_tree,
+)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    rmtree_path = tmp_path / "synthetic.rmtree"
+    census_db_path = tmp_path / "census.db"
+    stats = generate_synthetic_tree(
+        rmtree_path, SyntheticTreeConfig(persons=400, seed=3), census_db_path=census_db_path
+    )
+    return rmtree_path, census_db_path, stats
+
+
+def connect(path):
+    conn = sqlite3.connect(path)
+    register_rmnocase(conn)
+    return conn
+
+
+class TestGeneratedTree:
+    """Tests for the generated .rmtree file."""
+
+    def test_counts(self, tree):
+        rmtree_path, _, stats = tree
+        conn = connect(rmtree_path)
+
+        assert stats.persons == 400
+        assert conn.execute("SELECT COUNT(*) FROM PersonTable").fetchone()[0] == 400
+        primary = conn.execute("SELECT COUNT(*) FROM NameTable WHERE IsPrimary = 1").fetchone()[0]
+        assert primary == 400
+        assert stats.names > 400  # Alternate names
+        assert stats.witnesses > 0
+        assert stats.urls > 0
+        assert stats.media > 0
+        assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+
+    def test_same_seed_same_tree(self, tree, tmp_path):
+        rmtree_path, _, _ = tree
+        generate_synthetic_tree(tmp_path / "again.rmtree", SyntheticTreeConfig(persons=400, seed=3))
+
+        query = "SELECT SourceID, Name, Fields FROM SourceTable ORDER BY SourceID"
+        assert (
+            connect(rmtree_path).execute(query).fetchall()
+            == connect(tmp_path / "again.rmtree").execute(query).fetchall()
+        )
+
+    def test_census_sources_cite_household_events(self, tree):
+        rmtree_path, _, stats = tree
+        conn = connect(rmtree_path)
+
+        rows = conn.execute(
+            """
+            SELECT s.Name, s.Fields, e.Date, e.OwnerID
+            FROM SourceTable s
+            JOIN CitationTable c ON c.SourceID = s.SourceID
+            JOIN CitationLinkTable cl ON cl.CitationID = c.CitationID AND cl.OwnerType = 2
+            JOIN EventTable e ON e.EventID = cl.OwnerID AND e.EventType = ?
+            WHERE s.TemplateID = 0 AND s.Name LIKE 'Fed Census:%'
+            """,
+            (FACT_CENSUS,),
+        ).fetchall()
+
+        assert len(rows) == stats.households
+        for name, fields, date, head_id in rows:
+            year = re.match(r"Fed Census: (\d{4}), [^,]+, \S+ \[citing", name).group(1)
+            assert date[3:7] == year
+            assert re.search(rb"familysearch\.org/ark:/61903/1:1:[A-Z0-9-]+", fields)
+            birth = conn.execute(
+                "SELECT substr(Date, 4, 4) FROM EventTable WHERE OwnerID = ? AND EventType = ?",
+                (head_id, FACT_BIRTH),
+            ).fetchone()[0]
+            assert int(birth) <= int(year)
+
+    def test_witnesses_have_roles(self, tree):
+        conn = connect(tree[0])
+
+        unresolved = conn.execute(
+            """
+            SELECT COUNT(*) FROM WitnessTable w
+            LEFT JOIN RoleTable r ON r.RoleID = w.Role
+            LEFT JOIN PersonTable p ON p.PersonID = w.PersonID
+            WHERE r.RoleID IS NULL OR (w.PersonID != 0 AND p.PersonID IS NULL)
+            """
+        ).fetchone()[0]
+        non_rin = conn.execute(
+            "SELECT COUNT(*) FROM WitnessTable WHERE PersonID = 0 AND Given != ''"
+        ).fetchone()[0]
+
+        assert unresolved == 0
+        assert non_rin > 0
+
+    def test_findagrave_citations_recognized(self, tree):
+        conn = connect(tree[0])
+        cited = conn.execute(
+            "SELECT cl.OwnerID FROM CitationLinkTable cl "
+            "JOIN CitationTable c ON c.CitationID = cl.CitationID "
+            "WHERE cl.OwnerType = 0 AND c.RefNumber LIKE '%findagrave.com/memorial/%'"
+        ).fetchall()
+
+        assert cited
+        assert all(_check_existing_citation(conn.cursor(), person_id) for (person_id,) in cited)
+
+    def test_refuses_to_overwrite(self, tree):
+        with pytest.raises(FileExistsError):
+            generate_synthetic_tree(tree[0], SyntheticTreeConfig(persons=10))
+
+
+class TestGeneratedCensusDb:
+    """Tests for the matching census.db."""
+
+    def test_extracted_heads_match_source_arks(self, tree):
+        rmtree_path, census_db_path, stats = tree
+        source_arks = {
+            re.search(rb"ark:/61903/(1:1:[A-Z0-9-]+)", fields).group(1).decode()
+            for (fields,) in connect(rmtree_path).execute(
+                "SELECT Fields FROM SourceTable WHERE Name LIKE 'Fed Census:%'"
+            )
+        }
+        census = sqlite3.connect(census_db_path)
+        head_arks = {
+            ark.rsplit("/", 1)[1]
+            for (ark,) in census.execute(
+                "SELECT familysearch_ark FROM census_person WHERE is_target_person = 1"
+            )
+        }
+
+        assert stats.census_persons > 0
+        assert head_arks
+        assert head_arks < source_arks  # Some households are still pending
+        linked = census.execute("SELECT COUNT(*) FROM rmtree_link").fetchone()[0]
+        assert linked == stats.census_persons